@@ -21,6 +21,7 @@ SHARDED_TABLES = [
     "sharded_app_metrics2",
     "sharded_heatmaps",
     "sharded_ingestion_warnings",
+    "sharded_llm_trace_summaries",
     "sharded_performance_events",
     "sharded_raw_sessions",
     "sharded_session_replay_embeddings",
@@ -35,6 +36,7 @@ NON_SHARDED_TABLES = [
     "channel_definition",
     "cohortpeople",
     "error_tracking_issue_fingerprint_overrides",
+    "error_tracking_issues",
     "events_dead_letter_queue",
     "events_plugin_ingestion_partition_statistics_v2",
     "exchange_rate",
@@ -11,6 +11,7 @@ from dags import (
     orm_examples,
     person_overrides,
     property_definitions,
+    trends_rollup,
 )
 
 defs = dagster.Definitions(
@@ -19,6 +20,7 @@ defs = dagster.Definitions(
         ch_examples.print_clickhouse_version,
         orm_examples.process_pending_deletions,
         orm_examples.pending_deletions,
+        trends_rollup.trends_rollup_daily,
     ],
     jobs=[
         deletes.deletes_job,
@@ -29,6 +31,7 @@ defs = dagster.Definitions(
         property_definitions.property_definitions_ingestion_job,
         backups.sharded_backup,
         backups.non_sharded_backup,
+        trends_rollup.trends_rollup_daily_job,
     ],
     schedules=[
         export_query_logs_to_s3.query_logs_export_schedule,
@@ -38,9 +41,11 @@ defs = dagster.Definitions(
         backups.incremental_sharded_backup_schedule,
         backups.full_non_sharded_backup_schedule,
         backups.incremental_non_sharded_backup_schedule,
+        trends_rollup.trends_rollup_daily_schedule,
     ],
     sensors=[
         deletes.run_deletes_after_squash,
+        trends_rollup.trends_rollup_backfill_sensor,
     ],
     resources=resources,
 )
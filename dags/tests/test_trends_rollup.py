@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock, patch
+
+import dagster
+import pytest
+from dagster import TimeWindow
+
+from dags.trends_rollup import roll_up_trends
+
+
+class TestTrendsRollupDaily:
+    def setup_method(self):
+        self.mock_context = Mock(spec=dagster.AssetExecutionContext)
+        self.mock_context.log = Mock()
+        self.mock_context.partition_time_window = TimeWindow(
+            datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 3, tzinfo=UTC)
+        )
+
+    def _run(self, mock_sync_execute, team_ids, existing_partitions=()):
+        self.mock_context.op_config = {"team_ids": team_ids}
+
+        def side_effect(sql, args=None):
+            if "system.parts" in sql:
+                return [[args["partition_id"] in existing_partitions]]
+            return None
+
+        mock_sync_execute.side_effect = side_effect
+        with patch("dags.trends_rollup.get_team_ids_with_trends_rollups_enabled", return_value=[1, 2]):
+            roll_up_trends(self.mock_context)
+        return [call_args.args[0] for call_args in mock_sync_execute.call_args_list]
+
+    @patch("dags.trends_rollup.sync_execute")
+    def test_full_run_drops_existing_days(self, mock_sync_execute):
+        queries = self._run(mock_sync_execute, team_ids=[], existing_partitions=("20240102",))
+
+        drops = [query for query in queries if "DROP PARTITION" in query]
+        assert len(drops) == 2
+        assert all("'20240102'" in query for query in drops)
+        assert not any("DELETE WHERE" in query for query in queries)
+        assert "team_id IN (1, 2)" in queries[-2]
+        assert "arrayJoin([1, 2])" in queries[-1] and "completed" in queries[-1]
+
+    @patch("dags.trends_rollup.sync_execute")
+    def test_team_run_only_replaces_those_teams(self, mock_sync_execute):
+        queries = self._run(mock_sync_execute, team_ids=[3], existing_partitions=("20240101", "20240102"))
+
+        assert not any("DROP PARTITION" in query for query in queries)
+        deletes = [query for query in queries if "DELETE WHERE" in query]
+        assert len(deletes) == 2
+        assert all("team_id IN (3)" in query for query in deletes)
+        assert "arrayJoin([3])" in queries[0]
+        assert "arrayJoin([3])" in queries[-1]
+
+    @patch("dags.trends_rollup.sync_execute")
+    def test_failed_drop_fails_the_run(self, mock_sync_execute):
+        self.mock_context.op_config = {"team_ids": []}
+
+        def side_effect(sql, args=None):
+            if "system.parts" in sql:
+                return [[True]]
+            if "DROP PARTITION" in sql:
+                raise Exception("Drop failed")
+            return None
+
+        mock_sync_execute.side_effect = side_effect
+        with (
+            patch("dags.trends_rollup.get_team_ids_with_trends_rollups_enabled", return_value=[1, 2]),
+            pytest.raises(Exception, match="Drop failed"),
+        ):
+            roll_up_trends(self.mock_context)
+
+        assert not any(
+            "INSERT INTO trends_rollup_daily" in call_args.args[0] for call_args in mock_sync_execute.call_args_list
+        )
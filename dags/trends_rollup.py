@@ -0,0 +1,198 @@
+from datetime import UTC, datetime, timedelta
+
+import dagster
+from dagster import BackfillPolicy, DailyPartitionsDefinition, Field
+from django.conf import settings
+
+from dags.common import JobOwners, dagster_tags
+from posthog.clickhouse import query_tagging
+from posthog.clickhouse.client import sync_execute
+from posthog.models.team.team import Team
+from posthog.models.trends_rollup.sql import (
+    TRENDS_ROLLUP_COMPLETED_DAYS_SQL,
+    TRENDS_ROLLUP_DAILY_TABLE,
+    TRENDS_ROLLUP_DELETE_TEAMS_SQL,
+    TRENDS_ROLLUP_DROP_PARTITION_SQL,
+    TRENDS_ROLLUP_HOURLY_TABLE,
+    TRENDS_ROLLUP_INSERT_SQL,
+    TRENDS_ROLLUP_PARTITION_EXISTS_SQL,
+    TRENDS_ROLLUP_SET_WATERMARKS_SQL,
+)
+
+TRENDS_ROLLUP_CLICKHOUSE_SETTINGS = "max_execution_time=1600,max_bytes_before_external_group_by=51474836480"
+
+partition_def = DailyPartitionsDefinition(start_date="2020-01-01")
+
+TRENDS_ROLLUP_CONFIG_SCHEMA = {
+    "team_ids": Field(
+        list,
+        default_value=[],
+        description="Teams to roll up. Defaults to all teams with the useTrendsRollups modifier enabled.",
+    ),
+}
+
+
+def get_team_ids_with_trends_rollups_enabled() -> list[int]:
+    return list(Team.objects.filter(modifiers__useTrendsRollups=True).values_list("id", flat=True))
+
+
+@dagster.asset(
+    name="trends_rollup_daily",
+    group_name="trends_rollup",
+    config_schema=TRENDS_ROLLUP_CONFIG_SCHEMA,
+    partitions_def=partition_def,
+    backfill_policy=BackfillPolicy.multi_run(max_partitions_per_run=14),
+    metadata={"tables": [TRENDS_ROLLUP_DAILY_TABLE, TRENDS_ROLLUP_HOURLY_TABLE]},
+    tags={"owner": JobOwners.TEAM_CLICKHOUSE.value},
+)
+def trends_rollup_daily(context: dagster.AssetExecutionContext) -> None:
+    """
+    Rolls up event counts and unique persons per team and event into the daily and hourly trends rollup tables,
+    which trends queries read instead of raw events when the useTrendsRollups modifier is enabled.
+    """
+    query_tagging.get_query_tags().with_dagster(dagster_tags(context))
+    roll_up_trends(context)
+
+
+def roll_up_trends(context: dagster.AssetExecutionContext) -> None:
+    """Replaces the rollups of the partition's days with ones aggregated from raw events, and marks them completed."""
+    if not context.partition_time_window:
+        raise dagster.Failure("This asset should only be run with a partition_time_window")
+
+    # Without a team list all enabled teams are rolled up, which replaces whole days. Otherwise only the given
+    # teams' rollups are replaced, e.g. when backfilling newly enabled teams.
+    replace_all_teams = not context.op_config["team_ids"]
+    team_ids = context.op_config["team_ids"] or get_team_ids_with_trends_rollups_enabled()
+    if not team_ids:
+        context.log.info("No teams have trends rollups enabled, skipping")
+        return
+
+    start_datetime, end_datetime = context.partition_time_window
+    date_start = start_datetime.strftime("%Y-%m-%d")
+    date_end = end_datetime.strftime("%Y-%m-%d")
+
+    # Queries stop reading these days from the rollup until they are rolled up again
+    sync_execute(
+        TRENDS_ROLLUP_SET_WATERMARKS_SQL(
+            date_start, date_end, team_ids=None if replace_all_teams else team_ids, completed=False
+        )
+    )
+
+    for table_name in (TRENDS_ROLLUP_DAILY_TABLE, TRENDS_ROLLUP_HOURLY_TABLE):
+        if not replace_all_teams:
+            sync_execute(TRENDS_ROLLUP_DELETE_TEAMS_SQL(table_name, date_start, date_end, team_ids))
+            continue
+
+        current_date = start_datetime.date()
+        while current_date < end_datetime.date():
+            day = current_date.strftime("%Y-%m-%d")
+            # Only a day that was never rolled up has nothing to drop. Any other failure to drop the day fails the
+            # run, as inserting on top of it would count it twice.
+            [[partition_exists]] = sync_execute(
+                TRENDS_ROLLUP_PARTITION_EXISTS_SQL(),
+                {"table_name": table_name, "partition_id": day.replace("-", "")},
+            )
+            if partition_exists:
+                sync_execute(TRENDS_ROLLUP_DROP_PARTITION_SQL(table_name, day))
+            current_date += timedelta(days=1)
+
+    for granularity in ("daily", "hourly"):
+        insert_query = TRENDS_ROLLUP_INSERT_SQL(
+            date_start=date_start,
+            date_end=date_end,
+            team_ids=team_ids,
+            granularity=granularity,
+            settings=TRENDS_ROLLUP_CLICKHOUSE_SETTINGS,
+        )
+        context.log.info(insert_query)
+        sync_execute(insert_query)
+
+    sync_execute(TRENDS_ROLLUP_SET_WATERMARKS_SQL(date_start, date_end, team_ids=team_ids, completed=True))
+
+
+trends_rollup_daily_job = dagster.define_asset_job(
+    name="trends_rollup_daily_job",
+    selection=["trends_rollup_daily"],
+    tags={"owner": JobOwners.TEAM_CLICKHOUSE.value},
+)
+
+
+@dagster.schedule(
+    cron_schedule="0 1 * * *",
+    job=trends_rollup_daily_job,
+    execution_timezone="UTC",
+    tags={"owner": JobOwners.TEAM_CLICKHOUSE.value},
+)
+def trends_rollup_daily_schedule(context: dagster.ScheduleEvaluationContext):
+    """
+    Rolls up the previous UTC day for all teams with trends rollups enabled.
+    """
+    yesterday = (datetime.now(UTC) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    return dagster.RunRequest(partition_key=yesterday)
+
+
+@dagster.sensor(
+    job=trends_rollup_daily_job,
+    minimum_interval_seconds=60 * 60,
+    default_status=dagster.DefaultSensorStatus.RUNNING,
+)
+def trends_rollup_backfill_sensor(context: dagster.SensorEvaluationContext):
+    """
+    Rolls up the last TRENDS_ROLLUP_BACKFILL_DAYS for teams that are missing some of them, e.g. because they were
+    just enabled. Yesterday is left to the daily schedule, so the two never replace the same day.
+    """
+    in_progress_runs = context.instance.get_runs(
+        filters=dagster.RunsFilter(
+            job_name=trends_rollup_daily_job.name,
+            statuses=[
+                dagster.DagsterRunStatus.QUEUED,
+                dagster.DagsterRunStatus.NOT_STARTED,
+                dagster.DagsterRunStatus.STARTING,
+                dagster.DagsterRunStatus.STARTED,
+            ],
+            tags={"trends_rollup_backfill": "true"},
+        ),
+        limit=1,
+    )
+    if in_progress_runs:
+        return dagster.SkipReason("A trends rollup backfill is still running")
+
+    team_ids = get_team_ids_with_trends_rollups_enabled()
+    if not team_ids:
+        return dagster.SkipReason("No teams have trends rollups enabled")
+
+    today = datetime.now(UTC).date()
+    days = [today - timedelta(days=days_ago) for days_ago in range(settings.TRENDS_ROLLUP_BACKFILL_DAYS, 1, -1)]
+    if not days:
+        return dagster.SkipReason("Backfilling trends rollups is disabled")
+
+    completed_days = {
+        team_id: set(team_days)
+        for team_id, team_days in sync_execute(
+            TRENDS_ROLLUP_COMPLETED_DAYS_SQL(),
+            {"team_ids": team_ids, "date_from": days[0], "date_to": days[-1]},
+        )
+    }
+    missing_days_by_team = {}
+    for team_id in team_ids:
+        missing_days = [day for day in days if day not in completed_days.get(team_id, set())]
+        if missing_days:
+            missing_days_by_team[team_id] = missing_days
+    if not missing_days_by_team:
+        return dagster.SkipReason("All teams with trends rollups enabled are rolled up")
+
+    first_day = min(missing[0] for missing in missing_days_by_team.values())
+    last_day = max(missing[-1] for missing in missing_days_by_team.values())
+    backfill_team_ids = sorted(missing_days_by_team)
+    context.log.info(f"Backfilling trends rollups from {first_day} to {last_day} for teams {backfill_team_ids}")
+
+    return dagster.RunRequest(
+        run_key=f"{today}-{'-'.join(str(team_id) for team_id in backfill_team_ids)}",
+        run_config={"ops": {"trends_rollup_daily": {"config": {"team_ids": backfill_team_ids}}}},
+        tags={
+            "trends_rollup_backfill": "true",
+            "dagster/asset_partition_range_start": first_day.strftime("%Y-%m-%d"),
+            "dagster/asset_partition_range_end": last_day.strftime("%Y-%m-%d"),
+        },
+    )
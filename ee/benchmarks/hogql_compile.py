@@ -0,0 +1,147 @@
+# isort: skip_file
+# Needs to be first to set up django environment
+from .helpers import now  # noqa: F401
+import dataclasses
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from posthog.hogql import ast
+from posthog.hogql.context import HogQLContext
+from posthog.hogql.database.database import create_hogql_database
+from posthog.hogql.modifiers import create_default_modifiers_for_team
+from posthog.hogql.printer import prepare_ast_for_printing, print_prepared_ast
+from posthog.hogql.visitor import clone_expr
+from posthog.hogql_queries.query_runner import get_query_runner
+from posthog.models import Organization, Team
+
+DATE_RANGE = {"date_from": "2021-01-01", "date_to": "2021-10-01"}
+
+# Representative queries for the modern query runners. Only compiled, never sent to ClickHouse.
+QUERIES: dict[str, dict[str, Any]] = {
+    "trends": {
+        "kind": "TrendsQuery",
+        "series": [
+            {"kind": "EventsNode", "event": "$pageview", "math": "dau"},
+            {"kind": "EventsNode", "event": "$pageleave"},
+        ],
+        "interval": "week",
+        "dateRange": DATE_RANGE,
+        "breakdownFilter": {"breakdown": "$browser", "breakdown_type": "event"},
+        "properties": [{"key": "$host", "operator": "is_not", "value": ["localhost:8000"], "type": "event"}],
+    },
+    "funnels": {
+        "kind": "FunnelsQuery",
+        "series": [
+            {"kind": "EventsNode", "event": "$pageview"},
+            {"kind": "EventsNode", "event": "$autocapture"},
+            {"kind": "EventsNode", "event": "$pageleave"},
+        ],
+        "dateRange": DATE_RANGE,
+        "breakdownFilter": {"breakdown": "$browser", "breakdown_type": "event"},
+    },
+    "retention": {
+        "kind": "RetentionQuery",
+        "dateRange": DATE_RANGE,
+        "retentionFilter": {
+            "period": "Week",
+            "totalIntervals": 12,
+            "targetEntity": {"id": "$pageview", "type": "events"},
+            "returningEntity": {"id": "$pageview", "type": "events"},
+        },
+    },
+    "paths": {
+        "kind": "PathsQuery",
+        "dateRange": DATE_RANGE,
+        "pathsFilter": {"includeEventTypes": ["$pageview"], "stepLimit": 5},
+    },
+    "lifecycle": {
+        "kind": "LifecycleQuery",
+        "series": [{"kind": "EventsNode", "event": "$pageview"}],
+        "interval": "week",
+        "dateRange": DATE_RANGE,
+    },
+    "web_overview": {"kind": "WebOverviewQuery", "dateRange": DATE_RANGE, "properties": []},
+    "web_stats_table": {"kind": "WebStatsTableQuery", "breakdownBy": "Page", "dateRange": DATE_RANGE, "properties": []},
+    "actors": {
+        "kind": "ActorsQuery",
+        "properties": [{"key": "email", "operator": "icontains", "value": ".com", "type": "person"}],
+    },
+}
+
+STAGES = ["to_query", "create_hogql_database", "prepare_ast_for_printing", "print_prepared_ast"]
+
+
+class HogQLCompileSuite:
+    """
+    Tracks the Python side cost of compiling query runner queries to ClickHouse SQL, stage by stage. Runs against a
+    fixture team in Postgres, with materialized columns disabled so that nothing reaches ClickHouse.
+    """
+
+    timeout = 600.0
+    version = "v001"
+
+    params = (list(QUERIES.keys()), STAGES)
+    param_names = ["query", "stage"]
+
+    def setup(self, query_name: str, stage: str):
+        self._materialized_columns_patches = [
+            patch(f"{module}.get_materialized_column_for_property", return_value=None)
+            for module in ("posthog.hogql.printer", "posthog.hogql.transforms.property_types")
+        ]
+        for materialized_columns_patch in self._materialized_columns_patches:
+            materialized_columns_patch.start()
+
+        team = Team.objects.filter(name="HogQL compile benchmarks").first()
+        if team is None:
+            organization = Organization.objects.create(name="HogQL compile benchmarks")
+            team = Team.objects.create(organization=organization, name="HogQL compile benchmarks")
+        self.team = team
+
+        self.runner = get_query_runner(QUERIES[query_name], self.team)
+        self.query = self.runner.to_query()
+        self.modifiers = create_default_modifiers_for_team(self.team, self.runner.modifiers)
+        self.context = HogQLContext(
+            team_id=self.team.pk,
+            team=self.team,
+            enable_select_queries=True,
+            modifiers=self.modifiers,
+            database=create_hogql_database(team=self.team, modifiers=self.modifiers),
+        )
+        prepared_query = prepare_ast_for_printing(
+            node=clone_expr(self.query), context=self._fresh_context(), dialect="clickhouse"
+        )
+        assert prepared_query is not None
+        self.prepared_query: ast.AST = prepared_query
+
+    def teardown(self, query_name: str, stage: str):
+        for materialized_columns_patch in self._materialized_columns_patches:
+            materialized_columns_patch.stop()
+
+    def _fresh_context(self) -> HogQLContext:
+        # Printing collects values and property accesses on the context, so every run gets its own
+        return dataclasses.replace(self.context, values={}, property_accesses=set())
+
+    def _run_stage(self, stage: str) -> None:
+        if stage == "to_query":
+            self.runner.to_query()
+        elif stage == "create_hogql_database":
+            create_hogql_database(team=self.team, modifiers=self.modifiers)
+        elif stage == "prepare_ast_for_printing":
+            prepare_ast_for_printing(node=clone_expr(self.query), context=self._fresh_context(), dialect="clickhouse")
+        elif stage == "print_prepared_ast":
+            print_prepared_ast(node=self.prepared_query, context=self._fresh_context(), dialect="clickhouse")
+
+    def time_compile(self, query_name: str, stage: str):
+        self._run_stage(stage)
+
+    def track_allocated_bytes(self, query_name: str, stage: str):
+        tracemalloc.start()
+        try:
+            self._run_stage(stage)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    track_allocated_bytes.unit = "bytes"  # type: ignore[attr-defined]
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Optional
 
@@ -22,6 +23,24 @@ from posthog.settings import CLICKHOUSE_CLUSTER
 
 Suggestion = tuple[TableWithProperties, TableColumn, PropertyName]
 
+
+@dataclass(frozen=True)
+class MaterializationCandidate:
+    table: TableWithProperties
+    table_column: TableColumn
+    property_name: PropertyName
+    query_count: int
+    team_count: int
+    # Bytes read by queries reading this property out of JSON, split evenly between all the properties each query
+    # reads that way. Materializing the property would turn this into a read of a much narrower column.
+    estimated_savings_bytes: int
+    estimated_savings_ms: int
+
+    @property
+    def suggestion(self) -> Suggestion:
+        return (self.table, self.table_column, self.property_name)
+
+
 logger = structlog.get_logger(__name__)
 
 
@@ -85,6 +104,55 @@ LIMIT 100 -- Make sure we don't add 100s of columns in one run
     return [("events", table_column, property_name) for (table_column, property_name) in raw_queries]
 
 
+def _analyze_property_accesses(
+    since_hours_ago: int, team_id: Optional[int] = None, limit: int = 100
+) -> list[MaterializationCandidate]:
+    """
+    Ranks properties to materialize by how much of the workload's scan cost is spent reading them out of JSON.
+    Relies on HogQL recording the properties it reads from JSON columns in the `property_accesses` query tag.
+    """
+    rows = sync_execute(
+        """
+SELECT
+    access.1 AS table,
+    access.2 AS table_column,
+    access.3 AS property_name,
+    count() AS query_count,
+    uniqExact(team_id) AS team_count,
+    toUInt64(sum(read_bytes / access_count)) AS estimated_savings_bytes,
+    toUInt64(sum(query_duration_ms / access_count)) AS estimated_savings_ms
+FROM (
+    SELECT
+        JSONExtract(log_comment, 'property_accesses', 'Array(Tuple(String, String, String))') AS accesses,
+        length(accesses) AS access_count,
+        JSONExtractInt(log_comment, 'team_id') AS team_id,
+        read_bytes,
+        query_duration_ms
+    FROM clusterAllReplicas({cluster}, system, query_log)
+    WHERE
+        query_start_time > now() - toIntervalHour(%(since)s)
+        AND type > 1
+        AND is_initial_query
+        AND team_id != 0
+        AND access_count > 0
+        {team_id_filter}
+)
+ARRAY JOIN accesses AS access
+WHERE table IN ('events', 'person', 'groups')
+    AND table_column IN ('properties', 'group_properties', 'person_properties')
+GROUP BY table, table_column, property_name
+ORDER BY estimated_savings_bytes DESC, estimated_savings_ms DESC
+LIMIT %(limit)s
+        """.format(
+            cluster=CLICKHOUSE_CLUSTER,
+            team_id_filter="AND team_id = %(team_id)s" if team_id else "",
+        ),
+        {"since": since_hours_ago, "team_id": team_id, "limit": limit},
+    )
+
+    return [MaterializationCandidate(*row) for row in rows]
+
+
 def materialize_properties_task(
     properties_to_materialize: Optional[list[Suggestion]] = None,
     time_to_analyze_hours: int = MATERIALIZE_COLUMNS_ANALYSIS_PERIOD_HOURS,
@@ -94,13 +162,26 @@ def materialize_properties_task(
     dry_run: bool = False,
     team_id_to_analyze: Optional[int] = None,
     is_nullable: bool = False,
+    use_property_accesses: bool = False,
 ) -> None:
     """
-    Creates materialized columns for event and person properties based off of slow queries
+    Creates materialized columns for event and person properties based off of slow queries, or when
+    use_property_accesses is set, off of the properties HogQL queries read from JSON weighted by their cost
     """
 
     if properties_to_materialize is None:
-        properties_to_materialize = _analyze(time_to_analyze_hours, min_query_time, team_id_to_analyze)
+        if use_property_accesses:
+            candidates = _analyze_property_accesses(time_to_analyze_hours, team_id_to_analyze)
+            for candidate in candidates:
+                logger.info(
+                    f"Materialization candidate. table={candidate.table}, table_column={candidate.table_column} "
+                    f"property_name={candidate.property_name} queries={candidate.query_count} "
+                    f"teams={candidate.team_count} estimated_savings_bytes={candidate.estimated_savings_bytes} "
+                    f"estimated_savings_ms={candidate.estimated_savings_ms}"
+                )
+            properties_to_materialize = [candidate.suggestion for candidate in candidates]
+        else:
+            properties_to_materialize = _analyze(time_to_analyze_hours, min_query_time, team_id_to_analyze)
 
     properties_by_table: dict[TableWithProperties, list[tuple[TableColumn, PropertyName]]] = defaultdict(list)
     for table, table_column, property_name in properties_to_materialize:
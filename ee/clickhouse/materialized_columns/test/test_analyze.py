@@ -3,6 +3,7 @@ from posthog.clickhouse.client import sync_execute
 from ee.clickhouse.materialized_columns.analyze import materialize_properties_task
 
 from unittest.mock import patch, call
+import json
 
 
 class TestMaterializedColumnsAnalyze(ClickhouseTestMixin, BaseTest):
@@ -55,3 +56,59 @@ class TestMaterializedColumnsAnalyze(ClickhouseTestMixin, BaseTest):
                 call("events", "materialize_me3", table_column="properties", is_nullable=False),
             ]
         )
+
+    @patch("ee.clickhouse.materialized_columns.analyze.materialize")
+    @patch("ee.clickhouse.materialized_columns.analyze.backfill_materialized_columns")
+    def test_mat_columns_from_property_accesses(self, patch_backfill, patch_materialize):
+        sync_execute("SYSTEM FLUSH LOGS")
+        sync_execute("TRUNCATE TABLE system.query_log")
+
+        queries_to_insert = [
+            # read_bytes, property_accesses
+            (1000, [["events", "properties", "cheap"]]),
+            (50000, [["events", "properties", "expensive"], ["events", "properties", "shared"]]),
+            (20000, [["events", "person_properties", "person_prop"]]),
+            (90000, [["events", "properties", "$exception_list"], ["some_table", "properties", "ignored"]]),
+        ]
+        for read_bytes, property_accesses in queries_to_insert:
+            sync_execute(
+                """
+            INSERT INTO system.query_log (
+                query,
+                query_start_time,
+                type,
+                is_initial_query,
+                log_comment,
+                read_bytes,
+                query_duration_ms
+            ) VALUES (
+                'SELECT 1',
+                now(),
+                2,
+                1,
+                %(log_comment)s,
+                %(read_bytes)s,
+                1000
+            )
+            """,
+                {
+                    "log_comment": json.dumps({"team_id": 2, "property_accesses": property_accesses}),
+                    "read_bytes": read_bytes,
+                },
+            )
+
+        materialize_properties_task(use_property_accesses=True, maximum=4)
+        # Ranked by bytes read, split between the properties each query reads
+        self.assertEqual(
+            patch_materialize.call_args_list[0],
+            call("events", "$exception_list", table_column="properties", is_nullable=False),
+        )
+        patch_materialize.assert_has_calls(
+            [
+                call("events", "expensive", table_column="properties", is_nullable=False),
+                call("events", "shared", table_column="properties", is_nullable=False),
+                call("events", "person_prop", table_column="person_properties", is_nullable=False),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(patch_materialize.call_count, 4)
@@ -1208,6 +1208,66 @@ class TestCohort(ClickhouseTestMixin, BaseTest):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][1], "2")  # distinct_id '2' is the one in cohort
 
+    def test_cohortpeople_partitioned(self):
+        for distinct_id in ["1", "2", "3", "4", "5", "6"]:
+            _create_person(distinct_ids=[distinct_id], team_id=self.team.pk)
+            _create_event(
+                event="$pageview",
+                team=self.team,
+                distinct_id=distinct_id,
+                timestamp=datetime.now() - timedelta(days=1),
+            )
+        for distinct_id in ["1", "2"]:
+            _create_event(
+                event="signup",
+                team=self.team,
+                distinct_id=distinct_id,
+                timestamp=datetime.now() - timedelta(days=1),
+            )
+        flush_persons_and_events()
+
+        cohort = Cohort.objects.create(
+            team=self.team,
+            filters={
+                "properties": {
+                    "type": "AND",
+                    "values": [
+                        {
+                            "event_type": "events",
+                            "key": "$pageview",
+                            "time_interval": "day",
+                            "time_value": 7,
+                            "type": "behavioral",
+                            "value": "performed_event",
+                        },
+                        {
+                            "event_type": "events",
+                            "key": "signup",
+                            "negation": True,
+                            "time_interval": "day",
+                            "time_value": 7,
+                            "type": "behavioral",
+                            "value": "performed_event",
+                        },
+                    ],
+                }
+            },
+            name="cohort",
+        )
+
+        cohort.calculate_people_ch(pending_version=1)
+        unpartitioned_results = self._get_cohortpeople(cohort)
+        self.assertEqual(len(unpartitioned_results), 4)
+
+        with self.settings(CALCULATE_COHORTS_PARTITIONED_TEAM_IDS={str(self.team.pk)}, CALCULATE_COHORTS_PARTITIONS=4):
+            with self.capture_queries_startswith(("INSERT", "insert")) as queries:
+                cohort.calculate_people_ch(pending_version=2)
+
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(cohort.version, 2)
+        self.assertEqual(cohort.count, 4)
+        self.assertCountEqual(self._get_cohortpeople(cohort), unpartitioned_results)
+
     def test_cohortpeople_with_nonexistent_other_cohort_filter(self):
         Person.objects.create(team_id=self.team.pk, distinct_ids=["1"], properties={"foo": "bar"})
         Person.objects.create(team_id=self.team.pk, distinct_ids=["2"], properties={"foo": "non"})
@@ -70,6 +70,11 @@ class Command(BaseCommand):
             default=None,
             help="Analyze queries only for a specific team_id",
         )
+        parser.add_argument(
+            "--use-property-accesses",
+            action="store_true",
+            help="Rank properties by the bytes HogQL queries spend reading them out of JSON, instead of scraping slow queries",
+        )
         parser.add_argument(
             "--max-columns",
             type=int,
@@ -114,4 +119,5 @@ class Command(BaseCommand):
                 dry_run=options["dry_run"],
                 team_id_to_analyze=options["analyze_team_id"],
                 is_nullable=is_nullable,
+                use_property_accesses=options["use_property_accesses"],
             )
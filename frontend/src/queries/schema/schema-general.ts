@@ -341,6 +341,17 @@ export interface HogQLQueryModifiers {
     customChannelTypeRules?: CustomChannelRule[]
     usePresortedEventsTable?: boolean
     useWebAnalyticsPreAggregatedTables?: boolean
+    useTrendsRollups?: boolean
+    /** Sample insights that would read more rows than fit the latency budget */
+    adaptiveSampling?: boolean
+    /** Keep the top edges of each step level of paths insights in ClickHouse, instead of the top edges overall */
+    prunePathsEdges?: boolean
+    /** Run funnel correlation and its success/failure totals as separate concurrent queries, sharing the totals across correlation types of the same funnel */
+    funnelCorrelationFanOut?: boolean
+    /** Filter error tracking issues by status and assignee in ClickHouse, using the synced issues table instead of Postgres */
+    useErrorTrackingIssuesTable?: boolean
+    /** Read the LLM observability traces list from the trace summaries table instead of aggregating AI events */
+    useLLMTraceSummaries?: boolean
     formatCsvAllowDoubleQuotes?: boolean
     convertToProjectTimezone?: boolean
 }
@@ -669,6 +680,8 @@ export interface EventsQueryResponse extends AnalyticsQueryResponseBase<any[][]>
     hasMore?: boolean
     limit?: integer
     offset?: integer
+    /** Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor */
+    nextCursor?: string
 }
 
 export type CachedEventsQueryResponse = CachedQueryResponse<EventsQueryResponse>
@@ -707,6 +720,10 @@ export interface EventsQuery extends DataNode<EventsQueryResponse> {
      * Number of rows to skip before returning rows
      */
     offset?: integer
+    /**
+     * Opaque cursor for keyset pagination. Pass an empty string to paginate by cursor from the first page, then the `nextCursor` of the previous response. Unlike `offset`, deep pages cost about the same as the first one.
+     */
+    cursor?: string
     /**
      * Show events matching a given action
      */
@@ -1093,6 +1110,8 @@ export const TRENDS_FILTER_PROPERTIES = new Set<keyof TrendsFilter>([
 ])
 
 export interface TrendsQueryResponse extends AnalyticsQueryResponseBase<Record<string, any>[]> {
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
     /** Wether more breakdown values are available. */
     hasMore?: boolean
     /** The date range used for the query */
@@ -1250,6 +1269,8 @@ export interface FunnelsQueryResponse
     isUdf?: boolean
     /** The date range used for the query */
     resolved_date_range?: ResolvedDateRangeResponse
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
 }
 
 export type CachedFunnelsQueryResponse = CachedQueryResponse<FunnelsQueryResponse>
@@ -1290,7 +1311,10 @@ export interface RetentionResult {
     breakdown_value?: string | number | null
 }
 
-export interface RetentionQueryResponse extends AnalyticsQueryResponseBase<RetentionResult[]> {}
+export interface RetentionQueryResponse extends AnalyticsQueryResponseBase<RetentionResult[]> {
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
+}
 
 export type CachedRetentionQueryResponse = CachedQueryResponse<RetentionQueryResponse>
 
@@ -1309,7 +1333,10 @@ export type PathsLink = {
     average_conversion_time: number
 }
 
-export interface PathsQueryResponse extends AnalyticsQueryResponseBase<PathsLink[]> {}
+export interface PathsQueryResponse extends AnalyticsQueryResponseBase<PathsLink[]> {
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
+}
 
 export type CachedPathsQueryResponse = CachedQueryResponse<PathsQueryResponse>
 
@@ -1392,7 +1419,10 @@ export const STICKINESS_FILTER_PROPERTIES = new Set<keyof StickinessFilter>([
     'hiddenLegendIndexes',
 ])
 
-export interface StickinessQueryResponse extends AnalyticsQueryResponseBase<Record<string, any>[]> {}
+export interface StickinessQueryResponse extends AnalyticsQueryResponseBase<Record<string, any>[]> {
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
+}
 
 export type CachedStickinessQueryResponse = CachedQueryResponse<StickinessQueryResponse>
 
@@ -1502,6 +1532,15 @@ export interface AnalyticsQueryResponseBase<T> {
     query_status?: QueryStatus
 }
 
+export interface AdaptiveSamplingResult {
+    /** The sample factor applied to the query, 1 if it ran on all rows */
+    samplingFactor: number
+    /** Rows ClickHouse estimated the unsampled query would read */
+    estimatedRows: integer
+    /** Approximate relative standard error of counts, from the rows the sample matched. 0 if it ran on all rows, unset if the query doesn't report how many rows its sample matched */
+    relativeError?: number
+}
+
 interface CachedQueryResponseMixin {
     is_cached: boolean
     /**  @format date-time */
@@ -1592,6 +1631,8 @@ export type QueryStatus = {
 }
 
 export interface LifecycleQueryResponse extends AnalyticsQueryResponseBase<Record<string, any>[]> {
+    /** The sampling chosen by the adaptiveSampling modifier */
+    adaptiveSampling?: AdaptiveSamplingResult
     /** The date range used for the query */
     resolved_date_range?: ResolvedDateRangeResponse
 }
@@ -1619,6 +1660,8 @@ export interface ActorsQueryResponse extends AnalyticsQueryResponseBase<any[][]>
     limit: integer
     offset: integer
     missing_actors_count?: integer
+    /** Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor */
+    nextCursor?: string
 }
 
 export type CachedActorsQueryResponse = CachedQueryResponse<ActorsQueryResponse>
@@ -1633,8 +1676,14 @@ export interface ActorsQuery extends DataNode<ActorsQueryResponse> {
     /** Currently only person filters supported. No filters for querying groups. See `filter_conditions()` in actor_strategies.py. */
     fixedProperties?: AnyPersonScopeFilter[]
     orderBy?: string[]
+    /** Only load these person properties, plus the team's display name properties and any properties referenced in `select`, when enriching the `person` column. All properties are loaded when unset. */
+    personProperties?: string[]
     limit?: integer
     offset?: integer
+    /**
+     * Opaque cursor for keyset pagination. Pass an empty string to paginate by cursor from the first page, then the `nextCursor` of the previous response. Unlike `offset`, deep pages cost about the same as the first one.
+     */
+    cursor?: string
 }
 
 export type CachedGroupsQueryResponse = CachedQueryResponse<GroupsQueryResponse>
@@ -3079,6 +3128,7 @@ export interface LLMTrace {
     inputCost?: number
     outputCost?: number
     totalCost?: number
+    errorCount?: number
     inputState?: any
     outputState?: any
     traceName?: string
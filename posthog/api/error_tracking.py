@@ -32,6 +32,7 @@ from posthog.models.error_tracking import (
     ErrorTrackingIssueAssignment,
     ErrorTrackingIssueFingerprintV2,
     ErrorTrackingExternalReference,
+    sync_error_tracking_issues_to_clickhouse,
 )
 from posthog.models.activity_logging.activity_log import log_activity, Detail, Change, load_activity
 from posthog.models.activity_logging.activity_page import activity_page_response
@@ -301,6 +302,8 @@ class ErrorTrackingIssueViewSet(TeamAndOrgViewSetMixin, ForbidDestroyModel, view
                     )
 
                 issues.update(status=new_status)
+                # Bulk updates skip the model signals that keep ClickHouse in sync
+                sync_error_tracking_issues_to_clickhouse([issue.id for issue in issues])
             elif action == "assign":
                 assignee = request.data.get("assignee", None)
 
@@ -6,7 +6,7 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 
 from posthog.api.utils import get_token
-from posthog.api.capture import capture_internal, capture_batch_internal
+from posthog.api.capture import capture_internal, capture_batch_internal_compressed
 from posthog.api.csp import process_csp_report
 from posthog.exceptions import generate_exception_response
 from posthog.exceptions_capture import capture_exception
@@ -60,12 +60,11 @@ def get_csp_event(request):
             token = ""
 
         if isinstance(csp_report, list):
-            futures = capture_batch_internal(
+            outcomes = capture_batch_internal_compressed(
                 events=csp_report, event_source="get_csp_report", token=token, process_person_profile=False
             )
-            for future in futures:
-                result = future.result()
-                result.raise_for_status()
+            for outcome in outcomes:
+                outcome.raise_for_status()
         else:
             resp = capture_internal(
                 token=token,
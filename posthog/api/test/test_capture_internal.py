@@ -1,3 +1,5 @@
+import gzip
+import json
 import pathlib
 
 from typing import Any, cast
@@ -5,12 +7,20 @@ from datetime import datetime, UTC
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 from prance import ResolvingParser
-
-from posthog.api.capture import capture_internal, capture_batch_internal, CaptureInternalError
+from requests import RequestException
+
+from posthog.api.capture import (
+    CaptureInternalError,
+    _reset_capture_session,
+    capture_batch_internal,
+    capture_batch_internal_compressed,
+    capture_internal,
+)
 from posthog.test.base import BaseTest
 from posthog.settings.ingestion import (
     CAPTURE_INTERNAL_URL,
     CAPTURE_REPLAY_INTERNAL_URL,
+    CAPTURE_INTERNAL_BATCH_ENDPOINT,
     NEW_ANALYTICS_CAPTURE_ENDPOINT,
     REPLAY_CAPTURE_ENDPOINT,
 )
@@ -40,7 +50,7 @@ class InstallCapturePostSpy:
 
         mock_session = MagicMock()
         mock_session.post.side_effect = spy_post
-        mock_session_class.return_value.__enter__.return_value = mock_session
+        mock_session_class.return_value = mock_session
 
     def get_calls(self) -> list[dict[str, Any]]:
         return self.spied_calls
@@ -53,6 +63,12 @@ class TestCaptureInternal(BaseTest):
 
     def setUp(self):
         super().setUp()
+        # Every test gets its own (mocked) pooled capture session
+        _reset_capture_session()
+
+    def tearDown(self):
+        super().tearDown()
+        _reset_capture_session()
 
     @patch("posthog.api.capture.Session")
     def test_capture_internal(self, mock_session_class):
@@ -501,3 +517,73 @@ class TestCaptureInternal(BaseTest):
         for future in resp_futures:
             resp = future.result()
             assert resp.status_code == 400
+
+    @patch("posthog.api.capture.Session")
+    def test_capture_internal_reuses_pooled_session(self, mock_session_class):
+        InstallCapturePostSpy(mock_session_class)
+        for i in range(3):
+            capture_internal(
+                token="abc123",
+                event_name="test_event",
+                event_source="test_capture_internal_reuses_pooled_session",
+                distinct_id=f"xyz{i}",
+                timestamp=None,
+                properties={},
+            )
+
+        mock_session_class.assert_called_once()
+
+    @patch("posthog.api.capture.CAPTURE_INTERNAL_BATCH_SIZE", 2)
+    @patch("posthog.api.capture.Session")
+    def test_capture_batch_internal_compressed(self, mock_session_class):
+        token = "abc123"
+        test_events: list[dict[str, Any]] = [
+            {"event": f"test_event_{i}", "distinct_id": str(uuid4()), "properties": {"some_custom_property": i}}
+            for i in range(3)
+        ]
+        # without a distinct_id this event isn't sent
+        test_events.insert(1, {"event": "test_event_invalid", "properties": {}})
+
+        mock_response = MagicMock(ok=True, status_code=200)
+        mock_session_class.return_value.post.return_value = mock_response
+
+        outcomes = capture_batch_internal_compressed(
+            events=test_events, event_source="test_capture_batch_internal_compressed", token=token
+        )
+
+        assert [outcome.ok for outcome in outcomes] == [True, False, True, True]
+        assert isinstance(outcomes[1].error, CaptureInternalError)
+        assert outcomes[0].status_code == 200
+        outcomes[0].raise_for_status()
+        with self.assertRaises(CaptureInternalError):
+            outcomes[1].raise_for_status()
+
+        post_calls = mock_session_class.return_value.post.call_args_list
+        assert len(post_calls) == 2
+        batches = []
+        for post_call in post_calls:
+            assert post_call.args[0] == f"{CAPTURE_INTERNAL_URL}{CAPTURE_INTERNAL_BATCH_ENDPOINT}"
+            assert post_call.kwargs["headers"]["Content-Encoding"] == "gzip"
+            body = json.loads(gzip.decompress(post_call.kwargs["data"]))
+            assert body["api_key"] == token
+            assert body["historical_migration"] is False
+            batches.append([event["event"] for event in body["batch"]])
+            for event in body["batch"]:
+                assert event["properties"]["capture_internal"] is True
+                assert event["properties"]["$process_person_profile"] is False
+
+        assert batches == [["test_event_0", "test_event_1"], ["test_event_2"]]
+
+    @patch("posthog.api.capture.Session")
+    def test_capture_batch_internal_compressed_request_failure(self, mock_session_class):
+        mock_session_class.return_value.post.side_effect = RequestException("capture is down")
+
+        outcomes = capture_batch_internal_compressed(
+            events=[{"event": "test_event", "distinct_id": "xyz987", "properties": {}}],
+            event_source="test_capture_batch_internal_compressed_request_failure",
+            token="abc123",
+        )
+
+        assert len(outcomes) == 1
+        assert outcomes[0].ok is False
+        assert isinstance(outcomes[0].error, RequestException)
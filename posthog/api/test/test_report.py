@@ -4,6 +4,7 @@ from django.test.client import Client
 from rest_framework import status
 from unittest.mock import MagicMock, patch
 
+from posthog.api.capture import CaptureInternalOutcome
 from posthog.test.base import BaseTest
 
 
@@ -42,9 +43,9 @@ class TestCspReport(BaseTest):
         assert resp.status_code == status.HTTP_204_NO_CONTENT
         assert mock_capture.call_count == 1
 
-    @patch("posthog.api.capture.capture_internal")
-    def test_submit_csp_report_list_to_new_internal_capture(self, mock_capture) -> None:
-        mock_capture.return_value = MagicMock(status_code=204)
+    @patch("posthog.api.capture._post_compressed_batch")
+    def test_submit_csp_report_list_to_new_internal_capture(self, mock_post_batch) -> None:
+        mock_post_batch.return_value = CaptureInternalOutcome(ok=True, status_code=200)
 
         multiple_violations = [
             {
@@ -99,7 +100,9 @@ class TestCspReport(BaseTest):
             content_type="application/reports+json",
         )
         assert resp.status_code == status.HTTP_204_NO_CONTENT
-        assert mock_capture.call_count == 3
+        # The violations are sent together in one batch
+        assert mock_post_batch.call_count == 1
+        assert [event["event"] for event in mock_post_batch.call_args.args[1]] == ["$csp_violation"] * 3
 
     @patch("posthog.api.report.capture_internal")
     def test_capture_csp_violation(self, mock_capture):
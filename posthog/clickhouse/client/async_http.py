@@ -0,0 +1,211 @@
+import asyncio
+import datetime as dt
+import decimal
+import ipaddress
+import json
+import os
+import ssl
+import threading
+import uuid
+from collections.abc import Callable
+from functools import cache, lru_cache
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+import aiohttp
+from clickhouse_driver.errors import ServerException
+from django.conf import settings
+
+# Settings making the JSON output parseable without losing precision: 64-bit integers as numbers, nan and inf as
+# strings, and tuples as arrays rather than objects.
+JSON_OUTPUT_SETTINGS = {
+    "default_format": "JSONCompact",
+    "output_format_json_quote_64bit_integers": "0",
+    "output_format_json_quote_denormals": "1",
+    "output_format_json_named_tuples_as_objects": "0",
+}
+
+
+def _split_type_arguments(arguments: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    in_quotes = False
+    start = 0
+    for index, char in enumerate(arguments):
+        if char == "'":
+            in_quotes = not in_quotes
+        elif in_quotes:
+            continue
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(arguments[start:index].strip())
+            start = index + 1
+    parts.append(arguments[start:].strip())
+    return parts
+
+
+def _strip_element_name(element_type: str) -> str:
+    # Named tuple elements are printed as "name Type", and types only contain spaces within parentheses
+    name, _, rest = element_type.partition(" ")
+    return rest.strip() if rest and "(" not in name else element_type
+
+
+def _to_datetime(timezone: Optional[str]) -> Callable[[Any], Any]:
+    tzinfo = ZoneInfo(timezone) if timezone else None
+    return lambda value: dt.datetime.fromisoformat(value).replace(tzinfo=tzinfo)
+
+
+@lru_cache(maxsize=1024)
+def converter_for_type(ch_type: str) -> Callable[[Any], Any]:
+    """
+    Returns a function converting a value of a ClickHouse type from its JSON output to the Python value that
+    clickhouse_driver returns for it, so results don't depend on the protocol they were read with.
+    """
+    name, _, arguments = ch_type.partition("(")
+    arguments = arguments[:-1] if arguments else ""
+
+    if name == "Nullable":
+        inner = converter_for_type(arguments)
+        return lambda value: None if value is None else inner(value)
+    if name in ("LowCardinality", "SimpleAggregateFunction"):
+        return converter_for_type(_split_type_arguments(arguments)[-1])
+    if name == "Array":
+        element = converter_for_type(arguments)
+        return lambda value: [element(item) for item in value]
+    if name == "Tuple":
+        elements = [converter_for_type(_strip_element_name(arg)) for arg in _split_type_arguments(arguments)]
+        return lambda value: tuple(element(item) for element, item in zip(elements, value))
+    if name == "Map":
+        key_type, value_type = _split_type_arguments(arguments)
+        key_converter, value_converter = converter_for_type(key_type), converter_for_type(value_type)
+        return lambda value: {key_converter(key): value_converter(item) for key, item in value.items()}
+    if name == "DateTime64":
+        timezone_arguments = _split_type_arguments(arguments)[1:]
+        return _to_datetime(timezone_arguments[0].strip("'") if timezone_arguments else None)
+    if name == "DateTime":
+        return _to_datetime(arguments.strip("'") or None)
+    if name in ("Date", "Date32"):
+        return dt.date.fromisoformat
+    if name == "UUID":
+        return uuid.UUID
+    if name.startswith(("Int", "UInt")):
+        return int
+    if name.startswith("Float"):
+        return float
+    if name.startswith("Decimal"):
+        return lambda value: decimal.Decimal(str(value))
+    if name == "Bool":
+        return bool
+    if name in ("IPv4", "IPv6"):
+        return ipaddress.ip_address
+    return lambda value: value
+
+
+def parse_json_compact(body: bytes) -> tuple[list[tuple], list[tuple[str, str]]]:
+    """Parses a JSONCompact response into rows and (name, type) column pairs, as clickhouse_driver returns them."""
+    response = json.loads(body.decode("utf-8", errors="replace"))
+    column_types = [(column["name"], column["type"]) for column in response["meta"]]
+    converters = [converter_for_type(ch_type) for _, ch_type in column_types]
+    rows = [tuple(converter(value) for converter, value in zip(converters, row)) for row in response["data"]]
+    return rows, column_types
+
+
+@cache
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    The event loop all HTTP requests to ClickHouse are made from. Callers run on event loops that may only live for
+    one request (e.g. when called through async_to_sync), so the connections are kept on a loop of their own to be
+    reused across requests.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="clickhouse-async-http", daemon=True).start()
+    return loop
+
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    # Only called from the loop thread, so the session is created once
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.CLICKHOUSE_CONN_POOL_MAX, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30),
+        )
+    return _session
+
+
+def _reset_event_loop() -> None:
+    global _session
+    _event_loop.cache_clear()
+    _session = None
+
+
+# The loop thread doesn't survive forking, and pooled connections must not be shared with forked workers
+os.register_at_fork(after_in_child=_reset_event_loop)
+
+
+@cache
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    ssl_context = ssl.create_default_context(cafile=settings.CLICKHOUSE_CA)
+    if not verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+class AsyncHttpClient:
+    """
+    Runs read-only queries against the ClickHouse HTTP interface without blocking the calling event loop. All clients
+    share one pool of keep-alive connections, so concurrent queries don't each open a connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        database: str,
+        user: str,
+        password: str,
+        secure: bool,
+        verify: Optional[bool] = None,
+    ):
+        self.url = f"{'https' if secure else 'http'}://{host}:{8443 if secure else 8123}/"
+        self.database = database
+        self.headers = {"X-ClickHouse-User": user, "X-ClickHouse-Key": password}
+        # Verified like the connections of the sync HTTP client, unless the workload turns it off
+        self.ssl: ssl.SSLContext | bool = (
+            _ssl_context(settings.QUERYSERVICE_VERIFY if verify is None else verify) if secure else False
+        )
+
+    async def _post(self, query: str, params: dict[str, str]) -> bytes:
+        async with _get_session().post(
+            self.url, params=params, headers=self.headers, data=query.encode(), ssl=self.ssl
+        ) as response:
+            body = await response.read()
+            if response.status != 200:
+                code = response.headers.get("X-ClickHouse-Exception-Code")
+                raise ServerException(body.decode("utf-8", errors="replace"), code=int(code) if code else None)
+            return body
+
+    async def execute(
+        self,
+        query: str,
+        settings: Optional[dict[str, Any]] = None,
+        with_column_types: bool = False,
+        query_id: Optional[str] = None,
+    ):
+        params = {
+            "database": self.database,
+            **{key: str(value) for key, value in (settings or {}).items()},
+            **JSON_OUTPUT_SETTINGS,
+        }
+        if query_id:
+            params["query_id"] = query_id
+
+        future = asyncio.run_coroutine_threadsafe(self._post(query, params), _event_loop())
+        rows, column_types = parse_json_compact(await asyncio.wrap_future(future))
+        return (rows, column_types) if with_column_types else rows
@@ -12,6 +12,7 @@ from clickhouse_pool import ChPool
 from django.conf import settings
 
 
+from posthog.clickhouse.client.async_http import AsyncHttpClient
 from posthog.settings import data_stores
 from posthog.utils import patchable
 
@@ -202,6 +203,32 @@ def get_client_from_pool(
     return get_pool(workload=workload, team_id=team_id, readonly=readonly, ch_user=ch_user).get_client()
 
 
+def get_async_client(
+    workload: Workload = Workload.DEFAULT,
+    team_id=None,
+    readonly=False,
+    ch_user: ClickHouseUser = ClickHouseUser.DEFAULT,
+) -> AsyncHttpClient:
+    """
+    Returns the async client for a given workload. It always uses HTTP, on a pool of connections shared by all
+    async clients.
+    """
+    kwargs = {
+        "host": settings.CLICKHOUSE_HOST,
+        "database": settings.CLICKHOUSE_DATABASE,
+        "secure": settings.CLICKHOUSE_SECURE,
+        "user": settings.CLICKHOUSE_USER,
+        "password": settings.CLICKHOUSE_PASSWORD,
+        **get_kwargs_for_client(workload=workload, team_id=team_id, readonly=readonly, ch_user=ch_user),
+    }
+    return AsyncHttpClient(**kwargs)
+
+
+def use_async_client(team_id=None) -> bool:
+    """Whether queries of the team can fan out on an event loop with the async client, rather than on threads."""
+    return settings.CLICKHOUSE_USE_ASYNC_CLIENT or team_id in settings.CLICKHOUSE_USE_ASYNC_CLIENT_PER_TEAM
+
+
 def get_pool(
     workload: Workload = Workload.DEFAULT,
     team_id=None,
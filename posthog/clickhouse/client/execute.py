@@ -4,17 +4,20 @@ import traceback
 import types
 from collections.abc import Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass
 from functools import lru_cache
 from time import perf_counter
 from typing import Any, Optional, Union
 
 import sqlparse
+from asgiref.sync import sync_to_async
 from clickhouse_driver import Client as SyncClient
 from django.conf import settings as app_settings
 from prometheus_client import Counter
 
 from posthog.clickhouse.client.connection import (
     Workload,
+    get_async_client,
     get_client_from_pool,
     get_default_clickhouse_workload_type,
     ClickHouseUser,
@@ -106,32 +109,100 @@ def validated_client_query_id() -> Optional[str]:
 logger = logging.getLogger(__name__)
 
 
-@patchable
-@trace_clickhouse_query_decorator
-def sync_execute(
+@dataclass
+class _Execution:
+    """A query prepared for ClickHouse, with the workload and user it's routed to."""
+
+    prepared_sql: str
+    prepared_args: Optional[QueryArgs]
+    tags: QueryTags
+    query_id: Optional[str]
+    core_settings: dict
+    workload: Workload
+    ch_user: ClickHouseUser
+    team_id: Optional[int]
+    is_personal_api_key: bool
+
+    @property
+    def query_type(self) -> str:
+        return self.tags.query_type or "Other"
+
+    def settings(self) -> dict:
+        settings = {
+            **self.core_settings,
+            "log_comment": self.tags.to_json(),
+            "query_id": self.query_id,
+        }
+        if self.workload == Workload.OFFLINE:
+            # disabling hedged requests for offline queries reduces the likelihood of these queries bleeding over into the
+            # online resource pool when the offline resource pool is under heavy load. this comes at the cost of higher and
+            # more variable latency and a higher likelihood of query failures - but offline workloads should be tolerant to
+            # these disruptions
+            settings["use_hedged_requests"] = "0"
+        return settings
+
+    def started(self) -> float:
+        QUERY_STARTED_COUNTER.labels(
+            team_id=str(self.team_id or ""),
+            access_method=self.tags.access_method or "other",
+            chargeable=str(self.tags.chargeable or "0"),
+        ).inc()
+        return perf_counter()
+
+    def failed(self, e: Exception) -> bool:
+        """Returns whether to retry the query, after moving it to another workload. Raises otherwise."""
+        exception_type = ch_error_type(e)
+        QUERY_ERROR_COUNTER.labels(
+            exception_type=exception_type,
+            query_type=self.query_type,
+            workload=self.workload.value if self.workload else "None",
+            chargeable=str(self.tags.chargeable or "0"),
+        ).inc()
+        err = wrap_query_error(e)
+        if isinstance(err, ClickHouseAtCapacity) and self.is_personal_api_key and self.workload == Workload.OFFLINE:
+            self.workload = Workload.ONLINE
+            self.tags.clickhouse_exception_type = exception_type
+            self.tags.workload = str(self.workload)
+            return True
+        raise err from e
+
+    def finished(self, start_time: float) -> None:
+        execution_time = perf_counter() - start_time
+
+        QUERY_FINISHED_COUNTER.labels(
+            team_id=str(self.team_id or ""),
+            access_method=self.tags.access_method or "other",
+            chargeable=str(self.tags.chargeable or "0"),
+        ).inc()
+
+        if query_counter := getattr(thread_local_storage, "query_counter", None):
+            query_counter.total_query_time += execution_time
+
+        if app_settings.SHELL_PLUS_PRINT_SQL:
+            print("Execution time: %.6fs" % (execution_time,))  # noqa T201
+
+
+def _flush_test_data() -> None:
+    try:
+        from posthog.test.base import flush_persons_and_events
+
+        flush_persons_and_events()
+    except ModuleNotFoundError:  # when we run plugin server tests it tries to run above, ignore
+        pass
+
+
+def _prepare_execution(
     query,
-    args=None,
-    settings=None,
-    with_column_types=False,
-    flush=True,
-    *,
-    workload: Workload = Workload.DEFAULT,
-    team_id: Optional[int] = None,
-    readonly=False,
-    sync_client: Optional[SyncClient] = None,
-    ch_user: ClickHouseUser = ClickHouseUser.DEFAULT,
-):
+    args,
+    settings,
+    workload: Workload,
+    team_id: Optional[int],
+    ch_user: ClickHouseUser,
+) -> _Execution:
     if not workload:
         workload = Workload.DEFAULT
         # TODO replace this by assert, sorry, no messing with ClickHouse should be possible
         logging.warning(f"workload is None", traceback.format_stack())
-    if TEST and flush:
-        try:
-            from posthog.test.base import flush_persons_and_events
-
-            flush_persons_and_events()
-        except ModuleNotFoundError:  # when we run plugin server tests it tries to run above, ignore
-            pass
     tags = get_query_tags()
     is_personal_api_key = tags.access_method == AccessMethod.PERSONAL_API_KEY
 
@@ -172,7 +243,6 @@ def sync_execute(
         **(settings or {}),
     }
     tags.query_settings = core_settings
-    query_type = tags.query_type or "Other"
     if ch_user == ClickHouseUser.DEFAULT:
         if is_personal_api_key:
             ch_user = ClickHouseUser.API
@@ -185,64 +255,98 @@ def sync_execute(
     # update tags if inside temporal (should not)
     update_query_tags_with_temporal_info()
 
+    return _Execution(
+        prepared_sql=prepared_sql,
+        prepared_args=prepared_args,
+        tags=tags,
+        query_id=query_id,
+        core_settings=core_settings,
+        workload=workload,
+        ch_user=ch_user,
+        team_id=team_id,
+        is_personal_api_key=is_personal_api_key,
+    )
+
+
+@patchable
+@trace_clickhouse_query_decorator
+def sync_execute(
+    query,
+    args=None,
+    settings=None,
+    with_column_types=False,
+    flush=True,
+    *,
+    workload: Workload = Workload.DEFAULT,
+    team_id: Optional[int] = None,
+    readonly=False,
+    sync_client: Optional[SyncClient] = None,
+    ch_user: ClickHouseUser = ClickHouseUser.DEFAULT,
+):
+    if TEST and flush:
+        _flush_test_data()
+    execution = _prepare_execution(query, args, settings, workload, team_id, ch_user)
+
     while True:
-        settings = {
-            **core_settings,
-            "log_comment": tags.to_json(),
-            "query_id": query_id,
-        }
-        if workload == Workload.OFFLINE:
-            # disabling hedged requests for offline queries reduces the likelihood of these queries bleeding over into the
-            # online resource pool when the offline resource pool is under heavy load. this comes at the cost of higher and
-            # more variable latency and a higher likelihood of query failures - but offline workloads should be tolerant to
-            # these disruptions
-            settings["use_hedged_requests"] = "0"
-        start_time = perf_counter()
+        start_time = execution.started()
         try:
-            QUERY_STARTED_COUNTER.labels(
-                team_id=str(team_id or ""),
-                access_method=tags.access_method or "other",
-                chargeable=str(tags.chargeable or "0"),
-            ).inc()
-            with sync_client or get_client_from_pool(workload, team_id, readonly, ch_user) as client:
+            with sync_client or get_client_from_pool(
+                execution.workload, team_id, readonly, execution.ch_user
+            ) as client:
                 result = client.execute(
-                    prepared_sql,
-                    params=prepared_args,
-                    settings=settings,
+                    execution.prepared_sql,
+                    params=execution.prepared_args,
+                    settings=execution.settings(),
                     with_column_types=with_column_types,
-                    query_id=query_id,
+                    query_id=execution.query_id,
                 )
-                if "INSERT INTO" in prepared_sql and client.last_query.progress.written_rows > 0:
+                if "INSERT INTO" in execution.prepared_sql and client.last_query.progress.written_rows > 0:
                     result = client.last_query.progress.written_rows
         except Exception as e:
-            exception_type = ch_error_type(e)
-            QUERY_ERROR_COUNTER.labels(
-                exception_type=exception_type,
-                query_type=query_type,
-                workload=workload.value if workload else "None",
-                chargeable=str(tags.chargeable or "0"),
-            ).inc()
-            err = wrap_query_error(e)
-            if isinstance(err, ClickHouseAtCapacity) and is_personal_api_key and workload == Workload.OFFLINE:
-                workload = Workload.ONLINE
-                tags.clickhouse_exception_type = exception_type
-                tags.workload = str(workload)
+            if execution.failed(e):
                 continue
-            raise err from e
         finally:
-            execution_time = perf_counter() - start_time
+            execution.finished(start_time)
+
+        break
+
+    return result
 
-            QUERY_FINISHED_COUNTER.labels(
-                team_id=str(team_id or ""),
-                access_method=tags.access_method or "other",
-                chargeable=str(tags.chargeable or "0"),
-            ).inc()
 
-            if query_counter := getattr(thread_local_storage, "query_counter", None):
-                query_counter.total_query_time += execution_time
+async def async_execute(
+    query,
+    args: Optional[NonInsertParams] = None,
+    settings=None,
+    with_column_types=False,
+    flush=True,
+    *,
+    workload: Workload = Workload.DEFAULT,
+    team_id: Optional[int] = None,
+    readonly=False,
+    ch_user: ClickHouseUser = ClickHouseUser.DEFAULT,
+):
+    """
+    Runs a read-only query like sync_execute, routed and tagged the same way, without blocking the event loop. Queries
+    awaited together share the async client's HTTP connections, rather than each taking a thread and a connection.
+    """
+    if TEST and flush:
+        await sync_to_async(_flush_test_data)()
+    execution = _prepare_execution(query, args, settings, workload, team_id, ch_user)
 
-            if app_settings.SHELL_PLUS_PRINT_SQL:
-                print("Execution time: %.6fs" % (execution_time,))  # noqa T201
+    while True:
+        start_time = execution.started()
+        try:
+            result = await get_async_client(execution.workload, team_id, readonly, execution.ch_user).execute(
+                execution.prepared_sql,
+                settings=execution.settings(),
+                with_column_types=with_column_types,
+                query_id=execution.query_id,
+            )
+        except Exception as e:
+            if execution.failed(e):
+                continue
+        finally:
+            execution.finished(start_time)
 
         break
 
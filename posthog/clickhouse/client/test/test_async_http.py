@@ -0,0 +1,84 @@
+import datetime as dt
+import ssl
+import uuid
+from zoneinfo import ZoneInfo
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+
+from posthog.clickhouse.client import async_execute, sync_execute
+from posthog.clickhouse.client.async_http import converter_for_type, parse_json_compact
+from posthog.clickhouse.client.connection import Workload, get_async_client, use_async_client
+from posthog.test.base import ClickhouseTestMixin
+
+
+class TestConvertJsonValues(SimpleTestCase):
+    def test_converts_nested_types(self):
+        assert converter_for_type("Array(Tuple(String, DateTime64(6, 'UTC')))")(
+            [["a", "2024-01-02 03:04:05.000006"]]
+        ) == [("a", dt.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=ZoneInfo("UTC")))]
+        assert converter_for_type("Tuple(count UInt64, day Nullable(Date))")([3, None]) == (3, None)
+        assert converter_for_type("Map(LowCardinality(String), Float64)")({"a": 1, "b": "inf"}) == {
+            "a": 1.0,
+            "b": float("inf"),
+        }
+        assert converter_for_type("UUID")("00000000-0000-0000-0000-000000000001") == uuid.UUID(int=1)
+
+    def test_parses_json_compact(self):
+        rows, types = parse_json_compact(
+            b'{"meta": [{"name": "x", "type": "Int64"}, {"name": "d", "type": "Date"}], "data": [[1, "2024-01-01"]]}'
+        )
+        assert rows == [(1, dt.date(2024, 1, 1))]
+        assert types == [("x", "Int64"), ("d", "Date")]
+
+
+@override_settings(CLICKHOUSE_SECURE=True, QUERYSERVICE_VERIFY=True, CLICKHOUSE_PER_TEAM_SETTINGS={})
+class TestGetAsyncClient(SimpleTestCase):
+    def test_verifies_like_the_sync_client(self):
+        client = get_async_client()
+        assert isinstance(client.ssl, ssl.SSLContext) and client.ssl.check_hostname
+
+        with override_settings(QUERYSERVICE_VERIFY=False):
+            client = get_async_client()
+            assert isinstance(client.ssl, ssl.SSLContext) and not client.ssl.check_hostname
+
+    @override_settings(CLICKHOUSE_OFFLINE_CLUSTER_HOST="offline")
+    def test_applies_the_offline_cluster(self):
+        client = get_async_client(Workload.OFFLINE)
+        assert client.url == "https://offline:8443/"
+        assert isinstance(client.ssl, ssl.SSLContext) and not client.ssl.check_hostname
+
+    def test_applies_per_team_settings(self):
+        with override_settings(CLICKHOUSE_PER_TEAM_SETTINGS={"2": {"host": "clicky", "user": "default"}}):
+            assert get_async_client(team_id=2).url == "https://clicky:8443/"
+            assert get_async_client(team_id=3).url != "https://clicky:8443/"
+
+    @override_settings(
+        CLICKHOUSE_USE_HTTP=True, CLICKHOUSE_USE_ASYNC_CLIENT=False, CLICKHOUSE_USE_ASYNC_CLIENT_PER_TEAM={2}
+    )
+    def test_use_async_client(self):
+        assert use_async_client(2)
+        assert not use_async_client(3)
+
+
+class TestAsyncExecute(ClickhouseTestMixin, SimpleTestCase):
+    def test_matches_sync_execute(self):
+        query = """
+            SELECT
+                toInt64(number) AS n,
+                toString(number) AS s,
+                [toDate('2024-01-01') + number] AS days,
+                (number, toDateTime('2024-01-01 00:00:00', 'UTC')) AS pair,
+                map('key', number) AS m,
+                if(number = 0, NULL, number) AS nullable
+            FROM numbers(%(count)s)
+        """
+        assert async_to_sync(async_execute)(query, {"count": 3}, with_column_types=True) == sync_execute(
+            query, {"count": 3}, with_column_types=True
+        )
+
+    def test_raises_the_same_errors(self):
+        with self.assertRaises(Exception) as sync_error:
+            sync_execute("SELECT throwIf(1)")
+        with self.assertRaises(type(sync_error.exception)):
+            async_to_sync(async_execute)("SELECT throwIf(1)")
@@ -0,0 +1,11 @@
+from posthog.clickhouse.client.connection import NodeRole
+from posthog.clickhouse.client.migration_tools import run_sql_with_exceptions
+from posthog.models.trends_rollup.sql import (
+    TRENDS_ROLLUP_DAILY_SQL,
+    TRENDS_ROLLUP_HOURLY_SQL,
+)
+
+operations = [
+    run_sql_with_exceptions(TRENDS_ROLLUP_DAILY_SQL(), node_role=NodeRole.ALL),
+    run_sql_with_exceptions(TRENDS_ROLLUP_HOURLY_SQL(), node_role=NodeRole.ALL),
+]
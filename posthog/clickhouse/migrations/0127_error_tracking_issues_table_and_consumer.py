@@ -0,0 +1,12 @@
+from posthog.clickhouse.client.migration_tools import run_sql_with_exceptions
+from posthog.models.error_tracking.sql import (
+    ERROR_TRACKING_ISSUES_TABLE_SQL,
+    KAFKA_ERROR_TRACKING_ISSUES_TABLE_SQL,
+    ERROR_TRACKING_ISSUES_MV_SQL,
+)
+
+operations = [
+    run_sql_with_exceptions(ERROR_TRACKING_ISSUES_TABLE_SQL()),
+    run_sql_with_exceptions(KAFKA_ERROR_TRACKING_ISSUES_TABLE_SQL()),
+    run_sql_with_exceptions(ERROR_TRACKING_ISSUES_MV_SQL),
+]
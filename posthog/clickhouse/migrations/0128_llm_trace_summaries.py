@@ -0,0 +1,15 @@
+from posthog.clickhouse.client.connection import NodeRole
+from posthog.clickhouse.client.migration_tools import run_sql_with_exceptions
+from posthog.models.ai.llm_trace_summaries import (
+    DISTRIBUTED_LLM_TRACE_SUMMARIES_TABLE_SQL,
+    LLM_TRACE_SUMMARIES_MV_SQL,
+    LLM_TRACE_SUMMARIES_TABLE_SQL,
+    WRITABLE_LLM_TRACE_SUMMARIES_TABLE_SQL,
+)
+
+operations = [
+    run_sql_with_exceptions(LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=False)),
+    run_sql_with_exceptions(WRITABLE_LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=False)),
+    run_sql_with_exceptions(DISTRIBUTED_LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=False), node_role=NodeRole.ALL),
+    run_sql_with_exceptions(LLM_TRACE_SUMMARIES_MV_SQL(on_cluster=False)),
+]
@@ -0,0 +1,7 @@
+from posthog.clickhouse.client.connection import NodeRole
+from posthog.clickhouse.client.migration_tools import run_sql_with_exceptions
+from posthog.models.trends_rollup.sql import TRENDS_ROLLUP_WATERMARKS_SQL
+
+operations = [
+    run_sql_with_exceptions(TRENDS_ROLLUP_WATERMARKS_SQL(), node_role=NodeRole.ALL),
+]
@@ -138,6 +138,8 @@ class QueryTags(BaseModel):
 
     has_joins: Optional[bool] = None
     has_json_operations: Optional[bool] = None
+    # (table, table column, property name) of every property a HogQL query reads out of JSON
+    property_accesses: Optional[list[tuple[str, str, str]]] = None
 
     modifiers: Optional[object] = None
     number_of_entities: Optional[int] = None
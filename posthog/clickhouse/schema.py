@@ -23,6 +23,12 @@ from posthog.heatmaps.sql import (
     KAFKA_HEATMAPS_TABLE_SQL,
     WRITABLE_HEATMAPS_TABLE_SQL,
 )
+from posthog.models.ai.llm_trace_summaries import (
+    DISTRIBUTED_LLM_TRACE_SUMMARIES_TABLE_SQL,
+    LLM_TRACE_SUMMARIES_MV_SQL,
+    LLM_TRACE_SUMMARIES_TABLE_SQL,
+    WRITABLE_LLM_TRACE_SUMMARIES_TABLE_SQL,
+)
 from posthog.models.ai.pg_embeddings import (
     PG_EMBEDDINGS_TABLE_SQL,
 )
@@ -54,7 +60,10 @@ from posthog.models.cohort.sql import (
 from posthog.models.error_tracking.sql import (
     ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_MV_SQL,
     ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_TABLE_SQL,
+    ERROR_TRACKING_ISSUES_MV_SQL,
+    ERROR_TRACKING_ISSUES_TABLE_SQL,
     KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_TABLE_SQL,
+    KAFKA_ERROR_TRACKING_ISSUES_TABLE_SQL,
 )
 from posthog.models.event.sql import (
     DISTRIBUTED_EVENTS_RECENT_TABLE_SQL,
@@ -120,6 +129,11 @@ from posthog.models.sessions.sql import (
     SESSIONS_VIEW_SQL,
     WRITABLE_SESSIONS_TABLE_SQL,
 )
+from posthog.models.trends_rollup.sql import (
+    TRENDS_ROLLUP_DAILY_SQL,
+    TRENDS_ROLLUP_HOURLY_SQL,
+    TRENDS_ROLLUP_WATERMARKS_SQL,
+)
 from posthog.models.web_preaggregated.sql import (
     WEB_STATS_COMBINED_VIEW_SQL,
     WEB_BOUNCES_COMBINED_VIEW_SQL,
@@ -163,6 +177,7 @@ CREATE_MERGETREE_TABLE_QUERIES = (
     PERSON_DISTINCT_ID2_TABLE_SQL,
     PERSON_DISTINCT_ID_OVERRIDES_TABLE_SQL,
     ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_TABLE_SQL,
+    ERROR_TRACKING_ISSUES_TABLE_SQL,
     PLUGIN_LOG_ENTRIES_TABLE_SQL,
     SESSION_RECORDING_EVENTS_TABLE_SQL,
     INGESTION_WARNINGS_DATA_TABLE_SQL,
@@ -181,6 +196,10 @@ CREATE_MERGETREE_TABLE_QUERIES = (
     WEB_BOUNCES_DAILY_SQL,
     WEB_STATS_HOURLY_SQL,
     WEB_BOUNCES_HOURLY_SQL,
+    TRENDS_ROLLUP_DAILY_SQL,
+    TRENDS_ROLLUP_HOURLY_SQL,
+    TRENDS_ROLLUP_WATERMARKS_SQL,
+    LLM_TRACE_SUMMARIES_TABLE_SQL,
 )
 CREATE_DISTRIBUTED_TABLE_QUERIES = (
     WRITABLE_EVENTS_TABLE_SQL,
@@ -201,6 +220,8 @@ CREATE_DISTRIBUTED_TABLE_QUERIES = (
     DISTRIBUTED_RAW_SESSIONS_TABLE_SQL,
     WRITABLE_HEATMAPS_TABLE_SQL,
     DISTRIBUTED_HEATMAPS_TABLE_SQL,
+    WRITABLE_LLM_TRACE_SUMMARIES_TABLE_SQL,
+    DISTRIBUTED_LLM_TRACE_SUMMARIES_TABLE_SQL,
     DISTRIBUTED_SYSTEM_PROCESSES_TABLE_SQL,
 )
 CREATE_KAFKA_TABLE_QUERIES = (
@@ -215,6 +236,7 @@ CREATE_KAFKA_TABLE_QUERIES = (
     KAFKA_PERSON_DISTINCT_ID2_TABLE_SQL,
     KAFKA_PERSON_DISTINCT_ID_OVERRIDES_TABLE_SQL,
     KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_TABLE_SQL,
+    KAFKA_ERROR_TRACKING_ISSUES_TABLE_SQL,
     KAFKA_PLUGIN_LOG_ENTRIES_TABLE_SQL,
     KAFKA_SESSION_RECORDING_EVENTS_TABLE_SQL,
     KAFKA_INGESTION_WARNINGS_TABLE_SQL,
@@ -237,6 +259,7 @@ CREATE_MV_TABLE_QUERIES = (
     PERSON_DISTINCT_ID2_MV_SQL,
     PERSON_DISTINCT_ID_OVERRIDES_MV_SQL,
     ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_MV_SQL,
+    ERROR_TRACKING_ISSUES_MV_SQL,
     PLUGIN_LOG_ENTRIES_TABLE_MV_SQL,
     SESSION_RECORDING_EVENTS_TABLE_MV_SQL,
     INGESTION_WARNINGS_MV_TABLE_SQL,
@@ -248,6 +271,7 @@ CREATE_MV_TABLE_QUERIES = (
     SESSIONS_TABLE_MV_SQL,
     RAW_SESSIONS_TABLE_MV_SQL,
     HEATMAPS_TABLE_MV_SQL,
+    LLM_TRACE_SUMMARIES_MV_SQL,
 )
 
 CREATE_TABLE_QUERIES = (
@@ -1,11 +1,16 @@
 import json
-from copy import deepcopy
 from typing import Optional, cast
 from collections.abc import Callable
 
+from django.conf import settings
 from django.db.models.functions.comparison import Coalesce
 
 from posthog.exceptions_capture import capture_exception
+from posthog.hogql.autocomplete_index import (
+    AutocompleteIndex,
+    get_autocomplete_index,
+    resolve_table_field_traversers,
+)
 from posthog.hogql.context import HogQLContext
 from posthog.hogql.database.database import HOGQL_CHARACTERS_TO_BE_WRAPPED, Database, create_hogql_database
 from posthog.hogql.database.models import (
@@ -250,36 +255,6 @@ def get_tables_aliases(query: ast.SelectQuery, context: HogQLContext) -> dict[st
     return tables
 
 
-# Replaces all ast.FieldTraverser with the underlying node
-def resolve_table_field_traversers(table: Table, context: HogQLContext) -> Table:
-    new_table = deepcopy(table)
-    new_fields: dict[str, FieldOrTable] = {}
-    for key, field in list(new_table.fields.items()):
-        if not isinstance(field, ast.FieldTraverser):
-            new_fields[key] = field
-            continue
-
-        current_table_or_field: FieldOrTable = new_table
-        for chain in field.chain:
-            if isinstance(current_table_or_field, Table):
-                chain_field = current_table_or_field.fields.get(str(chain))
-            elif isinstance(current_table_or_field, LazyJoin):
-                chain_field = current_table_or_field.resolve_table(context).fields.get(str(chain))
-            elif isinstance(current_table_or_field, DatabaseField):
-                chain_field = current_table_or_field
-            else:
-                # Cant find the field, default back
-                new_fields[key] = field
-                break
-
-            if chain_field is not None:
-                current_table_or_field = chain_field
-                new_fields[key] = chain_field
-
-    new_table.fields = new_fields
-    return new_table
-
-
 def append_table_field_to_response(
     table: Table, suggestions: list[AutocompleteCompletionItem], language: str, context: HogQLContext
 ) -> None:
@@ -387,8 +362,13 @@ def get_hogql_autocomplete(
     response = HogQLAutocompleteResponse(suggestions=[], incomplete_list=False)
     timings = HogQLTimings()
 
+    autocomplete_index: Optional[AutocompleteIndex] = None
     if database_arg is not None:
         database = database_arg
+    elif settings.HOGQL_AUTOCOMPLETE_INDEX_ENABLED:
+        with timings.measure("autocomplete_index"):
+            autocomplete_index = get_autocomplete_index(team)
+        database = autocomplete_index.database
     else:
         database = create_hogql_database(team=team, timings=timings)
 
@@ -556,7 +536,11 @@ def get_hogql_autocomplete(
                         is_last_part = index >= (chain_len - 2)
 
                         # Replaces all ast.FieldTraverser with the underlying node
-                        last_table = resolve_table_field_traversers(last_table, context)
+                        last_table = (
+                            autocomplete_index.resolve_table_field_traversers(last_table, context)
+                            if autocomplete_index is not None
+                            else resolve_table_field_traversers(last_table, context)
+                        )
 
                         if is_last_part:
                             if last_table.fields.get(str(chain_part)) is None:
@@ -588,24 +572,36 @@ def get_hogql_autocomplete(
                                     if match_term == MATCH_ANY_CHARACTER:
                                         match_term = ""
 
-                                    with timings.measure("property_filter"):
-                                        property_query = PropertyDefinition.objects.alias(
-                                            effective_project_id=Coalesce(
-                                                "project_id", "team_id", output_field=models.BigIntegerField()
+                                    with timings.measure("property_index"):
+                                        indexed_properties = (
+                                            autocomplete_index.find_properties(
+                                                property_type, match_term, PROPERTY_DEFINITION_LIMIT
                                             )
-                                        ).filter(
-                                            effective_project_id=context.team.project_id,  # type: ignore
-                                            name__contains=match_term,
-                                            type=property_type,
+                                            if autocomplete_index is not None
+                                            else None
                                         )
 
-                                    with timings.measure("property_count"):
-                                        total_property_count = property_query.count()
+                                    if indexed_properties is not None:
+                                        properties, total_property_count = indexed_properties
+                                    else:
+                                        with timings.measure("property_filter"):
+                                            property_query = PropertyDefinition.objects.alias(
+                                                effective_project_id=Coalesce(
+                                                    "project_id", "team_id", output_field=models.BigIntegerField()
+                                                )
+                                            ).filter(
+                                                effective_project_id=context.team.project_id,  # type: ignore
+                                                name__contains=match_term,
+                                                type=property_type,
+                                            )
 
-                                    with timings.measure("property_get_values"):
-                                        properties = property_query[:PROPERTY_DEFINITION_LIMIT].values(
-                                            "name", "property_type"
-                                        )
+                                        with timings.measure("property_count"):
+                                            total_property_count = property_query.count()
+
+                                        with timings.measure("property_get_values"):
+                                            properties = property_query[:PROPERTY_DEFINITION_LIMIT].values(
+                                                "name", "property_type"
+                                            )
 
                                     extend_responses(
                                         keys=[prop["name"] for prop in properties],
@@ -0,0 +1,204 @@
+import dataclasses
+import threading
+import time
+from copy import deepcopy
+from typing import Any, Optional
+
+from cachetools import LRUCache
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models.functions.comparison import Coalesce
+
+from posthog.hogql import ast
+from posthog.hogql.context import HogQLContext
+from posthog.hogql.database.database import Database, create_hogql_database
+from posthog.hogql.database.models import DatabaseField, FieldOrTable, LazyJoin, Table
+from posthog.hogql.transforms.property_type_catalog import PROPERTY_TYPE_CATALOG_VERSION_KEY
+from posthog.models.team.team import Team
+
+AUTOCOMPLETE_SCHEMA_VERSION_KEY = "hogql_autocomplete_schema_version:{team_id}"
+
+
+@dataclasses.dataclass
+class AutocompleteProperties:
+    """The property definitions of a project, sorted by name per PropertyDefinition.Type."""
+
+    version: int
+    loaded_at: float
+    # (name, property_type) pairs
+    by_type: dict[int, list[tuple[str, Optional[str]]]]
+    # False when the project has more definitions than we're willing to hold in memory
+    complete: bool = True
+
+
+@dataclasses.dataclass
+class AutocompleteSchema:
+    """The HogQL database of a team, with the field traversers of its tables resolved as they're completed."""
+
+    version: int
+    loaded_at: float
+    database: Database
+    # Keyed by the id of the database's own tables, which live as long as the database does
+    resolved_tables: dict[int, Table] = dataclasses.field(default_factory=dict)
+    table_ids: set[int] = dataclasses.field(default_factory=set)
+
+
+@dataclasses.dataclass(frozen=True)
+class AutocompleteIndex:
+    """
+    What autocomplete looks up on every keystroke: the team's database and its project's property names. Each part
+    is versioned separately, so a new property definition doesn't rebuild the database and vice versa.
+    """
+
+    schema: AutocompleteSchema
+    properties: AutocompleteProperties
+
+    @property
+    def database(self) -> Database:
+        return self.schema.database
+
+    def resolve_table_field_traversers(self, table: Table, context: HogQLContext) -> Table:
+        if id(table) not in self.schema.table_ids:
+            return resolve_table_field_traversers(table, context)
+        resolved = self.schema.resolved_tables.get(id(table))
+        if resolved is None:
+            resolved = resolve_table_field_traversers(table, context)
+            self.schema.resolved_tables[id(table)] = resolved
+        return resolved
+
+    def find_properties(
+        self, property_type: int, match_term: str, limit: int
+    ) -> Optional[tuple[list[dict[str, Any]], int]]:
+        """
+        Returns up to `limit` properties of the type whose name contains the term, and how many match in total.
+        Returns None if the project has too many definitions to be indexed, in which case callers query them.
+        """
+        if not self.properties.complete:
+            return None
+        matches = [(name, type) for name, type in self.properties.by_type.get(property_type, []) if match_term in name]
+        return [{"name": name, "property_type": type} for name, type in matches[:limit]], len(matches)
+
+
+# Replaces all ast.FieldTraverser with the underlying node
+def resolve_table_field_traversers(table: Table, context: HogQLContext) -> Table:
+    new_table = deepcopy(table)
+    new_fields: dict[str, FieldOrTable] = {}
+    for key, field in list(new_table.fields.items()):
+        if not isinstance(field, ast.FieldTraverser):
+            new_fields[key] = field
+            continue
+
+        current_table_or_field: FieldOrTable = new_table
+        for chain in field.chain:
+            if isinstance(current_table_or_field, Table):
+                chain_field = current_table_or_field.fields.get(str(chain))
+            elif isinstance(current_table_or_field, LazyJoin):
+                chain_field = current_table_or_field.resolve_table(context).fields.get(str(chain))
+            elif isinstance(current_table_or_field, DatabaseField):
+                chain_field = current_table_or_field
+            else:
+                # Cant find the field, default back
+                new_fields[key] = field
+                break
+
+            if chain_field is not None:
+                current_table_or_field = chain_field
+                new_fields[key] = chain_field
+
+    new_table.fields = new_fields
+    return new_table
+
+
+_schemas: LRUCache[int, AutocompleteSchema] = LRUCache(maxsize=settings.HOGQL_AUTOCOMPLETE_INDEX_MAX_TEAMS)
+_properties: LRUCache[int, AutocompleteProperties] = LRUCache(maxsize=settings.HOGQL_AUTOCOMPLETE_INDEX_MAX_TEAMS)
+_index_lock = threading.Lock()
+
+
+def _is_stale(entry: AutocompleteSchema | AutocompleteProperties | None, version: int) -> bool:
+    return (
+        entry is None
+        or entry.version != version
+        or time.monotonic() - entry.loaded_at > settings.HOGQL_AUTOCOMPLETE_INDEX_TTL_SECONDS
+    )
+
+
+def _load_schema(team: Team, version: int) -> AutocompleteSchema:
+    database = create_hogql_database(team=team)
+    table_ids = set()
+    for table_name in database.get_all_tables():
+        try:
+            table_ids.add(id(database.get_table(table_name)))
+        except Exception:
+            pass
+    return AutocompleteSchema(version=version, loaded_at=time.monotonic(), database=database, table_ids=table_ids)
+
+
+def _load_properties(project_id: int, version: int) -> AutocompleteProperties:
+    from posthog.models import PropertyDefinition
+
+    max_definitions = settings.HOGQL_AUTOCOMPLETE_INDEX_MAX_PROPERTIES
+    rows = list(
+        PropertyDefinition.objects.alias(
+            effective_project_id=Coalesce("project_id", "team_id", output_field=models.BigIntegerField())
+        )
+        .filter(effective_project_id=project_id)  # type: ignore
+        .order_by("name")
+        .values_list("name", "type", "property_type")[: max_definitions + 1]
+    )
+    if len(rows) > max_definitions:
+        return AutocompleteProperties(version=version, loaded_at=time.monotonic(), by_type={}, complete=False)
+
+    by_type: dict[int, list[tuple[str, Optional[str]]]] = {}
+    for name, type, property_type in rows:
+        by_type.setdefault(type, []).append((name, property_type))
+    return AutocompleteProperties(version=version, loaded_at=time.monotonic(), by_type=by_type)
+
+
+def get_autocomplete_index(team: Team) -> AutocompleteIndex:
+    """
+    Returns the in-process autocomplete index of the team. Its database is rebuilt when the team's warehouse schema
+    version changes, and its properties are reloaded when the project's property definitions version changes. Both
+    versions are shared through the cache, so every process picks up changes on its next keystroke. Both parts are
+    also reloaded after HOGQL_AUTOCOMPLETE_INDEX_TTL_SECONDS, which bounds staleness for changes that don't bump a
+    version (e.g. definitions written by ingestion).
+    """
+    project_id = team.project_id or team.pk
+    versions = cache.get_many(
+        [
+            AUTOCOMPLETE_SCHEMA_VERSION_KEY.format(team_id=team.pk),
+            PROPERTY_TYPE_CATALOG_VERSION_KEY.format(project_id=project_id),
+        ]
+    )
+    schema_version = versions.get(AUTOCOMPLETE_SCHEMA_VERSION_KEY.format(team_id=team.pk)) or 0
+    properties_version = versions.get(PROPERTY_TYPE_CATALOG_VERSION_KEY.format(project_id=project_id)) or 0
+
+    with _index_lock:
+        schema = _schemas.get(team.pk)
+        properties = _properties.get(project_id)
+
+    if _is_stale(schema, schema_version):
+        schema = _load_schema(team, schema_version)
+        with _index_lock:
+            _schemas[team.pk] = schema
+    if _is_stale(properties, properties_version):
+        properties = _load_properties(project_id, properties_version)
+        with _index_lock:
+            _properties[project_id] = properties
+
+    assert schema is not None and properties is not None
+    return AutocompleteIndex(schema=schema, properties=properties)
+
+
+def invalidate_autocomplete_schema(team_id: int) -> None:
+    """Makes every process rebuild the team's autocomplete database on its next use."""
+    key = AUTOCOMPLETE_SCHEMA_VERSION_KEY.format(team_id=team_id)
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between add and incr
+        cache.set(key, 1, timeout=None)
+
+    with _index_lock:
+        _schemas.pop(team_id, None)
@@ -60,6 +60,8 @@ class HogQLContext:
     debug: bool = False
 
     property_swapper: Optional["PropertySwapper"] = None
+    # Properties read out of JSON columns while printing ClickHouse SQL, as (table, table column, property name)
+    property_accesses: set[tuple[str, str, str]] = field(default_factory=set)
 
     def __post_init__(self):
         if self.team:
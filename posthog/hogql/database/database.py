@@ -12,6 +12,7 @@ from typing import (
 )
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from django.conf import settings
 from django.db.models import Prefetch, Q
 from pydantic import BaseModel, ConfigDict
 
@@ -51,10 +52,15 @@ from posthog.hogql.database.schema.error_tracking_issue_fingerprint_overrides im
     RawErrorTrackingIssueFingerprintOverridesTable,
     join_with_error_tracking_issue_fingerprint_overrides_table,
 )
+from posthog.hogql.database.schema.error_tracking_issues import (
+    ErrorTrackingIssuesTable,
+    RawErrorTrackingIssuesTable,
+)
 from posthog.hogql.database.schema.events import EventsTable
 from posthog.hogql.database.schema.exchange_rate import ExchangeRateTable
 from posthog.hogql.database.schema.groups import GroupsTable, RawGroupsTable
 from posthog.hogql.database.schema.heatmaps import HeatmapsTable
+from posthog.hogql.database.schema.llm_trace_summaries import LLMTraceSummariesTable
 from posthog.hogql.database.schema.log_entries import (
     BatchExportLogEntriesTable,
     LogEntriesTable,
@@ -93,6 +99,7 @@ from posthog.hogql.database.schema.sessions_v2 import (
     join_events_table_to_sessions_table_v2,
 )
 from posthog.hogql.database.schema.static_cohort_people import StaticCohortPeople
+from posthog.hogql.database.schema.trends_rollup import TrendsRollupDailyTable, TrendsRollupHourlyTable
 from posthog.hogql.database.schema.web_analytics_preaggregated import (
     WebStatsDailyTable,
     WebBouncesDailyTable,
@@ -101,6 +108,12 @@ from posthog.hogql.database.schema.web_analytics_preaggregated import (
     WebStatsCombinedTable,
     WebBouncesCombinedTable,
 )
+from posthog.hogql.database.serialization_cache import (
+    SerializedTables,
+    get_serialized_tables,
+    set_serialized_tables,
+    table_fingerprint,
+)
 from posthog.hogql.errors import QueryError, ResolutionError
 from posthog.hogql.parser import parse_expr
 from posthog.hogql.timings import HogQLTimings
@@ -144,6 +157,7 @@ class Database(BaseModel):
     error_tracking_issue_fingerprint_overrides: ErrorTrackingIssueFingerprintOverridesTable = (
         ErrorTrackingIssueFingerprintOverridesTable()
     )
+    error_tracking_issues: ErrorTrackingIssuesTable = ErrorTrackingIssuesTable()
 
     session_replay_events: SessionReplayEventsTable = SessionReplayEventsTable()
     cohort_people: CohortPeople = CohortPeople()
@@ -165,6 +179,13 @@ class Database(BaseModel):
     web_stats_combined: WebStatsCombinedTable = WebStatsCombinedTable()
     web_bounces_combined: WebBouncesCombinedTable = WebBouncesCombinedTable()
 
+    # Trends rollup tables (internal use only)
+    trends_rollup_daily: TrendsRollupDailyTable = TrendsRollupDailyTable()
+    trends_rollup_hourly: TrendsRollupHourlyTable = TrendsRollupHourlyTable()
+
+    # LLM observability trace summaries (internal use only)
+    llm_trace_summaries: LLMTraceSummariesTable = LLMTraceSummariesTable()
+
     raw_session_replay_events: RawSessionReplayEventsTable = RawSessionReplayEventsTable()
     raw_person_distinct_ids: RawPersonDistinctIdsTable = RawPersonDistinctIdsTable()
     raw_persons: RawPersonsTable = RawPersonsTable()
@@ -174,6 +195,7 @@ class Database(BaseModel):
     raw_error_tracking_issue_fingerprint_overrides: RawErrorTrackingIssueFingerprintOverridesTable = (
         RawErrorTrackingIssueFingerprintOverridesTable()
     )
+    raw_error_tracking_issues: RawErrorTrackingIssuesTable = RawErrorTrackingIssuesTable()
     raw_sessions: Union[RawSessionsTableV1, RawSessionsTableV2] = RawSessionsTableV1()
     raw_query_log: RawQueryLogTable = RawQueryLogTable()
     pg_embeddings: PgEmbeddingsTable = PgEmbeddingsTable()
@@ -889,6 +911,31 @@ def serialize_database(
     if context.team_id is None:
         raise ResolutionError("Must provide team_id to serialize_database")
 
+    # Tables whose fingerprint hasn't changed since the last serialization reuse their serialized fields
+    use_cache = settings.HOGQL_SERIALIZED_DATABASE_CACHE_ENABLED
+    previous_tables = get_serialized_tables(context.team_id) if use_cache else {}
+    serialized_tables: SerializedTables = {}
+
+    def serialize_table_fields(
+        table_key: str,
+        field_input: dict[str, Any],
+        db_columns: Optional[DataWarehouseTableColumns] = None,
+        table_type: Literal["posthog"] | Literal["external"] = "posthog",
+    ) -> dict[str, DatabaseSchemaField]:
+        if not use_cache:
+            fields = serialize_fields(field_input, context, table_key.split("."), db_columns, table_type=table_type)
+            return {field.name: field for field in fields}
+
+        fingerprint = table_fingerprint(table_key, field_input, context, db_columns, table_type)
+        previous = previous_tables.get(table_key)
+        if previous is not None and previous[0] == fingerprint:
+            fields_dict = previous[1]
+        else:
+            fields = serialize_fields(field_input, context, table_key.split("."), db_columns, table_type=table_type)
+            fields_dict = {field.name: field for field in fields}
+        serialized_tables[table_key] = (fingerprint, fields_dict)
+        return dict(fields_dict)
+
     # PostHog Tables
     posthog_tables = context.database.get_posthog_tables()
     for table_key in posthog_tables:
@@ -899,8 +946,7 @@ def serialize_database(
         elif isinstance(table, Table):
             field_input = table.fields
 
-        fields = serialize_fields(field_input, context, table_key.split("."), table_type="posthog")
-        fields_dict = {field.name: field for field in fields}
+        fields_dict = serialize_table_fields(table_key, field_input, table_type="posthog")
         tables[table_key] = DatabaseSchemaPostHogTable(fields=fields_dict, id=table_key, name=table_key)
 
     # Data Warehouse Tables and Views - Fetch all related data in one go
@@ -980,10 +1026,7 @@ def serialize_database(
         if isinstance(table, Table):
             field_input = table.fields
 
-        fields = serialize_fields(
-            field_input, context, table_key.split("."), warehouse_table.columns, table_type="external"
-        )
-        fields_dict = {field.name: field for field in fields}
+        fields_dict = serialize_table_fields(table_key, field_input, warehouse_table.columns, table_type="external")
 
         tables[table_key] = DatabaseSchemaDataWarehouseTable(
             fields=fields_dict,
@@ -1017,8 +1060,7 @@ def serialize_database(
         if isinstance(view, TableGroup):
             continue
 
-        fields = serialize_fields(view.fields, context, view_name.split("."), table_type="external")
-        fields_dict = {field.name: field for field in fields}
+        fields_dict = serialize_table_fields(view_name, view.fields, table_type="external")
 
         if isinstance(view, RevenueAnalyticsBaseView):
             tables[view_name] = DatabaseSchemaManagedViewTable(
@@ -1048,6 +1090,10 @@ def serialize_database(
             row_count=row_count,
         )
 
+    if use_cache:
+        # Replaces the previous serialization, so removed tables don't linger
+        set_serialized_tables(context.team_id, serialized_tables)
+
     return tables
 
 
@@ -0,0 +1,73 @@
+from posthog.hogql.ast import SelectQuery
+from posthog.hogql.constants import HogQLQuerySettings
+from posthog.hogql.context import HogQLContext
+
+from posthog.hogql.database.argmax import argmax_select
+from posthog.hogql.database.models import (
+    Table,
+    IntegerDatabaseField,
+    StringDatabaseField,
+    DateTimeDatabaseField,
+    BooleanDatabaseField,
+    LazyTable,
+    FieldOrTable,
+    LazyTableToAdd,
+)
+
+ERROR_TRACKING_ISSUES_FIELDS: dict[str, FieldOrTable] = {
+    "team_id": IntegerDatabaseField(name="team_id", nullable=False),
+    "id": StringDatabaseField(name="id", nullable=False),
+    "status": StringDatabaseField(name="status", nullable=False),
+    "name": StringDatabaseField(name="name", nullable=True),
+    "description": StringDatabaseField(name="description", nullable=True),
+    "assigned_user_id": IntegerDatabaseField(name="assigned_user_id", nullable=True),
+    "assigned_role_id": StringDatabaseField(name="assigned_role_id", nullable=True),
+    "created_at": DateTimeDatabaseField(name="created_at", nullable=False),
+}
+
+
+def select_from_error_tracking_issues_table(requested_fields: dict[str, list[str | int]]):
+    # Always include "id", as it's the key we join on
+    if "id" not in requested_fields:
+        requested_fields = {**requested_fields, "id": ["id"]}
+    select = argmax_select(
+        table_name="raw_error_tracking_issues",
+        select_fields=requested_fields,
+        group_fields=["id"],
+        argmax_field="version",
+        deleted_field="is_deleted",
+    )
+    select.settings = HogQLQuerySettings(optimize_aggregation_in_order=True)
+    return select
+
+
+class RawErrorTrackingIssuesTable(Table):
+    fields: dict[str, FieldOrTable] = {
+        **ERROR_TRACKING_ISSUES_FIELDS,
+        "is_deleted": BooleanDatabaseField(name="is_deleted", nullable=False),
+        "version": IntegerDatabaseField(name="version", nullable=False),
+    }
+
+    def to_printed_clickhouse(self, context):
+        return "error_tracking_issues"
+
+    def to_printed_hogql(self):
+        return "raw_error_tracking_issues"
+
+
+class ErrorTrackingIssuesTable(LazyTable):
+    fields: dict[str, FieldOrTable] = ERROR_TRACKING_ISSUES_FIELDS
+
+    def lazy_select(
+        self,
+        table_to_add: LazyTableToAdd,
+        context: HogQLContext,
+        node: SelectQuery,
+    ):
+        return select_from_error_tracking_issues_table(table_to_add.fields_accessed)
+
+    def to_printed_clickhouse(self, context):
+        return "error_tracking_issues"
+
+    def to_printed_hogql(self):
+        return "error_tracking_issues"
@@ -0,0 +1,35 @@
+from posthog.hogql.database.models import (
+    DatabaseField,
+    DateTimeDatabaseField,
+    FieldOrTable,
+    FloatDatabaseField,
+    IntegerDatabaseField,
+    StringDatabaseField,
+    Table,
+)
+
+
+class LLMTraceSummariesTable(Table):
+    fields: dict[str, FieldOrTable] = {
+        "team_id": IntegerDatabaseField(name="team_id", nullable=False),
+        "trace_id": StringDatabaseField(name="trace_id", nullable=False),
+        "start_hour": DateTimeDatabaseField(name="start_hour", nullable=False),
+        "min_timestamp": DateTimeDatabaseField(name="min_timestamp", nullable=False),
+        "max_timestamp": DateTimeDatabaseField(name="max_timestamp", nullable=False),
+        "distinct_id": DatabaseField(name="distinct_id", nullable=False),
+        "total_latency": FloatDatabaseField(name="total_latency", nullable=True),
+        "input_tokens": FloatDatabaseField(name="input_tokens", nullable=True),
+        "output_tokens": FloatDatabaseField(name="output_tokens", nullable=True),
+        "input_cost": FloatDatabaseField(name="input_cost", nullable=True),
+        "output_cost": FloatDatabaseField(name="output_cost", nullable=True),
+        "total_cost": FloatDatabaseField(name="total_cost", nullable=True),
+        "generation_count": IntegerDatabaseField(name="generation_count", nullable=False),
+        "error_count": IntegerDatabaseField(name="error_count", nullable=False),
+        "trace_name": StringDatabaseField(name="trace_name", nullable=True),
+    }
+
+    def to_printed_clickhouse(self, context):
+        return "llm_trace_summaries"
+
+    def to_printed_hogql(self):
+        return "llm_trace_summaries"
@@ -0,0 +1,36 @@
+from posthog.hogql.database.models import (
+    DatabaseField,
+    DateTimeDatabaseField,
+    FieldOrTable,
+    IntegerDatabaseField,
+    StringDatabaseField,
+    Table,
+)
+
+trends_rollup_fields: dict[str, FieldOrTable] = {
+    "period_bucket": DateTimeDatabaseField(name="period_bucket"),
+    "team_id": IntegerDatabaseField(name="team_id"),
+    "event": StringDatabaseField(name="event"),
+    "events_count_state": DatabaseField(name="events_count_state"),
+    "persons_uniq_exact_state": DatabaseField(name="persons_uniq_exact_state"),
+}
+
+
+class TrendsRollupDailyTable(Table):
+    fields: dict[str, FieldOrTable] = trends_rollup_fields
+
+    def to_printed_clickhouse(self, context):
+        return "trends_rollup_daily"
+
+    def to_printed_hogql(self):
+        return "trends_rollup_daily"
+
+
+class TrendsRollupHourlyTable(Table):
+    fields: dict[str, FieldOrTable] = trends_rollup_fields
+
+    def to_printed_clickhouse(self, context):
+        return "trends_rollup_hourly"
+
+    def to_printed_hogql(self):
+        return "trends_rollup_hourly"
@@ -0,0 +1,75 @@
+import hashlib
+import json
+import threading
+from typing import Any, Optional
+
+from cachetools import LRUCache
+from django.conf import settings
+
+from posthog.hogql.context import HogQLContext
+from posthog.hogql.database.models import (
+    ExpressionField,
+    FieldOrTable,
+    FieldTraverser,
+    LazyJoin,
+    SavedQuery,
+    VirtualTable,
+)
+from posthog.schema import DatabaseSchemaField
+
+# The serialized fields of each table of a team, with the fingerprint of the table they were serialized from
+SerializedTables = dict[str, tuple[str, dict[str, DatabaseSchemaField]]]
+
+_serialized_tables: LRUCache[int, SerializedTables] = LRUCache(maxsize=settings.HOGQL_SERIALIZED_DATABASE_MAX_TEAMS)
+_serialized_tables_lock = threading.Lock()
+
+
+def _field_fingerprint(field: Any, context: HogQLContext) -> Any:
+    hidden = field.hidden if isinstance(field, FieldOrTable) else False
+    if isinstance(field, LazyJoin):
+        resolved_table = field.resolve_table(context)
+        return (
+            "LazyJoin",
+            hidden,
+            resolved_table.to_printed_hogql(),
+            str(resolved_table.id) if isinstance(resolved_table, SavedQuery) else None,
+            [(key, type(value).__name__) for key, value in resolved_table.fields.items()],
+        )
+    if isinstance(field, VirtualTable):
+        return ("VirtualTable", hidden, field.to_printed_hogql(), list(field.fields.keys()))
+    if isinstance(field, FieldTraverser):
+        return ("FieldTraverser", hidden, field.chain)
+    if isinstance(field, ExpressionField):
+        return ("ExpressionField", hidden, repr(field.expr))
+    return (type(field).__name__, hidden)
+
+
+def table_fingerprint(
+    table_key: str,
+    field_input: dict[str, Any],
+    context: HogQLContext,
+    db_columns: Optional[dict] = None,
+    table_type: str = "posthog",
+) -> str:
+    """
+    Hashes everything `serialize_fields` reads from a table: its fields, the tables its lazy joins resolve to, and
+    the validity of its warehouse columns. It only looks at the structure of the table, so computing it is much
+    cheaper than resolving the types of its expression fields.
+    """
+    fingerprint = (
+        table_key,
+        table_type,
+        json.dumps(db_columns, sort_keys=True, default=str) if db_columns is not None else None,
+        [(key, _field_fingerprint(field, context)) for key, field in field_input.items()],
+    )
+    return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+
+def get_serialized_tables(team_id: int) -> SerializedTables:
+    with _serialized_tables_lock:
+        return _serialized_tables.get(team_id) or {}
+
+
+def set_serialized_tables(team_id: int, tables: SerializedTables) -> None:
+    with _serialized_tables_lock:
+        _serialized_tables[team_id] = tables
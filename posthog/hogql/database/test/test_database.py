@@ -7,7 +7,7 @@ from django.test import override_settings
 from parameterized import parameterized
 
 from posthog.hogql.constants import MAX_SELECT_RETURNED_ROWS
-from posthog.hogql.database.database import create_hogql_database, serialize_database
+from posthog.hogql.database.database import create_hogql_database, serialize_database, serialize_fields
 from posthog.hogql.database.models import (
     FieldTraverser,
     LazyJoin,
@@ -176,6 +176,48 @@ class TestDatabase(BaseTest, QueryMatchingTest):
         assert field.type == "string"
         assert field.schema_valid is True
 
+    @override_settings(HOGQL_SERIALIZED_DATABASE_CACHE_ENABLED=True)
+    def test_serialize_database_reuses_unchanged_tables(self):
+        credentials = DataWarehouseCredential.objects.create(access_key="blah", access_secret="blah", team=self.team)
+        for name in ["table_1", "table_2"]:
+            DataWarehouseTable.objects.create(
+                name=name,
+                format="Parquet",
+                team=self.team,
+                credential=credentials,
+                url_pattern="https://bucket.s3/data/*",
+                columns={
+                    "id": {"hogql": "StringDatabaseField", "clickhouse": "Nullable(String)", "schema_valid": True}
+                },
+            )
+
+        database = create_hogql_database(team=self.team)
+        uncached = serialize_database(HogQLContext(team_id=self.team.pk, database=database))
+        with override_settings(HOGQL_SERIALIZED_DATABASE_CACHE_ENABLED=False):
+            assert serialize_database(HogQLContext(team_id=self.team.pk, database=database)) == uncached
+
+        with patch("posthog.hogql.database.database.serialize_fields") as serialize_fields_mock:
+            cached = serialize_database(
+                HogQLContext(team_id=self.team.pk, database=create_hogql_database(team=self.team))
+            )
+        assert cached == uncached
+        serialize_fields_mock.assert_not_called()
+
+        table_2 = DataWarehouseTable.objects.get(team=self.team, name="table_2")
+        table_2.columns = {
+            **table_2.columns,
+            "count": {"hogql": "IntegerDatabaseField", "clickhouse": "Int64", "schema_valid": True},
+        }
+        table_2.save()
+
+        with patch("posthog.hogql.database.database.serialize_fields", wraps=serialize_fields) as serialize_fields_mock:
+            serialized_database = serialize_database(
+                HogQLContext(team_id=self.team.pk, database=create_hogql_database(team=self.team))
+            )
+        assert [call.args[2] for call in serialize_fields_mock.call_args_list] == [["table_2"]]
+        assert list(serialized_database["table_2"].fields.keys()) == ["id", "count"]
+        assert serialized_database["table_1"] == uncached["table_1"]
+
     def test_serialize_database_warehouse_with_deleted_joins(self):
         DataWarehouseJoin.objects.create(
             team=self.team,
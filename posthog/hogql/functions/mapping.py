@@ -722,6 +722,7 @@ HOGQL_CLICKHOUSE_FUNCTIONS: dict[str, HogQLFunctionMeta] = {
     "multiSearchFirstIndex": HogQLFunctionMeta("multiSearchFirstIndex", 2, 2),
     "multiSearchAny": HogQLFunctionMeta("multiSearchAny", 2, 2),
     "match": HogQLFunctionMeta("match", 2, 2),
+    "hasToken": HogQLFunctionMeta("hasToken", 2, 2),
     "multiMatchAny": HogQLFunctionMeta("multiMatchAny", 2, 2),
     "multiMatchAnyIndex": HogQLFunctionMeta("multiMatchAnyIndex", 2, 2),
     "multiMatchAllIndices": HogQLFunctionMeta("multiMatchAllIndices", 2, 2),
@@ -1774,6 +1775,8 @@ HOGQL_AGGREGATIONS: dict[str, HogQLFunctionMeta] = {
     "uniqIf": HogQLFunctionMeta("uniqIf", 2, None, aggregate=True),
     "uniqExact": HogQLFunctionMeta("uniqExact", 1, None, aggregate=True),
     "uniqExactIf": HogQLFunctionMeta("uniqExactIf", 2, None, aggregate=True),
+    "uniqExactState": HogQLFunctionMeta("uniqExactState", 1, None, aggregate=True),
+    "uniqExactMerge": HogQLFunctionMeta("uniqExactMerge", 1, 1, aggregate=True),
     # "uniqCombined": HogQLFunctionMeta("uniqCombined", 1, 1, aggregate=True),
     # "uniqCombinedIf": HogQLFunctionMeta("uniqCombinedIf", 2, 2, aggregate=True),
     # "uniqCombined64": HogQLFunctionMeta("uniqCombined64", 1, 1, aggregate=True),
@@ -1,7 +1,11 @@
 import dataclasses
+from time import perf_counter
 from typing import ClassVar, Optional, Union, cast
 
-from posthog.clickhouse.client import sync_execute
+from asgiref.sync import sync_to_async
+
+from posthog.clickhouse import query_tagging
+from posthog.clickhouse.client import async_execute, sync_execute
 from posthog.clickhouse.client.connection import Workload
 from posthog.clickhouse.query_tagging import tag_queries
 from posthog.errors import ExposedCHQueryError
@@ -35,6 +39,16 @@ from posthog.schema import (
 from posthog.settings import HOGQL_INCREASED_MAX_EXECUTION_TIME
 
 
+@dataclasses.dataclass(frozen=True)
+class CompiledHogQLQuery:
+    """The HogQL and ClickHouse SQL printed from one parsed and placeholder-free query."""
+
+    hogql: str
+    clickhouse: str
+    columns: list[str]
+    context: HogQLContext
+
+
 @dataclasses.dataclass
 class HogQLQueryExecutor:
     query: Union[str, ast.SelectQuery, ast.SelectSetQuery]
@@ -52,6 +66,8 @@ class HogQLQueryExecutor:
     pretty: Optional[bool] = True
     context: HogQLContext = dataclasses.field(default_factory=lambda: HogQLQueryExecutor.__uninitialized_context)
     hogql_context: Optional[HogQLContext] = None
+    # Prints the HogQL of the query as given, without the default limit, e.g. for query runners to return
+    print_hogql_before_limit: bool = False
 
     __uninitialized_context: ClassVar[HogQLContext] = HogQLContext()
 
@@ -194,6 +210,7 @@ class HogQLQueryExecutor:
                 # it's valid to reuse the hogql DB because the modifiers are the same,
                 # and if we don't we end up creating the virtual DB twice per query
                 database=self.hogql_context.database if self.hogql_context else None,
+                property_accesses=set(),
             )
             with self.timings.measure("print_ast"):
                 self.clickhouse_sql = print_ast(
@@ -213,19 +230,23 @@ class HogQLQueryExecutor:
             else:
                 raise
 
+    def _tag_clickhouse_query(self, timings_dict: dict[str, float]):
+        tag_queries(
+            team_id=self.team.pk,
+            query_type=self.query_type,
+            has_joins="JOIN" in self.clickhouse_sql,
+            has_json_operations="JSONExtract" in self.clickhouse_sql or "JSONHas" in self.clickhouse_sql,
+            timings=timings_dict,
+            modifiers=(
+                {k: v for k, v in self.modifiers.model_dump().items() if v is not None} if self.modifiers else {}
+            ),
+            property_accesses=sorted(self.clickhouse_context.property_accesses) or None,
+        )
+
     def _execute_clickhouse_query(self):
         timings_dict = self.timings.to_dict()
         with self.timings.measure("clickhouse_execute"):
-            tag_queries(
-                team_id=self.team.pk,
-                query_type=self.query_type,
-                has_joins="JOIN" in self.clickhouse_sql,
-                has_json_operations="JSONExtract" in self.clickhouse_sql or "JSONHas" in self.clickhouse_sql,
-                timings=timings_dict,
-                modifiers=(
-                    {k: v for k, v in self.modifiers.model_dump().items() if v is not None} if self.modifiers else {}
-                ),
-            )
+            self._tag_clickhouse_query(timings_dict)
 
             try:
                 self.results, self.types = sync_execute(
@@ -264,22 +285,72 @@ class HogQLQueryExecutor:
                     HogQLMetadata(language=HogLanguage.HOG_QL, query=self.hogql, debug=True), self.team
                 )
 
-    def generate_clickhouse_sql(self) -> tuple[str, HogQLContext]:
+    def compile(self) -> CompiledHogQLQuery:
+        """
+        Prints the query in both dialects. The query is parsed and has its placeholders replaced once, and the
+        ClickHouse pass reuses the database built by the HogQL pass. The resolver is dialect specific, so each
+        dialect still resolves its own copy of the AST.
+        """
         self._parse_query()
         self._process_variables()
         self._process_placeholders()
-        self._apply_limit()
+        if not self.print_hogql_before_limit:
+            self._apply_limit()
+        hogql_start = perf_counter()
         with self.timings.measure("_generate_hogql"):
             self._generate_hogql()
+        # Callers used to print the HogQL for their response in a separate pass with its own database. That pass
+        # cost about as much as this one, which is what reusing the printed HogQL saves.
+        self.timings.record("hogql_print_reused", perf_counter() - hogql_start)
+        if self.print_hogql_before_limit:
+            self._apply_limit()
         with self.timings.measure("_generate_clickhouse_sql"):
             self._generate_clickhouse_sql()
-        return self.clickhouse_sql, self.clickhouse_context
+        return CompiledHogQLQuery(
+            hogql=self.hogql,
+            clickhouse=self.clickhouse_sql,
+            columns=self.print_columns,
+            context=self.clickhouse_context,
+        )
+
+    def generate_clickhouse_sql(self) -> tuple[str, HogQLContext]:
+        compiled = self.compile()
+        return compiled.clickhouse, compiled.context
 
     def execute(self) -> HogQLQueryResponse:
-        self.generate_clickhouse_sql()
+        self.compile()
         if self.clickhouse_sql is not None:
             self._execute_clickhouse_query()
 
+        return self._response()
+
+    async def aexecute(self) -> HogQLQueryResponse:
+        """
+        Like execute, but awaits ClickHouse instead of blocking a thread on it. Compiling reads Postgres, so it runs
+        in a sync thread. Debug queries also run explain and metadata queries, so they're executed synchronously.
+        """
+        # Queries awaited together each get their own tags, so they don't overwrite each other's
+        query_tagging.query_tags.set(query_tagging.get_query_tags().model_copy(deep=True))
+        if self.debug:
+            return await sync_to_async(self.execute)()
+
+        await sync_to_async(self.generate_clickhouse_sql)()
+        if self.clickhouse_sql is not None:
+            timings_dict = self.timings.to_dict()
+            with self.timings.measure("clickhouse_execute"):
+                self._tag_clickhouse_query(timings_dict)
+                self.results, self.types = await async_execute(
+                    self.clickhouse_sql,
+                    self.clickhouse_context.values,
+                    with_column_types=True,
+                    workload=self.workload,
+                    team_id=self.team.pk,
+                    readonly=True,
+                )
+
+        return self._response()
+
+    def _response(self) -> HogQLQueryResponse:
         return HogQLQueryResponse(
             query=self.query,
             hogql=self.hogql,
@@ -297,3 +368,13 @@ class HogQLQueryExecutor:
 
 def execute_hogql_query(*args, **kwargs) -> HogQLQueryResponse:
     return HogQLQueryExecutor(*args, **kwargs).execute()
+
+
+async def aexecute_hogql_query(*args, **kwargs) -> HogQLQueryResponse:
+    # Setting up the executor reads the team's modifiers, which may query Postgres
+    executor = await sync_to_async(HogQLQueryExecutor)(*args, **kwargs)
+    return await executor.aexecute()
+
+
+def compile_hogql_query(*args, **kwargs) -> CompiledHogQLQuery:
+    return HogQLQueryExecutor(*args, **kwargs).compile()
@@ -1,5 +1,9 @@
 from typing import Optional
-from posthog.hogql import ast
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from posthog.hogql import ast, autocomplete_index
 from posthog.hogql.autocomplete import get_hogql_autocomplete
 from posthog.hogql.database.database import Database, create_hogql_database
 from posthog.hogql.database.models import StringDatabaseField
@@ -22,6 +26,12 @@ from posthog.warehouse.models.table import DataWarehouseTable
 
 
 class TestAutocomplete(ClickhouseTestMixin, APIBaseTest):
+    def setUp(self):
+        super().setUp()
+        autocomplete_index._schemas.clear()
+        autocomplete_index._properties.clear()
+        cache.clear()
+
     def _create_properties(self):
         PropertyDefinition.objects.create(
             team=self.team,
@@ -530,3 +540,48 @@ class TestAutocomplete(ClickhouseTestMixin, APIBaseTest):
         results = get_hogql_autocomplete(query=autocomplete, team=self.team)
 
         assert "events" in [suggestion.label for suggestion in results.suggestions]
+
+    @override_settings(HOGQL_AUTOCOMPLETE_INDEX_ENABLED=True)
+    def test_autocomplete_index(self):
+        self._create_properties()
+
+        results = self._select(query="select properties. from events", start=18, end=18)
+        assert [suggestion.label for suggestion in results.suggestions] == ["some_event_value"]
+        assert results.incomplete_list is False
+
+        # New definitions and warehouse tables bump the index versions, so they're suggested right away
+        PropertyDefinition.objects.create(
+            team=self.team, name="another_event_value", property_type="Numeric", type=PropertyDefinition.Type.EVENT
+        )
+        results = self._select(query="select properties. from events", start=18, end=18)
+        assert [suggestion.label for suggestion in results.suggestions] == ["another_event_value", "some_event_value"]
+        assert results.suggestions[0].detail == "Numeric"
+
+        credentials = DataWarehouseCredential.objects.create(team=self.team, access_key="key", access_secret="secret")
+        DataWarehouseTable.objects.create(
+            team=self.team,
+            name="some_table",
+            format="CSV",
+            url_pattern="http://localhost/file.csv",
+            credential=credentials,
+        )
+        results = self._select(query="select * from ", start=14, end=14)
+        assert "some_table" in [x.label for x in results.suggestions]
+
+        results = self._select(query="select pdi. from events", start=11, end=11)
+        assert "distinct_id" in [x.label for x in results.suggestions]
+
+    def test_chain_completions_with_and_without_the_index(self):
+        self._create_properties()
+
+        def labels(query: str, position: int) -> list[str]:
+            return [
+                suggestion.label for suggestion in self._select(query=query, start=position, end=position).suggestions
+            ]
+
+        for enabled in (False, True):
+            with self.subTest(enabled=enabled), override_settings(HOGQL_AUTOCOMPLETE_INDEX_ENABLED=enabled):
+                assert labels("select properties. from events", 18) == ["some_event_value"]
+                assert labels("select pdi.person.properties. from events", 29) == ["some_person_value"]
+                assert "distinct_id" in labels("select pdi. from events", 11)
+                assert "properties" in labels("select person. from events", 14)
@@ -494,6 +494,21 @@ class TestPrinter(BaseTest):
             "events.mat_nullable_property",
         )
 
+    def test_property_accesses_are_recorded(self):
+        context = HogQLContext(team_id=self.team.pk, enable_select_queries=True)
+        self._select(
+            "SELECT properties.$browser, properties.$browser FROM events WHERE properties.$os = 'Mac'", context
+        )
+        self.assertEqual(
+            context.property_accesses,
+            {("events", "properties", "$browser"), ("events", "properties", "$os")},
+        )
+
+        with materialized("events", "$browser"):
+            context = HogQLContext(team_id=self.team.pk, enable_select_queries=True)
+            self._select("SELECT properties.$browser FROM events", context)
+            self.assertEqual(context.property_accesses, set())
+
     def test_property_groups(self):
         context = HogQLContext(
             team_id=self.team.pk,
@@ -10,9 +10,10 @@ from freezegun import freeze_time
 
 from posthog.errors import InternalCHQueryError
 from posthog.hogql import ast
+from posthog.hogql.database.database import create_hogql_database
 from posthog.hogql.errors import QueryError
 from posthog.hogql.property import property_to_expr
-from posthog.hogql.query import execute_hogql_query
+from posthog.hogql.query import compile_hogql_query, execute_hogql_query
 from posthog.hogql.test.utils import pretty_print_in_tests, pretty_print_response_in_tests
 from posthog.models import Cohort
 from posthog.models.exchange_rate.currencies import SUPPORTED_CURRENCY_CODES
@@ -147,6 +148,38 @@ class TestQuery(ClickhouseTestMixin, APIBaseTest):
             assert isinstance(response.timings[0], QueryTiming)
             self.assertEqual(response.timings[-1].k, ".")
 
+    def test_query_prints_hogql_before_limit(self):
+        response = execute_hogql_query(
+            "select event from events where event = {event}",
+            placeholders={"event": ast.Constant(value="$pageview")},
+            team=self.team,
+            pretty=False,
+            print_hogql_before_limit=True,
+        )
+
+        self.assertEqual(response.hogql, "SELECT event FROM events WHERE equals(event, '$pageview')")
+        self.assertIn("LIMIT 100", response.clickhouse)
+
+    def test_compile_query_prints_both_dialects(self):
+        with patch("posthog.hogql.printer.create_hogql_database", wraps=create_hogql_database) as database_mock:
+            compiled = compile_hogql_query(
+                "select event from events where event = {event}",
+                placeholders={"event": ast.Constant(value="$pageview")},
+                team=self.team,
+                pretty=False,
+            )
+
+        self.assertEqual(compiled.hogql, "SELECT event FROM events WHERE equals(event, '$pageview') LIMIT 100")
+        self.assertIn(f"equals(events.team_id, {self.team.pk})", compiled.clickhouse)
+        self.assertEqual(compiled.columns, ["event"])
+        self.assertEqual(database_mock.call_count, 1)
+
+    def test_query_response_reuses_printed_hogql(self):
+        response = execute_hogql_query("select event from events", team=self.team)
+
+        assert response.timings is not None
+        assert any(timing.k.endswith("/hogql_print_reused") for timing in response.timings)
+
     @pytest.mark.usefixtures("unittest_snapshot")
     def test_query_joins_simple(self):
         with freeze_time("2020-01-10"):
@@ -87,3 +87,16 @@ class TestHogQLTimings(BaseTest):
             results = timings.to_dict()
             self.assertAlmostEqual(results["./a"], 0.1)
             self.assertAlmostEqual(results["."], 0.25)
+
+    def test_record(self):
+        with patch("posthog.hogql.timings.perf_counter", fake_perf_counter):
+            timings = HogQLTimings()
+
+            with timings.measure("outer"):
+                timings.record("saved", 0.5)
+            timings.record("saved", 0.25)
+
+            results = timings.to_dict()
+            self.assertAlmostEqual(results["./outer/saved"], 0.5)
+            self.assertAlmostEqual(results["./saved"], 0.25)
+            self.assertAlmostEqual(results["./outer"], 0.05)
@@ -39,6 +39,11 @@ class HogQLTimings:
             del self._timing_starts[full_key]
             self._timing_pointer = last_key
 
+    def record(self, key: str, duration: float):
+        """Records a duration that wasn't measured around a block, e.g. work that a shared step made unnecessary."""
+        full_key = f"{self._timing_pointer}/{key}"
+        self.timings[full_key] = self.timings.get(full_key, 0.0) + duration
+
     def to_dict(self) -> dict[str, float]:
         timings = {**self.timings}
         for key, start in reversed(self._timing_starts.items()):
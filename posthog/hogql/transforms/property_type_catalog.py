@@ -0,0 +1,115 @@
+import dataclasses
+import threading
+import time
+from typing import Optional
+
+from cachetools import LRUCache
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models.functions.comparison import Coalesce
+
+PROPERTY_TYPE_CATALOG_VERSION_KEY = "property_type_catalog_version:{project_id}"
+
+
+@dataclasses.dataclass(frozen=True)
+class PropertyTypeCatalog:
+    """All typed property definitions of a project, as used by the PropertySwapper."""
+
+    version: int
+    loaded_at: float
+    event_properties: dict[str, str]
+    person_properties: dict[str, str]
+    # Keyed by "{group_type_index}_{name}", same as PropertySwapper.group_properties
+    group_properties: dict[str, str]
+    # False when the project has more typed definitions than we're willing to hold in memory
+    complete: bool = True
+
+
+_catalogs: LRUCache[int, PropertyTypeCatalog] = LRUCache(maxsize=settings.HOGQL_PROPERTY_TYPE_CATALOG_MAX_PROJECTS)
+_catalogs_lock = threading.Lock()
+
+
+def _get_catalog_version(project_id: int) -> int:
+    return cache.get(PROPERTY_TYPE_CATALOG_VERSION_KEY.format(project_id=project_id)) or 0
+
+
+def _load_property_type_catalog(project_id: int, version: int) -> PropertyTypeCatalog:
+    from posthog.models import PropertyDefinition
+
+    max_definitions = settings.HOGQL_PROPERTY_TYPE_CATALOG_MAX_DEFINITIONS
+    rows = list(
+        PropertyDefinition.objects.alias(
+            effective_project_id=Coalesce("project_id", "team_id", output_field=models.BigIntegerField())
+        )
+        .filter(effective_project_id=project_id, property_type__isnull=False)  # type: ignore
+        .values_list("name", "type", "group_type_index", "property_type")[: max_definitions + 1]
+    )
+    if len(rows) > max_definitions:
+        return PropertyTypeCatalog(
+            version=version,
+            loaded_at=time.monotonic(),
+            event_properties={},
+            person_properties={},
+            group_properties={},
+            complete=False,
+        )
+
+    event_properties: dict[str, str] = {}
+    person_properties: dict[str, str] = {}
+    group_properties: dict[str, str] = {}
+    for name, type, group_type_index, property_type in rows:
+        if not property_type:
+            continue
+        if type == PropertyDefinition.Type.EVENT:
+            event_properties[name] = property_type
+        elif type == PropertyDefinition.Type.PERSON:
+            person_properties[name] = property_type
+        elif type == PropertyDefinition.Type.GROUP:
+            group_properties[f"{group_type_index}_{name}"] = property_type
+
+    return PropertyTypeCatalog(
+        version=version,
+        loaded_at=time.monotonic(),
+        event_properties=event_properties,
+        person_properties=person_properties,
+        group_properties=group_properties,
+    )
+
+
+def get_property_type_catalog(project_id: int) -> Optional[PropertyTypeCatalog]:
+    """
+    Returns the in-process property type catalog for the project, loading it in bulk on first use and reloading it
+    when its shared version changes or it gets older than HOGQL_PROPERTY_TYPE_CATALOG_TTL_SECONDS. The TTL bounds
+    staleness for definitions written outside of Django (e.g. by ingestion), which don't bump the version.
+    Returns None if the project is too large to be cached, in which case callers should query types directly.
+    """
+    version = _get_catalog_version(project_id)
+
+    with _catalogs_lock:
+        catalog = _catalogs.get(project_id)
+
+    if (
+        catalog is None
+        or catalog.version != version
+        or time.monotonic() - catalog.loaded_at > settings.HOGQL_PROPERTY_TYPE_CATALOG_TTL_SECONDS
+    ):
+        catalog = _load_property_type_catalog(project_id, version)
+        with _catalogs_lock:
+            _catalogs[project_id] = catalog
+
+    return catalog if catalog.complete else None
+
+
+def invalidate_property_type_catalog(project_id: int) -> None:
+    """Makes every process reload the project's catalog on its next use."""
+    key = PROPERTY_TYPE_CATALOG_VERSION_KEY.format(project_id=project_id)
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between add and incr
+        cache.set(key, 1, timeout=None)
+
+    with _catalogs_lock:
+        _catalogs.pop(project_id, None)
@@ -1,5 +1,6 @@
 from typing import Literal, cast, Optional
 
+from django.conf import settings
 from django.db.models.functions.comparison import Coalesce
 
 from posthog.clickhouse.materialized_columns import (
@@ -14,6 +15,7 @@ from posthog.hogql.database.models import (
     BooleanDatabaseField,
 )
 from posthog.hogql.escape_sql import escape_hogql_identifier
+from posthog.hogql.transforms.property_type_catalog import get_property_type_catalog
 from posthog.hogql.visitor import CloningVisitor, TraversingVisitor
 from posthog.models import Team
 from posthog.models.property import PropertyName, TableColumn
@@ -23,8 +25,6 @@ from django.db import models
 
 
 def build_property_swapper(node: ast.AST, context: HogQLContext) -> None:
-    from posthog.models import PropertyDefinition
-
     if not context or not context.team_id:
         return
 
@@ -38,12 +38,53 @@ def build_property_swapper(node: ast.AST, context: HogQLContext) -> None:
     property_finder = PropertyFinder(context)
     property_finder.visit(node)
 
+    catalog = (
+        get_property_type_catalog(context.team.project_id) if settings.HOGQL_PROPERTY_TYPE_CATALOG_ENABLED else None
+    )
+    if catalog is not None:
+        event_properties = {
+            name: catalog.event_properties[name]
+            for name in property_finder.event_properties
+            if name in catalog.event_properties
+        }
+        person_properties = {
+            name: catalog.person_properties[name]
+            for name in property_finder.person_properties
+            if name in catalog.person_properties
+        }
+        group_properties = {
+            key: catalog.group_properties[key]
+            for group_id, properties in property_finder.group_properties.items()
+            for key in (f"{group_id}_{name}" for name in properties)
+            if key in catalog.group_properties
+        }
+    else:
+        event_properties, person_properties, group_properties = _query_property_types(
+            context.team.project_id, property_finder
+        )
+
+    timezone = context.database.get_timezone() if context and context.database else "UTC"
+    context.property_swapper = PropertySwapper(
+        timezone=timezone,
+        event_properties=event_properties,
+        person_properties=person_properties,
+        group_properties=group_properties,
+        context=context,
+        setTimeZones=True,
+    )
+
+
+def _query_property_types(
+    project_id: int, property_finder: "PropertyFinder"
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    from posthog.models import PropertyDefinition
+
     event_property_values = (
         PropertyDefinition.objects.alias(
             effective_project_id=Coalesce("project_id", "team_id", output_field=models.BigIntegerField())
         )
         .filter(
-            effective_project_id=context.team.project_id,  # type: ignore
+            effective_project_id=project_id,  # type: ignore
             name__in=property_finder.event_properties,
             type__in=[None, PropertyDefinition.Type.EVENT],
         )
@@ -58,7 +99,7 @@ def build_property_swapper(node: ast.AST, context: HogQLContext) -> None:
             effective_project_id=Coalesce("project_id", "team_id", output_field=models.BigIntegerField())
         )
         .filter(
-            effective_project_id=context.team.project_id,  # type: ignore
+            effective_project_id=project_id,  # type: ignore
             name__in=property_finder.person_properties,
             type=PropertyDefinition.Type.PERSON,
         )
@@ -77,7 +118,7 @@ def build_property_swapper(node: ast.AST, context: HogQLContext) -> None:
                 effective_project_id=Coalesce("project_id", "team_id", output_field=models.BigIntegerField())
             )
             .filter(
-                effective_project_id=context.team.project_id,  # type: ignore
+                effective_project_id=project_id,  # type: ignore
                 name__in=properties,
                 type=PropertyDefinition.Type.GROUP,
                 group_type_index=group_id,
@@ -88,15 +129,7 @@ def build_property_swapper(node: ast.AST, context: HogQLContext) -> None:
             {f"{group_id}_{name}": property_type for name, property_type in group_property_values if property_type}
         )
 
-    timezone = context.database.get_timezone() if context and context.database else "UTC"
-    context.property_swapper = PropertySwapper(
-        timezone=timezone,
-        event_properties=event_properties,
-        person_properties=person_properties,
-        group_properties=group_properties,
-        context=context,
-        setTimeZones=True,
-    )
+    return event_properties, person_properties, group_properties
 
 
 class PropertyFinder(TraversingVisitor):
@@ -1,5 +1,6 @@
 import pytest
 from typing import Any
+from unittest.mock import patch
 import re
 
 from django.test import override_settings
@@ -7,6 +8,7 @@ from django.test import override_settings
 from posthog.hogql.context import HogQLContext
 from posthog.hogql.parser import parse_select
 from posthog.hogql.printer import print_ast
+from posthog.hogql.transforms.property_type_catalog import _load_property_type_catalog
 from posthog.hogql.test.utils import pretty_print_in_tests
 from posthog.models import PropertyDefinition, GroupTypeMapping
 from posthog.models.group.util import create_group
@@ -203,6 +205,37 @@ class TestPropertyTypes(BaseTest):
 
         assert printed == self.snapshot
 
+    @override_settings(
+        PERSON_ON_EVENTS_OVERRIDE=False,
+        PERSON_ON_EVENTS_V2_OVERRIDE=False,
+        HOGQL_PROPERTY_TYPE_CATALOG_ENABLED=True,
+    )
+    def test_property_type_catalog_resolves_the_same_types(self):
+        select = "select properties.$screen_width * person.properties.tickets, organization.properties.inty, properties.bool from events"
+        with override_settings(HOGQL_PROPERTY_TYPE_CATALOG_ENABLED=False):
+            expected = self._print_select(select)
+
+        assert self._print_select(select) == expected
+
+    @override_settings(HOGQL_PROPERTY_TYPE_CATALOG_ENABLED=True)
+    def test_property_type_catalog_is_loaded_once_and_invalidated_on_change(self):
+        select = "select properties.$screen_width, properties.new_prop from events"
+
+        with patch(
+            "posthog.hogql.transforms.property_type_catalog._load_property_type_catalog",
+            wraps=_load_property_type_catalog,
+        ) as load_catalog:
+            assert self._print_select(select).count("accurateCastOrNull(") == 1
+            assert self._print_select(select).count("accurateCastOrNull(") == 1
+            assert load_catalog.call_count == 1
+
+            PropertyDefinition.objects.create(
+                team=self.team, type=PropertyDefinition.Type.EVENT, name="new_prop", property_type="Numeric"
+            )
+
+            assert self._print_select(select).count("accurateCastOrNull(") == 2
+            assert load_catalog.call_count == 2
+
     def _print_select(self, select: str):
         expr = parse_select(select)
         query = print_ast(
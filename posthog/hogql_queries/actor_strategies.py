@@ -6,6 +6,7 @@ from django.db import connections
 from posthog.hogql import ast
 from posthog.hogql.property import property_to_expr
 from posthog.hogql.parser import parse_expr
+from posthog.hogql.visitor import TraversingVisitor
 from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
 from posthog.hogql_queries.utils.recordings_helper import RecordingsHelper
 from posthog.models import Team, Group
@@ -13,6 +14,9 @@ from posthog.schema import ActorsQuery, InsightActorsQuery, TrendsQuery
 
 import orjson as json
 
+# Max number of persons looked up in Postgres per query
+PERSONS_LOOKUP_BATCH_SIZE = 10000
+
 
 class ActorStrategy:
     field: str
@@ -45,13 +49,59 @@ class PersonStrategy(ActorStrategy):
     origin = "persons"
     origin_id = "id"
 
-    # This is hand written instead of using the ORM because the ORM was blowing up the memory on exports and taking forever
     def get_actors(self, actor_ids, order_by: str = "") -> dict[str, dict]:
-        # If actor queries start quietly dying again, this might need batching at some point
-        # but currently works with 800,000 persondistinctid entries (May 24, 2024)
-        persons_query = """SELECT posthog_person.id, posthog_person.uuid, posthog_person.properties, posthog_person.is_identified, posthog_person.created_at
+        if order_by:
+            # Ordered lookups are returned in the order Postgres returns them, so can't be batched
+            return self._fetch_persons([str(actor_id) for actor_id in actor_ids], order_by=order_by)
+
+        uuids = list(dict.fromkeys(str(actor_id) for actor_id in actor_ids))
+        persons: dict[str, dict] = {}
+        for i in range(0, len(uuids), PERSONS_LOOKUP_BATCH_SIZE):
+            persons.update(self._fetch_persons(uuids[i : i + PERSONS_LOOKUP_BATCH_SIZE]))
+        return persons
+
+    def person_property_keys(self) -> Optional[list[str]]:
+        """
+        Person properties to load when enriching actors, or None to load all of them.
+        Only projected when the query opts in with `personProperties`, as the persons modal shows every property.
+        """
+        if self.query.personProperties is None:
+            return None
+
+        from posthog.api.person import PERSON_DEFAULT_DISPLAY_NAME_PROPERTIES
+
+        collector = PersonPropertyKeysCollector()
+        for column in self.query.select or []:
+            if column.split("--")[0].strip() in ("person", "person_display_name", "person.$delete", "actor"):
+                continue
+            collector.visit(parse_expr(column))
+
+        return list(
+            dict.fromkeys(
+                [
+                    *(self.team.person_display_name_properties or PERSON_DEFAULT_DISPLAY_NAME_PROPERTIES),
+                    *self.query.personProperties,
+                    *collector.keys,
+                ]
+            )
+        )
+
+    # This is hand written instead of using the ORM because the ORM was blowing up the memory on exports and taking forever
+    def _fetch_persons(self, uuids: list[str], order_by: str = "") -> dict[str, dict]:
+        property_keys = self.person_property_keys()
+        if property_keys is None:
+            properties_column = "posthog_person.properties"
+        else:
+            # Only pull the referenced keys out of the JSONB, wide property sets are expensive to ship and parse
+            properties_column = """(
+                SELECT COALESCE(jsonb_object_agg(props.key, props.value), '{}'::jsonb)
+                FROM jsonb_each(posthog_person.properties) AS props
+                WHERE props.key = ANY(%(property_keys)s)
+            )"""
+
+        persons_query = f"""SELECT posthog_person.id, posthog_person.uuid, {properties_column}, posthog_person.is_identified, posthog_person.created_at
             FROM posthog_person
-            WHERE posthog_person.uuid = ANY(%(uuids)s)
+            WHERE posthog_person.uuid = ANY(%(uuids)s::uuid[])
             AND posthog_person.team_id = %(team_id)s"""
         if order_by:
             persons_query += f" ORDER BY {order_by}"
@@ -61,7 +111,7 @@ class PersonStrategy(ActorStrategy):
         with conn.cursor() as cursor:
             cursor.execute(
                 persons_query,
-                {"uuids": list(actor_ids), "team_id": self.team.pk},
+                {"uuids": uuids, "team_id": self.team.pk, "property_keys": property_keys},
             )
             people = cursor.fetchall()
             cursor.execute(
@@ -152,6 +202,19 @@ class PersonStrategy(ActorStrategy):
         ]
 
 
+class PersonPropertyKeysCollector(TraversingVisitor):
+    """Collects the person property keys referenced by `properties.x` or `person.properties.x` fields."""
+
+    def __init__(self):
+        super().__init__()
+        self.keys: list[str] = []
+
+    def visit_field(self, node: ast.Field):
+        chain = node.chain[1:] if node.chain[:1] == ["person"] else node.chain
+        if len(chain) >= 2 and chain[0] == "properties" and isinstance(chain[1], str):
+            self.keys.append(chain[1])
+
+
 class GroupStrategy(ActorStrategy):
     field = "group"
     origin = "groups"
@@ -13,7 +13,7 @@ from posthog.hogql.resolver_utils import extract_select_queries
 from posthog.hogql_queries.actor_strategies import ActorStrategy, PersonStrategy, GroupStrategy
 from posthog.hogql_queries.insights.funnels.funnels_query_runner import FunnelsQueryRunner
 from posthog.hogql_queries.insights.insight_actors_query_runner import InsightActorsQueryRunner
-from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
+from posthog.hogql_queries.insights.paginators import HogQLCursorPaginator, HogQLHasMorePaginator
 from posthog.hogql_queries.query_runner import QueryRunner, get_query_runner
 from posthog.schema import (
     ActorsQuery,
@@ -30,18 +30,27 @@ class ActorsQueryRunner(QueryRunner):
     query: ActorsQuery
     response: ActorsQueryResponse
     cached_response: CachedActorsQueryResponse
+    paginator: HogQLHasMorePaginator
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.paginator = HogQLHasMorePaginator.from_limit_context(
-            limit_context=self.limit_context, limit=self.query.limit, offset=self.query.offset
-        )
         self.source_query_runner: Optional[QueryRunner] = None
 
         if self.query.source:
             self.source_query_runner = get_query_runner(self.query.source, self.team, self.timings, self.limit_context)
             self.modifiers = self.source_query_runner.modifiers
 
+        if self.query.cursor is not None:
+            self.paginator = HogQLCursorPaginator.from_limit_context(
+                limit_context=self.limit_context,
+                tiebreaker=[PersonStrategy.origin_id if self.group_type_index is None else GroupStrategy.origin_id],
+                cursor=self.query.cursor,
+                limit=self.query.limit,
+            )
+        else:
+            self.paginator = HogQLHasMorePaginator.from_limit_context(
+                limit_context=self.limit_context, limit=self.query.limit, offset=self.query.offset
+            )
         self.strategy = self.determine_strategy()
         self.calculating = False
 
@@ -130,10 +139,14 @@ class ActorsQueryRunner(QueryRunner):
         results: Sequence[list] | Iterator[list] = self.paginator.results
 
         enrich_columns = filter(lambda column: column in ("person", "group", "actor"), input_columns)
+        # The "person" and "actor" columns hold the same ids, so their actors are only looked up once
+        actors_lookups: dict[tuple, dict[str, dict]] = {}
         for column_name in enrich_columns:
             actor_column_index = input_columns.index(column_name)
-            actor_ids = (row[actor_column_index] for row in self.paginator.results)
-            actors_lookup = self.strategy.get_actors(actor_ids)
+            actor_ids = tuple(row[actor_column_index] for row in self.paginator.results)
+            if actor_ids not in actors_lookups:
+                actors_lookups[actor_ids] = self.strategy.get_actors(actor_ids)
+            actors_lookup = actors_lookups[actor_ids]
             person_uuid_to_event_distinct_ids = None
 
             if "event_distinct_ids" in input_columns:
@@ -2,7 +2,6 @@ from typing import cast
 
 from posthog.hogql import ast
 from posthog.hogql.parser import parse_expr, parse_select
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.property import action_to_expr
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql_queries.ai.utils import TaxonomyCacheMixin
@@ -28,7 +27,6 @@ class EventTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
 
     def calculate(self):
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="EventTaxonomyQuery",
@@ -37,6 +35,7 @@ class EventTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
         )
 
         results: list[EventTaxonomyItem] = []
@@ -52,7 +51,7 @@ class EventTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
         return EventTaxonomyQueryResponse(
             results=results,
             timings=response.timings,
-            hogql=hogql,
+            hogql=response.hogql,
             modifiers=self.modifiers,
         )
 
@@ -1,5 +1,8 @@
+from collections.abc import Iterator
 from typing import Any
 
+from posthog.hogql import ast
+from posthog.hogql.query import execute_hogql_query
 from posthog.hogql_queries.events_query_runner import EventsQueryRunner
 from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
 from posthog.hogql_queries.query_runner import QueryRunner
@@ -13,12 +16,14 @@ from posthog.schema import (
 from posthog.session_recordings.constants import (
     DEFAULT_TOTAL_EVENTS_PER_QUERY,
     EXTRA_SUMMARY_EVENT_FIELDS,
+    MAX_EVENTS_PER_SESSION,
     MAX_TOTAL_EVENTS_PER_QUERY,
 )
 from posthog.session_recordings.queries.session_replay_events import DEFAULT_EVENT_FIELDS
 
 # Type alias for convenience
 SessionEventsResults = dict[str, list[list[Any]]]  # session_id -> events mapping
+SessionEventsBlock = dict[str, list[tuple[Any, ...]]]  # session_id -> compact events mapping, ordered by session_id
 
 
 class SessionBatchEventsQueryRunner(QueryRunner):
@@ -142,6 +147,92 @@ class SessionBatchEventsQueryRunner(QueryRunner):
             **self.paginator.response_params(),
         )
 
+    def stream_columns(self) -> list[str]:
+        """Columns of the events yielded by `stream_session_events`, the selected columns without the session_id."""
+        columns = self.columns(None)
+        session_id_index = self._session_id_column_index(columns)
+        return columns[:session_id_index] + columns[session_id_index + 1 :]
+
+    def stream_session_events(
+        self, max_events_per_session: int = MAX_EVENTS_PER_SESSION
+    ) -> Iterator[tuple[str, list[tuple[Any, ...]]]]:
+        """
+        Stream the events of the queried sessions, one session at a time, so sessions can be processed before the
+        whole batch has loaded. Events are read in blocks of `query.limit` rows, ordered by (session_id, timestamp),
+        and yielded as tuples in `stream_columns()` order. Sessions are capped at `max_events_per_session` events,
+        and sessions without events are skipped.
+        """
+        block_size = self.query.limit or DEFAULT_TOTAL_EVENTS_PER_QUERY
+        if max_events_per_session >= block_size:
+            # Every full block then holds at least one complete session, so each block moves the stream forward
+            raise ValueError("Max events per session must be less than the number of events per block")
+
+        session_id_index = self._session_id_column_index(self.columns(None))
+        session_id_field = ast.Field(chain=["properties", "$session_id"])
+        last_session_id: str | None = None
+
+        while True:
+            query = self.to_query()
+            if last_session_id is not None:
+                cursor = ast.CompareOperation(
+                    op=ast.CompareOperationOp.Gt, left=session_id_field, right=ast.Constant(value=last_session_id)
+                )
+                query.where = ast.And(exprs=[query.where, cursor]) if query.where else cursor
+            query.order_by = [
+                ast.OrderExpr(expr=session_id_field, order="ASC"),
+                ast.OrderExpr(expr=ast.Field(chain=["timestamp"]), order="ASC"),
+            ]
+            query.limit_by = ast.LimitByExpr(n=ast.Constant(value=max_events_per_session), exprs=[session_id_field])
+            query.limit = ast.Constant(value=block_size)
+            query.offset = None
+
+            with self.timings.measure("stream_session_events_block"):
+                response = execute_hogql_query(
+                    query=query,
+                    team=self.team,
+                    query_type="SessionBatchEventsQuery",
+                    timings=self.timings,
+                    modifiers=self.modifiers,
+                    limit_context=self.limit_context,
+                )
+
+            rows = response.results or []
+            sessions = self._group_block_by_session(rows, session_id_index)
+            is_last_block = len(rows) < block_size
+            if not is_last_block:
+                # The last session of a full block can continue past it, so it's read again from its start
+                sessions.popitem()
+
+            for session_id, events in sessions.items():
+                yield session_id, events
+                last_session_id = session_id
+
+            if is_last_block or not sessions:
+                return
+
+    @staticmethod
+    def _group_block_by_session(rows: list, session_id_index: int) -> SessionEventsBlock:
+        sessions: SessionEventsBlock = {}
+        for row in rows:
+            session_id = row[session_id_index]
+            if session_id is None:
+                continue
+            sessions.setdefault(str(session_id), []).append(
+                tuple(row[:session_id_index]) + tuple(row[session_id_index + 1 :])
+            )
+        return sessions
+
+    @staticmethod
+    def _session_id_column_index(columns: list[str]) -> int:
+        for i, col in enumerate(columns):
+            if col in ["properties.$session_id", "$session_id"]:
+                return i
+        # If no session_id column found, we can't group by session
+        # This shouldn't happen if the query was constructed properly
+        raise ValueError(
+            "No session_id column found in query results. Ensure 'properties.$session_id' is included in the select clause."
+        )
+
     def _group_events_by_session(
         self, results: list[list[Any]], columns: list[str]
     ) -> tuple[SessionEventsResults, list[str]]:
@@ -149,17 +240,7 @@ class SessionBatchEventsQueryRunner(QueryRunner):
         if not results or not columns:
             return {}, columns
         # Find the index of the $session_id column
-        session_id_index = None
-        for i, col in enumerate(columns):
-            if col in ["properties.$session_id", "$session_id"]:
-                session_id_index = i
-                break
-        if session_id_index is None:
-            # If no session_id column found, we can't group by session
-            # This shouldn't happen if the query was constructed properly
-            raise ValueError(
-                "No session_id column found in query results. Ensure 'properties.$session_id' is included in the select clause."
-            )
+        session_id_index = self._session_id_column_index(columns)
         # Create filtered columns list without the session_id column
         filtered_columns = columns[:session_id_index] + columns[session_id_index + 1 :]
         # Group events by session_id
@@ -1,6 +1,5 @@
 from posthog.hogql import ast
 from posthog.hogql.parser import parse_select
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql_queries.ai.utils import TaxonomyCacheMixin
 from posthog.hogql_queries.query_runner import QueryRunner
@@ -29,7 +28,6 @@ class TeamTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
 
     def calculate(self):
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="TeamTaxonomyQuery",
@@ -38,6 +36,7 @@ class TeamTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
         )
 
         results: list[TeamTaxonomyItem] = []
@@ -48,7 +47,7 @@ class TeamTaxonomyQueryRunner(TaxonomyCacheMixin, QueryRunner):
             results.append(TeamTaxonomyItem(event=event, count=count))
 
         return TeamTaxonomyQueryResponse(
-            results=results, timings=response.timings, hogql=hogql, modifiers=self.modifiers
+            results=results, timings=response.timings, hogql=response.hogql, modifiers=self.modifiers
         )
 
     def to_query(self) -> ast.SelectQuery | ast.SelectSetQuery:
@@ -11,6 +11,7 @@ from posthog.models.property_definition import PropertyType
 from posthog.schema import (
     DateRange,
     EventPropertyFilter,
+    HogQLQueryModifiers,
     LLMTrace,
     LLMTraceEvent,
     PersonPropertyFilter,
@@ -935,3 +936,101 @@ class TestTracesQueryRunner(ClickhouseTestMixin, BaseTest):
         ).calculate()
         self.assertEqual(len(response.results), 1)
         self.assertEqual(response.results[0].inputTokens, 2)
+
+    @freeze_time("2025-01-16T00:00:00Z")
+    def test_trace_summaries(self):
+        _create_person(distinct_ids=["person1"], team=self.team, properties={"email": "test@posthog.com"})
+        _create_ai_trace_event(
+            trace_id="trace1",
+            trace_name="runnable",
+            input_state={"messages": [{"role": "user", "content": "Foo"}]},
+            output_state={"messages": [{"role": "assistant", "content": "Bar"}]},
+            team=self.team,
+            distinct_id="person1",
+            timestamp=datetime(2025, 1, 15, 0, 29),
+        )
+        _create_ai_generation_event(
+            distinct_id="person1",
+            trace_id="trace1",
+            team=self.team,
+            timestamp=datetime(2025, 1, 15, 0, 30),
+        )
+        # In the next hour, so the trace is summarized in two rows
+        _create_ai_generation_event(
+            distinct_id="person1",
+            trace_id="trace1",
+            team=self.team,
+            timestamp=datetime(2025, 1, 15, 1, 30),
+            properties={"$ai_is_error": True},
+        )
+        _create_ai_generation_event(
+            distinct_id="person1",
+            trace_id="trace2",
+            team=self.team,
+            timestamp=datetime(2025, 1, 14),
+        )
+
+        modifiers = HogQLQueryModifiers(useLLMTraceSummaries=True)
+        response = TracesQueryRunner(team=self.team, query=TracesQuery(modifiers=modifiers)).calculate()
+        self.assertIn("llm_trace_summaries", response.hogql)
+        self.assertEqual(len(response.results), 2)
+
+        trace = response.results[0]
+        self.assertTraceEqual(
+            trace,
+            {
+                "id": "trace1",
+                "createdAt": datetime(2025, 1, 15, 0, 29, tzinfo=UTC).isoformat(),
+                "traceName": "runnable",
+                "totalLatency": 2.0,
+                "inputTokens": 6.0,
+                "outputTokens": 6.0,
+                "inputCost": 6.0,
+                "outputCost": 6.0,
+                "totalCost": 12.0,
+                "errorCount": 1,
+                "inputState": None,
+                "outputState": None,
+                "events": [],
+            },
+        )
+        self.assertEqual(trace.person.distinct_id, "person1")
+        self.assertEqual(trace.person.properties, {"email": "test@posthog.com"})
+
+        trace = response.results[1]
+        self.assertTraceEqual(trace, {"id": "trace2", "totalCost": 6.0, "errorCount": 0})
+
+        # Full traces are read from events
+        response = TracesQueryRunner(
+            team=self.team, query=TracesQuery(traceId="trace1", modifiers=modifiers)
+        ).calculate()
+        self.assertNotIn("llm_trace_summaries", response.hogql)
+        self.assertEqual(len(response.results), 1)
+        self.assertEqual(len(response.results[0].events), 2)
+
+    @freeze_time("2025-01-16T00:00:00Z")
+    def test_trace_summaries_merge_traces_that_started_before_the_date_range(self):
+        _create_person(distinct_ids=["person1"], team=self.team)
+        for trace_id, timestamps in (
+            ("trace_before", [datetime(2025, 1, 14, 22, 0), datetime(2025, 1, 15, 1, 30)]),
+            ("trace_within", [datetime(2025, 1, 15, 0, 30), datetime(2025, 1, 15, 1, 30)]),
+        ):
+            for timestamp in timestamps:
+                _create_ai_generation_event(
+                    distinct_id="person1", trace_id=trace_id, team=self.team, timestamp=timestamp
+                )
+
+        response = TracesQueryRunner(
+            team=self.team,
+            query=TracesQuery(
+                dateRange=DateRange(date_from="2025-01-15T00:00:00Z", date_to="2025-01-15T02:00:00Z"),
+                modifiers=HogQLQueryModifiers(useLLMTraceSummaries=True),
+            ),
+        ).calculate()
+
+        # The trace that started before the range is merged with its earlier rows, so it isn't listed as starting later
+        self.assertEqual([trace.id for trace in response.results], ["trace_within"])
+        self.assertTraceEqual(
+            response.results[0],
+            {"createdAt": datetime(2025, 1, 15, 0, 30, tzinfo=UTC).isoformat(), "totalCost": 12.0},
+        )
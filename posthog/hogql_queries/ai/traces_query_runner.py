@@ -54,6 +54,10 @@ class TracesQueryRunner(QueryRunner):
     cached_response: CachedTracesQueryResponse
     paginator: HogQLHasMorePaginator
 
+    # Trace summary rows are read from this far before the date range, so traces that started before it are merged
+    # with their earlier rows and left out by their first timestamp
+    MAX_TRACE_DURATION_HOURS = 24
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.paginator = HogQLHasMorePaginator.from_limit_context(
@@ -69,14 +73,23 @@ class TracesQueryRunner(QueryRunner):
             offset_value = self.query.offset if self.query.offset else 0
             pagination_limit = limit_value + offset_value + 1
 
-            query_result = self.paginator.execute_hogql_query(
-                query=self.to_query(),
-                placeholders={
+            if self._use_trace_summaries:
+                placeholders = {
+                    "summary_conditions": self._get_summary_where_clause(),
+                    "first_timestamp_conditions": self._get_first_timestamp_clause(),
+                    "pagination_limit": ast.Constant(value=pagination_limit),
+                }
+            else:
+                placeholders = {
                     "subquery_conditions": self._get_subquery_filter(),
                     "filter_conditions": self._get_where_clause(),
                     "return_full_trace": ast.Constant(value=1 if self.query.traceId is not None else 0),
                     "pagination_limit": ast.Constant(value=pagination_limit),
-                },
+                }
+
+            query_result = self.paginator.execute_hogql_query(
+                query=self.to_query(),
+                placeholders=placeholders,
                 team=self.team,
                 query_type=NodeKind.TRACES_QUERY,
                 timings=self.timings,
@@ -97,6 +110,9 @@ class TracesQueryRunner(QueryRunner):
         )
 
     def to_query(self):
+        if self._use_trace_summaries:
+            return self._to_summaries_query()
+
         query = parse_select(
             """
             WITH relevant_trace_ids AS (
@@ -186,6 +202,56 @@ class TracesQueryRunner(QueryRunner):
         )
         return cast(ast.SelectQuery, query)
 
+    def _to_summaries_query(self) -> ast.SelectQuery:
+        """
+        Reads the traces list from the trace summaries table, which a materialized view fills as AI events are
+        ingested, so listing traces doesn't aggregate the events of every trace in the date range.
+        """
+        query = parse_select(
+            """
+            SELECT
+                traces.trace_id AS id,
+                traces.first_timestamp AS first_timestamp,
+                tuple(
+                    pdi.person.id,
+                    traces.distinct_id,
+                    pdi.person.created_at,
+                    pdi.person.properties
+                ) AS first_person,
+                round(traces.total_latency, 2) AS total_latency,
+                traces.input_tokens AS input_tokens,
+                traces.output_tokens AS output_tokens,
+                round(traces.input_cost, 4) AS input_cost,
+                round(traces.output_cost, 4) AS output_cost,
+                round(traces.total_cost, 4) AS total_cost,
+                traces.error_count AS error_count,
+                traces.trace_name AS trace_name
+            FROM (
+                SELECT
+                    summaries.trace_id AS trace_id,
+                    min(summaries.min_timestamp) AS first_timestamp,
+                    argMinMerge(summaries.distinct_id) AS distinct_id,
+                    sum(summaries.total_latency) AS total_latency,
+                    sum(summaries.input_tokens) AS input_tokens,
+                    sum(summaries.output_tokens) AS output_tokens,
+                    sum(summaries.input_cost) AS input_cost,
+                    sum(summaries.output_cost) AS output_cost,
+                    sum(summaries.total_cost) AS total_cost,
+                    sum(summaries.error_count) AS error_count,
+                    any(summaries.trace_name) AS trace_name
+                FROM llm_trace_summaries AS summaries
+                WHERE {summary_conditions}
+                GROUP BY summaries.trace_id
+                HAVING {first_timestamp_conditions}
+                ORDER BY first_timestamp DESC
+                LIMIT {pagination_limit}
+            ) AS traces
+            LEFT JOIN person_distinct_ids AS pdi ON pdi.distinct_id = traces.distinct_id
+            ORDER BY first_timestamp DESC
+            """,
+        )
+        return cast(ast.SelectQuery, query)
+
     def get_cache_payload(self):
         return {
             **super().get_cache_payload(),
@@ -193,6 +259,18 @@ class TracesQueryRunner(QueryRunner):
             "schema_version": 2,
         }
 
+    @cached_property
+    def _use_trace_summaries(self) -> bool:
+        """
+        Summaries hold no event or person properties, so only the unfiltered traces list can be read from them. A
+        single trace, with its full events, is always read from the events table.
+        """
+        if not self.modifiers.useLLMTraceSummaries or self.query.traceId is not None:
+            return False
+        if self.query.properties:
+            return False
+        return not (self.query.filterTestAccounts and self.team.test_account_filters)
+
     @cached_property
     def _date_range(self):
         # Minute-level precision for 10m capture range
@@ -228,12 +306,14 @@ class TracesQueryRunner(QueryRunner):
             "input_cost": "inputCost",
             "output_cost": "outputCost",
             "total_cost": "totalCost",
+            "error_count": "errorCount",
             "events": "events",
             "trace_name": "traceName",
         }
 
         generations = []
-        for uuid, event_name, timestamp, properties in result["events"]:
+        # The trace summaries table doesn't return events, only the events table does
+        for uuid, event_name, timestamp, properties in result.get("events", []):
             generations.append(self._map_event(uuid, event_name, timestamp, properties))
 
         trace_dict = {
@@ -243,11 +323,11 @@ class TracesQueryRunner(QueryRunner):
             "events": generations,
         }
         try:
-            trace_dict["input_state_parsed"] = orjson.loads(trace_dict["input_state"])
+            trace_dict["input_state_parsed"] = orjson.loads(trace_dict.get("input_state"))
         except (TypeError, orjson.JSONDecodeError):
             pass
         try:
-            trace_dict["output_state_parsed"] = orjson.loads(trace_dict["output_state"])
+            trace_dict["output_state_parsed"] = orjson.loads(trace_dict.get("output_state"))
         except (TypeError, orjson.JSONDecodeError):
             pass
         # Remap keys from snake case to camel case
@@ -324,5 +404,46 @@ class TracesQueryRunner(QueryRunner):
 
         return ast.And(exprs=where_exprs)
 
+    def _get_summary_where_clause(self) -> ast.Expr:
+        # A trace has a summary row per hour it spans, so the rows aren't filtered by their own timestamps. Only the
+        # merged traces are, by their first timestamp.
+        date_from = ast.ArithmeticOperation(
+            op=ast.ArithmeticOperationOp.Sub,
+            left=self._date_range.date_from_as_hogql(),
+            right=ast.Call(name="toIntervalHour", args=[ast.Constant(value=self.MAX_TRACE_DURATION_HOURS)]),
+        )
+        return ast.And(
+            exprs=[
+                # Summary rows are bucketed by hour, this clause lets ClickHouse skip hours by the primary key
+                ast.CompareOperation(
+                    op=ast.CompareOperationOp.GtEq,
+                    left=ast.Field(chain=["summaries", "start_hour"]),
+                    right=ast.Call(name="toStartOfHour", args=[date_from]),
+                ),
+                ast.CompareOperation(
+                    op=ast.CompareOperationOp.LtEq,
+                    left=ast.Field(chain=["summaries", "start_hour"]),
+                    right=self._date_range.date_to_as_hogql(),
+                ),
+            ]
+        )
+
+    def _get_first_timestamp_clause(self) -> ast.Expr:
+        # Applied before pagination, unlike the events query which drops traces outside of the range after it
+        return ast.And(
+            exprs=[
+                ast.CompareOperation(
+                    op=ast.CompareOperationOp.GtEq,
+                    left=ast.Field(chain=["first_timestamp"]),
+                    right=ast.Constant(value=self._date_range.date_from_for_filtering()),
+                ),
+                ast.CompareOperation(
+                    op=ast.CompareOperationOp.LtEq,
+                    left=ast.Field(chain=["first_timestamp"]),
+                    right=ast.Constant(value=self._date_range.date_to_for_filtering()),
+                ),
+            ]
+        )
+
     def _get_order_by_clause(self):
         return [ast.OrderExpr(expr=ast.Field(chain=["trace_timestamp"]), order="DESC")]
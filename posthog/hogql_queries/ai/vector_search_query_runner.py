@@ -1,6 +1,5 @@
 from posthog.hogql import ast
 from posthog.hogql.parser import parse_expr, parse_select
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql_queries.ai.utils import TaxonomyCacheMixin
 from posthog.hogql_queries.query_runner import QueryRunner
@@ -22,7 +21,6 @@ class VectorSearchQueryRunner(TaxonomyCacheMixin, QueryRunner):
 
     def calculate(self):
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="VectorSearchQuery",
@@ -31,6 +29,7 @@ class VectorSearchQueryRunner(TaxonomyCacheMixin, QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
         )
 
         results: list[VectorSearchResponseItem] = []
@@ -40,7 +39,7 @@ class VectorSearchQueryRunner(TaxonomyCacheMixin, QueryRunner):
         return VectorSearchQueryResponse(
             results=results,
             timings=response.timings,
-            hogql=hogql,
+            hogql=response.hogql,
             modifiers=self.modifiers,
         )
 
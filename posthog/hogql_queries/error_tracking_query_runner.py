@@ -14,14 +14,23 @@ from posthog.schema import (
     CachedErrorTrackingQueryResponse,
     DateRange,
 )
-from posthog.hogql.parser import parse_select
+from posthog.hogql.parser import parse_expr, parse_select
 from posthog.models.filters.mixins.utils import cached_property
 from posthog.models.error_tracking import ErrorTrackingIssue
 from posthog.models.property.util import property_to_django_filter
-from posthog.api.error_tracking import ErrorTrackingIssueSerializer
+from posthog.api.error_tracking import ErrorTrackingExternalReferenceSerializer, ErrorTrackingIssueSerializer
 
 logger = structlog.get_logger(__name__)
 
+# Issue metadata selected from the `error_tracking_issues` table, as (alias, field)
+ISSUES_TABLE_FIELDS = (
+    ("issue_status", "status"),
+    ("issue_name", "name"),
+    ("issue_description", "description"),
+    ("issue_assigned_user_id", "assigned_user_id"),
+    ("issue_assigned_role_id", "assigned_role_id"),
+)
+
 
 @dataclass
 class VolumeOptions:
@@ -59,6 +68,11 @@ class ErrorTrackingQueryRunner(QueryRunner):
         )
 
     def from_expr(self):
+        if self.use_issues_table:
+            return parse_select(
+                "SELECT 1 FROM events LEFT JOIN error_tracking_issues AS issue ON issue.id = events.issue_id"
+            ).select_from  # type: ignore
+
         # for the second iteration of this query, we just need to select from the events table
         return parse_select("SELECT 1 FROM events").select_from  # type: ignore
 
@@ -130,6 +144,12 @@ class ErrorTrackingQueryRunner(QueryRunner):
             )
         )
 
+        if self.use_issues_table:
+            exprs.extend(
+                ast.Alias(alias=alias, expr=ast.Call(name="any", args=[ast.Field(chain=["issue", field])]))
+                for alias, field in ISSUES_TABLE_FIELDS
+            )
+
         return exprs
 
     def select_sparkline_array(self, opts: VolumeOptions):
@@ -357,6 +377,10 @@ class ErrorTrackingQueryRunner(QueryRunner):
 
             exprs.append(ast.And(exprs=and_exprs))
 
+        if self.use_issues_table:
+            exprs.extend(self.issues_table_filters())
+            return ast.And(exprs=exprs)
+
         # We do this prefetching of a list of "valid" issue id's based on issue properties that aren't in
         # CH, so that when we run the aggregation and LIMIT, we can filter out the invalid issue id's
         # This is a hack - it'll break down if the list of valid issue id's is too long, but we do it for now
@@ -372,6 +396,32 @@ class ErrorTrackingQueryRunner(QueryRunner):
 
         return ast.And(exprs=exprs)
 
+    def issues_table_filters(self) -> list[ast.Expr]:
+        exprs: list[ast.Expr] = []
+
+        if self.query.status and self.query.status != "all" and not self.query.issueId:
+            # Issues that haven't been synced to ClickHouse yet are new, so treat them as active
+            exprs.append(
+                parse_expr(
+                    "coalesce(nullIf(issue.status, ''), 'active') = {status}",
+                    placeholders={"status": ast.Constant(value=self.query.status)},
+                )
+            )
+
+        if self.query.assignee:
+            exprs.append(
+                parse_expr(
+                    "issue.assigned_user_id = {id}", placeholders={"id": ast.Constant(value=self.query.assignee.id)}
+                )
+                if self.query.assignee.type == "user"
+                else parse_expr(
+                    "issue.assigned_role_id = toUUID({id})",
+                    placeholders={"id": ast.Constant(value=str(self.query.assignee.id))},
+                )
+            )
+
+        return exprs
+
     def calculate(self):
         with self.timings.measure("error_tracking_query_hogql_execute"):
             query_result = self.paginator.execute_hogql_query(
@@ -405,7 +455,11 @@ class ErrorTrackingQueryRunner(QueryRunner):
         issue_ids = [result["id"] for result in mapped_results]
 
         with self.timings.measure("issue_fetching_execute"):
-            issues = self.error_tracking_issues(issue_ids)
+            issues = (
+                self.error_tracking_issues_from_results(mapped_results)
+                if self.use_issues_table
+                else self.error_tracking_issues(issue_ids)
+            )
 
         with self.timings.measure("issue_resolution"):
             for result_dict in mapped_results:
@@ -490,6 +544,54 @@ class ErrorTrackingQueryRunner(QueryRunner):
         serializer = ErrorTrackingIssueSerializer(queryset, many=True)
         return {issue["id"]: issue for issue in serializer.data}
 
+    def error_tracking_issues_from_results(self, mapped_results: list[dict]) -> dict[str, dict]:
+        # A slim projection of the issue metadata selected from ClickHouse, instead of serializing issues
+        # from Postgres. Issues that haven't been synced yet are still read from Postgres, as are the first seen
+        # timestamp of the fingerprints and the external issues of synced ones.
+        issues: dict[str, dict] = {}
+        missing_ids: list[str] = []
+
+        for result_dict in mapped_results:
+            issue_id = str(result_dict["id"])
+            if not result_dict.get("issue_status"):
+                missing_ids.append(issue_id)
+                continue
+
+            issues[issue_id] = {
+                "id": issue_id,
+                "status": result_dict["issue_status"],
+                "name": result_dict.get("issue_name"),
+                "description": result_dict.get("issue_description"),
+                "first_seen": None,
+                "assignee": self.extract_assignee(result_dict),
+                "external_issues": [],
+            }
+
+        if issues:
+            queryset = (
+                ErrorTrackingIssue.objects.with_first_seen()
+                .prefetch_related("external_issues__integration")
+                .filter(team=self.team, id__in=list(issues.keys()))
+                .only("id")
+            )
+            for issue in queryset:
+                issues[str(issue.id)]["first_seen"] = issue.first_seen
+                issues[str(issue.id)]["external_issues"] = ErrorTrackingExternalReferenceSerializer(
+                    issue.external_issues.all(), many=True
+                ).data
+
+        if missing_ids:
+            issues.update(self.error_tracking_issues(missing_ids))
+
+        return issues
+
+    def extract_assignee(self, result):
+        if result.get("issue_assigned_user_id") is not None:
+            return {"id": result["issue_assigned_user_id"], "type": "user"}
+        if result.get("issue_assigned_role_id") is not None:
+            return {"id": str(result["issue_assigned_role_id"]), "type": "role"}
+        return None
+
     def prefetch_issue_ids(self) -> list[str]:
         # We hit postgres to get a list of "valid" issue id's based on issue properties that aren't in
         # CH, but that we want to filter the returned results by. This is a hack - it'll break down if
@@ -523,6 +625,11 @@ class ErrorTrackingQueryRunner(QueryRunner):
 
         return [str(issue["id"]) for issue in queryset.values("id")]
 
+    @cached_property
+    def use_issues_table(self) -> bool:
+        # Issue property filters can only be applied in Postgres, so those queries keep filtering there
+        return bool(self.modifiers.useErrorTrackingIssuesTable) and not self.issue_properties
+
     @cached_property
     def issue_properties(self):
         return [value for value in self.properties if "error_tracking_issue" == value.type]
@@ -14,7 +14,7 @@ from posthog.hogql.ast import Alias
 from posthog.hogql.parser import parse_expr, parse_order_expr, parse_select
 from posthog.hogql.property import action_to_expr, has_aggregation, property_to_expr, map_virtual_properties
 from posthog.hogql_queries.insights.insight_actors_query_runner import InsightActorsQueryRunner
-from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
+from posthog.hogql_queries.insights.paginators import HogQLCursorPaginator, HogQLHasMorePaginator
 from posthog.hogql_queries.query_runner import QueryRunner, get_query_runner
 from posthog.models import Action, Person
 from posthog.models.element import chain_to_elements
@@ -41,12 +41,18 @@ class EventsQueryRunner(QueryRunner):
     query: EventsQuery
     response: EventsQueryResponse
     cached_response: CachedEventsQueryResponse
+    paginator: HogQLHasMorePaginator
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.paginator = HogQLHasMorePaginator.from_limit_context(
-            limit_context=self.limit_context, limit=self.query.limit, offset=self.query.offset
-        )
+        if self.query.cursor is not None:
+            self.paginator = HogQLCursorPaginator.from_limit_context(
+                limit_context=self.limit_context, tiebreaker=["uuid"], cursor=self.query.cursor, limit=self.query.limit
+            )
+        else:
+            self.paginator = HogQLHasMorePaginator.from_limit_context(
+                limit_context=self.limit_context, limit=self.query.limit, offset=self.query.offset
+            )
 
     @cached_property
     def source_runner(self) -> InsightActorsQueryRunner:
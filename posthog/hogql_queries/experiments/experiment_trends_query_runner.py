@@ -1,12 +1,15 @@
+import asyncio
 import json
 import threading
 from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 from zoneinfo import ZoneInfo
 
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
 
+from posthog.clickhouse.client.connection import use_async_client
 from posthog.clickhouse.query_tagging import tag_queries
 from posthog.constants import ExperimentNoResultsErrorKeys
 from posthog.hogql import ast
@@ -235,6 +238,13 @@ class ExperimentTrendsQueryRunner(QueryRunner):
 
         return prepared_exposure_query
 
+    async def _acalculate_results(self) -> tuple[TrendsQueryResponse, TrendsQueryResponse]:
+        # Both runners' series queries are awaited together on one event loop
+        count_result, exposure_result = await asyncio.gather(
+            self.count_query_runner.acalculate(), self.exposure_query_runner.acalculate()
+        )
+        return count_result, exposure_result
+
     def calculate(self) -> ExperimentTrendsQueryResponse:
         # Adding experiment specific tags to the tag collection
         # This will be available as labels in Prometheus
@@ -265,6 +275,10 @@ class ExperimentTrendsQueryRunner(QueryRunner):
         if settings.IN_UNIT_TESTING:
             run(self.count_query_runner, "count_result", False)
             run(self.exposure_query_runner, "exposure_result", False)
+        elif use_async_client(self.team.pk):
+            shared_results["count_result"], shared_results["exposure_result"] = async_to_sync(
+                self._acalculate_results
+            )()
         else:
             jobs = [
                 threading.Thread(target=run, args=(self.count_query_runner, "count_result", True)),
@@ -90,8 +90,14 @@ def convert(prop: PropertyGroup) -> PropertyGroupFilterValue:
 
 class HogQLCohortQuery:
     def __init__(
-        self, cohort_query: Optional[CohortQuery] = None, cohort: Optional[Cohort] = None, team: Optional[Team] = None
+        self,
+        cohort_query: Optional[CohortQuery] = None,
+        cohort: Optional[Cohort] = None,
+        team: Optional[Team] = None,
+        partition: Optional[tuple[int, int]] = None,
     ):
+        # (index, count): only match the persons whose id hashes into the given partition
+        self.partition = partition
         if cohort is not None:
             self.hogql_context = HogQLContext(team_id=cohort.team.pk, enable_select_queries=True)
             self.team = team or cohort.team
@@ -433,6 +439,20 @@ class HogQLCohortQuery:
         else:
             raise ValueError(f"Invalid property type for Cohort queries: {prop.type}")
 
+    def _get_partition_of(self, query: ast.SelectQuery | ast.SelectSetQuery) -> ast.SelectQuery | ast.SelectSetQuery:
+        # Filtering every condition, rather than the combined query, lets ClickHouse push the filter down below the
+        # aggregations by person, and keeps the sets combined by UNION/INTERSECT/EXCEPT to the partition's persons.
+        if self.partition is None:
+            return query
+        index, count = self.partition
+        return cast(
+            ast.SelectQuery,
+            parse_select(
+                "SELECT id FROM {query} WHERE cityHash64(id) % {count} = {index}",
+                {"query": query, "count": ast.Constant(value=count), "index": ast.Constant(value=index)},
+            ),
+        )
+
     def _get_conditions(self) -> ast.SelectQuery | ast.SelectSetQuery:
         Condition = namedtuple("Condition", ["query", "negation"])
 
@@ -443,7 +463,7 @@ class HogQLCohortQuery:
                 raise ValidationError("Cohort has a null property", str(prop))
 
             if isinstance(prop, Property):
-                return Condition(self._get_condition_for_property(prop), prop.negation or False)
+                return Condition(self._get_partition_of(self._get_condition_for_property(prop)), prop.negation or False)
 
             children = [build_conditions(property) for property in prop.values]
 
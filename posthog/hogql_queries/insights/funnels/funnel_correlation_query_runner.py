@@ -1,6 +1,12 @@
 import dataclasses
+import threading
 from typing import Literal, Optional, Any, TypedDict, cast
 
+from django.conf import settings
+from django.core.cache import cache
+
+from posthog.clickhouse import query_tagging
+from posthog.clickhouse.query_tagging import QueryTags
 from posthog.constants import AUTOCAPTURE_EVENT
 from posthog.hogql.parser import parse_select
 from posthog.hogql.property import property_to_expr
@@ -16,7 +22,6 @@ from rest_framework.exceptions import ValidationError
 
 from posthog.hogql import ast
 from posthog.hogql.constants import LimitContext
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql.timings import HogQLTimings
 from posthog.hogql_queries.insights.funnels.funnel_query_context import FunnelQueryContext
@@ -46,6 +51,8 @@ from posthog.schema import (
     HogQLQueryResponse,
     EventOddsRatioSerialized,
 )
+from posthog.schema_helpers import to_dict
+from posthog.utils import generate_cache_key, to_json
 
 
 class EventOddsRatio(TypedDict):
@@ -232,25 +239,29 @@ class FunnelCorrelationQueryRunner(QueryRunner):
         )
 
     def _calculate(self) -> tuple[list[EventOddsRatio], bool, str, HogQLQueryResponse]:
-        query = self.to_query()
-
-        hogql = to_printed_hogql(query, self.team)
-
-        response = execute_hogql_query(
-            query_type="FunnelsQuery",
-            query=query,
-            team=self.team,
-            timings=self.timings,
-            modifiers=self.modifiers,
-            limit_context=self.limit_context,
-        )
-        assert response.results
+        if self.modifiers.funnelCorrelationFanOut:
+            response, success_total, failure_total = self._calculate_fan_out()
+            results = response.results or []
+        else:
+            query = self.to_query()
+
+            response = execute_hogql_query(
+                query_type="FunnelsQuery",
+                query=query,
+                team=self.team,
+                timings=self.timings,
+                modifiers=self.modifiers,
+                limit_context=self.limit_context,
+                print_hogql_before_limit=True,
+            )
+            assert response.results
 
-        # Get the total success/failure counts from the results
-        results = [result for result in response.results if result[0] != self.TOTAL_IDENTIFIER]
-        _, success_total, failure_total = next(
-            result for result in response.results if result[0] == self.TOTAL_IDENTIFIER
-        )
+            # Get the total success/failure counts from the results
+            results = [result for result in response.results if result[0] != self.TOTAL_IDENTIFIER]
+            _, success_total, failure_total = next(
+                result for result in response.results if result[0] == self.TOTAL_IDENTIFIER
+            )
+        hogql = response.hogql or ""
 
         # Add a little structure, and keep it close to the query definition so it's
         # obvious what's going on with result indices.
@@ -299,6 +310,96 @@ class FunnelCorrelationQueryRunner(QueryRunner):
         events = positively_correlated_events[:10] + negatively_correlated_events[:10]
         return events, skewed_totals, hogql, response
 
+    def _calculate_fan_out(self) -> tuple[HogQLQueryResponse, int, int]:
+        """
+        Runs the contingency query without the totals, and the totals on their own, concurrently. The totals only
+        depend on the funnel, so they are cached and shared by all correlation types of the same funnel.
+        """
+        totals_cache_key = self._get_totals_cache_key()
+        totals: Optional[tuple[int, int]] = cache.get(totals_cache_key)
+
+        queries: dict[str, ast.SelectQuery | ast.SelectSetQuery] = {"correlation": self.to_correlation_query()}
+        if totals is None:
+            queries["totals"] = self.get_totals_query()
+
+        responses: dict[str, HogQLQueryResponse] = {}
+        errors: list[Exception] = []
+
+        def run(
+            name: str,
+            query: ast.SelectQuery | ast.SelectSetQuery,
+            timings: HogQLTimings,
+            is_parallel: bool,
+            query_tags: Optional[QueryTags] = None,
+        ):
+            try:
+                if query_tags:
+                    query_tagging.update_tags(query_tags)
+
+                responses[name] = execute_hogql_query(
+                    query_type="FunnelsQuery",
+                    query=query,
+                    team=self.team,
+                    timings=timings,
+                    modifiers=self.modifiers,
+                    limit_context=self.limit_context,
+                    print_hogql_before_limit=True,
+                )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                if is_parallel:
+                    from django.db import connection
+
+                    # This will only close the DB connection for the newly spawned thread and not the whole app
+                    connection.close()
+
+        # Same as for trends series, we're not spawning threads during unit tests
+        if len(queries) == 1 or settings.IN_UNIT_TESTING:
+            for name, query in queries.items():
+                run(name, query, self.timings, False)
+        else:
+            jobs = [
+                threading.Thread(
+                    target=run,
+                    args=(
+                        name,
+                        query,
+                        self.timings.clone_for_subquery(index),
+                        True,
+                        query_tagging.get_query_tags().model_copy(deep=True),
+                    ),
+                )
+                for index, (name, query) in enumerate(queries.items())
+            ]
+            [j.start() for j in jobs]  # type:ignore
+            [j.join() for j in jobs]  # type:ignore
+
+        # Raise any errors raised in a seperate thread
+        if len(errors) > 0:
+            raise errors[0]
+
+        if totals is None:
+            assert responses["totals"].results
+            success_total, failure_total = responses["totals"].results[0]
+            totals = (success_total, failure_total)
+            cache.set(totals_cache_key, totals, timeout=settings.FUNNEL_CORRELATION_TOTALS_TTL_SECONDS)
+
+        return responses["correlation"], totals[0], totals[1]
+
+    def _get_totals_cache_key(self) -> str:
+        # The totals don't depend on the correlation type or names, only on the funnel actors. Relative date ranges
+        # are resolved, so that totals aren't reused once the range has moved on.
+        date_range = FunnelEventQuery(context=self.context)._date_range()
+        payload = {
+            "team_id": self.team.pk,
+            "date_from": date_range.date_from().isoformat(),
+            "date_to": date_range.date_to().isoformat(),
+            "actors_query": to_dict(self.actors_query),
+            "modifiers": to_dict(self.modifiers),
+        }
+        return generate_cache_key(f"funnel_correlation_totals_{bytes.decode(to_json(payload))}")
+
     def serialize_event_odds_ratio(self, odds_ratio: EventOddsRatio) -> EventOddsRatioSerialized:
         event_definition = self.serialize_event_with_property(event=odds_ratio["event"])
         return EventOddsRatioSerialized(
@@ -345,6 +446,44 @@ class FunnelCorrelationQueryRunner(QueryRunner):
 
         return self.get_event_query()
 
+    def to_correlation_query(self) -> ast.SelectQuery | ast.SelectSetQuery:
+        """
+        Returns the contingency query without the trailing total success and failure counts.
+        """
+        query = self.to_query()
+        assert isinstance(query, ast.SelectSetQuery)
+        return query.initial_select_query
+
+    def get_totals_query(self) -> ast.SelectQuery:
+        funnel_persons_query = self.get_funnel_actors_cte()
+        target_step = self.context.max_steps
+
+        return cast(
+            ast.SelectQuery,
+            parse_select(
+                f"""
+                WITH
+                    funnel_actors AS (
+                        {{funnel_persons_query}}
+                    ),
+                    {target_step} AS target_step
+
+                SELECT
+                    countDistinctIf(
+                        funnel_actors.actor_id,
+                        funnel_actors.steps = target_step
+                    ) AS success_count,
+
+                    countDistinctIf(
+                        funnel_actors.actor_id,
+                        funnel_actors.steps <> target_step
+                    ) AS failure_count
+                FROM funnel_actors
+            """,
+                placeholders={"funnel_persons_query": funnel_persons_query},
+            ),
+        )
+
     def to_actors_query(self) -> ast.SelectQuery:
         assert self.correlation_actors_query is not None
 
@@ -11,7 +11,6 @@ from posthog.caching.insights_api import (
 
 from posthog.hogql import ast
 from posthog.hogql.constants import LimitContext
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql.timings import HogQLTimings
 from posthog.hogql_queries.insights.funnels.funnel_query_context import FunnelQueryContext
@@ -83,9 +82,6 @@ class FunnelsQueryRunner(QueryRunner):
         query = self.to_query()
         timings = []
 
-        # TODO: can we get this from execute_hogql_query as well?
-        hogql = to_printed_hogql(query, self.team)
-
         response = execute_hogql_query(
             query_type="FunnelsQuery",
             query=query,
@@ -93,6 +89,7 @@ class FunnelsQueryRunner(QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
             settings=HogQLGlobalSettings(
                 # Make sure funnel queries never OOM
                 max_bytes_before_external_group_by=MAX_BYTES_BEFORE_EXTERNAL_GROUP_BY,
@@ -109,7 +106,7 @@ class FunnelsQueryRunner(QueryRunner):
             isUdf=self._use_udf,
             results=results,
             timings=timings,
-            hogql=hogql,
+            hogql=response.hogql,
             modifiers=self.modifiers,
             resolved_date_range=ResolvedDateRangeResponse(
                 date_from=self.query_date_range.date_from(),
@@ -1,7 +1,9 @@
 from typing import Any, cast
 import unittest
 from unittest import skip
+from unittest.mock import patch
 
+from django.core.cache import cache
 from freezegun import freeze_time
 from rest_framework.exceptions import ValidationError
 
@@ -26,6 +28,7 @@ from posthog.schema import (
     FunnelsQuery,
     FunnelCorrelationResultsType,
     GroupPropertyFilter,
+    HogQLQueryModifiers,
     PersonPropertyFilter,
     PropertyOperator,
 )
@@ -2086,6 +2089,98 @@ class BaseTestClickhouseFunnelCorrelation(ClickhouseTestMixin, APIBaseTest):
         #     6,
         # )
 
+    def test_funnel_correlation_fan_out_shares_totals(self):
+        filters = {
+            "events": [
+                {"id": "user signed up", "type": "events", "order": 0},
+                {"id": "paid", "type": "events", "order": 1},
+            ],
+            "insight": INSIGHT_FUNNELS,
+            "date_from": "2020-01-01",
+            "date_to": "2020-01-14",
+        }
+
+        for i in range(20):
+            _create_person(
+                distinct_ids=[f"user_{i}"],
+                team_id=self.team.pk,
+                properties={"$browser": "Positive" if i < 10 else "Negative"},
+            )
+            _create_event(
+                team=self.team,
+                event="user signed up",
+                distinct_id=f"user_{i}",
+                timestamp="2020-01-02T14:00:00Z",
+            )
+            if i % 2 == 0:
+                _create_event(
+                    team=self.team,
+                    event="positively_related" if i < 10 else "negatively_related",
+                    distinct_id=f"user_{i}",
+                    timestamp="2020-01-03T14:00:00Z",
+                )
+            if i < 10:
+                _create_event(
+                    team=self.team,
+                    event="paid",
+                    distinct_id=f"user_{i}",
+                    timestamp="2020-01-04T14:00:00Z",
+                )
+
+        cache.clear()
+
+        def calculate(fan_out: bool, **kwargs):
+            correlation_query = FunnelCorrelationQuery(
+                source=FunnelsActorsQuery(source=cast(FunnelsQuery, filter_to_query(filters))), **kwargs
+            )
+            result, skewed_totals, _, _ = FunnelCorrelationQueryRunner(
+                query=correlation_query,
+                team=self.team,
+                modifiers=HogQLQueryModifiers(funnelCorrelationFanOut=fan_out),
+            )._calculate()
+            return result, skewed_totals
+
+        events_kwargs = {"funnelCorrelationType": FunnelCorrelationResultsType.EVENTS}
+        properties_kwargs = {
+            "funnelCorrelationType": FunnelCorrelationResultsType.PROPERTIES,
+            "funnelCorrelationNames": ["$browser"],
+        }
+
+        self.assertEqual(calculate(fan_out=True, **events_kwargs), calculate(fan_out=False, **events_kwargs))
+
+        # The totals of the funnel were cached by the events correlation, so aren't queried again
+        with patch.object(FunnelCorrelationQueryRunner, "get_totals_query") as get_totals_query:
+            fan_out_result = calculate(fan_out=True, **properties_kwargs)
+        get_totals_query.assert_not_called()
+        self.assertEqual(fan_out_result, calculate(fan_out=False, **properties_kwargs))
+
+        cache.clear()
+
+    def test_funnel_correlation_totals_cache_key_resolves_relative_date_ranges(self):
+        filters = {
+            "events": [
+                {"id": "user signed up", "type": "events", "order": 0},
+                {"id": "paid", "type": "events", "order": 1},
+            ],
+            "insight": INSIGHT_FUNNELS,
+            "date_from": "-7d",
+        }
+
+        def totals_cache_key() -> str:
+            return FunnelCorrelationQueryRunner(
+                query=FunnelCorrelationQuery(
+                    source=FunnelsActorsQuery(source=cast(FunnelsQuery, filter_to_query(filters))),
+                    funnelCorrelationType=FunnelCorrelationResultsType.EVENTS,
+                ),
+                team=self.team,
+            )._get_totals_cache_key()
+
+        with freeze_time("2020-01-10T12:00:00Z"):
+            key = totals_cache_key()
+            self.assertEqual(key, totals_cache_key())
+        with freeze_time("2020-01-11T12:00:00Z"):
+            self.assertNotEqual(key, totals_cache_key())
+
 
 class TestClickhouseFunnelCorrelation(BaseTestClickhouseFunnelCorrelation):
     __test__ = True
@@ -9,7 +9,6 @@ from posthog.caching.insights_api import (
 
 from posthog.hogql import ast
 from posthog.hogql.parser import parse_expr, parse_select
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.property import property_to_expr, action_to_expr
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql_queries.query_runner import QueryRunner
@@ -144,7 +143,6 @@ class LifecycleQueryRunner(QueryRunner):
 
     def calculate(self) -> LifecycleQueryResponse:
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="LifecycleQuery",
@@ -153,6 +151,7 @@ class LifecycleQueryRunner(QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
         )
 
         # TODO: can we move the data conversion part into the query as well? It would make it easier to swap
@@ -210,7 +209,7 @@ class LifecycleQueryRunner(QueryRunner):
         return LifecycleQueryResponse(
             results=res,
             timings=response.timings,
-            hogql=hogql,
+            hogql=response.hogql,
             modifiers=self.modifiers,
             resolved_date_range=ResolvedDateRangeResponse(
                 date_from=self.query_date_range.date_from(),
@@ -1,4 +1,10 @@
-from typing import Any, Optional, Union, cast
+import base64
+import binascii
+from datetime import date, datetime
+from typing import Any, Literal, Optional, Union, cast
+from uuid import UUID
+
+import orjson
 
 from posthog.hogql import ast
 from posthog.hogql.constants import (
@@ -7,7 +13,10 @@ from posthog.hogql.constants import (
     LimitContext,
     DEFAULT_RETURNED_ROWS,
 )
+from posthog.hogql.errors import QueryError
+from posthog.hogql.property import has_aggregation
 from posthog.hogql.query import execute_hogql_query
+from posthog.hogql.visitor import clone_expr
 from posthog.schema import HogQLQueryResponse
 
 
@@ -89,3 +98,226 @@ class HogQLHasMorePaginator:
             "limit": self.limit,
             "offset": self.offset,
         }
+
+
+CURSOR_COLUMN_PREFIX = "__cursor_"
+
+
+class HogQLCursorPaginator(HogQLHasMorePaginator):
+    """
+    Keyset (seek) paginator. Instead of skipping `offset` rows, which ClickHouse has to read and then discard,
+    each page continues right after the sort key of the last row of the previous page. That sort key is handed
+    to the client as an opaque cursor, so page N costs about the same as page 1.
+
+    A unique `tiebreaker` column is appended to the sort order to make it total. Queries whose order can't be
+    expressed as a row comparison (aggregations, positional order by, unions) fall back to offset pagination,
+    with the offset carried in the cursor instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        tiebreaker: list[str | int],
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        limit_context: Optional[LimitContext] = None,
+    ):
+        self.cursor = decode_cursor(cursor) if cursor else {}
+        super().__init__(limit=limit, offset=self.cursor.get("offset"), limit_context=limit_context)
+        self.tiebreaker = tiebreaker
+        self.order_by: Optional[list[ast.OrderExpr]] = None
+        self.next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_limit_context(  # type: ignore[override]
+        cls,
+        *,
+        limit_context: LimitContext,
+        tiebreaker: list[str | int],
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> "HogQLCursorPaginator":
+        max_rows = get_max_limit_for_context(limit_context)
+        default_rows = get_default_limit_for_context(limit_context)
+        limit = min(max_rows, default_rows if (limit is None or limit <= 0) else limit)
+        return cls(tiebreaker=tiebreaker, cursor=cursor, limit=limit, limit_context=limit_context)
+
+    def _supports_keyset(self, query: ast.SelectQuery) -> bool:
+        if query.group_by or query.distinct or query.limit_by:
+            return False
+        if any(has_aggregation(column) for column in query.select):
+            return False
+        return all(
+            not isinstance(order.expr, ast.Constant) and not has_aggregation(order.expr)
+            for order in (query.order_by or [])
+        )
+
+    def paginate(self, query: Union[ast.SelectQuery, ast.SelectSetQuery]) -> Union[ast.SelectQuery, ast.SelectSetQuery]:
+        if not isinstance(query, ast.SelectQuery) or not self._supports_keyset(query):
+            self.order_by = None
+            return super().paginate(query)
+
+        order_by = list(query.order_by or [])
+        if not any(isinstance(order.expr, ast.Field) and order.expr.chain == self.tiebreaker for order in order_by):
+            direction = order_by[-1].order if order_by else "DESC"
+            order_by.append(ast.OrderExpr(expr=ast.Field(chain=self.tiebreaker), order=direction))
+        query.order_by = order_by
+        self.order_by = [ast.OrderExpr(expr=clone_expr(order.expr), order=order.order) for order in order_by]
+
+        values = self.cursor.get("values")
+        if values is not None:
+            if len(values) != len(order_by):
+                raise QueryError("Invalid cursor for this query")
+            predicate = _seek_predicate(order_by, values)
+            query.where = ast.And(exprs=[query.where, predicate]) if query.where else predicate
+
+        query.limit = ast.Constant(value=self.limit + 1)
+        query.offset = ast.Constant(value=self.offset) if self.offset else None
+        return query
+
+    def execute_hogql_query(
+        self,
+        query: Union[ast.SelectQuery, ast.SelectSetQuery],
+        *,
+        query_type: str,
+        **kwargs,
+    ) -> HogQLQueryResponse:
+        query = self.paginate(query)
+
+        cursor_columns = 0
+        if self.order_by is not None and isinstance(query, ast.SelectQuery):
+            # Select the sort key as hidden columns, so the cursor can be built from the last row
+            cursor_columns = len(self.order_by)
+            query.select = [
+                *query.select,
+                *(
+                    ast.Alias(alias=f"{CURSOR_COLUMN_PREFIX}{index}", expr=clone_expr(order.expr))
+                    for index, order in enumerate(self.order_by)
+                ),
+            ]
+
+        self.response = cast(
+            HogQLQueryResponse,
+            execute_hogql_query(
+                query=query,
+                query_type=query_type,
+                **kwargs if self.limit_context is None else {"limit_context": self.limit_context, **kwargs},
+            ),
+        )
+        self.results = self.trim_results()
+
+        if cursor_columns > 0:
+            if self.has_more():
+                self.next_cursor = self._keyset_cursor(self.results[-1][-cursor_columns:])
+            self.results = [row[:-cursor_columns] for row in self.results]
+            if self.response.columns:
+                self.response.columns = self.response.columns[:-cursor_columns]
+            if self.response.types:
+                self.response.types = self.response.types[:-cursor_columns]
+        elif self.has_more():
+            self.next_cursor = encode_cursor({"offset": self.offset + self.limit})
+
+        return self.response
+
+    def _keyset_cursor(self, values: list[Any]) -> str:
+        try:
+            return encode_cursor({"values": [_encode_cursor_value(value) for value in values]})
+        except ValueError:
+            # The sort key can't be carried in a cursor, continue with an offset instead
+            return encode_cursor({"offset": self.offset + self.limit})
+
+    def response_params(self):
+        return {
+            **super().response_params(),
+            "nextCursor": self.next_cursor,
+        }
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error, orjson.JSONDecodeError):
+        raise QueryError("Invalid cursor")
+    if not isinstance(payload, dict):
+        raise QueryError("Invalid cursor")
+    if "values" in payload:
+        if not isinstance(payload["values"], list):
+            raise QueryError("Invalid cursor")
+        payload["values"] = [_decode_cursor_value(value) for value in payload["values"]]
+    if not isinstance(payload.get("offset", 0), int):
+        raise QueryError("Invalid cursor")
+    return payload
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise ValueError(f"Can't use value of type {type(value).__name__} in a cursor")
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    try:
+        if isinstance(value, dict):
+            if "datetime" in value:
+                return datetime.fromisoformat(value["datetime"])
+            if "date" in value:
+                return date.fromisoformat(value["date"])
+            if "uuid" in value:
+                return UUID(value["uuid"])
+            raise QueryError("Invalid cursor")
+    except (TypeError, ValueError):
+        raise QueryError("Invalid cursor")
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise QueryError("Invalid cursor")
+
+
+def _seek_predicate(order_by: list[ast.OrderExpr], values: list[Any]) -> ast.Expr:
+    """
+    Rows that sort strictly after `values`, expanded lexicographically so that mixed ASC/DESC orders work:
+    (a > x) OR (a = x AND b < y) OR (a = x AND b = y AND c > z) ...
+    NULLs sort last in ClickHouse in both directions, so they come after any value.
+    """
+    alternatives: list[ast.Expr] = []
+    equal_so_far: list[ast.Expr] = []
+    for order, value in zip(order_by, values):
+        if value is not None:
+            after: ast.Expr = ast.Or(
+                exprs=[
+                    ast.CompareOperation(
+                        op=_after_op(order.order),
+                        left=clone_expr(order.expr),
+                        right=ast.Constant(value=value),
+                    ),
+                    ast.Call(name="isNull", args=[clone_expr(order.expr)]),
+                ]
+            )
+            alternatives.append(ast.And(exprs=[*equal_so_far, after]) if equal_so_far else after)
+            equal_so_far.append(
+                ast.CompareOperation(
+                    op=ast.CompareOperationOp.Eq, left=clone_expr(order.expr), right=ast.Constant(value=value)
+                )
+            )
+        else:
+            equal_so_far.append(ast.Call(name="isNull", args=[clone_expr(order.expr)]))
+
+    if not alternatives:
+        # Every key of the last row was NULL, so there is nothing after it
+        return ast.Constant(value=False)
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return ast.Or(exprs=alternatives)
+
+
+def _after_op(order: Literal["ASC", "DESC"]) -> ast.CompareOperationOp:
+    return ast.CompareOperationOp.Gt if order == "ASC" else ast.CompareOperationOp.Lt
@@ -12,7 +12,6 @@ from posthog.constants import PAGEVIEW_EVENT, SCREEN_EVENT, HOGQL
 from posthog.hogql import ast
 from posthog.hogql.constants import LimitContext
 from posthog.hogql.parser import parse_select, parse_expr
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.property import property_to_expr
 from posthog.hogql.query import execute_hogql_query
 from posthog.hogql.timings import HogQLTimings
@@ -781,10 +780,47 @@ class PathsQueryRunner(QueryRunner):
             if conditions:
                 paths_query.having = ast.And(exprs=conditions)
 
-            paths_query.limit = ast.Constant(value=self.query.pathsFilter.edgeLimit or EDGE_LIMIT_DEFAULT)
+            paths_query.limit = ast.Constant(value=self.edge_limit)
+
+            if self.modifiers.prunePathsEdges:
+                paths_query = self.limit_edges_per_step(paths_query)
 
         return paths_query
 
+    @property
+    def edge_limit(self) -> int:
+        return self.query.pathsFilter.edgeLimit or EDGE_LIMIT_DEFAULT
+
+    def limit_edges_per_step(self, paths_query: ast.SelectQuery) -> ast.SelectQuery:
+        """
+        Splits the edge limit evenly over the step levels, so that deep levels aren't crowded out by the first few.
+        ClickHouse keeps the heaviest edges of each level with LIMIT BY, then applies the overall edge limit.
+        """
+        # Edges start at the second step, as the first one has no source
+        step_levels = max(self.event_in_session_limit - 1, 1)
+        edges_per_step = ceil(self.edge_limit / step_levels)
+
+        paths_query.select.append(ast.Alias(alias="step", expr=ast.Field(chain=["event_in_session_index"])))
+        paths_query.group_by = [ast.Field(chain=["step"]), *(paths_query.group_by or [])]
+        paths_query.limit = None
+        paths_query.limit_by = ast.LimitByExpr(n=ast.Constant(value=edges_per_step), exprs=[ast.Field(chain=["step"])])
+
+        return cast(
+            ast.SelectQuery,
+            parse_select(
+                """
+                SELECT source_event, target_event, event_count, average_conversion_time
+                FROM {edges_per_step_query}
+                ORDER BY event_count DESC,
+                        source_event,
+                        target_event
+                LIMIT {edge_limit}
+                """,
+                {"edges_per_step_query": paths_query, "edge_limit": ast.Constant(value=self.edge_limit)},
+                timings=self.timings,
+            ),
+        )
+
     @cached_property
     def query_date_range(self) -> QueryDateRange:
         return QueryDateRange(
@@ -818,7 +854,6 @@ class PathsQueryRunner(QueryRunner):
 
         seen = set()  # source nodes that have been traversed
         edges = defaultdict(list)
-        validated_results = []
         starting_nodes_stack = []
 
         for result in results:
@@ -835,15 +870,11 @@ class PathsQueryRunner(QueryRunner):
                 if node not in seen:
                     starting_nodes_stack.append(node)
 
-        for result in results:
-            if result[0] in seen:
-                validated_results.append(result)
-
-        return validated_results
+        # Yield the valid edges lazily, so that they stream into the response without an intermediate list
+        return (result for result in results if result[0] in seen)
 
     def calculate(self) -> PathsQueryResponse:
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="PathsQuery",
@@ -852,13 +883,12 @@ class PathsQueryRunner(QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
             settings=HogQLGlobalSettings(
                 max_bytes_before_external_group_by=MAX_BYTES_BEFORE_EXTERNAL_GROUP_BY
             ),  # Make sure funnel queries never OOM
         )
 
-        response.results = self.validate_results(response.results)
-
         assert response.results is not None
         results = (
             {
@@ -867,10 +897,12 @@ class PathsQueryRunner(QueryRunner):
                 "value": correct_result_for_sampling(value, self.query.samplingFactor),
                 "average_conversion_time": avg_conversion_time * 1000.0,
             }
-            for source, target, value, avg_conversion_time in response.results
+            for source, target, value, avg_conversion_time in self.validate_results(response.results)
         )
 
-        return PathsQueryResponse(results=results, timings=response.timings, hogql=hogql, modifiers=self.modifiers)
+        return PathsQueryResponse(
+            results=results, timings=response.timings, hogql=response.hogql, modifiers=self.modifiers
+        )
 
     @property
     def extra_event_fields_and_properties(self) -> list[str]:
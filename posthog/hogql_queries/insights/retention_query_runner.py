@@ -8,6 +8,8 @@ from posthog.hogql.constants import HogQLGlobalSettings, MAX_BYTES_BEFORE_EXTERN
 from math import ceil
 from typing import Any, cast, Optional
 
+import numpy as np
+
 from posthog.caching.insights_api import BASE_MINIMUM_INSIGHT_REFRESH_INTERVAL, REDUCED_MINIMUM_INSIGHT_REFRESH_INTERVAL
 from posthog.constants import (
     TREND_FILTER_TYPE_EVENTS,
@@ -15,7 +17,6 @@ from posthog.constants import (
 )
 from posthog.hogql import ast
 from posthog.hogql.constants import LimitContext
-from posthog.hogql.printer import to_printed_hogql
 from posthog.hogql.property import entity_to_expr
 from posthog.hogql.query import execute_hogql_query
 from posthog.models.action.action import Action
@@ -24,7 +25,6 @@ from posthog.hogql_queries.query_runner import QueryRunner
 from posthog.hogql_queries.utils.query_date_range import QueryDateRangeWithIntervals
 from posthog.models import Team
 from posthog.models.filters.mixins.utils import cached_property
-from posthog.queries.util import correct_result_for_sampling
 from posthog.schema import (
     CachedRetentionQueryResponse,
     HogQLQueryModifiers,
@@ -35,7 +35,10 @@ from posthog.schema import (
 )
 from posthog.schema import RetentionQuery, RetentionType, Breakdown
 from posthog.hogql.constants import get_breakdown_limit_for_context
-from posthog.hogql_queries.insights.trends.breakdown import BREAKDOWN_OTHER_STRING_LABEL
+from posthog.hogql_queries.insights.utils.retention_matrix import (
+    build_breakdown_retention_matrices,
+    build_retention_matrix,
+)
 
 DEFAULT_INTERVAL = IntervalType("day")
 DEFAULT_TOTAL_INTERVALS = 7
@@ -540,7 +543,6 @@ class RetentionQueryRunner(QueryRunner):
 
     def calculate(self) -> RetentionQueryResponse:
         query = self.to_query()
-        hogql = to_printed_hogql(query, self.team)
 
         response = execute_hogql_query(
             query_type="RetentionQuery",
@@ -549,103 +551,48 @@ class RetentionQueryRunner(QueryRunner):
             timings=self.timings,
             modifiers=self.modifiers,
             limit_context=self.limit_context,
+            print_hogql_before_limit=True,
             settings=HogQLGlobalSettings(max_bytes_before_external_group_by=MAX_BYTES_BEFORE_EXTERNAL_GROUP_BY),
         )
 
+        intervals = self.query_date_range.intervals_between
+        lookahead = self.query_date_range.lookahead
+        interval_name = self.query_date_range.interval_name.title()
+        value_labels = [f"{interval_name} {return_interval}" for return_interval in range(lookahead)]
+        start_labels = [f"{interval_name} {start_interval}" for start_interval in range(intervals)]
+        start_dates = [self.get_date(start_interval) for start_interval in range(intervals)]
+
+        def matrix_to_results(matrix: np.ndarray) -> list[dict[str, Any]]:
+            return [
+                {
+                    "values": [{"count": count, "label": label} for count, label in zip(interval_counts, value_labels)],
+                    "label": start_labels[start_interval],
+                    "date": start_dates[start_interval],
+                }
+                for start_interval, interval_counts in enumerate(matrix.tolist())
+            ]
+
+        results: list[dict[str, Any]] = []
         if self.breakdowns_in_query:
-            # Step 1: Calculate total cohort size for each breakdown value (size at intervals_from_base = 0)
-            breakdown_totals: dict[str, int] = {}
-            original_results = response.results or []
-            for row in original_results:
-                start_interval, intervals_from_base, breakdown_value, count = row
-                if intervals_from_base == 0:
-                    breakdown_totals[breakdown_value] = breakdown_totals.get(breakdown_value, 0) + count
-
-            # Step 2: Rank breakdowns and determine top N and 'Other'
             breakdown_limit = (
                 self.query.breakdownFilter.breakdown_limit
                 if self.query.breakdownFilter and self.query.breakdownFilter.breakdown_limit is not None
                 else get_breakdown_limit_for_context(self.limit_context)
             )
-            # Sort by count descending, then by breakdown value ascending for stability
-            sorted_breakdowns = sorted(breakdown_totals.items(), key=lambda item: (-item[1], item[0]), reverse=False)
-            other_values = {item[0] for item in sorted_breakdowns[breakdown_limit:]}
-
-            # Step 3: Aggregate results, grouping less frequent breakdowns into 'Other'
-            aggregated_data: dict[str, dict[int, dict[int, float]]] = {}
-            for row in original_results:
-                start_interval, intervals_from_base, breakdown_value, count = row
-
-                target_breakdown = breakdown_value
-                if breakdown_value in other_values:
-                    target_breakdown = BREAKDOWN_OTHER_STRING_LABEL
-
-                # Apply sampling correction when aggregating into the final structure
-                corrected_count = correct_result_for_sampling(count, self.query.samplingFactor)
-                aggregated_data[target_breakdown] = aggregated_data.get(target_breakdown, {})
-                breakdown_data = aggregated_data[target_breakdown]
-
-                breakdown_data[start_interval] = breakdown_data.get(start_interval, {})
-                interval_data = breakdown_data[start_interval]
-                interval_data[intervals_from_base] = interval_data.get(intervals_from_base, 0.0) + corrected_count
-
-            # Step 4: Format final output
-            final_results: list[dict[str, Any]] = []
-            # Keep track of the order based on the ranking
-            ordered_breakdown_keys = [item[0] for item in sorted_breakdowns[:breakdown_limit]]
-            if other_values:
-                ordered_breakdown_keys.append(BREAKDOWN_OTHER_STRING_LABEL)
-
-            for breakdown_value in ordered_breakdown_keys:
-                intervals_data: dict[int, dict[int, float]] = aggregated_data.get(breakdown_value, {})
-
-                breakdown_results = []
-                for start_interval in range(self.query_date_range.intervals_between):
-                    result_dict: dict[int, float] = intervals_data.get(start_interval, {})
-                    values = [
-                        {
-                            "count": result_dict.get(return_interval, 0.0),
-                            "label": f"{self.query_date_range.interval_name.title()} {return_interval}",
-                        }
-                        for return_interval in range(self.query_date_range.lookahead)
-                    ]
-
-                    breakdown_results.append(
-                        {
-                            "values": values,
-                            "label": f"{self.query_date_range.interval_name.title()} {start_interval}",
-                            "date": self.get_date(start_interval),
-                            "breakdown_value": breakdown_value,
-                        }
-                    )
-
-                final_results.extend(breakdown_results)
-
-            results = final_results
+            for breakdown_value, matrix in build_breakdown_retention_matrices(
+                response.results or [], intervals, lookahead, self.query.samplingFactor, breakdown_limit
+            ):
+                for result in matrix_to_results(matrix):
+                    result["breakdown_value"] = breakdown_value
+                    results.append(result)
         else:
-            # Rename this variable to avoid conflict with the one in the if block
-            results_by_interval_pair: dict[tuple[int, int], dict[str, float]] = {
-                (start_event_matching_interval, intervals_from_base): {
-                    "count": correct_result_for_sampling(count, self.query.samplingFactor)
-                }
-                for (start_event_matching_interval, intervals_from_base, count) in response.results
-            }
-            results = [
-                {
-                    "values": [
-                        {
-                            **results_by_interval_pair.get((start_interval, return_interval), {"count": 0.0}),
-                            "label": f"{self.query_date_range.interval_name.title()} {return_interval}",
-                        }
-                        for return_interval in range(self.query_date_range.lookahead)
-                    ],
-                    "label": f"{self.query_date_range.interval_name.title()} {start_interval}",
-                    "date": self.get_date(start_interval),
-                }
-                for start_interval in range(self.query_date_range.intervals_between)
-            ]
+            results = matrix_to_results(
+                build_retention_matrix(response.results or [], intervals, lookahead, self.query.samplingFactor)
+            )
 
-        return RetentionQueryResponse(results=results, timings=response.timings, hogql=hogql, modifiers=self.modifiers)
+        return RetentionQueryResponse(
+            results=results, timings=response.timings, hogql=response.hogql, modifiers=self.modifiers
+        )
 
     def to_actors_query(
         self, interval: Optional[int] = None, breakdown_values: str | list[str] | int | None = None
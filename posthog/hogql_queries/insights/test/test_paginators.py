@@ -8,12 +8,20 @@ from posthog.hogql.constants import (
     get_max_limit_for_context,
     MAX_SELECT_RETURNED_ROWS,
 )
+from posthog.hogql.errors import QueryError
 from posthog.hogql.parser import parse_select
-from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
+from posthog.hogql_queries.events_query_runner import EventsQueryRunner
+from posthog.hogql_queries.insights.paginators import (
+    HogQLCursorPaginator,
+    HogQLHasMorePaginator,
+    decode_cursor,
+    encode_cursor,
+)
 from posthog.hogql_queries.actors_query_runner import ActorsQueryRunner
 from posthog.models.utils import UUIDT
 from posthog.schema import (
     ActorsQuery,
+    EventsQuery,
     PersonPropertyFilter,
     PropertyOperator,
 )
@@ -221,3 +229,116 @@ class TestHogQLHasMorePaginator(ClickhouseTestMixin, APIBaseTest):
         )
         mock_execute_hogql_query.assert_called_once()
         self.assertEqual(mock_execute_hogql_query.call_args.kwargs["limit_context"], limit_context)
+
+
+class TestHogQLCursorPaginator(ClickhouseTestMixin, APIBaseTest):
+    maxDiff = None
+
+    def setUp(self):
+        super().setUp()
+        self.random_uuid = f"RANDOM_TEST_ID::{UUIDT()}"
+        for index in range(10):
+            _create_person(
+                properties={"email": f"jacob{index}@{self.random_uuid}.posthog.com", "index": index % 3},
+                team=self.team,
+                distinct_ids=[f"id-{self.random_uuid}-{index}"],
+            )
+            _create_event(distinct_id=f"id-{self.random_uuid}-{index}", event=f"clicky-{index}", team=self.team)
+        flush_persons_and_events()
+
+    def _paginate_actors(self, **kwargs) -> list[list]:
+        pages = []
+        cursor: str | None = ""
+        while cursor is not None:
+            response = ActorsQueryRunner(team=self.team, query=ActorsQuery(cursor=cursor, **kwargs)).calculate()
+            pages.append(response.results)
+            cursor = response.nextCursor
+            self.assertEqual(cursor is not None, response.hasMore)
+        return pages
+
+    def test_pages_match_offset_pagination(self):
+        pages = self._paginate_actors(select=["properties.email"], orderBy=["properties.email DESC"], limit=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+        self.assertEqual(
+            [row for page in pages for row in page],
+            [[f"jacob{index}@{self.random_uuid}.posthog.com"] for index in reversed(range(10))],
+        )
+
+    def test_ties_are_broken_by_actor_id(self):
+        pages = self._paginate_actors(
+            select=["properties.email", "properties.index"], orderBy=["properties.index ASC"], limit=4
+        )
+
+        rows = [row for page in pages for row in page]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(len({row[0] for row in rows}), 10)
+        self.assertEqual([row[1] for row in rows], sorted(row[1] for row in rows))
+
+    def test_does_not_use_offset(self):
+        runner = ActorsQueryRunner(
+            team=self.team, query=ActorsQuery(select=["properties.email"], orderBy=["properties.email DESC"], limit=3)
+        )
+        first_page = runner.calculate()
+
+        runner = ActorsQueryRunner(
+            team=self.team,
+            query=ActorsQuery(select=["properties.email"], orderBy=["properties.email DESC"], limit=3, cursor=""),
+        )
+        response = runner.calculate()
+        self.assertEqual(response.results, first_page.results)
+        assert response.nextCursor is not None
+
+        paginator = HogQLCursorPaginator(tiebreaker=["id"], cursor=response.nextCursor, limit=3)
+        query = cast(SelectQuery, parse_select("SELECT properties.email FROM persons ORDER BY properties.email DESC"))
+        paginator.paginate(query)
+        self.assertIsNone(query.offset)
+        self.assertIsNotNone(query.where)
+        self.assertEqual(len(query.order_by or []), 2)
+
+    def test_falls_back_to_offset_for_aggregations(self):
+        paginator = HogQLCursorPaginator(tiebreaker=["id"], limit=2)
+        paginator.execute_hogql_query(
+            cast(SelectQuery, parse_select("SELECT count() FROM persons GROUP BY properties.index")),
+            query_type="test_query",
+            team=self.team,
+        )
+        self.assertEqual(len(paginator.results), 2)
+        self.assertEqual(paginator.response_params()["hasMore"], True)
+        assert paginator.next_cursor is not None
+        self.assertEqual(decode_cursor(paginator.next_cursor), {"offset": 2})
+
+        paginator = HogQLCursorPaginator(tiebreaker=["id"], cursor=paginator.next_cursor, limit=2)
+        paginator.execute_hogql_query(
+            cast(SelectQuery, parse_select("SELECT count() FROM persons GROUP BY properties.index")),
+            query_type="test_query",
+            team=self.team,
+        )
+        self.assertEqual(len(paginator.results), 1)
+        self.assertIsNone(paginator.next_cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(QueryError):
+            HogQLCursorPaginator(tiebreaker=["id"], cursor="not a cursor")
+        with self.assertRaises(QueryError):
+            HogQLCursorPaginator(tiebreaker=["id"], cursor=encode_cursor({"values": [{"unknown": 1}]}))
+
+    def test_events_query(self):
+        rows = []
+        cursor: str | None = ""
+        while cursor is not None:
+            response = EventsQueryRunner(
+                team=self.team,
+                query=EventsQuery(
+                    select=["event", "timestamp"],
+                    where=[f"distinct_id like 'id-{self.random_uuid}-%'"],
+                    orderBy=["timestamp DESC"],
+                    limit=4,
+                    cursor=cursor,
+                ),
+            ).calculate()
+            self.assertEqual(response.columns, ["event", "timestamp"])
+            rows.extend(response.results)
+            cursor = response.nextCursor
+
+        self.assertEqual(sorted(row[0] for row in rows), sorted(f"clicky-{index}" for index in range(10)))
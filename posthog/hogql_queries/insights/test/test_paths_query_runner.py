@@ -988,3 +988,41 @@ class TestPaths(ClickhouseTestMixin, APIBaseTest):
         self.assertEqual(response[0].source, "1_/")
         self.assertEqual(response[0].target, "2_/about")
         self.assertEqual(response[0].value, 2)
+
+    def test_prune_paths_edges_keeps_top_edges_per_step(self):
+        for person_index, urls in enumerate(
+            [["/", "/a", "/b"], ["/", "/a"], ["/", "/a"], ["/", "/a"], ["/", "/c"], ["/", "/c"]], start=1
+        ):
+            _create_person(team_id=self.team.pk, distinct_ids=[f"person_{person_index}"])
+            for url_index, url in enumerate(urls):
+                _create_event(
+                    properties={"$current_url": url},
+                    distinct_id=f"person_{person_index}",
+                    event="$pageview",
+                    team=self.team,
+                    timestamp=f"2020-04-14 03:2{url_index}:34",
+                )
+
+        def run(prune_paths_edges: bool) -> tuple[list[tuple[str, str, int]], str]:
+            result = PathsQueryRunner(
+                query={
+                    "kind": "PathsQuery",
+                    "dateRange": {"date_from": "2020-04-13"},
+                    "pathsFilter": {"stepLimit": 3, "edgeLimit": 2},
+                    "modifiers": {"prunePathsEdges": prune_paths_edges},
+                },
+                team=self.team,
+            ).run()
+            assert isinstance(result, CachedPathsQueryResponse)
+            return [(edge.source, edge.target, edge.value) for edge in result.results], result.hogql or ""
+
+        # The two heaviest edges overall are both on the first step
+        edges, hogql = run(prune_paths_edges=False)
+        self.assertEqual(edges, [("1_/", "2_/a", 4), ("1_/", "2_/c", 2)])
+        self.assertNotRegex(hogql, r"LIMIT \d+\s+BY step")
+
+        # With pruning, ClickHouse splits the edge limit between the two steps
+        edges, hogql = run(prune_paths_edges=True)
+        self.assertEqual(edges, [("1_/", "2_/a", 4), ("2_/a", "3_/b", 1)])
+        self.assertRegex(hogql, r"LIMIT 1\s+BY step")
+        self.assertRegex(hogql, r"LIMIT 2$")
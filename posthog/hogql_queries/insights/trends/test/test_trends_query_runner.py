@@ -21,6 +21,7 @@ from posthog.hogql_queries.insights.trends.breakdown import (
     BREAKDOWN_NULL_STRING_LABEL,
     BREAKDOWN_OTHER_STRING_LABEL,
 )
+from posthog.hogql_queries.query_runner import ExecutionMode
 from posthog.hogql_queries.insights.trends.trends_query_runner import (
     BREAKDOWN_OTHER_DISPLAY,
     TrendsQueryRunner,
@@ -5717,3 +5718,43 @@ class TestTrendsQueryRunner(ClickhouseTestMixin, APIBaseTest):
             "2020-01-09",
             response.results[0]["days"],
         )
+
+    @override_settings(INSIGHT_INCREMENTAL_REFRESH_ENABLED=True, INSIGHT_INCREMENTAL_REFRESH_SETTLE_HOURS=24)
+    def test_incremental_refresh_reuses_settled_buckets(self):
+        query = TrendsQuery(
+            series=[EventsNode(event="$pageview")],
+            dateRange=DateRange(date_from="-7d"),
+            interval=IntervalType.DAY,
+        )
+
+        with freeze_time("2020-01-15T12:00:00Z"):
+            for day in range(8, 16):
+                _create_event(team=self.team, event="$pageview", distinct_id="p1", timestamp=f"2020-01-{day}T10:00:00Z")
+            flush_persons_and_events()
+            TrendsQueryRunner(team=self.team, query=query).run(execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS)
+
+        with freeze_time("2020-01-17T12:00:00Z"):
+            for timestamp in ("2020-01-16T10:00:00Z", "2020-01-17T10:00:00Z", "2020-01-17T11:00:00Z"):
+                _create_event(team=self.team, event="$pageview", distinct_id="p1", timestamp=timestamp)
+            # Arrived too late to be picked up, as the day had settled by the time it was first calculated
+            _create_event(team=self.team, event="$pageview", distinct_id="p1", timestamp="2020-01-12T10:00:00Z")
+            flush_persons_and_events()
+
+            with patch.object(
+                TrendsQueryRunner, "calculate", autospec=True, wraps=TrendsQueryRunner.calculate
+            ) as calculate:
+                response = TrendsQueryRunner(team=self.team, query=query).run(
+                    execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS
+                )
+            full_response = TrendsQueryRunner(team=self.team, query=query).calculate()
+
+        # Only the buckets from the day before the previous refresh onwards were queried
+        assert calculate.call_count == 1
+        assert calculate.call_args.args[0].query_date_range.date_from() == datetime(
+            2020, 1, 14, tzinfo=zoneinfo.ZoneInfo("UTC")
+        )
+
+        assert response.results[0]["days"] == full_response.results[0]["days"]
+        assert response.results[0]["data"] == [1, 1, 1, 1, 1, 1, 1, 2]
+        assert full_response.results[0]["data"] == [1, 1, 2, 1, 1, 1, 1, 2]
+        assert response.results[0]["count"] == 9
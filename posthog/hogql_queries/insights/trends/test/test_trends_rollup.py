@@ -0,0 +1,113 @@
+import uuid
+
+from freezegun import freeze_time
+
+from posthog.clickhouse.client import sync_execute
+from posthog.hogql_queries.insights.trends.trends_query_runner import TrendsQueryRunner
+from posthog.models.trends_rollup.sql import TRENDS_ROLLUP_INSERT_SQL, TRENDS_ROLLUP_SET_WATERMARKS_SQL
+from posthog.schema import (
+    BaseMathType,
+    BreakdownFilter,
+    DateRange,
+    EventsNode,
+    HogQLQueryModifiers,
+    IntervalType,
+    PersonsOnEventsMode,
+    TrendsQuery,
+)
+from posthog.test.base import APIBaseTest, ClickhouseTestMixin, _create_event, flush_persons_and_events
+
+
+@freeze_time("2025-01-10T12:00:00Z")
+class TestTrendsRollup(ClickhouseTestMixin, APIBaseTest):
+    def _create_events(self, rolled_up_until: str = "2025-01-10"):
+        person_ids = [uuid.uuid4() for _ in range(3)]
+        for day in range(1, 11):
+            for index in range(day % 3 + 1):
+                for hour in (0, 10, 23):
+                    _create_event(
+                        team=self.team,
+                        event="$pageview",
+                        distinct_id=f"user_{index}",
+                        person_id=person_ids[index],
+                        timestamp=f"2025-01-{day:02d}T{hour:02d}:30:00Z",
+                    )
+            _create_event(
+                team=self.team,
+                event="signed_up",
+                distinct_id="user_0",
+                person_id=person_ids[0],
+                timestamp=f"2025-01-{day:02d}T12:00:00Z",
+            )
+        flush_persons_and_events()
+
+        for granularity in ("daily", "hourly"):
+            sync_execute(TRENDS_ROLLUP_INSERT_SQL("2025-01-01", "2025-01-10", [self.team.pk], granularity))
+        sync_execute(TRENDS_ROLLUP_SET_WATERMARKS_SQL("2025-01-01", rolled_up_until, [self.team.pk], completed=True))
+
+    def _run(self, use_trends_rollups: bool, **kwargs):
+        query = TrendsQuery(
+            dateRange=DateRange(date_from="-7d"),
+            interval=IntervalType.DAY,
+            modifiers=HogQLQueryModifiers(
+                useTrendsRollups=use_trends_rollups,
+                personsOnEventsMode=PersonsOnEventsMode.PERSON_ID_NO_OVERRIDE_PROPERTIES_ON_EVENTS,
+            ),
+            **kwargs,
+        )
+        return TrendsQueryRunner(team=self.team, query=query).calculate()
+
+    def test_rollup_matches_raw_events(self):
+        self._create_events()
+
+        for series in (
+            [EventsNode(event="$pageview")],
+            [EventsNode(event="$pageview", math=BaseMathType.DAU)],
+            [EventsNode(event=None)],
+        ):
+            raw_response = self._run(use_trends_rollups=False, series=series)
+            rollup_response = self._run(use_trends_rollups=True, series=series)
+
+            assert "trends_rollup_daily" not in (raw_response.hogql or "")
+            assert "trends_rollup_daily" in (rollup_response.hogql or "")
+            assert [result["data"] for result in rollup_response.results] == [
+                result["data"] for result in raw_response.results
+            ]
+            assert [result["days"] for result in rollup_response.results] == [
+                result["days"] for result in raw_response.results
+            ]
+
+    def test_days_not_marked_as_completed_read_raw_events(self):
+        self._create_events(rolled_up_until="2025-01-06")
+        sync_execute(TRENDS_ROLLUP_SET_WATERMARKS_SQL("2025-01-04", "2025-01-05", [self.team.pk], completed=False))
+
+        for series in ([EventsNode(event="$pageview")], [EventsNode(event="$pageview", math=BaseMathType.DAU)]):
+            raw_response = self._run(use_trends_rollups=False, series=series)
+            rollup_response = self._run(use_trends_rollups=True, series=series)
+
+            assert "trends_rollup_daily" in (rollup_response.hogql or "")
+            assert "2025-01-04" in (rollup_response.hogql or "")
+            assert rollup_response.results[0]["data"] == raw_response.results[0]["data"]
+
+    def test_hourly_rollup_for_projects_outside_utc(self):
+        self.team.timezone = "Europe/Berlin"
+        self.team.save()
+        self._create_events()
+
+        series = [EventsNode(event="$pageview")]
+        raw_response = self._run(use_trends_rollups=False, series=series)
+        rollup_response = self._run(use_trends_rollups=True, series=series)
+
+        assert "trends_rollup_hourly" in (rollup_response.hogql or "")
+        assert rollup_response.results[0]["data"] == raw_response.results[0]["data"]
+
+    def test_unsupported_queries_read_raw_events(self):
+        self._create_events()
+
+        for kwargs in (
+            {"breakdownFilter": BreakdownFilter(breakdown="$browser")},
+            {"series": [EventsNode(event="$pageview", math=BaseMathType.WEEKLY_ACTIVE)]},
+        ):
+            response = self._run(use_trends_rollups=True, **{"series": [EventsNode(event="$pageview")], **kwargs})
+
+            assert "trends_rollup" not in (response.hogql or "")
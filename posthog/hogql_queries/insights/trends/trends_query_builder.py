@@ -17,6 +17,7 @@ from posthog.hogql_queries.insights.trends.breakdown import (
     Breakdown,
 )
 from posthog.hogql_queries.insights.trends.display import TrendsDisplay
+from posthog.hogql_queries.insights.trends.trends_rollup import TrendsRollupQueryBuilder
 from posthog.hogql_queries.insights.trends.utils import series_event_name, is_groups_math
 from posthog.hogql_queries.utils.query_date_range import QueryDateRange
 from posthog.models.action.action import Action
@@ -147,6 +148,9 @@ class TrendsQueryBuilder(DataWarehouseInsightQueryMixin):
         no_modifications: Optional[bool],
         breakdown: Breakdown,
     ) -> ast.SelectQuery:
+        if not no_modifications and not breakdown.enabled and self._rollup_query_builder.can_use_rollup():
+            return self._rollup_query_builder.build_query()
+
         events_filter = self._events_filter(
             ignore_breakdowns=False,
             breakdown=breakdown,
@@ -812,6 +816,17 @@ class TrendsQueryBuilder(DataWarehouseInsightQueryMixin):
             limit_context=self.limit_context,
         )
 
+    @cached_property
+    def _rollup_query_builder(self) -> TrendsRollupQueryBuilder:
+        return TrendsRollupQueryBuilder(
+            trends_query=self.query,
+            team=self.team,
+            query_date_range=self.query_date_range,
+            series=self.series,
+            modifiers=self.modifiers,
+            trends_display=self._trends_display,
+        )
+
     @cached_property
     def _aggregation_operation(self) -> AggregationOperations:
         return AggregationOperations(
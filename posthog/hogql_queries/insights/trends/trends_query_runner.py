@@ -1,10 +1,12 @@
+import asyncio
 import threading
 from copy import deepcopy
 from datetime import timedelta, datetime
 from math import ceil
 from operator import itemgetter
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
 from django.db import models
 from django.db.models.functions import Coalesce
@@ -16,11 +18,11 @@ from posthog.caching.insights_api import (
     REDUCED_MINIMUM_INSIGHT_REFRESH_INTERVAL,
 )
 from posthog.clickhouse import query_tagging
+from posthog.clickhouse.client.connection import use_async_client
 from posthog.clickhouse.query_tagging import QueryTags
 from posthog.hogql import ast
 from posthog.hogql.constants import MAX_SELECT_RETURNED_ROWS, LimitContext
-from posthog.hogql.printer import to_printed_hogql
-from posthog.hogql.query import execute_hogql_query
+from posthog.hogql.query import aexecute_hogql_query, execute_hogql_query
 from posthog.hogql.timings import HogQLTimings
 from posthog.hogql_queries.insights.trends.breakdown import (
     BREAKDOWN_NULL_DISPLAY,
@@ -49,6 +51,7 @@ from posthog.models.property_definition import PropertyDefinition
 from posthog.queries.util import correct_result_for_sampling
 from posthog.schema import (
     ActionsNode,
+    BaseMathType,
     BreakdownItem,
     BreakdownType,
     CachedTrendsQueryResponse,
@@ -58,6 +61,7 @@ from posthog.schema import (
     DashboardFilter,
     DataWarehouseEventsModifier,
     DataWarehouseNode,
+    DateRange,
     DayItem,
     EventsNode,
     HogQLQueryModifiers,
@@ -340,87 +344,144 @@ class TrendsQueryRunner(QueryRunner):
     def calculate(self):
         queries = self.to_queries()
 
-        if len(queries) == 0:
-            response_hogql = ""
-        else:
-            if len(queries) == 1:
-                response_hogql_query = queries[0]
+        with self.timings.measure("execute_queries"):
+            query_timings = self.timings.to_list(back_out_stack=False)
+            self.timings.clear_timings()
+
+            # This exists so that we're not spawning threads or event loops during unit tests. We can't do
+            # this right now due to the lack of multithreaded support of Django
+            if len(queries) == 1 or settings.IN_UNIT_TESTING:
+                responses = [
+                    self._execute_query(query, self.timings.clone_for_subquery(index))
+                    for index, query in enumerate(queries)
+                ]
+            elif use_async_client(self.team.pk):
+                responses = async_to_sync(self._aexecute_queries)(queries)
             else:
-                response_hogql_query = ast.SelectSetQuery.create_from_queries(queries, "UNION ALL")
+                responses = self._execute_queries_in_threads(queries)
 
-            with self.timings.measure("printing_hogql_for_response"):
-                response_hogql = to_printed_hogql(response_hogql_query, self.team, self.modifiers)
+        return self._build_response(queries, responses, query_timings)
 
-        res_matrix: list[list[Any] | Any | None] = [None] * len(queries)
-        timings_matrix: list[list[QueryTiming] | None] = [None] * (2 + len(queries))
-        errors: list[Exception] = []
-        debug_errors: list[str] = []
+    async def acalculate(self) -> TrendsQueryResponse:
+        """
+        Calculates the response with the series queries awaited together, so that it can be calculated concurrently
+        with other query runners on the same event loop.
+        """
+        queries = await sync_to_async(self.to_queries)()
 
-        def run(
-            index: int,
-            query: ast.SelectQuery | ast.SelectSetQuery,
-            timings: HogQLTimings,
-            is_parallel: bool,
-            query_tags: Optional[QueryTags] = None,
-        ):
-            try:
-                if query_tags:
-                    query_tagging.update_tags(query_tags)
+        with self.timings.measure("execute_queries"):
+            query_timings = self.timings.to_list(back_out_stack=False)
+            self.timings.clear_timings()
+            responses = await self._aexecute_queries(queries)
+
+        return await sync_to_async(self._build_response)(queries, responses, query_timings)
 
-                series_with_extra = self.series[index]
+    def _execute_query(self, query: ast.SelectQuery | ast.SelectSetQuery, timings: HogQLTimings) -> HogQLQueryResponse:
+        return execute_hogql_query(
+            query_type="TrendsQuery",
+            query=query,
+            team=self.team,
+            timings=timings,
+            modifiers=self.modifiers,
+            limit_context=self.limit_context,
+            print_hogql_before_limit=True,
+        )
 
-                response = execute_hogql_query(
+    async def _aexecute_queries(self, queries: list[ast.SelectQuery | ast.SelectSetQuery]) -> list[HogQLQueryResponse]:
+        responses = await asyncio.gather(
+            *(
+                aexecute_hogql_query(
                     query_type="TrendsQuery",
                     query=query,
                     team=self.team,
-                    timings=timings,
+                    timings=self.timings.clone_for_subquery(index),
                     modifiers=self.modifiers,
                     limit_context=self.limit_context,
+                    print_hogql_before_limit=True,
                 )
+                for index, query in enumerate(queries)
+            ),
+            return_exceptions=True,
+        )
+        # Like the threads, all queries are awaited before raising the first error
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+        return cast(list[HogQLQueryResponse], responses)
+
+    def _execute_queries_in_threads(
+        self, queries: list[ast.SelectQuery | ast.SelectSetQuery]
+    ) -> list[HogQLQueryResponse]:
+        responses: list[HogQLQueryResponse | None] = [None] * len(queries)
+        errors: list[Exception] = []
 
-                timings_matrix[index + 1] = response.timings
-                res_matrix[index] = self.build_series_response(response, series_with_extra, len(queries))
-                if response.error:
-                    debug_errors.append(response.error)
+        def run(
+            index: int,
+            query: ast.SelectQuery | ast.SelectSetQuery,
+            timings: HogQLTimings,
+            query_tags: QueryTags,
+        ):
+            try:
+                query_tagging.update_tags(query_tags)
+                responses[index] = self._execute_query(query, timings)
             except Exception as e:
                 errors.append(e)
             finally:
-                if is_parallel:
-                    from django.db import connection
-
-                    # This will only close the DB connection for the newly spawned thread and not the whole app
-                    connection.close()
-
-        with self.timings.measure("execute_queries"):
-            timings_matrix[0] = self.timings.to_list(back_out_stack=False)
-            self.timings.clear_timings()
-
-            # This exists so that we're not spawning threads during unit tests. We can't do
-            # this right now due to the lack of multithreaded support of Django
-            if len(queries) == 1 or settings.IN_UNIT_TESTING:
-                for index, query in enumerate(queries):
-                    run(index, query, self.timings.clone_for_subquery(index), False)
-            else:
-                jobs = [
-                    threading.Thread(
-                        target=run,
-                        args=(
-                            index,
-                            query,
-                            self.timings.clone_for_subquery(index),
-                            True,
-                            query_tagging.get_query_tags().model_copy(deep=True),
-                        ),
-                    )
-                    for index, query in enumerate(queries)
-                ]
-                [j.start() for j in jobs]  # type:ignore
-                [j.join() for j in jobs]  # type:ignore
+                from django.db import connection
+
+                # This will only close the DB connection for the newly spawned thread and not the whole app
+                connection.close()
+
+        jobs = [
+            threading.Thread(
+                target=run,
+                args=(
+                    index,
+                    query,
+                    self.timings.clone_for_subquery(index),
+                    query_tagging.get_query_tags().model_copy(deep=True),
+                ),
+            )
+            for index, query in enumerate(queries)
+        ]
+        [j.start() for j in jobs]  # type:ignore
+        [j.join() for j in jobs]  # type:ignore
 
         # Raise any errors raised in a seperate thread
         if len(errors) > 0:
             raise errors[0]
 
+        return cast(list[HogQLQueryResponse], responses)
+
+    def _hogql_for_response(
+        self, queries: list[ast.SelectQuery | ast.SelectSetQuery], responses: list[HogQLQueryResponse]
+    ) -> str:
+        # Each series query is printed to HogQL while being compiled, so the response joins those into the union of
+        # the series rather than printing the queries again
+        if len(responses) == 1:
+            return responses[0].hogql or ""
+        return "\nUNION ALL\n".join(
+            f"({response.hogql})" if isinstance(query, ast.SelectSetQuery) else response.hogql or ""
+            for query, response in zip(queries, responses)
+        )
+
+    def _build_response(
+        self,
+        queries: list[ast.SelectQuery | ast.SelectSetQuery],
+        responses: list[HogQLQueryResponse],
+        query_timings: list[QueryTiming],
+    ) -> TrendsQueryResponse:
+        res_matrix: list[list[Any] | Any | None] = [
+            self.build_series_response(response, self.series[index], len(queries))
+            for index, response in enumerate(responses)
+        ]
+        timings_matrix: list[list[QueryTiming] | None] = [
+            query_timings,
+            *(response.timings for response in responses),
+            None,
+        ]
+        debug_errors: list[str] = [response.error for response in responses if response.error]
+
         # Flatten res and timings
         returned_results: list[list[dict[str, Any]]] = []
         for result in res_matrix:
@@ -491,7 +552,7 @@ class TrendsQueryRunner(QueryRunner):
             results=final_result,
             hasMore=has_more,
             timings=timings,
-            hogql=response_hogql,
+            hogql=self._hogql_for_response(queries, responses),
             modifiers=self.modifiers,
             error=". ".join(debug_errors),
             resolved_date_range=ResolvedDateRangeResponse(
@@ -500,6 +561,131 @@ class TrendsQueryRunner(QueryRunner):
             ),
         )
 
+    def calculate_incrementally(self, cached_response: dict) -> Optional[TrendsQueryResponse]:
+        """
+        Reuses the buckets of the cached results that had settled when they were calculated, and only queries the
+        buckets after them. Only plain time series are supported, where every bucket is calculated independently.
+        """
+        if not self._can_calculate_incrementally():
+            return None
+
+        previous_results = cached_response.get("results")
+        last_refresh = cached_response.get("last_refresh")
+        if not isinstance(previous_results, list) or not isinstance(last_refresh, str):
+            return None
+        if cached_response.get("timezone") != self.team.timezone:
+            return None
+
+        settled_before = datetime.fromisoformat(last_refresh) - timedelta(
+            hours=settings.INSIGHT_INCREMENTAL_REFRESH_SETTLE_HOURS
+        )
+        buckets = self.query_date_range.all_values()
+        interval_delta = self.query_date_range.interval_relativedelta()
+        settled_count = next(
+            (index for index, bucket in enumerate(buckets) if bucket + interval_delta > settled_before), len(buckets)
+        )
+        if settled_count == 0 or settled_count == len(buckets):
+            return None
+
+        date_format = "%Y-%m-%dT%H:%M:%S.%f"
+        incremental_query = self.query.model_copy(
+            update={
+                "dateRange": DateRange(
+                    date_from=buckets[settled_count].strftime(date_format),
+                    date_to=self.query_date_range.date_to().strftime(date_format),
+                    explicitDate=True,
+                )
+            }
+        )
+        incremental_response = TrendsQueryRunner(
+            query=incremental_query,
+            team=self.team,
+            timings=self.timings,
+            modifiers=self.modifiers,
+            limit_context=self.limit_context,
+        ).calculate()
+
+        if incremental_response.error or len(incremental_response.results) != len(previous_results):
+            return None
+
+        merged_results: list[dict[str, Any]] = []
+        for previous, fresh in zip(previous_results, incremental_response.results):
+            if previous.get("label") != fresh["label"] or previous.get("order") != fresh.get("order"):
+                return None
+
+            previous_data_by_day = dict(zip(previous.get("days") or [], previous.get("data") or []))
+            previous_labels_by_day = dict(zip(previous.get("days") or [], previous.get("labels") or []))
+            settled_days = [
+                bucket.strftime("%Y-%m-%d %H:%M:%S" if self.query_date_range.interval_name == "hour" else "%Y-%m-%d")
+                for bucket in buckets[:settled_count]
+            ]
+            if any(day not in previous_data_by_day for day in settled_days):
+                # The cached results were calculated for a range that didn't include these buckets
+                return None
+
+            data = [previous_data_by_day[day] for day in settled_days] + fresh["data"]
+            merged_results.append(
+                {
+                    **fresh,
+                    "data": data,
+                    "labels": [previous_labels_by_day.get(day) for day in settled_days] + fresh["labels"],
+                    "days": settled_days + fresh["days"],
+                    "count": float(sum(data)),
+                    "filter": self._query_to_filter(),
+                    "action": {**fresh["action"], "days": buckets},
+                }
+            )
+
+        return TrendsQueryResponse(
+            results=merged_results,
+            hasMore=False,
+            timings=incremental_response.timings,
+            hogql=incremental_response.hogql,
+            modifiers=self.modifiers,
+            resolved_date_range=ResolvedDateRangeResponse(
+                date_from=self.query_date_range.date_from(),
+                date_to=self.query_date_range.date_to(),
+            ),
+        )
+
+    def _can_calculate_incrementally(self) -> bool:
+        if self.query_date_range.interval_name == "minute":
+            return False
+        if self._trends_display.is_total_value() or self._trends_display.display_type in (
+            ChartDisplayType.ACTIONS_LINE_GRAPH_CUMULATIVE,
+        ):
+            return False
+        if self.breakdown_enabled or (self.query.compareFilter is not None and self.query.compareFilter.compare):
+            return False
+        if self.query.trendsFilter is not None and (
+            self.query.trendsFilter.formula
+            or self.query.trendsFilter.formulas
+            or self.query.trendsFilter.formulaNodes
+            or (self.query.trendsFilter.smoothingIntervals or 1) > 1
+        ):
+            return False
+        if self.query.samplingFactor is not None and self.query.samplingFactor != 1:
+            return False
+        # These look back beyond their own bucket, or depend on when an actor was first seen
+        return not any(
+            series.math
+            in (
+                BaseMathType.WEEKLY_ACTIVE,
+                BaseMathType.MONTHLY_ACTIVE,
+                BaseMathType.FIRST_TIME_FOR_USER,
+                BaseMathType.FIRST_MATCHING_EVENT_FOR_USER,
+            )
+            for series in self.query.series
+        )
+
+    def sampled_matches(self, response: TrendsQueryResponse) -> Optional[float]:
+        # Only event counts scale with the sample factor, other maths and formulas don't count matched rows
+        if not self.query.samplingFactor or (self.query.trendsFilter and self.query.trendsFilter.formulaNodes):
+            return None
+        if any(series.math not in (None, BaseMathType.TOTAL) for series in self.query.series):
+            return None
+        return sum(result.get("count", 0) for result in response.results) * self.query.samplingFactor
+
     def build_series_response(self, response: HogQLQueryResponse, series: SeriesWithExtras, series_count: int):
         def get_value(name: str, val: Any):
             if name not in ["date", "total", "breakdown_value"]:
@@ -0,0 +1,230 @@
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Literal, Optional, cast
+
+from posthog.clickhouse.client import sync_execute
+from posthog.hogql import ast
+from posthog.hogql.parser import parse_expr, parse_select
+from posthog.hogql_queries.insights.trends.display import TrendsDisplay
+from posthog.hogql_queries.utils.query_date_range import QueryDateRange
+from posthog.models.filters.mixins.utils import cached_property
+from posthog.models.team.team import Team
+from posthog.models.trends_rollup.sql import (
+    TRENDS_ROLLUP_COMPLETED_DAYS_SQL,
+    TRENDS_ROLLUP_DAILY_TABLE,
+    TRENDS_ROLLUP_HOURLY_TABLE,
+)
+from posthog.schema import (
+    ActionsNode,
+    BaseMathType,
+    ChartDisplayType,
+    DataWarehouseNode,
+    EventsNode,
+    HogQLQueryModifiers,
+    PersonsOnEventsMode,
+    TrendsQuery,
+)
+
+RollupGranularity = Literal["daily", "hourly"]
+
+
+class TrendsRollupQueryBuilder:
+    """
+    Answers simple trends series from the trends_rollup_daily/hourly tables instead of scanning raw events.
+
+    Only UTC days that the rollup job marked as completed for the team are read. Everything from the first day that
+    isn't (usually the current day) is aggregated from raw events into the same aggregate states and merged with the rollup, so the results match the
+    regular query.
+    """
+
+    def __init__(
+        self,
+        trends_query: TrendsQuery,
+        team: Team,
+        query_date_range: QueryDateRange,
+        series: EventsNode | ActionsNode | DataWarehouseNode,
+        modifiers: HogQLQueryModifiers,
+        trends_display: TrendsDisplay,
+    ):
+        self.query = trends_query
+        self.team = team
+        self.query_date_range = query_date_range
+        self.series = series
+        self.modifiers = modifiers
+        self.trends_display = trends_display
+
+    def can_use_rollup(self) -> bool:
+        if not self.modifiers.useTrendsRollups:
+            return False
+
+        if not isinstance(self.series, EventsNode):
+            return False
+
+        if self.series.math not in (None, BaseMathType.TOTAL, BaseMathType.DAU):
+            return False
+
+        if self.series.math == BaseMathType.DAU:
+            # The rollup counts the person_id written on the event, which is only right without person overrides
+            if self.modifiers.personsOnEventsMode != PersonsOnEventsMode.PERSON_ID_NO_OVERRIDE_PROPERTIES_ON_EVENTS:
+                return False
+            # Cumulative unique users are counted once per query, which the per bucket states can't answer
+            if self.trends_display.display_type == ChartDisplayType.ACTIONS_LINE_GRAPH_CUMULATIVE:
+                return False
+
+        # The rollup has no dimensions other than the event name
+        if self.series.properties or self.series.fixedProperties or self.query.properties:
+            return False
+
+        if self.query.filterTestAccounts and self.team.test_account_filters:
+            return False
+
+        if self.query.breakdownFilter is not None and (
+            self.query.breakdownFilter.breakdown is not None or self.query.breakdownFilter.breakdowns
+        ):
+            return False
+
+        if self.query.samplingFactor is not None and self.query.samplingFactor != 1:
+            return False
+
+        if self._granularity is None:
+            return False
+
+        return self._rollup_date_to() > self._rollup_date_from()
+
+    def build_query(self) -> ast.SelectQuery:
+        granularity = cast(RollupGranularity, self._granularity)
+        table_name = TRENDS_ROLLUP_DAILY_TABLE if granularity == "daily" else TRENDS_ROLLUP_HOURLY_TABLE
+
+        if self.series.math == BaseMathType.DAU:
+            state_column, state_aggregation, merge_function = (
+                "persons_uniq_exact_state",
+                "uniqExactState(e.person_id)",
+                "uniqExactMerge",
+            )
+        else:
+            state_column, state_aggregation, merge_function = (
+                "events_count_state",
+                "sumState(toUInt64(1))",
+                "sumMerge",
+            )
+
+        date_range_placeholders = self.query_date_range.to_placeholders()
+        rollup_date_to = ast.Constant(value=self._rollup_date_to())
+        rollup_filters: list[ast.Expr] = [
+            parse_expr(
+                "period_bucket >= {date_from_with_adjusted_start_of_interval}", placeholders=date_range_placeholders
+            ),
+            parse_expr("period_bucket < {rollup_date_to}", placeholders={"rollup_date_to": rollup_date_to}),
+        ]
+        events_filters: list[ast.Expr] = [
+            parse_expr("timestamp >= {rollup_date_to}", placeholders={"rollup_date_to": rollup_date_to}),
+            parse_expr("timestamp <= {date_to}", placeholders=date_range_placeholders),
+        ]
+        event = cast(EventsNode, self.series).event
+        if event is not None:
+            rollup_filters.append(parse_expr("event = {event}", placeholders={"event": ast.Constant(value=event)}))
+            events_filters.append(parse_expr("event = {event}", placeholders={"event": ast.Constant(value=event)}))
+
+        is_total_value = self.trends_display.is_total_value()
+        start_of_interval = f"toStartOf{self.query_date_range.interval_name.title()}"
+
+        query = cast(
+            ast.SelectQuery,
+            parse_select(
+                f"""
+                SELECT {merge_function}(state) AS total {"" if is_total_value else ", day_start"}
+                FROM (
+                    SELECT
+                        {state_column} AS state
+                        {"" if is_total_value else f", {start_of_interval}(period_bucket) AS day_start"}
+                    FROM {table_name}
+                    WHERE {{rollup_filter}}
+                    UNION ALL
+                    SELECT
+                        {state_aggregation} AS state
+                        {"" if is_total_value else f", {start_of_interval}(timestamp) AS day_start"}
+                    FROM events AS e
+                    WHERE {{events_filter}}
+                    {"" if is_total_value else "GROUP BY day_start"}
+                )
+                {"" if is_total_value else "GROUP BY day_start"}
+                """,
+                placeholders={
+                    "rollup_filter": ast.And(exprs=rollup_filters),
+                    "events_filter": ast.And(exprs=events_filters),
+                },
+            ),
+        )
+
+        if is_total_value:
+            query.order_by = [ast.OrderExpr(expr=parse_expr("1"), order="DESC")]
+
+        return query
+
+    @cached_property
+    def _granularity(self) -> Optional[RollupGranularity]:
+        interval_name = self.query_date_range.interval_name
+        if interval_name == "minute":
+            return None
+
+        date_from, date_to = self.query_date_range.date_from(), self.query_date_range.date_to()
+        utc_offsets = [date_from.utcoffset(), date_to.utcoffset()]
+
+        # Daily buckets are UTC days, so they only line up with the intervals of UTC projects
+        if interval_name != "hour" and self.team.timezone == "UTC":
+            granularity: RollupGranularity = "daily"
+        elif all(offset is not None and offset % timedelta(hours=1) == timedelta(0) for offset in utc_offsets):
+            granularity = "hourly"
+        else:
+            return None
+
+        # The query must start on a bucket boundary, or the first bucket would count events from before the range
+        if not self.query_date_range.use_start_of_interval() and self._truncate(date_from, granularity) != date_from:
+            return None
+
+        return granularity
+
+    def _rollup_date_from(self) -> datetime:
+        date_from = self.query_date_range.date_from()
+        if self.query_date_range.use_start_of_interval():
+            date_from = self.query_date_range.align_with_interval(date_from)
+        return date_from
+
+    def _date_to_bucket(self) -> datetime:
+        granularity = cast(RollupGranularity, self._granularity)
+        return self._truncate(self.query_date_range.date_to() + timedelta(microseconds=1), granularity)
+
+    def _rollup_date_to(self) -> datetime:
+        """The end of the completed rollup days within the query range. Raw events are read from here on."""
+        rollup_date_from = self._rollup_date_from()
+        date_to_bucket = self._date_to_bucket()
+        if date_to_bucket <= rollup_date_from:
+            return rollup_date_from
+
+        day = rollup_date_from.astimezone(UTC).date()
+        while day in self._completed_days:
+            day += timedelta(days=1)
+        first_incomplete_day = datetime.combine(day, time.min, tzinfo=UTC).astimezone(rollup_date_from.tzinfo)
+        return max(min(first_incomplete_day, date_to_bucket), rollup_date_from)
+
+    @cached_property
+    def _completed_days(self) -> set[date]:
+        rollup_date_from = self._rollup_date_from()
+        date_to_bucket = self._date_to_bucket()
+        rows = sync_execute(
+            TRENDS_ROLLUP_COMPLETED_DAYS_SQL(),
+            {
+                "team_ids": [self.team.pk],
+                "date_from": rollup_date_from.astimezone(UTC).date(),
+                "date_to": (date_to_bucket - timedelta(microseconds=1)).astimezone(UTC).date(),
+            },
+            team_id=self.team.pk,
+        )
+        return {day for _, team_days in rows for day in team_days}
+
+    @staticmethod
+    def _truncate(date: datetime, granularity: RollupGranularity) -> datetime:
+        date_utc = date.astimezone(UTC)
+        truncated = date_utc.replace(minute=0, second=0, microsecond=0)
+        if granularity == "daily":
+            truncated = truncated.replace(hour=0)
+        return truncated.astimezone(date.tzinfo)
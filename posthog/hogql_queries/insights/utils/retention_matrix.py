@@ -0,0 +1,103 @@
+from collections.abc import Hashable, Sequence
+from typing import Any, Optional
+
+import numpy as np
+
+from posthog.hogql_queries.insights.trends.breakdown import BREAKDOWN_OTHER_STRING_LABEL
+
+
+def _correct_for_sampling(counts: np.ndarray, sampling_factor: Optional[float]) -> np.ndarray:
+    """Vectorized `correct_result_for_sampling`. np.round rounds half to even, same as Python's round."""
+    if not sampling_factor:
+        return counts
+    return np.round(counts * (1 / sampling_factor))
+
+
+def _in_bounds(start_intervals: np.ndarray, return_intervals: np.ndarray, intervals: int, lookahead: int) -> np.ndarray:
+    return (
+        (start_intervals >= 0)
+        & (start_intervals < intervals)
+        & (return_intervals >= 0)
+        & (return_intervals < lookahead)
+    )
+
+
+def build_retention_matrix(
+    rows: Sequence[Sequence[Any]], intervals: int, lookahead: int, sampling_factor: Optional[float]
+) -> np.ndarray:
+    """
+    Turns (start_interval, intervals_from_base, count) rows into an intervals x lookahead matrix of sampling corrected
+    counts. Pairs missing from the rows are 0.
+    """
+    matrix = np.zeros((intervals, lookahead), dtype=np.float64)
+    if not rows:
+        return matrix
+
+    start_intervals, return_intervals, counts = (np.asarray(column) for column in zip(*rows))
+    start_intervals = start_intervals.astype(np.int64)
+    return_intervals = return_intervals.astype(np.int64)
+    counts = _correct_for_sampling(counts.astype(np.float64), sampling_factor)
+
+    mask = _in_bounds(start_intervals, return_intervals, intervals, lookahead)
+    matrix[start_intervals[mask], return_intervals[mask]] = counts[mask]
+    return matrix
+
+
+def build_breakdown_retention_matrices(
+    rows: Sequence[Sequence[Any]],
+    intervals: int,
+    lookahead: int,
+    sampling_factor: Optional[float],
+    breakdown_limit: int,
+) -> list[tuple[Hashable, np.ndarray]]:
+    """
+    Turns (start_interval, intervals_from_base, breakdown_value, count) rows into one retention matrix per breakdown
+    value, ordered by cohort size. Breakdown values past `breakdown_limit` are summed into an "Other" matrix, and
+    breakdown values without a cohort (no row for interval 0) are left out.
+    """
+    if not rows:
+        return []
+
+    start_column, return_column, breakdown_column, count_column = zip(*rows)
+
+    # Factorize in Python, as breakdown values can be of any (mixed) hashable type
+    breakdown_codes: dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (breakdown_codes.setdefault(value, len(breakdown_codes)) for value in breakdown_column),
+        dtype=np.int64,
+        count=len(breakdown_column),
+    )
+    breakdown_values = list(breakdown_codes.keys())
+
+    start_intervals = np.asarray(start_column, dtype=np.int64)
+    return_intervals = np.asarray(return_column, dtype=np.int64)
+    raw_counts = np.asarray(count_column, dtype=np.float64)
+
+    # Rank breakdowns by cohort size (count at intervals_from_base = 0), then by value for stability
+    is_cohort = return_intervals == 0
+    has_cohort = np.bincount(codes[is_cohort], minlength=len(breakdown_values)) > 0
+    cohort_sizes = np.bincount(codes[is_cohort], weights=raw_counts[is_cohort], minlength=len(breakdown_values))
+    ranked_codes = sorted(
+        (code for code in range(len(breakdown_values)) if has_cohort[code]),
+        key=lambda code: (-cohort_sizes[code], breakdown_values[code]),
+    )
+    top_codes, other_codes = ranked_codes[:breakdown_limit], ranked_codes[breakdown_limit:]
+
+    # Map every breakdown to its output slot: top breakdowns first, then "Other", and -1 for dropped breakdowns
+    slots = np.full(len(breakdown_values), -1, dtype=np.int64)
+    slots[top_codes] = np.arange(len(top_codes))
+    if other_codes:
+        slots[other_codes] = len(top_codes)
+    slot_count = len(top_codes) + (1 if other_codes else 0)
+
+    row_slots = slots[codes]
+    mask = (row_slots >= 0) & _in_bounds(start_intervals, return_intervals, intervals, lookahead)
+    counts = _correct_for_sampling(raw_counts[mask], sampling_factor)
+
+    matrices = np.zeros((slot_count, intervals, lookahead), dtype=np.float64)
+    np.add.at(matrices, (row_slots[mask], start_intervals[mask], return_intervals[mask]), counts)
+
+    labels: list[Hashable] = [breakdown_values[code] for code in top_codes]
+    if other_codes:
+        labels.append(BREAKDOWN_OTHER_STRING_LABEL)
+    return list(zip(labels, matrices))
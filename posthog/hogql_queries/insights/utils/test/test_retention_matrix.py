@@ -0,0 +1,57 @@
+from posthog.hogql_queries.insights.trends.breakdown import BREAKDOWN_OTHER_STRING_LABEL
+from posthog.hogql_queries.insights.utils.retention_matrix import (
+    build_breakdown_retention_matrices,
+    build_retention_matrix,
+)
+
+
+class TestBuildRetentionMatrix:
+    def test_fills_missing_pairs_with_zero(self):
+        matrix = build_retention_matrix([(0, 0, 5), (0, 1, 3), (1, 0, 4), (5, 0, 100)], 2, 2, None)
+
+        assert matrix.tolist() == [[5.0, 3.0], [4.0, 0.0]]
+
+    def test_corrects_for_sampling(self):
+        matrix = build_retention_matrix([(0, 0, 5), (0, 1, 3)], 1, 2, 0.1)
+
+        assert matrix.tolist() == [[50.0, 30.0]]
+
+
+class TestBuildBreakdownRetentionMatrices:
+    def test_ranks_breakdowns_by_cohort_size(self):
+        rows = [
+            (0, 0, "b", 2),
+            (0, 0, "a", 2),
+            (0, 1, "a", 1),
+            (0, 0, "c", 7),
+            # No cohort for "d", so it's left out
+            (0, 1, "d", 9),
+        ]
+
+        result = build_breakdown_retention_matrices(rows, 1, 2, None, breakdown_limit=10)
+
+        assert [(value, matrix.tolist()) for value, matrix in result] == [
+            ("c", [[7.0, 0.0]]),
+            ("a", [[2.0, 1.0]]),
+            ("b", [[2.0, 0.0]]),
+        ]
+
+    def test_folds_breakdowns_past_the_limit_into_other(self):
+        rows = [
+            (0, 0, "a", 10),
+            (0, 0, "b", 3),
+            (0, 1, "b", 1),
+            (0, 0, "c", 2),
+            (1, 0, "c", 5),
+            (0, 1, "c", 1),
+        ]
+
+        result = build_breakdown_retention_matrices(rows, 2, 2, 0.5, breakdown_limit=1)
+
+        assert [(value, matrix.tolist()) for value, matrix in result] == [
+            ("a", [[20.0, 0.0], [0.0, 0.0]]),
+            (BREAKDOWN_OTHER_STRING_LABEL, [[10.0, 4.0], [10.0, 0.0]]),
+        ]
+
+    def test_no_rows(self):
+        assert build_breakdown_retention_matrices([], 2, 2, None, breakdown_limit=10) == []
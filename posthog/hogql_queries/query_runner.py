@@ -29,12 +29,14 @@ from posthog.hogql.printer import print_ast
 from posthog.hogql.query import create_default_modifiers_for_team
 from posthog.hogql.timings import HogQLTimings
 from posthog.hogql_queries.query_cache import QueryCacheManager
+from posthog.hogql_queries.utils.adaptive_sampling import get_adaptive_sampling, relative_error
 from posthog.metrics import LABEL_TEAM_ID
 from posthog.models import Team, User
 from posthog.models.team import WeekStartDay
 from posthog.schema import (
     ActorsPropertyTaxonomyQuery,
     ActorsQuery,
+    AdaptiveSamplingResult,
     CacheMissResponse,
     DashboardFilter,
     DateRange,
@@ -89,6 +91,12 @@ QUERY_CACHE_WRITE_COUNTER = Counter(
     labelnames=[LABEL_TEAM_ID],
 )
 
+QUERY_INCREMENTAL_REFRESH_COUNTER = Counter(
+    "posthog_query_incremental_refresh_total",
+    "Whether a query could be refreshed incrementally from its cached result.",
+    labelnames=[LABEL_TEAM_ID, "result"],
+)
+
 QUERY_CACHE_HIT_COUNTER = Counter(
     "posthog_query_cache_hit_total",
     "Whether we could fetch the query from the cache or not.",
@@ -760,6 +768,28 @@ class QueryRunner(ABC, Generic[Q, R, CR]):
     def calculate(self) -> R:
         raise NotImplementedError()
 
+    def calculate_incrementally(self, cached_response: dict) -> Optional[R]:
+        """
+        Recalculates only the part of a previously cached response that may have changed since it was calculated.
+        The cached response comes from the same cache key, so it was calculated for the same query and modifiers.
+        Returns None when the query can't be refreshed incrementally, in which case it's calculated in full.
+        """
+        return None
+
+    def _calculate_with_cache(self, cache_manager: QueryCacheManager) -> R:
+        if settings.INSIGHT_INCREMENTAL_REFRESH_ENABLED:
+            cached_response = cache_manager.get_cache_data()
+            if self.is_cached_response(cached_response):
+                with self.timings.measure("incremental_refresh"):
+                    response = self.calculate_incrementally(cached_response)
+                QUERY_INCREMENTAL_REFRESH_COUNTER.labels(
+                    team_id=self.team.pk, result="incremental" if response is not None else "full"
+                ).inc()
+                if response is not None:
+                    return response
+
+        return self.calculate()
+
     def enqueue_async_calculation(
         self,
         *,
@@ -928,6 +958,10 @@ class QueryRunner(ABC, Generic[Q, R, CR]):
                 self.modifiers = create_default_modifiers_for_user(user, self.team, self.modifiers)
                 self.modifiers.useMaterializedViews = True
 
+            # Only estimated when calculating. Results are cached under the key of the query as requested, which
+            # differs from the exact query's by the adaptiveSampling modifier.
+            adaptive_sampling = self.apply_adaptive_sampling(cache_key)
+
             concurrency_limit = self.get_api_queries_concurrency_limit()
             with get_api_personal_rate_limiter().run(
                 is_api=self.is_query_service,
@@ -952,8 +986,9 @@ class QueryRunner(ABC, Generic[Q, R, CR]):
                         team_id=self.team.id,
                         is_api=get_query_tag_value("access_method") == "personal_api_key",
                     ):
+                        calculated_response = self._calculate_with_cache(cache_manager)
                         fresh_response_dict = {
-                            **self.calculate().model_dump(),
+                            **calculated_response.model_dump(),
                             "is_cached": False,
                             "last_refresh": last_refresh,
                             "next_allowed_client_refresh": last_refresh + self._refresh_frequency(),
@@ -961,6 +996,11 @@ class QueryRunner(ABC, Generic[Q, R, CR]):
                             "timezone": self.team.timezone,
                             "cache_target_age": target_age,
                         }
+            if adaptive_sampling is not None and "adaptiveSampling" in CachedResponse.model_fields:
+                adaptive_sampling.relativeError = relative_error(
+                    adaptive_sampling.samplingFactor, self.sampled_matches(calculated_response)
+                )
+                fresh_response_dict["adaptiveSampling"] = adaptive_sampling.model_dump()
             if get_query_tag_value("trigger"):
                 fresh_response_dict["calculation_trigger"] = get_query_tag_value("trigger")
             fresh_response = CachedResponse(**fresh_response_dict)
@@ -979,6 +1019,25 @@ class QueryRunner(ABC, Generic[Q, R, CR]):
 
             return fresh_response
 
+    def apply_adaptive_sampling(self, cache_key: str) -> Optional[AdaptiveSamplingResult]:
+        """
+        With the adaptiveSampling modifier, samples queries that would read more rows than fit the latency budget.
+        Only applies to queries that support sampling and don't set a sample factor themselves.
+        """
+        if not self.modifiers.adaptiveSampling:
+            return None
+        if "samplingFactor" not in type(self.query).model_fields or self.query.samplingFactor is not None:  # type: ignore
+            return None
+
+        adaptive_sampling = get_adaptive_sampling(self, cache_key)
+        if adaptive_sampling is not None and adaptive_sampling.samplingFactor < 1:
+            self.query.samplingFactor = adaptive_sampling.samplingFactor  # type: ignore
+        return adaptive_sampling
+
+    def sampled_matches(self, response: R) -> Optional[float]:
+        """Rows the sampled query matched, for the relative error of adaptive sampling. None if the runner can't tell."""
+        return None
+
     def get_api_queries_concurrency_limit(self):
         """
         :return: None - no feature, 0 - rate limited, 1,3,<other> for actual concurrency limit
@@ -693,3 +693,40 @@ class TestActorsQueryRunner(ClickhouseTestMixin, APIBaseTest):
         response = runner.calculate()
 
         self.assertEqual(response.results[0][0], "Test User With Spaces")
+
+    def test_person_properties_projection(self):
+        self.random_uuid = self._create_random_persons()
+        runner = self._create_runner(
+            ActorsQuery(select=["person", "properties.index"], personProperties=["random_uuid"])
+        )
+
+        response = runner.calculate()
+
+        assert len(response.results) == 10
+        for row in response.results:
+            assert set(row[0]["properties"].keys()) == {"email", "name", "random_uuid", "index"}
+            assert row[0]["properties"]["random_uuid"] == self.random_uuid
+            assert len(row[0]["distinct_ids"]) > 0
+
+    def test_person_properties_are_all_loaded_without_projection(self):
+        _create_person(
+            team_id=self.team.pk,
+            distinct_ids=["id_email"],
+            properties={"email": "user@email.com", "plan": "free", "wide": "x" * 100},
+        )
+        flush_persons_and_events()
+
+        response = self._create_runner(ActorsQuery(select=["person"])).calculate()
+
+        assert response.results[0][0]["properties"] == {"email": "user@email.com", "plan": "free", "wide": "x" * 100}
+
+    def test_persons_are_looked_up_once_per_request(self):
+        self.random_uuid = self._create_random_persons()
+        runner = self._create_runner(ActorsQuery(select=["person", "actor"]))
+
+        with patch.object(runner.strategy, "_fetch_persons", wraps=runner.strategy._fetch_persons) as fetch_persons:
+            response = runner.calculate()
+
+        assert fetch_persons.call_count == 1
+        assert len(fetch_persons.call_args.args[0]) == 10
+        assert all(row[0]["id"] == row[1]["id"] for row in response.results)
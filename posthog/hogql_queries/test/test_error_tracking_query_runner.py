@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 from unittest import TestCase
 from freezegun import freeze_time
 from dateutil.relativedelta import relativedelta
@@ -14,6 +14,7 @@ from posthog.schema import (
     PropertyGroupFilterValue,
     PersonPropertyFilter,
     ErrorTrackingIssueFilter,
+    HogQLQueryModifiers,
     PropertyOperator,
 )
 from ee.models.rbac.role import Role
@@ -24,6 +25,8 @@ from posthog.models.error_tracking import (
     update_error_tracking_issue_fingerprints,
     override_error_tracking_issue_fingerprint,
 )
+from posthog.clickhouse.client import sync_execute
+from posthog.models.error_tracking.sql import TRUNCATE_ERROR_TRACKING_ISSUES_TABLE_SQL
 from posthog.test.base import (
     APIBaseTest,
     ClickhouseTestMixin,
@@ -135,6 +138,7 @@ class TestErrorTrackingQueryRunner(ClickhouseTestMixin, APIBaseTest):
         volumeResolution=1,
         withAggregations=False,
         withFirstEvent=False,
+        modifiers=None,
     ):
         return (
             ErrorTrackingQueryRunner(
@@ -152,6 +156,7 @@ class TestErrorTrackingQueryRunner(ClickhouseTestMixin, APIBaseTest):
                     volumeResolution=volumeResolution,
                     withFirstEvent=withFirstEvent,
                     withAggregations=withAggregations,
+                    modifiers=modifiers,
                 ),
             )
             .calculate()
@@ -473,6 +478,41 @@ class TestErrorTrackingQueryRunner(ClickhouseTestMixin, APIBaseTest):
         results = self._calculate(assignee={"type": "role", "id": str(role.id)})["results"]
         self.assertEqual([x["id"] for x in results], [issue_id])
 
+    @freeze_time("2022-01-10T12:11:00")
+    def test_issues_table_status_and_assignee(self):
+        modifiers = HogQLQueryModifiers(useErrorTrackingIssuesTable=True)
+        resolved_issue = ErrorTrackingIssue.objects.get(id=self.issue_id_one)
+        resolved_issue.status = ErrorTrackingIssue.Status.RESOLVED
+        resolved_issue.save()
+        ErrorTrackingIssueFingerprintV2.objects.filter(issue=resolved_issue).update(
+            first_seen=datetime(2019, 12, 1, tzinfo=UTC)
+        )
+        ErrorTrackingIssueAssignment.objects.create(issue_id=self.issue_id_two, user=self.user)
+
+        results = self._calculate(status="active", orderBy="last_seen", modifiers=modifiers)["results"]
+        self.assertEqual([r["id"] for r in results], [self.issue_id_three, self.issue_id_two])
+
+        results = self._calculate(status="resolved", modifiers=modifiers)["results"]
+        self.assertEqual([r["id"] for r in results], [self.issue_id_one])
+        self.assertEqual(results[0]["status"], "resolved")
+        self.assertEqual(results[0]["name"], self.issue_name_one)
+        self.assertEqual(results[0]["first_seen"].isoformat(), "2019-12-01T00:00:00+00:00")
+        self.assertEqual(results[0]["external_issues"], [])
+
+        results = self._calculate(assignee={"type": "user", "id": self.user.pk}, modifiers=modifiers)["results"]
+        self.assertEqual([r["id"] for r in results], [self.issue_id_two])
+        self.assertEqual(results[0]["assignee"], {"id": self.user.pk, "type": "user"})
+
+    @freeze_time("2022-01-10T12:11:00")
+    def test_issues_table_falls_back_to_postgres_for_unsynced_issues(self):
+        sync_execute(TRUNCATE_ERROR_TRACKING_ISSUES_TABLE_SQL)
+
+        results = self._calculate(
+            status="active", orderBy="last_seen", modifiers=HogQLQueryModifiers(useErrorTrackingIssuesTable=True)
+        )["results"]
+        self.assertEqual([r["id"] for r in results], [self.issue_id_three, self.issue_id_two, self.issue_id_one])
+        self.assertEqual(results[2]["name"], self.issue_name_one)
+
     @freeze_time("2022-01-10T12:11:00")
     @snapshot_clickhouse_queries
     def test_issue_filters(self):
@@ -464,6 +464,53 @@ class TestSessionBatchEventsQueryRunner(ClickhouseTestMixin, APIBaseTest):
             actual_pages = [event[2] for event in all_events]  # properties.page is at index 2
             self.assertEqual(actual_pages, expected_pages)
 
+    def test_stream_session_events(self):
+        """Test streaming events one session at a time, across blocks and with a per-session cap."""
+        self._create_events_for_sessions(
+            [
+                ("user1", "2025-01-11T12:00:01Z", self.session_1_id, {"page": "/page1"}),
+                ("user1", "2025-01-11T12:01:00Z", self.session_1_id, {"page": "/page2"}),
+                ("user1", "2025-01-11T12:02:00Z", self.session_1_id, {"page": "/page3"}),
+                ("user2", "2025-01-11T13:00:01Z", self.session_2_id, {"page": "/home"}),
+                ("user2", "2025-01-11T13:01:00Z", self.session_2_id, {"page": "/products"}),
+                ("user3", "2025-01-11T14:00:01Z", self.session_3_id, {"page": "/login"}),
+            ]
+        )
+        with freeze_time("2025-01-11T16:00:00"):
+            query = create_session_batch_events_query(
+                session_ids=[self.session_1_id, self.session_2_id, self.session_3_id, self.session_4_id],
+                before="2025-01-12T00:00:00",
+                after="2025-01-10T00:00:00",
+                select=["event", "timestamp", "properties.page", "properties.$session_id"],
+                max_total_events=3,
+            )
+            runner = SessionBatchEventsQueryRunner(query=query, team=self.team)
+            # Blocks of 3 events, so sessions are split across blocks
+            sessions = list(runner.stream_session_events(max_events_per_session=2))
+
+        self.assertEqual(runner.stream_columns(), ["event", "timestamp", "properties.page"])
+        # Sessions come ordered by id, session_4 has no events
+        self.assertEqual(
+            [session_id for session_id, _ in sessions],
+            sorted([self.session_1_id, self.session_2_id, self.session_3_id]),
+        )
+        pages_by_session = {session_id: [event[2] for event in events] for session_id, events in sessions}
+        # Session 1 is capped at its first 2 events
+        self.assertEqual(pages_by_session[self.session_1_id], ["/page1", "/page2"])
+        self.assertEqual(pages_by_session[self.session_2_id], ["/home", "/products"])
+        self.assertEqual(pages_by_session[self.session_3_id], ["/login"])
+        self.assertIsInstance(sessions[0][1][0], tuple)
+
+    def test_stream_session_events_cap_must_fit_in_a_block(self):
+        query = create_session_batch_events_query(
+            session_ids=[self.session_1_id],
+            select=["event", "timestamp", "properties.$session_id"],
+            max_total_events=10,
+        )
+        runner = SessionBatchEventsQueryRunner(query=query, team=self.team)
+        with self.assertRaises(ValueError):
+            next(runner.stream_session_events(max_events_per_session=10))
+
     def test_get_session_batch_query_runner(self):
         """Test that get_query_runner correctly returns session batch runner."""
         query = create_session_batch_events_query(
@@ -0,0 +1,91 @@
+import math
+from typing import TYPE_CHECKING, Optional
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+
+from posthog.clickhouse.client import sync_execute
+from posthog.exceptions_capture import capture_exception
+from posthog.hogql.query import HogQLQueryExecutor
+from posthog.schema import AdaptiveSamplingResult
+
+if TYPE_CHECKING:
+    from posthog.hogql_queries.query_runner import QueryRunner
+
+logger = structlog.get_logger(__name__)
+
+# The sample factors offered in the UI, so that adaptively sampled results match ones users can pick by hand
+SAMPLING_FACTORS = (0.25, 0.1, 0.01, 0.001)
+
+ADAPTIVE_SAMPLING_ESTIMATE_KEY = "adaptive_sampling_estimate:{cache_key}"
+
+
+def estimate_rows(query_runner: "QueryRunner") -> int:
+    """Asks ClickHouse how many rows the runner's query would read, from the primary key index alone."""
+    executor = HogQLQueryExecutor(
+        query=query_runner.to_query(),
+        team=query_runner.team,
+        modifiers=query_runner.modifiers,
+        limit_context=query_runner.limit_context,
+        timings=query_runner.timings,
+        workload=query_runner.workload,
+    )
+    with query_runner.timings.measure("adaptive_sampling_estimate"):
+        clickhouse_sql, context = executor.generate_clickhouse_sql()
+        rows = sync_execute(
+            f"EXPLAIN ESTIMATE {clickhouse_sql}",
+            context.values,
+            workload=query_runner.workload,
+            team_id=query_runner.team.pk,
+            readonly=True,
+        )
+    # Columns are database, table, parts, rows and marks
+    return sum(row[3] for row in rows)
+
+
+def choose_sampling_factor(estimated_rows: int) -> float:
+    """The largest sample factor that reads few enough rows to fit the latency budget, or 1 if no sampling is needed."""
+    budget_rows = settings.ADAPTIVE_SAMPLING_LATENCY_BUDGET_SECONDS * settings.ADAPTIVE_SAMPLING_ROWS_PER_SECOND
+    if estimated_rows <= budget_rows:
+        return 1
+    for sampling_factor in SAMPLING_FACTORS:
+        if estimated_rows * sampling_factor <= budget_rows:
+            return sampling_factor
+    return SAMPLING_FACTORS[-1]
+
+
+def relative_error(sampling_factor: float, sampled_matches: Optional[float]) -> Optional[float]:
+    """
+    Relative standard error of counts scaled up from a sample, from the number of rows the sample matched. 0 if the
+    query ran on all rows, None if the runner can't tell how many rows its sample matched.
+    """
+    if sampling_factor >= 1:
+        return 0
+    if sampled_matches is None:
+        return None
+    return 1 / math.sqrt(max(sampled_matches, 1))
+
+
+def get_adaptive_sampling(query_runner: "QueryRunner", cache_key: str) -> Optional[AdaptiveSamplingResult]:
+    """
+    Picks the sample factor for the runner's query. Estimates are cached per query, so that recalculating it picks
+    the same factor without estimating again. Returns None if the estimate fails, to run the query unsampled.
+    """
+    estimate_key = ADAPTIVE_SAMPLING_ESTIMATE_KEY.format(cache_key=cache_key)
+    estimated_rows: Optional[int] = cache.get(estimate_key)
+
+    if estimated_rows is None:
+        try:
+            estimated_rows = estimate_rows(query_runner)
+        except Exception as e:
+            logger.warning("adaptive_sampling_estimate_failed", team_id=query_runner.team.pk, error=str(e))
+            capture_exception(e)
+            return None
+        cache.set(estimate_key, estimated_rows, timeout=settings.ADAPTIVE_SAMPLING_ESTIMATE_TTL_SECONDS)
+
+    sampling_factor = choose_sampling_factor(estimated_rows)
+    return AdaptiveSamplingResult(
+        samplingFactor=sampling_factor,
+        estimatedRows=estimated_rows,
+    )
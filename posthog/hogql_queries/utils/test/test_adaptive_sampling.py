@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from posthog.hogql_queries.insights.trends.trends_query_runner import TrendsQueryRunner
+from posthog.hogql_queries.query_runner import ExecutionMode
+from posthog.hogql_queries.utils.adaptive_sampling import choose_sampling_factor, estimate_rows, relative_error
+from posthog.schema import (
+    BaseMathType,
+    CacheMissResponse,
+    DateRange,
+    EventsNode,
+    HogQLQueryModifiers,
+    TrendsQuery,
+    TrendsQueryResponse,
+)
+from posthog.test.base import APIBaseTest, ClickhouseTestMixin, _create_event, _create_person, flush_persons_and_events
+
+
+@override_settings(ADAPTIVE_SAMPLING_LATENCY_BUDGET_SECONDS=10, ADAPTIVE_SAMPLING_ROWS_PER_SECOND=100)
+class TestAdaptiveSampling(ClickhouseTestMixin, APIBaseTest):
+    def tearDown(self):
+        super().tearDown()
+        cache.clear()
+
+    def _runner(self, adaptive_sampling: bool = True, **kwargs) -> TrendsQueryRunner:
+        return TrendsQueryRunner(
+            team=self.team,
+            query=TrendsQuery(
+                series=[EventsNode(event="$pageview")],
+                dateRange=DateRange(date_from="-7d"),
+                modifiers=HogQLQueryModifiers(adaptiveSampling=adaptive_sampling),
+                **kwargs,
+            ),
+        )
+
+    def test_choose_sampling_factor(self):
+        assert choose_sampling_factor(1_000) == 1
+        assert choose_sampling_factor(1_001) == 0.25
+        assert choose_sampling_factor(50_000) == 0.01
+        assert choose_sampling_factor(10**9) == 0.001
+
+    def test_relative_error(self):
+        assert relative_error(1, 10**6) == 0
+        assert relative_error(0.1, None) is None
+        assert relative_error(0.1, 0) == 1
+        assert relative_error(0.1, 10_000) == 0.01
+
+    def test_trends_sampled_matches(self):
+        response = TrendsQueryResponse(results=[{"count": 300}, {"count": 100}])
+
+        assert self._runner().sampled_matches(response) is None
+        assert self._runner(samplingFactor=0.1).sampled_matches(response) == 40
+        dau_runner = TrendsQueryRunner(
+            team=self.team,
+            query=TrendsQuery(
+                series=[EventsNode(event="$pageview", math=BaseMathType.DAU)],
+                samplingFactor=0.1,
+            ),
+        )
+        assert dau_runner.sampled_matches(response) is None
+
+    def test_estimate_rows(self):
+        _create_person(team_id=self.team.pk, distinct_ids=["person_1"])
+        for _ in range(3):
+            _create_event(team=self.team, event="$pageview", distinct_id="person_1")
+        flush_persons_and_events()
+
+        estimated_rows = estimate_rows(self._runner())
+
+        assert isinstance(estimated_rows, int)
+        assert estimated_rows >= 3
+
+    @patch("posthog.hogql_queries.utils.adaptive_sampling.estimate_rows", return_value=5_000)
+    def test_samples_queries_over_the_latency_budget(self, estimate_rows_mock):
+        exact_cache_key = self._runner(adaptive_sampling=False).get_cache_key()
+
+        runner = self._runner()
+        response = runner.run(execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS)
+
+        assert runner.query.samplingFactor == 0.1
+        assert response.adaptiveSampling is not None
+        assert response.adaptiveSampling.samplingFactor == 0.1
+        assert response.adaptiveSampling.estimatedRows == 5_000
+        # Nothing matched in the sample, so the error is as large as the counts
+        assert response.adaptiveSampling.relativeError == 1
+        assert response.cache_key != exact_cache_key
+
+        # Sampled results are cached under the key of the query as requested, so reading them doesn't estimate again
+        cached_response = self._runner().run(execution_mode=ExecutionMode.RECENT_CACHE_CALCULATE_BLOCKING_IF_STALE)
+        assert cached_response.is_cached
+        assert cached_response.cache_key == response.cache_key
+        assert cached_response.adaptiveSampling == response.adaptiveSampling
+        estimate_rows_mock.assert_called_once()
+
+    @patch("posthog.hogql_queries.utils.adaptive_sampling.estimate_rows", return_value=500)
+    def test_runs_small_queries_exactly(self, estimate_rows_mock):
+        runner = self._runner()
+        response = runner.run(execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS)
+
+        assert runner.query.samplingFactor is None
+        assert response.adaptiveSampling is not None
+        assert response.adaptiveSampling.samplingFactor == 1
+        assert response.adaptiveSampling.relativeError == 0
+
+    @patch("posthog.hogql_queries.utils.adaptive_sampling.estimate_rows", return_value=5_000)
+    def test_only_estimates_when_calculating(self, estimate_rows_mock):
+        response = self._runner().run(execution_mode=ExecutionMode.CACHE_ONLY_NEVER_CALCULATE)
+
+        assert isinstance(response, CacheMissResponse)
+        estimate_rows_mock.assert_not_called()
+
+    @patch("posthog.hogql_queries.utils.adaptive_sampling.estimate_rows", return_value=5_000)
+    def test_keeps_explicit_sample_factor(self, estimate_rows_mock):
+        runner = self._runner(samplingFactor=0.5)
+        response = runner.run(execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS)
+
+        assert runner.query.samplingFactor == 0.5
+        assert response.adaptiveSampling is None
+        estimate_rows_mock.assert_not_called()
+
+    @patch("posthog.hogql_queries.utils.adaptive_sampling.estimate_rows", side_effect=Exception("boom"))
+    def test_runs_unsampled_if_the_estimate_fails(self, estimate_rows_mock):
+        runner = self._runner()
+        response = runner.run(execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS)
+
+        assert runner.query.samplingFactor is None
+        assert response.adaptiveSampling is None
@@ -0,0 +1,56 @@
+import logging
+from datetime import datetime, timedelta
+
+import structlog
+from django.core.management.base import BaseCommand
+
+from posthog.clickhouse.client.connection import Workload
+from posthog.clickhouse.client.execute import sync_execute
+from posthog.models.ai.llm_trace_summaries import LLM_TRACE_SUMMARIES_BACKFILL_SQL
+
+logger = structlog.get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+SETTINGS = {
+    "max_execution_time": 7200  # 2 hours
+}
+
+
+class Command(BaseCommand):
+    help = """Backfill the `llm_trace_summaries` table from AI events.
+        New events are summarized by a materialized view, this summarizes the days before it was created.
+        Days must only be backfilled once, as summaries of the same trace are added up.
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start-date", required=True, type=str, help="first day to run backfill on (format YYYY-MM-DD)"
+        )
+        parser.add_argument(
+            "--end-date", required=True, type=str, help="last day to run backfill, inclusive, on (format YYYY-MM-DD)"
+        )
+        parser.add_argument("--team-id", default=None, type=int, help="Team id (will do all teams if not set)")
+        parser.add_argument("--live-run", action="store_true", help="Run changes, default is dry-run")
+
+    def handle(self, *args, **options):
+        start_date = datetime.strptime(options["start_date"], "%Y-%m-%d")
+        end_date = datetime.strptime(options["end_date"], "%Y-%m-%d")
+        num_days = (end_date - start_date).days + 1
+
+        logger.info(f"Backfilling {num_days} days of LLM trace summaries")
+        if not options["live_run"]:
+            logger.info(
+                f"Dry run, not backfilling. Pass --live-run to run:\n{LLM_TRACE_SUMMARIES_BACKFILL_SQL(options['end_date'], options['team_id'])}"
+            )
+            return
+
+        for i in range(num_days):
+            date = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+            logger.info(f"Backfilling LLM trace summaries for {date}")
+            sync_execute(
+                LLM_TRACE_SUMMARIES_BACKFILL_SQL(date, options["team_id"]),
+                workload=Workload.OFFLINE,
+                settings=SETTINGS,
+            )
+
+        logger.info("Done backfilling LLM trace summaries")
@@ -11,7 +11,7 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 from kafka import KafkaAdminClient, KafkaConsumer, TopicPartition
 
-from posthog.api.capture import capture_batch_internal
+from posthog.api.capture import capture_batch_internal_compressed
 from posthog.demo.products.hedgebox import HedgeboxMatrix
 from posthog.models import Team
 from posthog.kafka_client.topics import KAFKA_EVENTS_PLUGIN_INGESTION
@@ -109,20 +109,17 @@ class Command(BaseCommand):
                 }
             )
 
-        # as in "classic" capture_internal, ordered_events are submitted async
-        # returning a list of futures (previously ignored!) so final event
-        # ordering in the ingest topic is not guaranteed here
+        # events are submitted in gzipped batches, in order
         start_time = time.monotonic()
-        results = capture_batch_internal(
+        outcomes = capture_batch_internal_compressed(
             events=events,
             event_source="plugin_server_load_test",
             token=token,
             process_person_profile=True,  # allow person profile processing to occur as cfg for this token (team/project)
         )
-        for future in results:
+        for outcome in outcomes:
             try:
-                result = future.result()
-                result.raise_for_status()
+                outcome.raise_for_status()
             except Exception as e:
                 logger.exception("event_submission_fail", error=e)
 
@@ -0,0 +1,39 @@
+import logging
+
+import structlog
+from django.core.management.base import BaseCommand
+
+from posthog.models.error_tracking import ErrorTrackingIssue, sync_error_tracking_issue_to_clickhouse
+
+logger = structlog.get_logger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class Command(BaseCommand):
+    help = """Sync error tracking issues from postgres to the ClickHouse `error_tracking_issues` table.
+        Issues saved through Django are kept in sync by model signals, this backfills existing issues
+        and issues created outside of Django (e.g. by cymbal during ingestion).
+        """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--team-id", default=None, type=int, help="Specify a team to sync issues for.")
+        parser.add_argument("--live-run", action="store_true", help="Run changes, default is dry-run")
+
+    def handle(self, *args, **options):
+        run(options)
+
+
+def run(options, sync: bool = False):  # sync used for unittests
+    queryset = ErrorTrackingIssue.objects.select_related("assignment").order_by("id")
+    if options["team_id"]:
+        queryset = queryset.filter(team_id=options["team_id"])
+
+    logger.info(f"Syncing {queryset.count()} error tracking issues")
+    if not options["live_run"]:
+        logger.info("Dry run, not syncing. Pass --live-run to sync.")
+        return
+
+    for issue in queryset.iterator(chunk_size=1000):
+        sync_error_tracking_issue_to_clickhouse(issue, sync=sync)
+
+    logger.info("Done syncing error tracking issues")
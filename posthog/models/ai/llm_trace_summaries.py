@@ -0,0 +1,180 @@
+from django.conf import settings
+
+from posthog.clickhouse.cluster import ON_CLUSTER_CLAUSE
+from posthog.clickhouse.table_engines import AggregatingMergeTree, Distributed, ReplicationScheme
+
+TABLE_BASE_NAME = "llm_trace_summaries"
+
+AI_TRACE_EVENTS = ("$ai_span", "$ai_generation", "$ai_metric", "$ai_feedback", "$ai_trace")
+
+
+def LLM_TRACE_SUMMARIES_DATA_TABLE():
+    return f"sharded_{TABLE_BASE_NAME}"
+
+
+def TRUNCATE_LLM_TRACE_SUMMARIES_TABLE_SQL():
+    return f"TRUNCATE TABLE IF EXISTS {LLM_TRACE_SUMMARIES_DATA_TABLE()} {ON_CLUSTER_CLAUSE()}"
+
+
+# if updating these column definitions
+# you'll need to update the select statement of the materialized view below
+LLM_TRACE_SUMMARIES_TABLE_BASE_SQL = """
+CREATE TABLE IF NOT EXISTS {table_name} {on_cluster_clause}
+(
+    team_id Int64,
+    trace_id String,
+
+    -- traces spanning several hours have a row per hour, queries merge them by trace_id
+    start_hour DateTime('UTC'),
+
+    min_timestamp SimpleAggregateFunction(min, DateTime64(6, 'UTC')),
+    max_timestamp SimpleAggregateFunction(max, DateTime64(6, 'UTC')),
+    distinct_id AggregateFunction(argMin, String, DateTime64(6, 'UTC')),
+
+    -- latency of the root spans and generations, tokens and costs of the generations
+    total_latency SimpleAggregateFunction(sum, Nullable(Float64)),
+    input_tokens SimpleAggregateFunction(sum, Nullable(Float64)),
+    output_tokens SimpleAggregateFunction(sum, Nullable(Float64)),
+    input_cost SimpleAggregateFunction(sum, Nullable(Float64)),
+    output_cost SimpleAggregateFunction(sum, Nullable(Float64)),
+    total_cost SimpleAggregateFunction(sum, Nullable(Float64)),
+
+    generation_count SimpleAggregateFunction(sum, UInt64),
+    error_count SimpleAggregateFunction(sum, UInt64),
+
+    trace_name SimpleAggregateFunction(any, Nullable(String))
+) ENGINE = {engine}
+"""
+
+
+def LLM_TRACE_SUMMARIES_DATA_TABLE_ENGINE():
+    return AggregatingMergeTree(TABLE_BASE_NAME, replication_scheme=ReplicationScheme.SHARDED)
+
+
+def LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=True):
+    return (
+        LLM_TRACE_SUMMARIES_TABLE_BASE_SQL
+        + """
+PARTITION BY toYYYYMM(start_hour)
+ORDER BY (team_id, start_hour, trace_id)
+"""
+    ).format(
+        table_name=LLM_TRACE_SUMMARIES_DATA_TABLE(),
+        on_cluster_clause=ON_CLUSTER_CLAUSE(on_cluster),
+        engine=LLM_TRACE_SUMMARIES_DATA_TABLE_ENGINE(),
+    )
+
+
+# Distributed engine tables are only created if CLICKHOUSE_REPLICATED
+
+# This table is responsible for writing to sharded_llm_trace_summaries based on a sharding key.
+
+
+def WRITABLE_LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=True):
+    return LLM_TRACE_SUMMARIES_TABLE_BASE_SQL.format(
+        table_name=f"writable_{TABLE_BASE_NAME}",
+        on_cluster_clause=ON_CLUSTER_CLAUSE(on_cluster),
+        engine=Distributed(
+            data_table=LLM_TRACE_SUMMARIES_DATA_TABLE(),
+            # shard via trace_id so that all rows of a trace are merged on the same shard
+            sharding_key="cityHash64(trace_id)",
+        ),
+    )
+
+
+# This table is responsible for reading from llm_trace_summaries on a cluster setting
+
+
+def DISTRIBUTED_LLM_TRACE_SUMMARIES_TABLE_SQL(on_cluster=True):
+    return LLM_TRACE_SUMMARIES_TABLE_BASE_SQL.format(
+        table_name=TABLE_BASE_NAME,
+        on_cluster_clause=ON_CLUSTER_CLAUSE(on_cluster),
+        engine=Distributed(
+            data_table=LLM_TRACE_SUMMARIES_DATA_TABLE(),
+            sharding_key="cityHash64(trace_id)",
+        ),
+    )
+
+
+def source_string_column(column_name: str) -> str:
+    # same extraction as HogQL uses for string properties, so numeric trace ids are kept too
+    return f"""replaceRegexpAll(nullIf(nullIf(JSONExtractRaw(properties, '{column_name}'), ''), 'null'), '^"|"$', '')"""
+
+
+def source_nullable_float_column(column_name: str) -> str:
+    return f"accurateCastOrNull({source_string_column(column_name)}, 'Float64')"
+
+
+def LLM_TRACE_SUMMARIES_SELECT_SQL(source_table: str, where: str | None = None) -> str:
+    """
+    Aggregates AI events into trace summary rows. Used by the materialized view for every insert into events, and by
+    backfills with a where clause selecting the events to summarize.
+    """
+    return """
+SELECT
+    team_id,
+    ifNull({trace_id}, '') AS trace_id,
+    toStartOfHour(timestamp) AS start_hour,
+
+    min(timestamp) AS min_timestamp,
+    max(timestamp) AS max_timestamp,
+    argMinState(distinct_id, timestamp) AS distinct_id,
+
+    sumIf({latency}, {parent_id} IS NULL OR {parent_id} = trace_id) AS total_latency,
+    sumIf({input_tokens}, event = '$ai_generation') AS input_tokens,
+    sumIf({output_tokens}, event = '$ai_generation') AS output_tokens,
+    sumIf({input_cost}, event = '$ai_generation') AS input_cost,
+    sumIf({output_cost}, event = '$ai_generation') AS output_cost,
+    sumIf({total_cost}, event = '$ai_generation') AS total_cost,
+
+    countIf(event = '$ai_generation') AS generation_count,
+    countIf({is_error} = 'true') AS error_count,
+
+    any(if(event = '$ai_trace', ifNull({span_name}, {legacy_trace_name}), NULL)) AS trace_name
+FROM {source_table}
+WHERE event IN ({events})
+    AND trace_id != ''{where_clause}
+GROUP BY team_id, start_hour, trace_id
+""".format(
+        source_table=source_table,
+        where_clause=f"\n    AND {where}" if where else "",
+        events=", ".join(f"'{event}'" for event in AI_TRACE_EVENTS),
+        trace_id=source_string_column("$ai_trace_id"),
+        parent_id=source_string_column("$ai_parent_id"),
+        latency=source_nullable_float_column("$ai_latency"),
+        input_tokens=source_nullable_float_column("$ai_input_tokens"),
+        output_tokens=source_nullable_float_column("$ai_output_tokens"),
+        input_cost=source_nullable_float_column("$ai_input_cost_usd"),
+        output_cost=source_nullable_float_column("$ai_output_cost_usd"),
+        total_cost=source_nullable_float_column("$ai_total_cost_usd"),
+        is_error=source_string_column("$ai_is_error"),
+        span_name=source_string_column("$ai_span_name"),
+        legacy_trace_name=source_string_column("$ai_trace_name"),
+    )
+
+
+def LLM_TRACE_SUMMARIES_MV_SQL(on_cluster=True):
+    return """
+CREATE MATERIALIZED VIEW IF NOT EXISTS {table_name} {on_cluster_clause}
+TO {database}.{target_table}
+AS
+{select_sql}
+""".format(
+        table_name=f"{TABLE_BASE_NAME}_mv",
+        target_table=f"writable_{TABLE_BASE_NAME}",
+        on_cluster_clause=ON_CLUSTER_CLAUSE(on_cluster),
+        database=settings.CLICKHOUSE_DATABASE,
+        select_sql=LLM_TRACE_SUMMARIES_SELECT_SQL(f"{settings.CLICKHOUSE_DATABASE}.sharded_events"),
+    )
+
+
+def LLM_TRACE_SUMMARIES_BACKFILL_SQL(date: str, team_id=None):
+    """
+    Summarizes the AI events of a UTC day (YYYY-MM-DD), for events ingested before the materialized view existed.
+    Running it for a day that's already summarized double counts the day, as rows are merged rather than replaced.
+    """
+    team_where = f"team_id = {int(team_id)}" if team_id is not None else "true"
+    return f"""
+INSERT INTO writable_{TABLE_BASE_NAME}
+{LLM_TRACE_SUMMARIES_SELECT_SQL("events", where=f"toDate(timestamp) = '{date}' AND {team_where}")}
+"""
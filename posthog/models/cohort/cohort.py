@@ -7,6 +7,7 @@ from django.conf import settings
 from django.db import connection, models
 from django.db.models import Q, QuerySet
 from django.db.models.expressions import F
+from django.db.models.signals import post_delete, post_save
 
 from django.utils import timezone
 from posthog.exceptions_capture import capture_exception
@@ -22,6 +23,7 @@ from posthog.models.utils import RootTeamManager, RootTeamMixin, sane_repr
 from posthog.settings.base_variables import TEST
 from posthog.models.file_system.file_system_representation import FileSystemRepresentation
 from posthog.models.person import PersonDistinctId
+from posthog.models.signals import mutable_receiver
 
 if TYPE_CHECKING:
     from posthog.models.team import Team
@@ -520,6 +522,33 @@ class Cohort(FileSystemSyncMixin, RootTeamMixin, models.Model):
     __repr__ = sane_repr("id", "name", "last_calculation")
 
 
+# Fields only written by cohort calculations, which flags don't read
+CALCULATION_FIELDS = frozenset(
+    {
+        "is_calculating",
+        "count",
+        "version",
+        "pending_version",
+        "last_calculation",
+        "errors_calculating",
+        "last_error_at",
+    }
+)
+
+
+@mutable_receiver([post_save, post_delete], sender=Cohort)
+def cohort_changed(sender, instance: Cohort, update_fields=None, **kwargs):
+    # Flags matching on the cohort must see its new definition
+    from posthog.models.feature_flag.flag_definitions import get_project_id, publish_flag_definitions_changed
+
+    if update_fields is not None and CALCULATION_FIELDS.issuperset(update_fields):
+        return
+
+    project_id = get_project_id(instance.team_id)
+    if project_id is not None:
+        publish_flag_definitions_changed(project_id)
+
+
 class CohortPeople(models.Model):
     id = models.BigAutoField(primary_key=True)
     cohort = models.ForeignKey("Cohort", on_delete=models.CASCADE)
@@ -1,4 +1,6 @@
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union, cast
 
@@ -11,7 +13,7 @@ from rest_framework.exceptions import ValidationError
 from posthog.hogql.resolver_utils import extract_select_queries
 from posthog.queries.util import PersonPropertiesMode
 from posthog.clickhouse.client.connection import Workload, ClickHouseUser
-from posthog.clickhouse.query_tagging import tag_queries, tags_context, Feature
+from posthog.clickhouse.query_tagging import QueryTags, tag_queries, tags_context, Feature, get_query_tags, update_tags
 from posthog.clickhouse.client import sync_execute
 from posthog.constants import PropertyOperatorType
 from posthog.hogql import ast
@@ -314,7 +316,18 @@ def recalculate_cohortpeople(
         tag_queries(user_id=initiating_user_id)
     for team in relevant_teams:
         tag_queries(team_id=team.id)
-        _recalculate_cohortpeople_for_team_hogql(cohort, pending_version, team, initiating_user_id=initiating_user_id)
+        if not cohort.is_static and str(team.id) in settings.CALCULATE_COHORTS_PARTITIONED_TEAM_IDS:
+            _recalculate_cohortpeople_for_team_hogql_partitioned(
+                cohort,
+                pending_version,
+                team,
+                initiating_user_id=initiating_user_id,
+                partitions=settings.CALCULATE_COHORTS_PARTITIONS,
+            )
+        else:
+            _recalculate_cohortpeople_for_team_hogql(
+                cohort, pending_version, team, initiating_user_id=initiating_user_id
+            )
         count = get_cohort_size(cohort, override_version=pending_version, team_id=team.id)
         count_by_team_id[team.id] = count or 0
 
@@ -322,7 +335,12 @@ def recalculate_cohortpeople(
 
 
 def _recalculate_cohortpeople_for_team_hogql(
-    cohort: Cohort, pending_version: int, team: Team, *, initiating_user_id: Optional[int]
+    cohort: Cohort,
+    pending_version: int,
+    team: Team,
+    *,
+    initiating_user_id: Optional[int],
+    partition: Optional[tuple[int, int]] = None,
 ) -> int:
     tag_queries(name="recalculate_cohortpeople_for_team_hogql")
     cohort_params: dict[str, Any]
@@ -337,7 +355,9 @@ def _recalculate_cohortpeople_for_team_hogql(
         from posthog.hogql_queries.hogql_cohort_query import HogQLCohortQuery
 
         cohort_query, hogql_context = (
-            HogQLCohortQuery(cohort=cohort, team=team).get_query_executor().generate_clickhouse_sql()
+            HogQLCohortQuery(cohort=cohort, team=team, partition=partition)
+            .get_query_executor()
+            .generate_clickhouse_sql()
         )
         cohort_params = hogql_context.values
 
@@ -373,6 +393,57 @@ def _recalculate_cohortpeople_for_team_hogql(
     )
 
 
+def _recalculate_cohortpeople_for_team_hogql_partitioned(
+    cohort: Cohort, pending_version: int, team: Team, *, initiating_user_id: Optional[int], partitions: int
+) -> None:
+    """
+    Recalculates the cohort one partition of persons at a time, split by cityHash64(person_id) % partitions, so that no
+    query has to hold all persons of the team in memory. Every partition is written into the pending version, which only
+    replaces the cohort's version once all partitions succeeded, so the cohort is never read half calculated.
+    """
+
+    def calculate_partition(index: int) -> None:
+        start_time = time.monotonic()
+        _recalculate_cohortpeople_for_team_hogql(
+            cohort, pending_version, team, initiating_user_id=initiating_user_id, partition=(index, partitions)
+        )
+        logger.info(
+            "cohort_partition_calculated",
+            cohort_id=cohort.pk,
+            team_id=team.id,
+            version=pending_version,
+            partition=index,
+            partitions=partitions,
+            duration=time.monotonic() - start_time,
+        )
+
+    max_workers = min(settings.CALCULATE_X_PARALLEL_COHORT_PARTITIONS, partitions)
+    # Partitions run sequentially in unit tests, as Django's test database isn't shared with other threads
+    if max_workers <= 1 or settings.IN_UNIT_TESTING:
+        for index in range(partitions):
+            calculate_partition(index)
+        return
+
+    def calculate_partition_in_thread(index: int, query_tags: QueryTags) -> None:
+        try:
+            update_tags(query_tags)
+            calculate_partition(index)
+        finally:
+            from django.db import connection
+
+            # This will only close the DB connection for the newly spawned thread and not the whole app
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(calculate_partition_in_thread, index, get_query_tags().model_copy(deep=True))
+            for index in range(partitions)
+        ]
+        # Raises the error of the first failed partition
+        for future in futures:
+            future.result()
+
+
 def get_cohort_size(cohort: Cohort, override_version: Optional[int] = None, *, team_id: int) -> Optional[int]:
     tag_queries(name="get_cohort_size", feature=Feature.COHORT)
     count_result = sync_execute(
@@ -1,4 +1,7 @@
+import time
+
 from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.contrib.postgres.fields import ArrayField
 from django.conf import settings
 from rest_framework.exceptions import ValidationError
@@ -10,11 +13,15 @@ from posthog.models.team import Team
 from posthog.models.user import User
 from posthog.models.user_group import UserGroup
 from posthog.models.integration import Integration
-from posthog.models.error_tracking.sql import INSERT_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES
+from posthog.models.error_tracking.sql import (
+    INSERT_ERROR_TRACKING_ISSUE,
+    INSERT_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES,
+)
+from posthog.models.signals import mutable_receiver
 from posthog.storage import object_storage
 
 from posthog.kafka_client.client import ClickhouseProducer
-from posthog.kafka_client.topics import KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT
+from posthog.kafka_client.topics import KAFKA_ERROR_TRACKING_ISSUE, KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT
 from uuid import UUID
 
 
@@ -378,6 +385,55 @@ def override_error_tracking_issue_fingerprint(
     )
 
 
+def sync_error_tracking_issue_to_clickhouse(
+    issue: ErrorTrackingIssue, is_deleted: bool = False, sync: bool = False
+) -> None:
+    """
+    Writes the issue's status, name and assignee to the ClickHouse `error_tracking_issues` table. The version is the
+    write time, so the latest write of an issue wins when the table collapses.
+    """
+    assignment = None if is_deleted else getattr(issue, "assignment", None)
+    p = ClickhouseProducer()
+    p.produce(
+        topic=KAFKA_ERROR_TRACKING_ISSUE,
+        sql=INSERT_ERROR_TRACKING_ISSUE,
+        data={
+            "id": str(issue.id),
+            "team_id": issue.team_id,
+            "status": issue.status,
+            "name": issue.name,
+            "description": issue.description,
+            "assigned_user_id": assignment.user_id if assignment else None,
+            "assigned_role_id": str(assignment.role_id) if assignment and assignment.role_id else None,
+            "created_at": issue.created_at.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "is_deleted": int(is_deleted),
+            "version": time.time_ns() // 1000,
+        },
+        sync=sync,
+    )
+
+
+def sync_error_tracking_issues_to_clickhouse(issue_ids: list[str]) -> None:
+    for issue in ErrorTrackingIssue.objects.select_related("assignment").filter(id__in=issue_ids):
+        sync_error_tracking_issue_to_clickhouse(issue)
+
+
+@mutable_receiver(post_save, sender=ErrorTrackingIssue)
+def error_tracking_issue_saved(sender, instance: ErrorTrackingIssue, created, **kwargs):
+    sync_error_tracking_issue_to_clickhouse(instance)
+
+
+@mutable_receiver(post_delete, sender=ErrorTrackingIssue)
+def error_tracking_issue_deleted(sender, instance: ErrorTrackingIssue, **kwargs):
+    sync_error_tracking_issue_to_clickhouse(instance, is_deleted=True)
+
+
+@mutable_receiver([post_save, post_delete], sender=ErrorTrackingIssueAssignment)
+def error_tracking_issue_assignment_changed(sender, instance: ErrorTrackingIssueAssignment, **kwargs):
+    # Re-read the issue, as the assignment cached on it can be stale. It's gone if the assignment was deleted with it.
+    sync_error_tracking_issues_to_clickhouse([instance.issue_id])
+
+
 def delete_symbol_set_contents(upload_path: str) -> None:
     if settings.OBJECT_STORAGE_ENABLED:
         object_storage.delete(file_name=upload_path)
@@ -1,7 +1,7 @@
 from posthog.clickhouse.indexes import index_by_kafka_timestamp
 from posthog.clickhouse.kafka_engine import KAFKA_COLUMNS_WITH_PARTITION, kafka_engine
 from posthog.clickhouse.table_engines import ReplacingMergeTree
-from posthog.kafka_client.topics import KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT
+from posthog.kafka_client.topics import KAFKA_ERROR_TRACKING_ISSUE, KAFKA_ERROR_TRACKING_ISSUE_FINGERPRINT
 from posthog.settings import CLICKHOUSE_CLUSTER, CLICKHOUSE_DATABASE
 
 #
@@ -81,3 +81,84 @@ TRUNCATE_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES_TABLE_SQL = (
 INSERT_ERROR_TRACKING_ISSUE_FINGERPRINT_OVERRIDES = """
 INSERT INTO error_tracking_issue_fingerprint_overrides (fingerprint, issue_id, team_id, is_deleted, version, _timestamp, _offset, _partition) SELECT %(fingerprint)s, %(issue_id)s, %(team_id)s, %(is_deleted)s, %(version)s, now(), 0, 0 VALUES
 """
+
+#
+# error_tracking_issues: A copy of the Postgres issue metadata (status, name, assignee), so issues can be filtered
+# and ordered in the same query as their exception events. Rows are written on every save of an issue or its assignment.
+#
+
+ERROR_TRACKING_ISSUES_TABLE = "error_tracking_issues"
+
+ERROR_TRACKING_ISSUES_TABLE_BASE_SQL = """
+CREATE TABLE IF NOT EXISTS {table_name} ON CLUSTER '{cluster}'
+(
+    team_id Int64,
+    id UUID,
+    status VARCHAR,
+    name Nullable(VARCHAR),
+    description Nullable(VARCHAR),
+    assigned_user_id Nullable(Int64),
+    assigned_role_id Nullable(UUID),
+    created_at DateTime64(6, 'UTC'),
+    is_deleted Int8,
+    version Int64
+    {extra_fields}
+) ENGINE = {engine}
+"""
+
+ERROR_TRACKING_ISSUES_TABLE_ENGINE = lambda: ReplacingMergeTree(ERROR_TRACKING_ISSUES_TABLE, ver="version")
+
+ERROR_TRACKING_ISSUES_TABLE_SQL = lambda: (
+    ERROR_TRACKING_ISSUES_TABLE_BASE_SQL
+    + """
+    ORDER BY (team_id, id)
+    SETTINGS index_granularity = 512
+    """
+).format(
+    table_name=ERROR_TRACKING_ISSUES_TABLE,
+    cluster=CLICKHOUSE_CLUSTER,
+    engine=ERROR_TRACKING_ISSUES_TABLE_ENGINE(),
+    extra_fields=f"""
+    {KAFKA_COLUMNS_WITH_PARTITION}
+    , {index_by_kafka_timestamp(ERROR_TRACKING_ISSUES_TABLE)}
+    """,
+)
+
+KAFKA_ERROR_TRACKING_ISSUES_TABLE_SQL = lambda: ERROR_TRACKING_ISSUES_TABLE_BASE_SQL.format(
+    table_name="kafka_" + ERROR_TRACKING_ISSUES_TABLE,
+    cluster=CLICKHOUSE_CLUSTER,
+    engine=kafka_engine(KAFKA_ERROR_TRACKING_ISSUE, group="clickhouse-error-tracking-issues"),
+    extra_fields="",
+)
+
+ERROR_TRACKING_ISSUES_MV_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS {table_name}_mv ON CLUSTER '{cluster}'
+TO {database}.{table_name}
+AS SELECT
+team_id,
+id,
+status,
+name,
+description,
+assigned_user_id,
+assigned_role_id,
+created_at,
+is_deleted,
+version,
+_timestamp,
+_offset,
+_partition
+FROM {database}.kafka_{table_name}
+""".format(
+    table_name=ERROR_TRACKING_ISSUES_TABLE,
+    cluster=CLICKHOUSE_CLUSTER,
+    database=CLICKHOUSE_DATABASE,
+)
+
+TRUNCATE_ERROR_TRACKING_ISSUES_TABLE_SQL = (
+    f"TRUNCATE TABLE IF EXISTS {ERROR_TRACKING_ISSUES_TABLE} ON CLUSTER '{CLICKHOUSE_CLUSTER}'"
+)
+
+INSERT_ERROR_TRACKING_ISSUE = """
+INSERT INTO error_tracking_issues (id, team_id, status, name, description, assigned_user_id, assigned_role_id, created_at, is_deleted, version, _timestamp, _offset, _partition) SELECT %(id)s, %(team_id)s, %(status)s, %(name)s, %(description)s, %(assigned_user_id)s, %(assigned_role_id)s, %(created_at)s, %(is_deleted)s, %(version)s, now(), 0, 0 VALUES
+"""
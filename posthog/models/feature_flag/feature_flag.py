@@ -400,7 +400,10 @@ class FeatureFlag(FileSystemSyncMixin, ModelActivityMixin, RootTeamMixin, models
 
 @mutable_receiver([post_save, post_delete], sender=FeatureFlag)
 def refresh_flag_cache_on_updates(sender, instance, **kwargs):
+    from posthog.models.feature_flag.flag_definitions import publish_flag_definitions_changed
+
     set_feature_flags_for_team_in_cache(instance.team.project_id)
+    publish_flag_definitions_changed(instance.team.project_id)
 
 
 class FeatureFlagHashKeyOverride(models.Model):
@@ -0,0 +1,183 @@
+import dataclasses
+import json
+import os
+import threading
+import time
+from typing import Optional, cast
+
+import structlog
+from cachetools import LRUCache
+from django.conf import settings
+from django.db import transaction
+
+from posthog.exceptions_capture import capture_exception
+from posthog.models.cohort import Cohort, CohortOrEmpty
+from posthog.models.group_type_mapping import GroupTypeMapping
+from posthog.models.property import GroupTypeIndex, GroupTypeName
+from posthog.models.utils import execute_with_timeout
+from posthog.redis import get_client
+
+from .feature_flag import FeatureFlag, get_feature_flags_for_team_in_cache, set_feature_flags_for_team_in_cache
+
+logger = structlog.get_logger(__name__)
+
+FLAG_DEFINITIONS_CHANNEL = "@posthog/flag-definitions-changed"
+
+# Loads only happen after a change, so they read from the primary, which already has the change
+FLAG_DEFINITIONS_QUERY_TIMEOUT_MS = 1000
+
+
+@dataclasses.dataclass(frozen=True)
+class FlagDefinitions:
+    """Everything /decide reads about a project's flags, besides the persons and groups being matched."""
+
+    loaded_at: float
+    feature_flags: list[FeatureFlag]
+    group_types_to_indexes: dict[GroupTypeName, GroupTypeIndex]
+    # All cohorts of the project if any flag uses cohorts, empty otherwise
+    cohorts: dict[int, CohortOrEmpty]
+
+
+_definitions: LRUCache[int, FlagDefinitions] = LRUCache(maxsize=settings.DECIDE_FLAG_DEFINITIONS_CACHE_MAX_PROJECTS)
+_definitions_lock = threading.Lock()
+_project_ids: LRUCache[int, int] = LRUCache(maxsize=10_000)
+# Set while this process is subscribed to changes. Definitions are only cached meanwhile, as changes are missed otherwise.
+_subscribed = threading.Event()
+_listener_pid: Optional[int] = None
+# Count the changes seen by this process to all projects and to each project, so definitions that changed while being
+# loaded aren't kept. Loads of other projects are unaffected by a project's change.
+_generation = 0
+_project_generations: dict[int, int] = {}
+# Project generations are reset past this many projects, by bumping the generation of all projects
+MAX_PROJECT_GENERATIONS = 10_000
+
+
+def get_project_id(team_id: int) -> Optional[int]:
+    """The project of a team. Teams never move between projects, so it's only read once per team."""
+    with _definitions_lock:
+        project_id = _project_ids.get(team_id)
+    if project_id is None:
+        from posthog.models.team import Team
+
+        project_id = Team.objects.filter(pk=team_id).values_list("project_id", flat=True).first()
+        if project_id is not None:
+            with _definitions_lock:
+                _project_ids[team_id] = project_id
+    return project_id
+
+
+def _generation_of(project_id: int) -> tuple[int, int]:
+    return _generation, _project_generations.get(project_id, 0)
+
+
+def _forget(project_id: Optional[int] = None) -> None:
+    global _generation
+    with _definitions_lock:
+        if project_id is None or len(_project_generations) >= MAX_PROJECT_GENERATIONS:
+            _generation += 1
+            _project_generations.clear()
+        if project_id is None:
+            _definitions.clear()
+        else:
+            _project_generations[project_id] = _project_generations.get(project_id, 0) + 1
+            _definitions.pop(project_id, None)
+
+
+def _listen() -> None:
+    while True:
+        try:
+            pubsub = get_client().pubsub()
+            pubsub.subscribe(FLAG_DEFINITIONS_CHANNEL)
+            for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    _subscribed.set()
+                elif message["type"] == "message":
+                    _forget(int(message["data"]))
+        except Exception:
+            logger.exception("flag_definitions_listener_failed")
+        finally:
+            _subscribed.clear()
+            _forget()
+        time.sleep(1)
+
+
+def _ensure_listening() -> bool:
+    global _listener_pid
+    # Threads don't survive forking, so each worker process starts its own
+    if _listener_pid != os.getpid():
+        with _definitions_lock:
+            if _listener_pid != os.getpid():
+                _listener_pid = os.getpid()
+                _subscribed.clear()
+                _definitions.clear()
+                threading.Thread(target=_listen, name="flag-definitions-listener", daemon=True).start()
+    return _subscribed.is_set()
+
+
+def _load_flag_definitions(project_id: int) -> FlagDefinitions:
+    feature_flags = get_feature_flags_for_team_in_cache(project_id)
+    if feature_flags is None:
+        feature_flags = set_feature_flags_for_team_in_cache(project_id)
+
+    with execute_with_timeout(FLAG_DEFINITIONS_QUERY_TIMEOUT_MS, "default"):
+        group_types_to_indexes = {
+            row.group_type: cast(GroupTypeIndex, row.group_type_index)
+            for row in GroupTypeMapping.objects.filter(project_id=project_id)
+        }
+        cohorts: dict[int, CohortOrEmpty] = {}
+        if any(feature_flag.uses_cohorts for feature_flag in feature_flags):
+            cohorts = {
+                cohort.pk: cohort for cohort in Cohort.objects.filter(team__project_id=project_id, deleted=False)
+            }
+
+    return FlagDefinitions(
+        loaded_at=time.monotonic(),
+        feature_flags=feature_flags,
+        group_types_to_indexes=group_types_to_indexes,
+        cohorts=cohorts,
+    )
+
+
+def get_flag_definitions(project_id: int) -> Optional[FlagDefinitions]:
+    """
+    Returns the project's flag definitions from memory, loading them after they changed. Returns None when they can't
+    be trusted to be current, i.e. while this process isn't subscribed to changes, or when they failed to load, in
+    which case callers load the definitions themselves.
+    """
+    if not _ensure_listening():
+        return None
+
+    with _definitions_lock:
+        definitions = _definitions.get(project_id)
+        generation = _generation_of(project_id)
+    if (
+        definitions is not None
+        and time.monotonic() - definitions.loaded_at <= settings.DECIDE_FLAG_DEFINITIONS_CACHE_TTL_SECONDS
+    ):
+        return definitions
+
+    try:
+        definitions = _load_flag_definitions(project_id)
+    except Exception as e:
+        logger.exception("flag_definitions_load_failed", project_id=project_id)
+        capture_exception(e)
+        return None
+
+    with _definitions_lock:
+        if _subscribed.is_set() and generation == _generation_of(project_id):
+            _definitions[project_id] = definitions
+    return definitions
+
+
+def publish_flag_definitions_changed(project_id: int) -> None:
+    """Makes every process drop the project's flag definitions, once the current transaction commits."""
+
+    def publish() -> None:
+        try:
+            get_client().publish(FLAG_DEFINITIONS_CHANNEL, json.dumps(project_id))
+        except Exception:
+            # redis is unavailable, in which case listeners are disconnected and drop all definitions anyway
+            logger.exception("Redis is unavailable")
+
+    _forget(project_id)
+    transaction.on_commit(publish)
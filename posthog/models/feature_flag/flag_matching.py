@@ -41,6 +41,7 @@ from .feature_flag import (
     get_feature_flags_for_team_in_cache,
     set_feature_flags_for_team_in_cache,
 )
+from .flag_definitions import FlagDefinitions, get_flag_definitions
 
 logger = structlog.get_logger(__name__)
 
@@ -132,12 +133,15 @@ class FeatureFlagDetails:
 
 
 class FlagsMatcherCache:
-    def __init__(self, project_id: int):
+    def __init__(self, project_id: int, group_types_to_indexes: Optional[dict[GroupTypeName, GroupTypeIndex]] = None):
         self.project_id = project_id
         self.failed_to_fetch_flags = False
+        self._group_types_to_indexes = group_types_to_indexes
 
     @cached_property
     def group_types_to_indexes(self) -> dict[GroupTypeName, GroupTypeIndex]:
+        if self._group_types_to_indexes is not None:
+            return self._group_types_to_indexes
         if self.failed_to_fetch_flags:
             raise DatabaseError("Failed to fetch group type mapping previously, not trying again.")
         try:
@@ -838,6 +842,7 @@ def _get_all_feature_flags(
     property_value_overrides: Optional[dict[str, Union[str, int]]] = None,
     group_property_value_overrides: Optional[dict[str, dict[str, Union[str, int]]]] = None,
     skip_database_flags: bool = False,
+    definitions: Optional[FlagDefinitions] = None,
 ) -> tuple[
     dict[str, Union[str, bool]], dict[str, dict], dict[str, object], bool, Optional[dict[str, FeatureFlagDetails]]
 ]:
@@ -847,7 +852,7 @@ def _get_all_feature_flags(
         property_value_overrides = {}
     if groups is None:
         groups = {}
-    cache = FlagsMatcherCache(project_id)
+    cache = FlagsMatcherCache(project_id, definitions.group_types_to_indexes if definitions else None)
 
     if feature_flags:
         return FeatureFlagMatcher(
@@ -861,6 +866,8 @@ def _get_all_feature_flags(
             property_value_overrides,
             group_property_value_overrides,
             skip_database_flags,
+            # Copied, as cohorts missing from the project are cached for the request only
+            cohorts_cache=dict(definitions.cohorts) if definitions else None,
         ).get_matches_with_details()
 
     return {}, {}, {}, False, None
@@ -909,7 +916,11 @@ def get_all_feature_flags_with_details(
     property_value_overrides, group_property_value_overrides = add_local_person_and_group_properties(
         distinct_id, groups, property_value_overrides, group_property_value_overrides
     )
-    feature_flags_to_be_evaluated = get_feature_flags_for_team_in_cache(team.project_id)
+    # In the steady state, the project's definitions are read from memory without any I/O
+    definitions = get_flag_definitions(team.project_id) if settings.DECIDE_FLAG_DEFINITIONS_CACHE_ENABLED else None
+    feature_flags_to_be_evaluated = (
+        definitions.feature_flags if definitions else get_feature_flags_for_team_in_cache(team.project_id)
+    )
     cache_hit = True
 
     if feature_flags_to_be_evaluated is None:
@@ -943,6 +954,7 @@ def get_all_feature_flags_with_details(
             property_value_overrides=property_value_overrides,
             group_property_value_overrides=group_property_value_overrides,
             skip_database_flags=not is_database_alive,
+            definitions=definitions,
         )
 
     # For flags with experience continuity enabled, we want a consistent distinct_id that doesn't change,
@@ -1049,6 +1061,7 @@ def get_all_feature_flags_with_details(
             property_value_overrides=property_value_overrides,
             group_property_value_overrides=group_property_value_overrides,
             skip_database_flags=True,
+            definitions=definitions,
         )
 
     return _get_all_feature_flags(
@@ -1060,6 +1073,7 @@ def get_all_feature_flags_with_details(
         groups=groups,
         property_value_overrides=property_value_overrides,
         group_property_value_overrides=group_property_value_overrides,
+        definitions=definitions,
     )
 
 
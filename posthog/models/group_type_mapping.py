@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.db.models.signals import post_delete, post_save
+from posthog.models.signals import mutable_receiver
 from posthog.models.utils import RootTeamMixin
 
 # Defined here for reuse between OS and EE
@@ -56,3 +58,10 @@ class GroupTypeMapping(RootTeamMixin, models.Model):
                 check=models.Q(project_id__isnull=False),
             ),
         ]
+
+
+@mutable_receiver([post_save, post_delete], sender=GroupTypeMapping)
+def group_type_mapping_changed(sender, instance: GroupTypeMapping, **kwargs):
+    from posthog.models.feature_flag.flag_definitions import publish_flag_definitions_changed
+
+    publish_flag_definitions_changed(instance.project_id)
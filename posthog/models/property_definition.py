@@ -2,6 +2,8 @@ from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models.expressions import F
 from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from posthog.clickhouse.table_engines import ReplacingMergeTree, ReplicationScheme
 from posthog.models.team import Team
@@ -131,6 +133,14 @@ class PropertyDefinition(UUIDModel):
         return None
 
 
+@receiver(post_save, sender=PropertyDefinition)
+@receiver(post_delete, sender=PropertyDefinition)
+def property_definition_changed(sender, instance: PropertyDefinition, **kwargs):
+    from posthog.hogql.transforms.property_type_catalog import invalidate_property_type_catalog
+
+    invalidate_property_type_catalog(instance.project_id or instance.team_id)
+
+
 # ClickHouse Table DDL
 
 PROPERTY_DEFINITIONS_TABLE_SQL = (
@@ -0,0 +1,150 @@
+from posthog.clickhouse.cluster import ON_CLUSTER_CLAUSE
+from posthog.clickhouse.table_engines import MergeTreeEngine, ReplacingMergeTree, ReplicationScheme
+
+TRENDS_ROLLUP_DAILY_TABLE = "trends_rollup_daily"
+TRENDS_ROLLUP_HOURLY_TABLE = "trends_rollup_hourly"
+TRENDS_ROLLUP_WATERMARKS_TABLE = "trends_rollup_watermarks"
+
+
+def TRENDS_ROLLUP_TABLE_TEMPLATE(table_name):
+    engine = MergeTreeEngine(table_name, replication_scheme=ReplicationScheme.REPLICATED)
+
+    # Both granularities are partitioned by UTC day, so that a single day can be dropped and re-inserted idempotently
+    return f"""
+    CREATE TABLE IF NOT EXISTS {table_name} {ON_CLUSTER_CLAUSE(on_cluster=True)}
+    (
+        period_bucket DateTime('UTC'),
+        team_id UInt64,
+        event String,
+        events_count_state AggregateFunction(sum, UInt64),
+        persons_uniq_exact_state AggregateFunction(uniqExact, UUID)
+    ) ENGINE = {engine}
+    PARTITION BY toYYYYMMDD(period_bucket)
+    ORDER BY (team_id, event, period_bucket)
+    """
+
+
+def TRENDS_ROLLUP_DAILY_SQL():
+    return TRENDS_ROLLUP_TABLE_TEMPLATE(TRENDS_ROLLUP_DAILY_TABLE)
+
+
+def TRENDS_ROLLUP_HOURLY_SQL():
+    return TRENDS_ROLLUP_TABLE_TEMPLATE(TRENDS_ROLLUP_HOURLY_TABLE)
+
+
+def TRENDS_ROLLUP_WATERMARKS_SQL():
+    engine = ReplacingMergeTree(
+        TRENDS_ROLLUP_WATERMARKS_TABLE, ver="updated_at", replication_scheme=ReplicationScheme.REPLICATED
+    )
+
+    # A team's UTC day is only read from the rollup tables while its latest row is completed
+    return f"""
+    CREATE TABLE IF NOT EXISTS {TRENDS_ROLLUP_WATERMARKS_TABLE} {ON_CLUSTER_CLAUSE(on_cluster=True)}
+    (
+        team_id UInt64,
+        day Date,
+        completed UInt8,
+        updated_at DateTime64(6, 'UTC')
+    ) ENGINE = {engine}
+    ORDER BY (team_id, day)
+    """
+
+
+def TRENDS_ROLLUP_PARTITION_EXISTS_SQL():
+    return """
+    SELECT count() > 0
+    FROM system.parts
+    WHERE database = currentDatabase() AND table = %(table_name)s AND partition_id = %(partition_id)s AND active
+    """
+
+
+def TRENDS_ROLLUP_DROP_PARTITION_SQL(table_name, date_start):
+    """
+    Drops the UTC day starting at date_start (YYYY-MM-DD) from a rollup table, so it can be re-inserted.
+    """
+    return f"""
+    ALTER TABLE {table_name}
+    DROP PARTITION '{date_start.replace("-", "")}'
+    """
+
+
+def TRENDS_ROLLUP_DELETE_TEAMS_SQL(table_name, date_start, date_end, team_ids):
+    """
+    Deletes the rollups of some teams between date_start (inclusive) and date_end (exclusive), both YYYY-MM-DD in UTC,
+    leaving the other teams' rollups of those days in place.
+    """
+    return f"""
+    ALTER TABLE {table_name}
+    DELETE WHERE team_id IN ({", ".join(str(team_id) for team_id in team_ids)})
+        AND period_bucket >= toDateTime('{date_start}', 'UTC')
+        AND period_bucket < toDateTime('{date_end}', 'UTC')
+    SETTINGS mutations_sync = 2
+    """
+
+
+def TRENDS_ROLLUP_SET_WATERMARKS_SQL(date_start, date_end, team_ids, completed):
+    """
+    Marks the UTC days between date_start (inclusive) and date_end (exclusive) as completed or not for the given
+    teams, or for all teams with a watermark on those days if team_ids is None.
+    """
+    if team_ids is None:
+        return f"""
+        INSERT INTO {TRENDS_ROLLUP_WATERMARKS_TABLE} (team_id, day, completed, updated_at)
+        SELECT team_id, day, {int(completed)}, now64(6, 'UTC')
+        FROM {TRENDS_ROLLUP_WATERMARKS_TABLE} FINAL
+        WHERE day >= toDate('{date_start}') AND day < toDate('{date_end}')
+        """
+
+    return f"""
+    INSERT INTO {TRENDS_ROLLUP_WATERMARKS_TABLE} (team_id, day, completed, updated_at)
+    SELECT
+        arrayJoin([{", ".join(str(team_id) for team_id in team_ids)}]) AS team_id,
+        arrayJoin(
+            arrayMap(i -> toDate('{date_start}') + i, range(toUInt64(toDate('{date_end}') - toDate('{date_start}'))))
+        ) AS day,
+        {int(completed)},
+        now64(6, 'UTC')
+    """
+
+
+def TRENDS_ROLLUP_COMPLETED_DAYS_SQL():
+    """The UTC days between %(date_from)s and %(date_to)s (both inclusive) that are rolled up for the teams."""
+    return f"""
+    SELECT team_id, groupArray(day)
+    FROM {TRENDS_ROLLUP_WATERMARKS_TABLE} FINAL
+    WHERE team_id IN %(team_ids)s AND day >= %(date_from)s AND day <= %(date_to)s AND completed = 1
+    GROUP BY team_id
+    """
+
+
+def TRENDS_ROLLUP_INSERT_SQL(date_start, date_end, team_ids, granularity="daily", settings=""):
+    """
+    Aggregates raw events between date_start (inclusive) and date_end (exclusive), both YYYY-MM-DD in UTC, into the
+    daily or hourly rollup table. Persons are counted by the person_id written on the event, which is what trends
+    queries use in the `person_id_no_override_properties_on_events` persons-on-events mode.
+    """
+    if granularity == "hourly":
+        table_name = TRENDS_ROLLUP_HOURLY_TABLE
+        time_bucket_func = "toStartOfHour"
+    else:
+        table_name = TRENDS_ROLLUP_DAILY_TABLE
+        time_bucket_func = "toStartOfDay"
+
+    team_filter = f"team_id IN ({', '.join(str(team_id) for team_id in team_ids)})" if team_ids else "1=1"
+    settings_clause = f"SETTINGS {settings}" if settings else ""
+
+    return f"""
+    INSERT INTO {table_name}
+    SELECT
+        {time_bucket_func}(toTimeZone(timestamp, 'UTC')) AS period_bucket,
+        team_id,
+        event,
+        sumState(toUInt64(1)) AS events_count_state,
+        uniqExactState(person_id) AS persons_uniq_exact_state
+    FROM events
+    WHERE {team_filter}
+        AND timestamp >= toDateTime('{date_start}', 'UTC')
+        AND timestamp < toDateTime('{date_end}', 'UTC')
+    GROUP BY period_bucket, team_id, event
+    {settings_clause}
+    """
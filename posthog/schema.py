@@ -2563,6 +2563,21 @@ class ActorsPropertyTaxonomyResponse(BaseModel):
     sample_values: list[Union[str, float, bool, int]]
 
 
+class AdaptiveSamplingResult(BaseModel):
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    estimatedRows: int = Field(..., description="Rows ClickHouse estimated the unsampled query would read")
+    relativeError: Optional[float] = Field(
+        default=None,
+        description=(
+            "Approximate relative standard error of counts, from the rows the sample matched. 0 if it ran on all rows,"
+            " unset if the query doesn't report how many rows its sample matched"
+        ),
+    )
+    samplingFactor: float = Field(..., description="The sample factor applied to the query, 1 if it ran on all rows")
+
+
 class AlertCondition(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
@@ -3483,6 +3498,9 @@ class HogQLQueryModifiers(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[bool] = Field(
+        default=None, description="Sample insights that would read more rows than fit the latency budget"
+    )
     bounceRateDurationSeconds: Optional[float] = None
     bounceRatePageViewMode: Optional[BounceRatePageViewMode] = None
     convertToProjectTimezone: Optional[bool] = None
@@ -3490,6 +3508,13 @@ class HogQLQueryModifiers(BaseModel):
     dataWarehouseEventsModifiers: Optional[list[DataWarehouseEventsModifier]] = None
     debug: Optional[bool] = None
     formatCsvAllowDoubleQuotes: Optional[bool] = None
+    funnelCorrelationFanOut: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Run funnel correlation and its success/failure totals as separate concurrent queries, sharing the totals"
+            " across correlation types of the same funnel"
+        ),
+    )
     inCohortVia: Optional[InCohortVia] = None
     materializationMode: Optional[MaterializationMode] = None
     optimizeJoinedFilters: Optional[bool] = None
@@ -3497,11 +3522,31 @@ class HogQLQueryModifiers(BaseModel):
     personsJoinMode: Optional[PersonsJoinMode] = None
     personsOnEventsMode: Optional[PersonsOnEventsMode] = None
     propertyGroupsMode: Optional[PropertyGroupsMode] = None
+    prunePathsEdges: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Keep the top edges of each step level of paths insights in ClickHouse, instead of the top edges overall"
+        ),
+    )
     s3TableUseInvalidColumns: Optional[bool] = None
     sessionTableVersion: Optional[SessionTableVersion] = None
     sessionsV2JoinMode: Optional[SessionsV2JoinMode] = None
+    useErrorTrackingIssuesTable: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Filter error tracking issues by status and assignee in ClickHouse, using the synced issues table instead"
+            " of Postgres"
+        ),
+    )
+    useLLMTraceSummaries: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Read the LLM observability traces list from the trace summaries table instead of aggregating AI events"
+        ),
+    )
     useMaterializedViews: Optional[bool] = None
     usePresortedEventsTable: Optional[bool] = None
+    useTrendsRollups: Optional[bool] = None
     useWebAnalyticsPreAggregatedTables: Optional[bool] = None
 
 
@@ -3540,6 +3585,7 @@ class LLMTrace(BaseModel):
         extra="forbid",
     )
     createdAt: str
+    errorCount: Optional[float] = None
     events: list[LLMTraceEvent]
     id: str
     inputCost: Optional[float] = None
@@ -4208,6 +4254,9 @@ class StickinessQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -4379,6 +4428,9 @@ class TrendsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -4606,6 +4658,10 @@ class ActorsQueryResponse(BaseModel):
     modifiers: Optional[HogQLQueryModifiers] = Field(
         default=None, description="Modifiers used when performing the query"
     )
+    nextCursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor",
+    )
     offset: int
     query_status: Optional[QueryStatus] = Field(
         default=None, description="Query status indicates whether next to the provided data, a query is still running."
@@ -5201,6 +5257,10 @@ class CachedActorsQueryResponse(BaseModel):
     modifiers: Optional[HogQLQueryModifiers] = Field(
         default=None, description="Modifiers used when performing the query"
     )
+    nextCursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor",
+    )
     next_allowed_client_refresh: datetime
     offset: int
     query_status: Optional[QueryStatus] = Field(
@@ -5297,6 +5357,10 @@ class CachedEventsQueryResponse(BaseModel):
     modifiers: Optional[HogQLQueryModifiers] = Field(
         default=None, description="Modifiers used when performing the query"
     )
+    nextCursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor",
+    )
     next_allowed_client_refresh: datetime
     offset: Optional[int] = None
     query_status: Optional[QueryStatus] = Field(
@@ -5371,6 +5435,9 @@ class CachedFunnelsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -5441,6 +5508,9 @@ class CachedLifecycleQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -5564,6 +5634,9 @@ class CachedPathsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -5968,6 +6041,9 @@ class CachedStickinessQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -6081,6 +6157,9 @@ class CachedTrendsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -7464,6 +7543,10 @@ class EventsQueryResponse(BaseModel):
     modifiers: Optional[HogQLQueryModifiers] = Field(
         default=None, description="Modifiers used when performing the query"
     )
+    nextCursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor to pass as `cursor` to fetch the next page, only set when paginating by cursor",
+    )
     offset: Optional[int] = None
     query_status: Optional[QueryStatus] = Field(
         default=None, description="Query status indicates whether next to the provided data, a query is still running."
@@ -7819,6 +7902,9 @@ class FunnelsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -7978,6 +8064,9 @@ class LifecycleQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -8069,6 +8158,9 @@ class PathsQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -10287,6 +10379,9 @@ class CachedRetentionQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     cache_key: str
     cache_target_age: Optional[datetime] = None
     calculation_trigger: Optional[str] = Field(
@@ -10720,6 +10815,9 @@ class RetentionQueryResponse(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    adaptiveSampling: Optional[AdaptiveSamplingResult] = Field(
+        default=None, description="The sampling chosen by the adaptiveSampling modifier"
+    )
     error: Optional[str] = Field(
         default=None,
         description="Query error. Returned only if 'explain' or `modifiers.debug` is true. Throws an error otherwise.",
@@ -12465,6 +12563,14 @@ class ActorsQuery(BaseModel):
     model_config = ConfigDict(
         extra="forbid",
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque cursor for keyset pagination. Pass an empty string to paginate by cursor from the first page, then"
+            " the `nextCursor` of the previous response. Unlike `offset`, deep pages cost about the same as the first"
+            " one."
+        ),
+    )
     fixedProperties: Optional[
         list[Union[PersonPropertyFilter, CohortPropertyFilter, HogQLPropertyFilter, EmptyPropertyFilter]]
     ] = Field(
@@ -12481,6 +12587,13 @@ class ActorsQuery(BaseModel):
     )
     offset: Optional[int] = None
     orderBy: Optional[list[str]] = None
+    personProperties: Optional[list[str]] = Field(
+        default=None,
+        description=(
+            "Only load these person properties, plus the team's display name properties and any properties referenced"
+            " in `select`, when enriching the `person` column. All properties are loaded when unset."
+        ),
+    )
     properties: Optional[
         Union[
             list[Union[PersonPropertyFilter, CohortPropertyFilter, HogQLPropertyFilter, EmptyPropertyFilter]],
@@ -12510,6 +12623,14 @@ class EventsQuery(BaseModel):
     actionId: Optional[int] = Field(default=None, description="Show events matching a given action")
     after: Optional[str] = Field(default=None, description="Only fetch events that happened after this timestamp")
     before: Optional[str] = Field(default=None, description="Only fetch events that happened before this timestamp")
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque cursor for keyset pagination. Pass an empty string to paginate by cursor from the first page, then"
+            " the `nextCursor` of the previous response. Unlike `offset`, deep pages cost about the same as the first"
+            " one."
+        ),
+    )
     event: Optional[str] = Field(default=None, description="Limit to events matching this string")
     filterTestAccounts: Optional[bool] = Field(default=None, description="Filter test accounts")
     fixedProperties: Optional[
@@ -27,3 +27,6 @@ DEFAULT_TOTAL_EVENTS_PER_QUERY = 10000
 
 # Maximum number of events to fetch per query
 MAX_TOTAL_EVENTS_PER_QUERY = 50000
+
+# Maximum number of events to load for a single session when streaming the events of a batch of sessions
+MAX_EVENTS_PER_SESSION = 10000
@@ -112,6 +112,72 @@ PROM_PUSHGATEWAY_ADDRESS: str | None = os.getenv("PROM_PUSHGATEWAY_ADDRESS", Non
 
 HOGQL_INCREASED_MAX_EXECUTION_TIME: int = get_from_env("HOGQL_INCREASED_MAX_EXECUTION_TIME", 600, type_cast=int)
 
+# Resolve HogQL property types from an in-process, per-project catalog instead of querying them for every query
+HOGQL_PROPERTY_TYPE_CATALOG_ENABLED: bool = get_from_env(
+    "HOGQL_PROPERTY_TYPE_CATALOG_ENABLED", False, type_cast=str_to_bool
+)
+HOGQL_PROPERTY_TYPE_CATALOG_TTL_SECONDS: int = get_from_env(
+    "HOGQL_PROPERTY_TYPE_CATALOG_TTL_SECONDS", 60, type_cast=int
+)
+HOGQL_PROPERTY_TYPE_CATALOG_MAX_PROJECTS: int = get_from_env(
+    "HOGQL_PROPERTY_TYPE_CATALOG_MAX_PROJECTS", 500, type_cast=int
+)
+HOGQL_PROPERTY_TYPE_CATALOG_MAX_DEFINITIONS: int = get_from_env(
+    "HOGQL_PROPERTY_TYPE_CATALOG_MAX_DEFINITIONS", 20000, type_cast=int
+)
+
+# Serve HogQL autocomplete from an in-process, per-team index of the database and property names
+HOGQL_AUTOCOMPLETE_INDEX_ENABLED: bool = get_from_env("HOGQL_AUTOCOMPLETE_INDEX_ENABLED", False, type_cast=str_to_bool)
+HOGQL_AUTOCOMPLETE_INDEX_TTL_SECONDS: int = get_from_env("HOGQL_AUTOCOMPLETE_INDEX_TTL_SECONDS", 60, type_cast=int)
+HOGQL_AUTOCOMPLETE_INDEX_MAX_TEAMS: int = get_from_env("HOGQL_AUTOCOMPLETE_INDEX_MAX_TEAMS", 200, type_cast=int)
+HOGQL_AUTOCOMPLETE_INDEX_MAX_PROPERTIES: int = get_from_env(
+    "HOGQL_AUTOCOMPLETE_INDEX_MAX_PROPERTIES", 50000, type_cast=int
+)
+
+# Reuse the serialized fields of tables that haven't changed since the team's database schema was last serialized
+HOGQL_SERIALIZED_DATABASE_CACHE_ENABLED: bool = get_from_env(
+    "HOGQL_SERIALIZED_DATABASE_CACHE_ENABLED", False, type_cast=str_to_bool
+)
+HOGQL_SERIALIZED_DATABASE_MAX_TEAMS: int = get_from_env("HOGQL_SERIALIZED_DATABASE_MAX_TEAMS", 200, type_cast=int)
+
+# Write CSV/XLSX exports page by page to a temporary file instead of rendering them in memory
+CSV_EXPORT_STREAMING_ENABLED: bool = get_from_env("CSV_EXPORT_STREAMING_ENABLED", False, type_cast=str_to_bool)
+
+# Collect usage report event metrics in a single multi-aggregate scan and run the remaining queries concurrently
+USAGE_REPORT_CONSOLIDATED_QUERIES: bool = get_from_env(
+    "USAGE_REPORT_CONSOLIDATED_QUERIES", False, type_cast=str_to_bool
+)
+USAGE_REPORT_QUERY_CONCURRENCY: int = get_from_env("USAGE_REPORT_QUERY_CONCURRENCY", 4, type_cast=int)
+# Persist usage report query results so a retried run resumes, and stream org reports instead of holding them all
+USAGE_REPORT_CHECKPOINTS_ENABLED: bool = get_from_env("USAGE_REPORT_CHECKPOINTS_ENABLED", False, type_cast=str_to_bool)
+
+# Days rolled up for teams that just enabled trends rollups
+TRENDS_ROLLUP_BACKFILL_DAYS: int = get_from_env("TRENDS_ROLLUP_BACKFILL_DAYS", 90, type_cast=int)
+
+# Refresh time series insights by recalculating only the buckets that may have changed since the cached result
+INSIGHT_INCREMENTAL_REFRESH_ENABLED: bool = get_from_env(
+    "INSIGHT_INCREMENTAL_REFRESH_ENABLED", False, type_cast=str_to_bool
+)
+# Buckets that ended this long before the cached result was calculated are reused as they are
+INSIGHT_INCREMENTAL_REFRESH_SETTLE_HOURS: int = get_from_env(
+    "INSIGHT_INCREMENTAL_REFRESH_SETTLE_HOURS", 24, type_cast=int
+)
+
+# Insights with the adaptiveSampling modifier are sampled down to run in about this many seconds
+ADAPTIVE_SAMPLING_LATENCY_BUDGET_SECONDS: float = get_from_env(
+    "ADAPTIVE_SAMPLING_LATENCY_BUDGET_SECONDS", 20.0, type_cast=float
+)
+# Rows ClickHouse reads per second for a typical insight, used to turn the row estimate into a latency
+ADAPTIVE_SAMPLING_ROWS_PER_SECOND: int = get_from_env("ADAPTIVE_SAMPLING_ROWS_PER_SECOND", 250_000_000, type_cast=int)
+# How long a query's row estimate is reused before asking ClickHouse again
+ADAPTIVE_SAMPLING_ESTIMATE_TTL_SECONDS: int = get_from_env(
+    "ADAPTIVE_SAMPLING_ESTIMATE_TTL_SECONDS", 60 * 60, type_cast=int
+)
+# How long funnel correlation totals are shared between correlation types of the same funnel
+FUNNEL_CORRELATION_TOTALS_TTL_SECONDS: int = get_from_env(
+    "FUNNEL_CORRELATION_TOTALS_TTL_SECONDS", 5 * 60, type_cast=int
+)
+
 # Extend and override these settings with EE's ones
 if "ee.apps.EnterpriseConfig" in INSTALLED_APPS:
     from ee.settings import *  # noqa: F401, F403
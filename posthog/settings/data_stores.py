@@ -189,6 +189,13 @@ with suppress(Exception):
     as_json = json.loads(os.getenv("CLICKHOUSE_USE_HTTP_PER_TEAM", "[]"))
     CLICKHOUSE_USE_HTTP_PER_TEAM = {int(v) for v in as_json}
 
+# Fans out the queries of a request on an event loop with the async HTTP client, rather than on threads
+CLICKHOUSE_USE_ASYNC_CLIENT: bool = get_from_env("CLICKHOUSE_USE_ASYNC_CLIENT", False, type_cast=str_to_bool)
+CLICKHOUSE_USE_ASYNC_CLIENT_PER_TEAM = set[int]([])
+with suppress(Exception):
+    as_json = json.loads(os.getenv("CLICKHOUSE_USE_ASYNC_CLIENT_PER_TEAM", "[]"))
+    CLICKHOUSE_USE_ASYNC_CLIENT_PER_TEAM = {int(v) for v in as_json}
+
 QUERYSERVICE_HOST: str = get_from_env("QUERYSERVICE_HOST", CLICKHOUSE_HOST)
 QUERYSERVICE_SECURE: bool = get_from_env("QUERYSERVICE_SECURE", CLICKHOUSE_SECURE, type_cast=str_to_bool)
 QUERYSERVICE_VERIFY: bool = get_from_env("QUERYSERVICE_VERIFY", CLICKHOUSE_VERIFY, type_cast=str_to_bool)
@@ -53,6 +53,9 @@ REPLAY_CAPTURE_ENDPOINT = os.getenv("REPLAY_CAPTURE_ENDPOINT", "/s/")
 CAPTURE_INTERNAL_URL = os.getenv("CAPTURE_INTERNAL_URL", "http://localhost:8010")
 CAPTURE_REPLAY_INTERNAL_URL = os.getenv("CAPTURE_REPLAY_INTERNAL_URL", "http://localhost:8010")
 CAPTURE_INTERNAL_MAX_WORKERS = get_from_env("CAPTURE_INTERNAL_MAX_WORKERS", type_cast=int, default=16)
+# capture_batch_internal_compressed POSTs up to this many events per gzipped request to the batch endpoint
+CAPTURE_INTERNAL_BATCH_ENDPOINT = os.getenv("CAPTURE_INTERNAL_BATCH_ENDPOINT", "/batch/")
+CAPTURE_INTERNAL_BATCH_SIZE = get_from_env("CAPTURE_INTERNAL_BATCH_SIZE", type_cast=int, default=500)
 
 NEW_ANALYTICS_CAPTURE_ENDPOINT = os.getenv("NEW_CAPTURE_ENDPOINT", "/i/v0/e/")
 NEW_ANALYTICS_CAPTURE_EXCLUDED_TEAM_IDS = get_set(os.getenv("NEW_ANALYTICS_CAPTURE_EXCLUDED_TEAM_IDS", ""))
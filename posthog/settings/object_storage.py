@@ -29,6 +29,10 @@ OBJECT_STORAGE_SESSION_RECORDING_LTS_FOLDER = os.getenv(
     "OBJECT_STORAGE_SESSION_RECORDING_LTS_FOLDER", "session_recordings_lts"
 )
 OBJECT_STORAGE_EXPORTS_FOLDER = os.getenv("OBJECT_STORAGE_EXPORTS_FOLDER", "exports")
+# Part size for multipart uploads of streamed content, S3 requires at least 5MB per part
+OBJECT_STORAGE_MULTIPART_CHUNK_SIZE_BYTES = get_from_env(
+    "OBJECT_STORAGE_MULTIPART_CHUNK_SIZE_BYTES", 1024 * 1024 * 16, type_cast=int
+)
 OBJECT_STORAGE_MEDIA_UPLOADS_FOLDER = os.getenv("OBJECT_STORAGE_MEDIA_UPLOADS_FOLDER", "media_uploads")
 OBJECT_STORAGE_ERROR_TRACKING_SOURCE_MAPS_FOLDER = os.getenv(
     "OBJECT_STORAGE_ERROR_TRACKING_SOURCE_MAPS_FOLDER", "symbolsets"
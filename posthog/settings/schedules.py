@@ -1,5 +1,7 @@
+import os
+
 from posthog.settings.base_variables import TEST
-from posthog.settings.utils import get_from_env
+from posthog.settings.utils import get_from_env, get_set
 
 USE_PRECALCULATED_CH_COHORT_PEOPLE = not TEST
 
@@ -16,6 +18,12 @@ CALCULATE_COHORTS_NIGHT_SCHEDULE = get_from_env(
 )
 CALCULATE_X_PARALLEL_COHORTS_DURING_NIGHT = get_from_env("CALCULATE_X_PARALLEL_COHORTS_DURING_NIGHT", 5, type_cast=int)
 
+# Teams whose cohorts are calculated one partition of persons at a time, to bound the memory of each query.
+# Every partition scans the cohort's events again, so this is only worth it for teams with very many persons.
+CALCULATE_COHORTS_PARTITIONED_TEAM_IDS = get_set(os.getenv("CALCULATE_COHORTS_PARTITIONED_TEAM_IDS", ""))
+CALCULATE_COHORTS_PARTITIONS = get_from_env("CALCULATE_COHORTS_PARTITIONS", 8, type_cast=int)
+CALCULATE_X_PARALLEL_COHORT_PARTITIONS = get_from_env("CALCULATE_X_PARALLEL_COHORT_PARTITIONS", 1, type_cast=int)
+
 ACTION_EVENT_MAPPING_INTERVAL_SECONDS = get_from_env("ACTION_EVENT_MAPPING_INTERVAL_SECONDS", 300, type_cast=int)
 
 # Schedule to syncronize insight cache states on. Follows crontab syntax.
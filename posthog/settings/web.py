@@ -406,6 +406,18 @@ DECIDE_SHORT_CIRCUITED_TEAM_IDS = [0]
 # Decide db settings
 DECIDE_SKIP_POSTGRES_FLAGS = get_from_env("DECIDE_SKIP_POSTGRES_FLAGS", False, type_cast=str_to_bool)
 
+# Keep the flag definitions, group type mappings and cohorts of each project in memory. Entries are dropped when a
+# change is published over Redis pub/sub, and after the TTL in case a change was missed.
+DECIDE_FLAG_DEFINITIONS_CACHE_ENABLED = get_from_env(
+    "DECIDE_FLAG_DEFINITIONS_CACHE_ENABLED", False, type_cast=str_to_bool
+)
+DECIDE_FLAG_DEFINITIONS_CACHE_TTL_SECONDS = get_from_env(
+    "DECIDE_FLAG_DEFINITIONS_CACHE_TTL_SECONDS", 300, type_cast=int
+)
+DECIDE_FLAG_DEFINITIONS_CACHE_MAX_PROJECTS = get_from_env(
+    "DECIDE_FLAG_DEFINITIONS_CACHE_MAX_PROJECTS", 1000, type_cast=int
+)
+
 # Decide billing analytics
 DECIDE_BILLING_SAMPLING_RATE = get_from_env("DECIDE_BILLING_SAMPLING_RATE", 0.1, type_cast=float)
 DECIDE_BILLING_ANALYTICS_TOKEN = get_from_env("DECIDE_BILLING_ANALYTICS_TOKEN", None, type_cast=str, optional=True)
@@ -1,8 +1,9 @@
 import abc
-from typing import Optional, Union, Any
+from typing import IO, Optional, Union, Any
 
 import structlog
 from boto3 import client
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from django.conf import settings
 from posthog.exceptions_capture import capture_exception
@@ -55,6 +56,13 @@ class ObjectStorageClient(metaclass=abc.ABCMeta):
     def write(self, bucket: str, key: str, content: Union[str, bytes], extras: dict | None) -> None:
         pass
 
+    @abc.abstractmethod
+    def write_stream(self, bucket: str, key: str, fileobj: IO[bytes], extras: dict | None) -> None:
+        """
+        Upload a file-like object without reading it into memory, using a multipart upload for large files.
+        """
+        pass
+
     @abc.abstractmethod
     def copy_objects(self, bucket: str, source_prefix: str, target_prefix: str) -> int | None:
         """
@@ -97,6 +105,9 @@ class UnavailableStorage(ObjectStorageClient):
     def write(self, bucket: str, key: str, content: Union[str, bytes], extras: dict | None) -> None:
         pass
 
+    def write_stream(self, bucket: str, key: str, fileobj: IO[bytes], extras: dict | None) -> None:
+        pass
+
     def copy_objects(self, bucket: str, source_prefix: str, target_prefix: str) -> int | None:
         pass
 
@@ -214,6 +225,23 @@ class ObjectStorage(ObjectStorageClient):
             capture_exception(e)
             raise ObjectStorageError("write failed") from e
 
+    def write_stream(self, bucket: str, key: str, fileobj: IO[bytes], extras: dict | None) -> None:
+        try:
+            self.aws_client.upload_fileobj(
+                fileobj,
+                bucket,
+                key,
+                ExtraArgs=extras or None,
+                Config=TransferConfig(
+                    multipart_threshold=settings.OBJECT_STORAGE_MULTIPART_CHUNK_SIZE_BYTES,
+                    multipart_chunksize=settings.OBJECT_STORAGE_MULTIPART_CHUNK_SIZE_BYTES,
+                ),
+            )
+        except Exception as e:
+            logger.exception("object_storage.write_stream_failed", bucket=bucket, file_name=key, error=e)
+            capture_exception(e)
+            raise ObjectStorageError("write failed") from e
+
     def copy_objects(self, bucket: str, source_prefix: str, target_prefix: str) -> int | None:
         try:
             source_objects = self.list_objects(bucket, source_prefix) or []
@@ -280,6 +308,15 @@ def write(file_name: str, content: Union[str, bytes], extras: dict | None = None
     )
 
 
+def write_stream(file_name: str, fileobj: IO[bytes], extras: dict | None = None, bucket: str | None = None) -> None:
+    return object_storage_client().write_stream(
+        bucket=bucket or settings.OBJECT_STORAGE_BUCKET,
+        key=file_name,
+        fileobj=fileobj,
+        extras=extras,
+    )
+
+
 def delete(file_name: str, bucket: str | None = None) -> None:
     return object_storage_client().delete(bucket=bucket or settings.OBJECT_STORAGE_BUCKET, key=file_name)
 
@@ -1,6 +1,9 @@
+import csv
 import datetime
 import io
-from typing import Any, Optional
+import pickle
+import tempfile
+from typing import IO, Any, Optional
 from collections.abc import Generator
 from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlunparse
 
@@ -8,6 +11,7 @@ from pydantic import BaseModel
 import requests
 import structlog
 from openpyxl import Workbook
+from django.conf import settings
 from django.http import QueryDict
 from requests.exceptions import HTTPError
 
@@ -15,9 +19,9 @@ from posthog.exceptions_capture import capture_exception
 from posthog.api.services.query import process_query_dict
 from posthog.hogql_queries.query_runner import ExecutionMode
 from posthog.jwt import PosthogJwtAudience, encode_jwt
-from posthog.models.exported_asset import ExportedAsset, save_content
+from posthog.models.exported_asset import ExportedAsset, save_content, save_content_from_file
 from posthog.utils import absolute_uri
-from .ordered_csv_renderer import OrderedCsvRenderer
+from .ordered_csv_renderer import OrderedCsvRenderer, extract_expression_comment, order_fields
 from ..exporter import (
     EXPORT_FAILED_COUNTER,
     EXPORT_ASSET_UNKNOWN_COUNTER,
@@ -25,7 +29,12 @@ from ..exporter import (
     EXPORT_TIMER,
 )
 from ...exceptions import QuerySizeExceeded
-from ...hogql.constants import CSV_EXPORT_LIMIT, CSV_EXPORT_BREAKDOWN_LIMIT_INITIAL, CSV_EXPORT_BREAKDOWN_LIMIT_LOW
+from ...hogql.constants import (
+    CSV_EXPORT_LIMIT,
+    CSV_EXPORT_BREAKDOWN_LIMIT_INITIAL,
+    CSV_EXPORT_BREAKDOWN_LIMIT_LOW,
+    CSV_EXPORT_STREAMING_PAGE_SIZE,
+)
 from ...hogql.query import LimitContext
 
 logger = structlog.get_logger(__name__)
@@ -33,6 +42,11 @@ logger = structlog.get_logger(__name__)
 RESULT_LIMIT_KEYS = ("distinct_ids",)
 RESULT_LIMIT_LENGTH = 10
 
+# Query kinds that support limit/offset, and can therefore be fetched page by page when streaming
+PAGINATED_QUERY_KINDS = ("EventsQuery", "ActorsQuery")
+# Keep this much of a streamed export in memory before spilling to disk
+STREAMING_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
 
 # SUPPORTED CSV TYPES
 
@@ -296,6 +310,48 @@ def get_from_hogql_query(exported_asset: ExportedAsset, limit: int, resource: di
         return
 
 
+def get_from_hogql_query_paginated(
+    exported_asset: ExportedAsset, limit: int, resource: dict
+) -> Generator[Any, None, None]:
+    """
+    Like `get_from_hogql_query`, but fetches paginated query kinds one page at a time,
+    so that only a single page of results is held in memory.
+    """
+    query = resource.get("source")
+    assert query is not None
+
+    if query.get("kind") not in PAGINATED_QUERY_KINDS:
+        yield from get_from_hogql_query(exported_asset, limit, resource)
+        return
+
+    max_rows = min(query.get("limit") or CSV_EXPORT_LIMIT, CSV_EXPORT_LIMIT)
+    initial_offset = query.get("offset") or 0
+    total = 0
+    while total < max_rows:
+        page_query = {
+            **query,
+            "limit": min(CSV_EXPORT_STREAMING_PAGE_SIZE, max_rows - total),
+            "offset": initial_offset + total,
+        }
+        query_response = process_query_dict(
+            team=exported_asset.team,
+            query_json=page_query,
+            limit_context=LimitContext.EXPORT,
+            execution_mode=ExecutionMode.CALCULATE_BLOCKING_ALWAYS,
+        )
+        if isinstance(query_response, BaseModel):
+            query_response = query_response.model_dump(by_alias=True)
+
+        page_rows = 0
+        for row in _convert_response_to_csv_data(query_response):
+            page_rows += 1
+            yield row
+        total += page_rows
+
+        if not query_response.get("hasMore") or page_rows == 0:
+            break
+
+
 def _export_to_dict(exported_asset: ExportedAsset, limit: int) -> Any:
     resource = exported_asset.export_context
 
@@ -353,6 +409,100 @@ def _export_to_excel(exported_asset: ExportedAsset, limit: int) -> None:
     save_content(exported_asset, output.getvalue())
 
 
+def _export_to_spooled_rows(
+    exported_asset: ExportedAsset, limit: int, header_from_first_row: bool
+) -> tuple[IO[bytes], list[str]]:
+    """
+    Streaming counterpart of `_export_to_dict`. Flattened rows are pickled one by one into a spooled temporary
+    file while the set of columns is discovered, so the header can be computed without keeping every row in memory.
+    """
+    resource = exported_asset.export_context
+    columns: list[str] = resource.get("columns", [])
+    returned_rows: Generator[Any, None, None]
+
+    if resource.get("source"):
+        returned_rows = get_from_hogql_query_paginated(exported_asset, limit, resource)
+    else:
+        returned_rows = get_from_insights_api(exported_asset, limit, resource)
+
+    renderer = OrderedCsvRenderer()
+    rows_file = tempfile.SpooledTemporaryFile(max_size=STREAMING_SPOOL_MAX_SIZE)
+    # Used as an ordered set
+    unique_fields: dict[str, None] = {}
+    header: Optional[list[str]] = list(columns) if columns else None
+    row_count = 0
+
+    for row in returned_rows:
+        if row_count == 0 and not header and header_from_first_row:
+            # Same logic as `_export_to_dict`: if values are serialised then keep the order of the keys
+            is_any_col_list_or_dict = [x for x in row.values() if isinstance(x, dict) or isinstance(x, list)]
+            if not is_any_col_list_or_dict:
+                header = list(row.keys())
+
+        flat_row = renderer.flatten_item(row)
+        unique_fields.update(dict.fromkeys(flat_row.keys()))
+        pickle.dump(flat_row, rows_file, protocol=pickle.HIGHEST_PROTOCOL)
+        row_count += 1
+
+    if row_count == 0:
+        # If we have no rows, that means we couldn't convert anything, so put something to avoid confusion
+        error_row = {"error": "No data available or unable to format for export."}
+        unique_fields.update(dict.fromkeys(error_row.keys()))
+        pickle.dump(error_row, rows_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    rows_file.seek(0)
+    return rows_file, order_fields(list(unique_fields.keys()), header)
+
+
+def _iter_spooled_rows(rows_file: IO[bytes], field_headers: list[str]) -> Generator[list[Any], None, None]:
+    yield [extract_expression_comment(header) for header in field_headers]
+    while True:
+        try:
+            item = pickle.load(rows_file)
+        except EOFError:
+            return
+        yield [item.get(key, None) for key in field_headers]
+
+
+def _export_to_csv_streaming(exported_asset: ExportedAsset, limit: int) -> None:
+    rows_file, field_headers = _export_to_spooled_rows(exported_asset, limit, header_from_first_row=True)
+
+    with rows_file, tempfile.SpooledTemporaryFile(max_size=STREAMING_SPOOL_MAX_SIZE) as output:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in _iter_spooled_rows(rows_file, field_headers):
+            writer.writerow(row)
+            if buffer.tell() > STREAMING_SPOOL_MAX_SIZE:
+                output.write(buffer.getvalue().encode(settings.DEFAULT_CHARSET))
+                buffer.seek(0)
+                buffer.truncate()
+        output.write(buffer.getvalue().encode(settings.DEFAULT_CHARSET))
+
+        output.seek(0)
+        save_content_from_file(exported_asset, output)
+
+
+def _export_to_excel_streaming(exported_asset: ExportedAsset, limit: int) -> None:
+    rows_file, field_headers = _export_to_spooled_rows(exported_asset, limit, header_from_first_row=False)
+
+    with rows_file, tempfile.SpooledTemporaryFile(max_size=STREAMING_SPOOL_MAX_SIZE) as output:
+        # Write-only workbooks flush rows to disk as they are appended
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+
+        for row_data in _iter_spooled_rows(rows_file, field_headers):
+            worksheet.append(
+                [
+                    str(value) if value is not None and not isinstance(value, str | int | float | bool) else value
+                    for value in row_data
+                ]
+            )
+
+        workbook.save(output)
+        output.seek(0)
+        save_content_from_file(exported_asset, output)
+
+
 def get_limit_param_key(path: str) -> str:
     query = QueryDict(path)
     breakdown = query.get("breakdown", None)
@@ -390,11 +540,17 @@ def export_tabular(exported_asset: ExportedAsset, limit: Optional[int] = None) -
     try:
         if exported_asset.export_format == ExportedAsset.ExportFormat.CSV:
             with EXPORT_TIMER.labels(type="csv").time():
-                _export_to_csv(exported_asset, limit)
+                if settings.CSV_EXPORT_STREAMING_ENABLED:
+                    _export_to_csv_streaming(exported_asset, limit)
+                else:
+                    _export_to_csv(exported_asset, limit)
             EXPORT_SUCCEEDED_COUNTER.labels(type="csv").inc()
         elif exported_asset.export_format == ExportedAsset.ExportFormat.XLSX:
             with EXPORT_TIMER.labels(type="xlsx").time():
-                _export_to_excel(exported_asset, limit)
+                if settings.CSV_EXPORT_STREAMING_ENABLED:
+                    _export_to_excel_streaming(exported_asset, limit)
+                else:
+                    _export_to_excel(exported_asset, limit)
             EXPORT_SUCCEEDED_COUNTER.labels(type="xlsx").inc()
         else:
             EXPORT_ASSET_UNKNOWN_COUNTER.labels(type="csv").inc()
@@ -28,28 +28,7 @@ class OrderedCsvRenderer(
 
         # Get the set of all unique headers, and sort them.
         unique_fields = list(unique_everseen(itertools.chain(*(item.keys() for item in data))))
-
-        ordered_fields: dict[str, Any] = OrderedDict()
-        for item in unique_fields:
-            field = item.split(".")
-            field = field[0]
-            if field in ordered_fields:
-                ordered_fields[field].append(item)
-            else:
-                ordered_fields[field] = [item]
-
-        flat_ordered_fields = list(itertools.chain(*ordered_fields.values()))
-        if not header:
-            field_headers = flat_ordered_fields
-        else:
-            field_headers = header
-            for single_header in field_headers:
-                if single_header in flat_ordered_fields or single_header not in ordered_fields:
-                    continue
-
-                pos_single_header = field_headers.index(single_header)
-                field_headers.remove(single_header)
-                field_headers[pos_single_header:pos_single_header] = ordered_fields[single_header]
+        field_headers = order_fields(unique_fields, header)
 
         # Return your "table", with the headers as the first row.
         if labels:
@@ -63,6 +42,36 @@ class OrderedCsvRenderer(
             yield [item.get(key, None) for key in field_headers]
 
 
+def order_fields(unique_fields: list[str], header: Any = None) -> list[str]:
+    """
+    Group flattened fields (e.g. `properties.$browser`) under their top level key, keeping first-seen order.
+    If a header is given, any top level key in it is expanded in place into its flattened fields.
+    """
+    ordered_fields: dict[str, Any] = OrderedDict()
+    for item in unique_fields:
+        field = item.split(".")
+        field = field[0]
+        if field in ordered_fields:
+            ordered_fields[field].append(item)
+        else:
+            ordered_fields[field] = [item]
+
+    flat_ordered_fields = list(itertools.chain(*ordered_fields.values()))
+    if not header:
+        return flat_ordered_fields
+
+    field_headers = header
+    for single_header in field_headers:
+        if single_header in flat_ordered_fields or single_header not in ordered_fields:
+            continue
+
+        pos_single_header = field_headers.index(single_header)
+        field_headers.remove(single_header)
+        field_headers[pos_single_header:pos_single_header] = ordered_fields[single_header]
+
+    return field_headers
+
+
 def extract_expression_comment(header: str) -> str:
     if "--" in header:
         return header.split("--")[-1].strip() or header
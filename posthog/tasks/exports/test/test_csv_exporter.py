@@ -290,6 +290,60 @@ class TestCSVExporter(APIBaseTest):
                 ("2", "Safari", "event_name", None),
             ]
 
+    def test_csv_exporter_streaming_writes_to_asset_when_object_storage_is_disabled(self) -> None:
+        exported_asset = self._create_asset()
+        with self.settings(OBJECT_STORAGE_ENABLED=False, CSV_EXPORT_STREAMING_ENABLED=True):
+            csv_exporter.export_tabular(exported_asset)
+
+            assert (
+                exported_asset.content
+                == b"id,distinct_id,properties.$browser,event,timestamp,person,elements_chain\r\ne9ca132e-400f-4854-a83c-16c151b2f145,2,Safari,event_name,2022-07-06T19:37:43.095295+00:00,,\r\n1624228e-a4f1-48cd-aabc-6baa3ddb22e4,2,Safari,event_name,2022-07-06T19:37:43.095279+00:00,,\r\n66d45914-bdf5-4980-a54a-7dc699bdcce9,2,Safari,event_name,2022-07-06T19:37:43.095262+00:00,,\r\n"
+            )
+            assert exported_asset.content_location is None
+
+    @patch("posthog.models.exported_asset.UUIDT")
+    def test_csv_exporter_streaming_writes_to_object_storage(self, mocked_uuidt) -> None:
+        exported_asset = self._create_asset({"columns": ["distinct_id", "properties"]})
+        mocked_uuidt.return_value = "a-guid"
+
+        with self.settings(
+            OBJECT_STORAGE_ENABLED=True, OBJECT_STORAGE_EXPORTS_FOLDER="Test-Exports", CSV_EXPORT_STREAMING_ENABLED=True
+        ):
+            csv_exporter.export_tabular(exported_asset)
+
+            assert (
+                exported_asset.content_location
+                == f"{TEST_PREFIX}/csv/team-{self.team.id}/task-{exported_asset.id}/a-guid"
+            )
+            content = object_storage.read(exported_asset.content_location)
+            assert content == "distinct_id,properties.$browser\r\n2,Safari\r\n2,Safari\r\n2,Safari\r\n"
+            assert exported_asset.content is None
+
+    @patch("posthog.models.exported_asset.UUIDT")
+    @patch("posthog.models.exported_asset.object_storage.write_stream")
+    def test_csv_exporter_streaming_excel(self, mocked_object_storage_write_stream: Any, mocked_uuidt: Any) -> None:
+        exported_asset = self._create_asset({"columns": ["distinct_id", "properties.$browser", "event", "tomato"]})
+        exported_asset.export_format = ExportedAsset.ExportFormat.XLSX
+        mocked_uuidt.return_value = "a-guid"
+        mocked_object_storage_write_stream.side_effect = ObjectStorageError("mock write failed")
+
+        with self.settings(
+            OBJECT_STORAGE_ENABLED=True, OBJECT_STORAGE_EXPORTS_FOLDER="Test-Exports", CSV_EXPORT_STREAMING_ENABLED=True
+        ):
+            csv_exporter.export_tabular(exported_asset)
+
+            assert exported_asset.content_location is None
+
+            wb = load_workbook(filename=BytesIO(exported_asset.content))
+            ws = wb.active
+            data = list(ws.iter_rows(values_only=True))
+            assert data == [
+                ("distinct_id", "properties.$browser", "event", "tomato"),
+                ("2", "Safari", "event_name", None),
+                ("2", "Safari", "event_name", None),
+                ("2", "Safari", "event_name", None),
+            ]
+
     @patch("posthog.models.exported_asset.UUIDT")
     @patch("posthog.models.exported_asset.object_storage.write")
     @patch("requests.request")
@@ -459,6 +513,50 @@ class TestCSVExporter(APIBaseTest):
             self.assertEqual(first_row[2], "$pageview")
             self.assertEqual(first_row[5], str(self.team.pk))
 
+    @patch("posthog.tasks.exports.csv_exporter.CSV_EXPORT_STREAMING_PAGE_SIZE", 4)
+    @patch("posthog.tasks.exports.csv_exporter.process_query_dict", wraps=csv_exporter.process_query_dict)
+    @patch("posthog.models.exported_asset.UUIDT")
+    def test_csv_exporter_streaming_events_query_is_paginated(
+        self, mocked_uuidt: Any, mocked_process_query_dict: Any
+    ) -> None:
+        random_uuid = f"RANDOM_TEST_ID::{UUIDT()}"
+        for i in range(10):
+            _create_event(
+                event="$pageview",
+                distinct_id=random_uuid,
+                team=self.team,
+                timestamp=now() - relativedelta(hours=1, minutes=i),
+                properties={"prop": i},
+            )
+        flush_persons_and_events()
+
+        exported_asset = ExportedAsset(
+            team=self.team,
+            export_format=ExportedAsset.ExportFormat.CSV,
+            export_context={
+                "source": {
+                    "kind": "EventsQuery",
+                    "select": ["event", "properties.prop"],
+                    "where": [f"distinct_id = '{random_uuid}'"],
+                    "orderBy": ["timestamp DESC"],
+                }
+            },
+        )
+        exported_asset.save()
+        mocked_uuidt.return_value = "a-guid"
+
+        with self.settings(
+            OBJECT_STORAGE_ENABLED=True, OBJECT_STORAGE_EXPORTS_FOLDER="Test-Exports", CSV_EXPORT_STREAMING_ENABLED=True
+        ):
+            csv_exporter.export_tabular(exported_asset)
+            content = object_storage.read(exported_asset.content_location)
+            lines = (content or "").split("\r\n")
+            self.assertEqual(lines[0], "event,properties.prop")
+            self.assertEqual(lines[1:-1], [f"$pageview,{i}" for i in range(10)])
+            self.assertEqual(
+                [call.kwargs["query_json"]["offset"] for call in mocked_process_query_dict.call_args_list], [0, 4, 8]
+            )
+
     @patch("posthog.hogql.constants.CSV_EXPORT_LIMIT", 10)
     @patch("posthog.models.exported_asset.UUIDT")
     def test_csv_exporter_events_query_with_columns(self, mocked_uuidt: Any, CSV_EXPORT_LIMIT: int = 10) -> None:
@@ -38,13 +38,16 @@ from posthog.session_recordings.queries.test.session_replay_sql import (
 )
 from posthog.tasks.usage_report import (
     OrgReport,
+    UsageReportCheckpoint,
     _add_team_report_to_org_reports,
     _get_all_org_reports,
     _get_all_usage_data_as_team_rows,
+    _get_all_usage_data_as_team_rows_checkpointed,
     _get_full_org_usage_report,
     _get_full_org_usage_report_as_dict,
     _get_team_report,
     _get_teams_for_usage_reports,
+    _iter_org_reports,
     capture_event,
     get_instance_metadata,
     send_all_org_usage_reports,
@@ -2377,6 +2380,107 @@ class SendUsageTest(LicensedTestMixin, ClickhouseDestroyTablesMixin, APIBaseTest
     #             send_all_org_usage_reports(dry_run=False)
     #     assert mock_capture_exception.call_count == 1
 
+    @freeze_time("2021-10-10T23:01:00Z")
+    def test_iter_org_reports_matches_all_org_reports(self) -> None:
+        other_organization = Organization.objects.create(name="other org")
+        Team.objects.create(organization=other_organization)
+        period_start, period_end = get_previous_day()
+
+        all_reports = _get_all_org_reports(period_start, period_end)
+        all_data = _get_all_usage_data_as_team_rows(period_start, period_end)
+        streamed_reports = {report.organization_id: report for report in _iter_org_reports(all_data, period_start)}
+
+        assert streamed_reports == all_reports
+        assert streamed_reports[str(self.organization.id)].team_count == 2
+
+    @freeze_time("2021-10-10T23:01:00Z")
+    @patch("posthog.tasks.usage_report.get_all_event_table_metrics_in_period_single_scan")
+    def test_checkpointed_usage_data_resumes_from_completed_queries(self, mock_single_scan: MagicMock) -> None:
+        period_start, period_end = get_previous_day()
+        mock_single_scan.return_value = {"teams_with_event_count_in_period": [(self.team.id, 3)]}
+        checkpoint = UsageReportCheckpoint(period_start)
+
+        all_data = _get_all_usage_data_as_team_rows_checkpointed(period_start, period_end, checkpoint)
+        resumed_data = _get_all_usage_data_as_team_rows_checkpointed(period_start, period_end, checkpoint)
+
+        assert mock_single_scan.call_count == 1
+        assert all_data["teams_with_event_count_in_period"] == {self.team.id: 3}
+        assert resumed_data == all_data
+
+        checkpoint.clear()
+        assert checkpoint.get_query_results("event_table_metrics") is None
+
+    @freeze_time("2021-10-10T23:01:00Z")
+    @patch("posthog.tasks.usage_report.get_ph_client")
+    @patch("ee.sqs.SQSProducer.get_sqs_producer")
+    def test_send_usage_with_checkpoints_skips_orgs_already_sent(
+        self, mock_get_sqs_producer: MagicMock, mock_client: MagicMock
+    ) -> None:
+        mock_client.return_value = MagicMock()
+        mock_producer = MagicMock()
+        mock_get_sqs_producer.return_value = mock_producer
+        period_start, _ = get_previous_day()
+
+        checkpoint = UsageReportCheckpoint(period_start)
+        checkpoint.mark_org_sent(str(self.organization.id))
+
+        with self.settings(USAGE_REPORT_CHECKPOINTS_ENABLED=True):
+            send_all_org_usage_reports(dry_run=False)
+
+        mock_producer.send_message.assert_not_called()
+        # A completed run clears its checkpoint
+        assert not checkpoint.is_org_sent(str(self.organization.id))
+
+    @freeze_time("2021-10-10T23:01:00Z")
+    @patch("posthog.tasks.usage_report._queue_report")
+    @patch("posthog.tasks.usage_report.get_ph_client")
+    @patch("ee.sqs.SQSProducer.get_sqs_producer")
+    def test_send_usage_with_checkpoints_doesnt_mark_orgs_that_failed_to_queue(
+        self, mock_get_sqs_producer: MagicMock, mock_client: MagicMock, mock_queue_report: MagicMock
+    ) -> None:
+        mock_client.return_value = MagicMock()
+        mock_get_sqs_producer.return_value = MagicMock()
+        mock_queue_report.side_effect = Exception("SQS is down")
+        period_start, _ = get_previous_day()
+        checkpoint = UsageReportCheckpoint(period_start)
+
+        with self.settings(USAGE_REPORT_CHECKPOINTS_ENABLED=True):
+            send_all_org_usage_reports(dry_run=False)
+
+        assert mock_queue_report.call_count > 0
+        for organization_id in (call.args[1] for call in mock_queue_report.call_args_list):
+            assert not checkpoint.is_org_sent(organization_id)
+
+        # The rerun queues the reports that failed
+        mock_queue_report.reset_mock(side_effect=True)
+        with self.settings(USAGE_REPORT_CHECKPOINTS_ENABLED=True):
+            send_all_org_usage_reports(dry_run=False)
+
+        assert mock_queue_report.call_count > 0
+        checkpoint.clear()
+
+    @freeze_time("2021-10-10T23:01:00Z")
+    @patch("posthog.tasks.usage_report._get_full_org_usage_report")
+    @patch("posthog.tasks.usage_report.get_ph_client")
+    @patch("ee.sqs.SQSProducer.get_sqs_producer")
+    def test_send_usage_with_checkpoints_keeps_the_checkpoint_when_an_org_fails(
+        self, mock_get_sqs_producer: MagicMock, mock_client: MagicMock, mock_get_full_org_usage_report: MagicMock
+    ) -> None:
+        mock_client.return_value = MagicMock()
+        mock_get_sqs_producer.return_value = MagicMock()
+        mock_get_full_org_usage_report.side_effect = Exception("Report failed")
+        period_start, _ = get_previous_day()
+        checkpoint = UsageReportCheckpoint(period_start)
+        checkpoint.mark_org_sent("already-sent-org")
+
+        with self.settings(USAGE_REPORT_CHECKPOINTS_ENABLED=True):
+            send_all_org_usage_reports(dry_run=False)
+
+        assert mock_get_full_org_usage_report.call_count > 0
+        # The run didn't complete, so orgs sent before the failure are still skipped on the rerun
+        assert checkpoint.is_org_sent("already-sent-org")
+        checkpoint.clear()
+
     @patch("posthog.tasks.usage_report.get_ph_client")
     def test_capture_event_called_with_string_timestamp(self, mock_client: MagicMock) -> None:
         organization = Organization.objects.create()
@@ -2705,3 +2809,34 @@ class TestQuerySplitting(ClickhouseTestMixin, TestCase):
         self.assertEqual(len(all_data["teams_with_event_count_in_period"]), 1)
         self.assertEqual(next(iter(all_data["teams_with_event_count_in_period"].keys())), self.team.id)
         self.assertEqual(all_data["teams_with_event_count_in_period"][self.team.id], 20)
+
+    def test_single_scan_event_metrics_match_individual_queries(self) -> None:
+        from posthog.tasks.usage_report import (
+            get_all_event_table_metrics_in_period_single_scan,
+            get_teams_with_billable_enhanced_persons_event_count_in_period,
+            get_teams_with_billable_event_count_in_period,
+        )
+
+        result = get_all_event_table_metrics_in_period_single_scan(self.begin, self.end)
+
+        self.assertEqual(
+            result["teams_with_event_count_in_period"],
+            get_teams_with_billable_event_count_in_period(self.begin, self.end, count_distinct=True),
+        )
+        self.assertEqual(
+            result["teams_with_enhanced_persons_event_count_in_period"],
+            get_teams_with_billable_enhanced_persons_event_count_in_period(self.begin, self.end, count_distinct=True),
+        )
+        self.assertEqual(result["teams_with_web_events_count_in_period"], [(self.team.id, 5)])
+        # Teams without matching events are left out, like in the individual queries
+        self.assertEqual(result["teams_with_exceptions_captured_in_period"], [])
+
+    def test_consolidated_usage_data_matches_default_collection(self) -> None:
+        period_start, period_end = get_previous_day(at=self.end)
+
+        default_data = _get_all_usage_data_as_team_rows(period_start, period_end)
+        with self.settings(USAGE_REPORT_CONSOLIDATED_QUERIES=True, USAGE_REPORT_QUERY_CONCURRENCY=2):
+            consolidated_data = _get_all_usage_data_as_team_rows(period_start, period_end)
+
+        self.assertEqual(consolidated_data, default_data)
+        self.assertIn(self.team.id, consolidated_data["teams_with_event_count_in_period"])
@@ -1,10 +1,13 @@
 import dataclasses
+import functools
 import os
 import json
 import base64
 import gzip
+import time
 from collections import Counter
-from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from typing import Any, Literal, Optional, TypedDict, Union
 from collections.abc import Callable
@@ -17,7 +20,7 @@ from celery import shared_task
 from dateutil import parser
 from django.conf import settings
 from django.db import connection
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, Q, QuerySet, Sum
 from posthoganalytics.client import Client as PostHogClient
 from psycopg import sql
 from retry import retry
@@ -39,6 +42,7 @@ from posthog.models.plugin import PluginConfig
 from posthog.models.property.util import get_property_string_expr
 from posthog.models.team.team import Team
 from posthog.models.utils import namedtuplefetchall
+from posthog.redis import get_client
 from posthog.settings import CLICKHOUSE_CLUSTER, INSTANCE_TAG
 from posthog.tasks.report_utils import capture_event
 from posthog.tasks.utils import CeleryQueue
@@ -77,6 +81,9 @@ QUERY_RETRIES = 3
 QUERY_RETRY_DELAY = 1
 QUERY_RETRY_BACKOFF = 2
 
+USAGE_REPORT_CHECKPOINT_TTL_SECONDS = 60 * 60 * 48  # 2 days
+USAGE_REPORT_TEAMS_CHUNK_SIZE = 2000
+
 USAGE_REPORT_TASK_KWARGS = {
     "queue": CeleryQueue.USAGE_REPORTS.value,
     "ignore_result": True,
@@ -526,6 +533,34 @@ def get_teams_with_event_count_with_groups_in_period(begin: datetime, end: datet
     return result
 
 
+def _get_event_metric_expression(lib_expression: str) -> str:
+    """
+    Classifies each event into one of the per-source event metrics (or 'other'). Shared between the
+    per-metric query and the single-scan query so that both attribute events in the same way.
+    """
+    return f"""multiIf(
+            event LIKE 'helicone%%', 'helicone_events',
+            event LIKE 'langfuse%%', 'langfuse_events',
+            event LIKE 'keywords_ai%%', 'keywords_ai_events',
+            event LIKE 'traceloop%%', 'traceloop_events',
+            {lib_expression} = 'web', 'web_events',
+            {lib_expression} = 'js', 'web_lite_events',
+            {lib_expression} = 'posthog-node', 'node_events',
+            {lib_expression} = 'posthog-android', 'android_events',
+            {lib_expression} = 'posthog-flutter', 'flutter_events',
+            {lib_expression} = 'posthog-ios', 'ios_events',
+            {lib_expression} = 'posthog-go', 'go_events',
+            {lib_expression} = 'posthog-java', 'java_events',
+            {lib_expression} = 'posthog-react-native', 'react_native_events',
+            {lib_expression} = 'posthog-ruby', 'ruby_events',
+            {lib_expression} = 'posthog-python', 'python_events',
+            {lib_expression} = 'posthog-php', 'php_events',
+            {lib_expression} = 'posthog-dotnet', 'dotnet_events',
+            {lib_expression} = 'posthog-elixir', 'elixir_events',
+            'other'
+        )"""
+
+
 @timed_log()
 @retry(tries=QUERY_RETRIES, delay=QUERY_RETRY_DELAY, backoff=QUERY_RETRY_BACKOFF)
 def get_all_event_metrics_in_period(begin: datetime, end: datetime) -> dict[str, list[tuple[int, int]]]:
@@ -535,27 +570,7 @@ def get_all_event_metrics_in_period(begin: datetime, end: datetime) -> dict[str,
     query_template = f"""
         SELECT
             team_id,
-            multiIf(
-                event LIKE 'helicone%%', 'helicone_events',
-                event LIKE 'langfuse%%', 'langfuse_events',
-                event LIKE 'keywords_ai%%', 'keywords_ai_events',
-                event LIKE 'traceloop%%', 'traceloop_events',
-                {lib_expression} = 'web', 'web_events',
-                {lib_expression} = 'js', 'web_lite_events',
-                {lib_expression} = 'posthog-node', 'node_events',
-                {lib_expression} = 'posthog-android', 'android_events',
-                {lib_expression} = 'posthog-flutter', 'flutter_events',
-                {lib_expression} = 'posthog-ios', 'ios_events',
-                {lib_expression} = 'posthog-go', 'go_events',
-                {lib_expression} = 'posthog-java', 'java_events',
-                {lib_expression} = 'posthog-react-native', 'react_native_events',
-                {lib_expression} = 'posthog-ruby', 'ruby_events',
-                {lib_expression} = 'posthog-python', 'python_events',
-                {lib_expression} = 'posthog-php', 'php_events',
-                {lib_expression} = 'posthog-dotnet', 'dotnet_events',
-                {lib_expression} = 'posthog-elixir', 'elixir_events',
-                'other'
-            ) AS metric,
+            {_get_event_metric_expression(lib_expression)} AS metric,
             count(1) as count
         FROM events
         WHERE timestamp >= %(begin)s AND timestamp < %(end)s
@@ -613,6 +628,89 @@ def get_all_event_metrics_in_period(begin: datetime, end: datetime) -> dict[str,
     )
 
 
+# Maps the metric names produced by _get_event_metric_expression to their keys in the usage data
+EVENT_METRIC_USAGE_DATA_KEYS: dict[str, str] = {
+    "helicone_events": "teams_with_event_count_from_helicone_in_period",
+    "langfuse_events": "teams_with_event_count_from_langfuse_in_period",
+    "keywords_ai_events": "teams_with_event_count_from_keywords_ai_in_period",
+    "traceloop_events": "teams_with_event_count_from_traceloop_in_period",
+    "web_events": "teams_with_web_events_count_in_period",
+    "web_lite_events": "teams_with_web_lite_events_count_in_period",
+    "node_events": "teams_with_node_events_count_in_period",
+    "android_events": "teams_with_android_events_count_in_period",
+    "flutter_events": "teams_with_flutter_events_count_in_period",
+    "ios_events": "teams_with_ios_events_count_in_period",
+    "go_events": "teams_with_go_events_count_in_period",
+    "java_events": "teams_with_java_events_count_in_period",
+    "react_native_events": "teams_with_react_native_events_count_in_period",
+    "ruby_events": "teams_with_ruby_events_count_in_period",
+    "python_events": "teams_with_python_events_count_in_period",
+    "php_events": "teams_with_php_events_count_in_period",
+    "dotnet_events": "teams_with_dotnet_events_count_in_period",
+    "elixir_events": "teams_with_elixir_events_count_in_period",
+}
+
+
+@timed_log()
+@retry(tries=QUERY_RETRIES, delay=QUERY_RETRY_DELAY, backoff=QUERY_RETRY_BACKOFF)
+def get_all_event_table_metrics_in_period_single_scan(
+    begin: datetime, end: datetime
+) -> dict[str, list[tuple[int, int]]]:
+    """
+    Computes every events-table metric of the usage report with one scan per time split, using conditional
+    aggregates grouped by team. Returns the same (team_id, count) rows, keyed like _get_all_usage_data,
+    as the individual get_teams_with_* queries it replaces.
+    """
+    lib_expression, _ = get_property_string_expr("events", "$lib", "'$lib'", "properties")
+
+    billable_condition = (
+        "event NOT IN ('$feature_flag_called', 'survey sent', 'survey shown', 'survey dismissed', '$exception')"
+    )
+    # Same de-duplication expression as get_teams_with_billable_event_count_in_period with count_distinct=True
+    distinct_expression = "toDate(timestamp), event, cityHash64(distinct_id), cityHash64(uuid)"
+
+    aggregates: dict[str, str] = {
+        "teams_with_event_count_in_period": f"uniqExactIf({distinct_expression}, {billable_condition})",
+        "teams_with_enhanced_persons_event_count_in_period": f"uniqExactIf({distinct_expression}, {billable_condition} AND person_mode IN ('full', 'force_upgrade'))",
+        "teams_with_event_count_with_groups_in_period": "countIf($group_0 != '' OR $group_1 != '' OR $group_2 != '' OR $group_3 != '' OR $group_4 != '')",
+        "teams_with_exceptions_captured_in_period": "countIf(event = '$exception')",
+        "teams_with_ai_event_count_in_period": "countIf(event LIKE '$ai_%%')",
+        **{key: f"countIf(metric = '{metric}')" for metric, key in EVENT_METRIC_USAGE_DATA_KEYS.items()},
+    }
+    select_expressions = ",\n            ".join(aggregates.values())
+
+    query_template = f"""
+        WITH {_get_event_metric_expression(lib_expression)} AS metric
+        SELECT
+            team_id,
+            {select_expressions}
+        FROM events
+        WHERE timestamp >= %(begin)s AND timestamp < %(end)s
+        GROUP BY team_id
+    """
+
+    def combine_single_scan_results(results_list: list) -> dict[str, list[tuple[int, int]]]:
+        metrics: dict[str, dict[int, int]] = {key: {} for key in aggregates}
+
+        for results in results_list:
+            for team_id, *counts in results:
+                for key, count in zip(aggregates, counts):
+                    # The individual queries only return teams that have a non-zero count
+                    if count:
+                        metrics[key][team_id] = metrics[key].get(team_id, 0) + count
+
+        return {key: list(team_counts.items()) for key, team_counts in metrics.items()}
+
+    return _execute_split_query(
+        begin=begin,
+        end=end,
+        query_template=query_template,
+        params={},
+        num_splits=3,
+        combine_results_func=combine_single_scan_results,
+    )
+
+
 @timed_log()
 @retry(tries=QUERY_RETRIES, delay=QUERY_RETRY_DELAY, backoff=QUERY_RETRY_BACKOFF)
 def get_teams_with_recording_count_in_period(
@@ -1114,11 +1212,74 @@ def convert_team_usage_rows_to_dict(rows: list[Union[dict, tuple[int, int]]]) ->
     return team_id_map
 
 
+def _get_postgres_usage_queries(period_start: datetime, period_end: datetime) -> dict[str, Callable[[], Any]]:
+    """
+    Usage data that comes from Postgres rather than ClickHouse. These are kept apart so the consolidated
+    collector can run them on the calling thread, as Django connections are per-thread.
+    """
+    return {
+        "teams_with_group_types_total": lambda: list(
+            GroupTypeMapping.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_dashboard_count": lambda: list(
+            Dashboard.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_dashboard_template_count": lambda: list(
+            Dashboard.objects.filter(creation_mode="template")
+            .values("team_id")
+            .annotate(total=Count("id"))
+            .order_by("team_id")
+        ),
+        "teams_with_dashboard_shared_count": lambda: list(
+            Dashboard.objects.filter(sharingconfiguration__enabled=True)
+            .values("team_id")
+            .annotate(total=Count("id"))
+            .order_by("team_id")
+        ),
+        "teams_with_dashboard_tagged_count": lambda: list(
+            Dashboard.objects.filter(tagged_items__isnull=False)
+            .values("team_id")
+            .annotate(total=Count("id"))
+            .order_by("team_id")
+        ),
+        "teams_with_ff_count": lambda: list(
+            FeatureFlag.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_ff_active_count": lambda: list(
+            FeatureFlag.objects.filter(active=True).values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_issues_created_total": lambda: list(
+            ErrorTrackingIssue.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_symbol_sets_count": lambda: list(
+            ErrorTrackingSymbolSet.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
+        ),
+        "teams_with_resolved_symbol_sets_count": lambda: list(
+            ErrorTrackingSymbolSet.objects.filter(storage_ptr__isnull=False)
+            .values("team_id")
+            .annotate(total=Count("id"))
+            .order_by("team_id")
+        ),
+        "teams_with_rows_synced_in_period": functools.partial(
+            get_teams_with_rows_synced_in_period, period_start, period_end
+        ),
+        "teams_with_active_external_data_schemas_in_period": get_teams_with_active_external_data_schemas_in_period,
+        "teams_with_active_batch_exports_in_period": get_teams_with_active_batch_exports_in_period,
+        "teams_with_dwh_tables_storage_in_s3_in_mib": get_teams_with_dwh_tables_storage_in_s3,
+        "teams_with_dwh_mat_views_storage_in_s3_in_mib": get_teams_with_dwh_mat_views_storage_in_s3,
+        "teams_with_dwh_total_storage_in_s3_in_mib": get_teams_with_dwh_total_storage_in_s3,
+        "teams_with_active_hog_destinations_in_period": get_teams_with_active_hog_destinations_in_period,
+        "teams_with_active_hog_transformations_in_period": get_teams_with_active_hog_transformations_in_period,
+    }
+
+
 def _get_all_usage_data(period_start: datetime, period_end: datetime) -> dict[str, Any]:
     """
     Gets all usage data for the specified period. Clickhouse is good at counting things so
     we count across all teams rather than doing it one by one
     """
+    if settings.USAGE_REPORT_CONSOLIDATED_QUERIES:
+        return _get_all_usage_data_consolidated(period_start, period_end)
 
     all_metrics = get_all_event_metrics_in_period(period_start, period_end)
     api_queries_usage = get_teams_with_api_queries_metrics(period_start, period_end)
@@ -1172,48 +1333,6 @@ def _get_all_usage_data(period_start: datetime, period_end: datetime) -> dict[st
         "teams_with_local_evaluation_requests_count_in_period": get_teams_with_feature_flag_requests_count_in_period(
             period_start, period_end, FlagRequestType.LOCAL_EVALUATION
         ),
-        "teams_with_group_types_total": list(
-            GroupTypeMapping.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_dashboard_count": list(
-            Dashboard.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_dashboard_template_count": list(
-            Dashboard.objects.filter(creation_mode="template")
-            .values("team_id")
-            .annotate(total=Count("id"))
-            .order_by("team_id")
-        ),
-        "teams_with_dashboard_shared_count": list(
-            Dashboard.objects.filter(sharingconfiguration__enabled=True)
-            .values("team_id")
-            .annotate(total=Count("id"))
-            .order_by("team_id")
-        ),
-        "teams_with_dashboard_tagged_count": list(
-            Dashboard.objects.filter(tagged_items__isnull=False)
-            .values("team_id")
-            .annotate(total=Count("id"))
-            .order_by("team_id")
-        ),
-        "teams_with_ff_count": list(
-            FeatureFlag.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_ff_active_count": list(
-            FeatureFlag.objects.filter(active=True).values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_issues_created_total": list(
-            ErrorTrackingIssue.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_symbol_sets_count": list(
-            ErrorTrackingSymbolSet.objects.values("team_id").annotate(total=Count("id")).order_by("team_id")
-        ),
-        "teams_with_resolved_symbol_sets_count": list(
-            ErrorTrackingSymbolSet.objects.filter(storage_ptr__isnull=False)
-            .values("team_id")
-            .annotate(total=Count("id"))
-            .order_by("team_id")
-        ),
         "teams_with_query_app_bytes_read": get_teams_with_query_metric(
             period_start,
             period_end,
@@ -1297,12 +1416,6 @@ def _get_all_usage_data(period_start: datetime, period_end: datetime) -> dict[st
         "teams_with_survey_responses_count_in_period": get_teams_with_survey_responses_count_in_period(
             period_start, period_end
         ),
-        "teams_with_rows_synced_in_period": get_teams_with_rows_synced_in_period(period_start, period_end),
-        "teams_with_active_external_data_schemas_in_period": get_teams_with_active_external_data_schemas_in_period(),
-        "teams_with_active_batch_exports_in_period": get_teams_with_active_batch_exports_in_period(),
-        "teams_with_dwh_tables_storage_in_s3_in_mib": get_teams_with_dwh_tables_storage_in_s3(),
-        "teams_with_dwh_mat_views_storage_in_s3_in_mib": get_teams_with_dwh_mat_views_storage_in_s3(),
-        "teams_with_dwh_total_storage_in_s3_in_mib": get_teams_with_dwh_total_storage_in_s3(),
         "teams_with_exceptions_captured_in_period": get_teams_with_exceptions_captured_in_period(
             period_start, period_end
         ),
@@ -1313,11 +1426,141 @@ def _get_all_usage_data(period_start: datetime, period_end: datetime) -> dict[st
             period_start, period_end
         ),
         "teams_with_ai_event_count_in_period": get_teams_with_ai_event_count_in_period(period_start, period_end),
-        "teams_with_active_hog_destinations_in_period": get_teams_with_active_hog_destinations_in_period(),
-        "teams_with_active_hog_transformations_in_period": get_teams_with_active_hog_transformations_in_period(),
+        **{key: query() for key, query in _get_postgres_usage_queries(period_start, period_end).items()},
+    }
+
+
+def _run_timed_usage_queries(
+    queries: dict[str, Callable[[], Any]], max_workers: int = 1
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """
+    Runs the given usage queries, concurrently when max_workers > 1, and returns their results along with
+    how long each one took in milliseconds.
+    """
+    timings: dict[str, float] = {}
+
+    def run_query(name: str, query: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return query()
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    if max_workers <= 1:
+        return {name: run_query(name, query) for name, query in queries.items()}, timings
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(run_query, name, query) for name, query in queries.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    return results, timings
+
+
+def _get_clickhouse_query_metric_usage_queries(
+    period_start: datetime, period_end: datetime
+) -> dict[str, Callable[[], Any]]:
+    queries: dict[str, Callable[[], Any]] = {}
+    for prefix, query_types in (("query", None), ("event_explorer", ["EventsQuery"])):
+        for access, access_method in (("app", ""), ("api", "personal_api_key")):
+            for suffix, metric in (
+                ("bytes_read", "read_bytes"),
+                ("rows_read", "read_rows"),
+                ("duration_ms", "query_duration_ms"),
+            ):
+                queries[f"teams_with_{prefix}_{access}_{suffix}"] = functools.partial(
+                    get_teams_with_query_metric,
+                    period_start,
+                    period_end,
+                    metric=metric,
+                    query_types=query_types,
+                    access_method=access_method,
+                )
+    return queries
+
+
+def _get_clickhouse_usage_queries(period_start: datetime, period_end: datetime) -> dict[str, Callable[[], Any]]:
+    """
+    ClickHouse usage queries used by the consolidated and checkpointed collectors. The "event_table_metrics" and
+    "api_queries_usage" entries return several metrics at once, see _expand_usage_query_results.
+    """
+    return {
+        "event_table_metrics": functools.partial(
+            get_all_event_table_metrics_in_period_single_scan, period_start, period_end
+        ),
+        "api_queries_usage": functools.partial(get_teams_with_api_queries_metrics, period_start, period_end),
+        "teams_with_recording_count_in_period": functools.partial(
+            get_teams_with_recording_count_in_period, period_start, period_end, snapshot_source="web"
+        ),
+        "teams_with_recording_bytes_in_period": functools.partial(
+            get_teams_with_recording_bytes_in_period, period_start, period_end, snapshot_source="web"
+        ),
+        "teams_with_mobile_recording_count_in_period": functools.partial(
+            get_teams_with_recording_count_in_period, period_start, period_end, snapshot_source="mobile"
+        ),
+        "teams_with_mobile_recording_bytes_in_period": functools.partial(
+            get_teams_with_recording_bytes_in_period, period_start, period_end, snapshot_source="mobile"
+        ),
+        "teams_with_mobile_billable_recording_count_in_period": functools.partial(
+            get_teams_with_mobile_billable_recording_count_in_period, period_start, period_end
+        ),
+        "teams_with_decide_requests_count_in_period": functools.partial(
+            get_teams_with_feature_flag_requests_count_in_period, period_start, period_end, FlagRequestType.DECIDE
+        ),
+        "teams_with_local_evaluation_requests_count_in_period": functools.partial(
+            get_teams_with_feature_flag_requests_count_in_period,
+            period_start,
+            period_end,
+            FlagRequestType.LOCAL_EVALUATION,
+        ),
+        "teams_with_survey_responses_count_in_period": functools.partial(
+            get_teams_with_survey_responses_count_in_period, period_start, period_end
+        ),
+        "teams_with_hog_function_calls_in_period": functools.partial(
+            get_teams_with_hog_function_calls_in_period, period_start, period_end
+        ),
+        "teams_with_hog_function_fetch_calls_in_period": functools.partial(
+            get_teams_with_hog_function_fetch_calls_in_period, period_start, period_end
+        ),
+        **_get_clickhouse_query_metric_usage_queries(period_start, period_end),
     }
 
 
+def _expand_usage_query_results(results: dict[str, Any]) -> dict[str, Any]:
+    expanded = dict(results)
+    if "event_table_metrics" in expanded:
+        expanded.update(expanded.pop("event_table_metrics"))
+    if "api_queries_usage" in expanded:
+        api_queries_usage = expanded.pop("api_queries_usage")
+        expanded["teams_with_api_queries_count"] = api_queries_usage["count"]
+        expanded["teams_with_api_queries_read_bytes"] = api_queries_usage["read_bytes"]
+    return expanded
+
+
+def _log_usage_query_timings(clickhouse_timings: dict[str, float], postgres_timings: dict[str, float]) -> None:
+    logger.info(
+        "Usage report query timings",
+        timings_ms={**clickhouse_timings, **postgres_timings},
+        clickhouse_ms=sum(clickhouse_timings.values()),
+        postgres_ms=sum(postgres_timings.values()),
+    )
+
+
+def _get_all_usage_data_consolidated(period_start: datetime, period_end: datetime) -> dict[str, Any]:
+    """
+    Gets the same usage data as _get_all_usage_data, but computes all events-table metrics in a single
+    multi-aggregate scan and runs the remaining ClickHouse queries concurrently. Postgres queries stay
+    on the calling thread. Per-query timings are logged so slow metrics are easy to spot.
+    """
+    clickhouse_results, clickhouse_timings = _run_timed_usage_queries(
+        _get_clickhouse_usage_queries(period_start, period_end), max_workers=settings.USAGE_REPORT_QUERY_CONCURRENCY
+    )
+    postgres_results, postgres_timings = _run_timed_usage_queries(_get_postgres_usage_queries(period_start, period_end))
+
+    _log_usage_query_timings(clickhouse_timings, postgres_timings)
+
+    return _expand_usage_query_results({**clickhouse_results, **postgres_results})
+
+
 def _get_all_usage_data_as_team_rows(period_start: datetime, period_end: datetime) -> dict[str, Any]:
     """
     Gets all usage data for the specified period as a map of team_id -> value. This makes it faster
@@ -1330,14 +1573,105 @@ def _get_all_usage_data_as_team_rows(period_start: datetime, period_end: datetim
     return all_data
 
 
-def _get_teams_for_usage_reports() -> Sequence[Team]:
-    return list(
+class UsageReportCheckpoint:
+    """
+    Persists the results of each usage query, and the organizations whose reports were already sent, for one
+    report period in Redis. A retried run then resumes from the last completed query instead of recomputing
+    the whole day, and doesn't send the same organization twice.
+    """
+
+    def __init__(self, period_start: datetime, ttl: int = USAGE_REPORT_CHECKPOINT_TTL_SECONDS) -> None:
+        self.key_prefix = f"usage_report_checkpoint:{period_start.date().isoformat()}"
+        self.ttl = ttl
+        self.redis_client = get_client()
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.key_prefix}:{suffix}"
+
+    def get_query_results(self, name: str) -> Optional[dict[str, dict[int, Any]]]:
+        raw = self.redis_client.get(self._key(f"query:{name}"))
+        if raw is None:
+            return None
+        results = json.loads(gzip.decompress(raw))
+        # JSON turns the team id keys into strings, so the team rows are stored as pairs instead
+        return {key: {int(team_id): value for team_id, value in rows} for key, rows in results.items()}
+
+    def set_query_results(self, name: str, results: dict[str, dict[int, Any]]) -> None:
+        payload = {key: list(team_rows.items()) for key, team_rows in results.items()}
+        compressed = gzip.compress(json.dumps(payload, separators=(",", ":"), default=float).encode("utf-8"))
+        self.redis_client.set(self._key(f"query:{name}"), compressed, ex=self.ttl)
+
+    def is_org_sent(self, organization_id: str) -> bool:
+        return bool(self.redis_client.sismember(self._key("sent_orgs"), organization_id))
+
+    def mark_org_sent(self, organization_id: str) -> None:
+        self.redis_client.sadd(self._key("sent_orgs"), organization_id)
+        self.redis_client.expire(self._key("sent_orgs"), self.ttl)
+
+    def clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=self._key("*")))
+        if keys:
+            self.redis_client.delete(*keys)
+
+
+def _get_all_usage_data_as_team_rows_checkpointed(
+    period_start: datetime, period_end: datetime, checkpoint: UsageReportCheckpoint
+) -> dict[str, Any]:
+    """
+    Same as _get_all_usage_data_as_team_rows using the consolidated queries, but every query's results are
+    stored in the checkpoint as soon as it completes, and queries with stored results are not run again.
+    """
+
+    def checkpointed(name: str, query: Callable[[], Any]) -> Callable[[], dict[str, dict[int, Any]]]:
+        def run() -> dict[str, dict[int, Any]]:
+            results = checkpoint.get_query_results(name)
+            if results is None:
+                results = {
+                    key: convert_team_usage_rows_to_dict(rows)
+                    for key, rows in _expand_usage_query_results({name: query()}).items()
+                }
+                checkpoint.set_query_results(name, results)
+            return results
+
+        return run
+
+    clickhouse_results, clickhouse_timings = _run_timed_usage_queries(
+        {
+            name: checkpointed(name, query)
+            for name, query in _get_clickhouse_usage_queries(period_start, period_end).items()
+        },
+        max_workers=settings.USAGE_REPORT_QUERY_CONCURRENCY,
+    )
+    postgres_results, postgres_timings = _run_timed_usage_queries(
+        {
+            name: checkpointed(name, query)
+            for name, query in _get_postgres_usage_queries(period_start, period_end).items()
+        }
+    )
+    _log_usage_query_timings(clickhouse_timings, postgres_timings)
+
+    all_data: dict[str, Any] = {}
+    for results in (*clickhouse_results.values(), *postgres_results.values()):
+        all_data.update(results)
+    return all_data
+
+
+def _get_teams_for_usage_reports_queryset() -> QuerySet[Team]:
+    return (
         Team.objects.select_related("organization")
         .exclude(Q(organization__for_internal_metrics=True) | Q(is_demo=True))
         .only("id", "name", "organization__id", "organization__name", "organization__created_at")
     )
 
 
+def _get_teams_for_usage_reports() -> Sequence[Team]:
+    return list(_get_teams_for_usage_reports_queryset())
+
+
+def _get_org_count_for_usage_reports() -> int:
+    return _get_teams_for_usage_reports_queryset().values("organization_id").distinct().count()
+
+
 def _get_team_report(all_data: dict[str, Any], team: Team) -> UsageReportCounters:
     decide_requests_count_in_period = all_data["teams_with_decide_requests_count_in_period"].get(team.id, 0)
     local_evaluation_requests_count_in_period = all_data["teams_with_local_evaluation_requests_count_in_period"].get(
@@ -1484,6 +1818,29 @@ def _get_all_org_reports(period_start: datetime, period_end: datetime) -> dict[s
     return org_reports
 
 
+def _iter_org_reports(all_data: dict[str, Any], period_start: datetime) -> Iterator[OrgReport]:
+    """
+    Yields org reports one at a time instead of building all of them up front. Teams are read in chunks,
+    ordered by organization, so an org report is complete as soon as the next organization's team shows up.
+    """
+    org_reports: dict[str, OrgReport] = {}
+
+    teams = (
+        _get_teams_for_usage_reports_queryset()
+        .order_by("organization_id", "id")
+        .iterator(chunk_size=USAGE_REPORT_TEAMS_CHUNK_SIZE)
+    )
+    for team in teams:
+        if org_reports and str(team.organization_id) not in org_reports:
+            yield from org_reports.values()
+            org_reports.clear()
+
+        team_report = _get_team_report(all_data, team)
+        _add_team_report_to_org_reports(org_reports, team, team_report, period_start)
+
+    yield from org_reports.values()
+
+
 def _get_full_org_usage_report(org_report: OrgReport, instance_metadata: InstanceMetadata) -> FullUsageReport:
     return FullUsageReport(
         **dataclasses.asdict(org_report),
@@ -1548,13 +1905,23 @@ def send_all_org_usage_reports(
     logger.info("Querying usage report data")
     query_time_start = datetime.now()
 
-    org_reports = _get_all_org_reports(period_start, period_end)
+    # With checkpoints, query results survive a failed run and org reports are streamed rather than kept in memory
+    checkpoint = UsageReportCheckpoint(period_start) if settings.USAGE_REPORT_CHECKPOINTS_ENABLED else None
+    org_reports: Iterator[OrgReport]
+    if checkpoint:
+        all_data = _get_all_usage_data_as_team_rows_checkpointed(period_start, period_end, checkpoint)
+        total_orgs = _get_org_count_for_usage_reports()
+        org_reports = _iter_org_reports(all_data, period_start)
+    else:
+        all_org_reports = _get_all_org_reports(period_start, period_end)
+        total_orgs = len(all_org_reports)
+        org_reports = iter(all_org_reports.values())
 
     query_time_duration = (datetime.now() - query_time_start).total_seconds()
-    logger.info(f"Found {len(org_reports)} org reports. It took {query_time_duration} seconds.")
+    logger.info(f"Found {total_orgs} org reports. It took {query_time_duration} seconds.")
 
-    total_orgs = len(org_reports)
     total_orgs_sent = 0
+    total_orgs_failed = 0
 
     logger.info("Sending usage reports to billing")
     queue_time_start = datetime.now()
@@ -1569,10 +1936,14 @@ def send_all_org_usage_reports(
         groups={"instance": settings.SITE_URL},
     )
 
-    for org_report in org_reports.values():
+    for org_report in org_reports:
         try:
             organization_id = org_report.organization_id
 
+            if checkpoint and checkpoint.is_org_sent(organization_id):
+                logger.info(f"Report for organization {organization_id} was already sent, skipping")
+                continue
+
             full_report = _get_full_org_usage_report(org_report, instance_metadata)
             full_report_dict = _get_full_org_usage_report_as_dict(full_report)
 
@@ -1599,9 +1970,16 @@ def send_all_org_usage_reports(
                     total_orgs_sent += 1
                 except Exception as err:
                     logger.exception(f"Failed to queue report for organization {organization_id}", error=err)
+                    # Not marked as sent, so a rerun queues it again
+                    total_orgs_failed += 1
+                    continue
+
+            if checkpoint:
+                checkpoint.mark_org_sent(organization_id)
 
         except Exception as loop_err:
             logger.exception(f"Failed to process organization {organization_id}", error=loop_err)
+            total_orgs_failed += 1
 
     queue_time_duration = (datetime.now() - queue_time_start).total_seconds()
     pha_client.capture(
@@ -1620,4 +1998,8 @@ def send_all_org_usage_reports(
         groups={"instance": settings.SITE_URL},
     )
 
+    # The checkpoint is kept while any report failed, so a rerun only sends those
+    if checkpoint and not dry_run and not total_orgs_failed:
+        checkpoint.clear()
+
     logger.info(f"Usage reports complete. Total orgs: {total_orgs}, total orgs sent: {total_orgs_sent}.")
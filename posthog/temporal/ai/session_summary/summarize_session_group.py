@@ -3,7 +3,8 @@ import dataclasses
 from datetime import datetime, timedelta
 import hashlib
 import json
-from typing import cast
+from typing import Any, cast
+from collections.abc import Iterator
 import uuid
 import structlog
 import temporalio
@@ -23,8 +24,7 @@ from ee.session_recordings.session_summary.summarize_session import (
 )
 from posthog import constants
 from posthog.models.team.team import Team
-from posthog.schema import CachedSessionBatchEventsQueryResponse
-from posthog.session_recordings.constants import DEFAULT_TOTAL_EVENTS_PER_QUERY
+from posthog.session_recordings.constants import MAX_TOTAL_EVENTS_PER_QUERY
 from posthog.session_recordings.queries.session_replay_events import SessionReplayEvents
 from posthog.sync import database_sync_to_async
 from posthog.temporal.ai.session_summary.activities.patterns import (
@@ -56,25 +56,25 @@ from temporalio.exceptions import ApplicationError
 logger = structlog.get_logger(__name__)
 
 
-def _get_db_events_per_page(
-    session_ids: list[str], team: Team, min_timestamp_str: str, max_timestamp_str: str, page_size: int, offset: int
-) -> CachedSessionBatchEventsQueryResponse:
-    """Fetch events for multiple sessions in a single query and return the response. Separate function to run in a single db_sync_to_async call."""
+def _get_db_events_stream(
+    session_ids: list[str], team: Team, min_timestamp_str: str, max_timestamp_str: str
+) -> tuple[list[str], Iterator[tuple[str, list[tuple[Any, ...]]]]]:
+    """Prepare streaming events for multiple sessions, one session at a time. Returns the columns of the events and the stream."""
     query = create_session_batch_events_query(
         session_ids=session_ids,
         after=min_timestamp_str,
         before=max_timestamp_str,
-        max_total_events=page_size,
-        offset=offset,
+        max_total_events=MAX_TOTAL_EVENTS_PER_QUERY,
     )
     runner = SessionBatchEventsQueryRunner(query=query, team=team)
-    response = runner.run()
-    if not isinstance(response, CachedSessionBatchEventsQueryResponse):
-        raise ValueError(
-            f"Failed to fetch events for sessions {session_ids} in team {team.id} "
-            f"when fetching batch events for group summary"
-        )
-    return response
+    return runner.stream_columns(), runner.stream_session_events()
+
+
+def _get_next_session_events(
+    session_events_stream: Iterator[tuple[str, list[tuple[Any, ...]]]],
+) -> tuple[str, list[tuple[Any, ...]]] | None:
+    """Load the events of the next session from the stream. Separate function to run in a single db_sync_to_async call."""
+    return next(session_events_stream, None)
 
 
 def _get_db_columns(response_columns: list) -> list[str]:
@@ -122,43 +122,21 @@ async def fetch_session_batch_events_activity(
         recordings_min_timestamp=datetime.fromisoformat(inputs.min_timestamp_str),
         recordings_max_timestamp=datetime.fromisoformat(inputs.max_timestamp_str),
     )
-    # Fetch events for all uncached sessions
+    # Stream events for all uncached sessions, so each session is prepared as soon as its events are loaded
     team = await database_sync_to_async(get_team)(team_id=inputs.team_id)
-    all_session_events: dict[str, list[tuple]] = {}  # session_id -> list of events
-    columns, offset, page_size = None, 0, DEFAULT_TOTAL_EVENTS_PER_QUERY
-    # Paginate
-    while True:
-        response = await database_sync_to_async(_get_db_events_per_page)(
-            session_ids=session_ids_to_fetch,
-            team=team,
-            min_timestamp_str=inputs.min_timestamp_str,
-            max_timestamp_str=inputs.max_timestamp_str,
-            page_size=page_size,
-            offset=offset,
-        )
-        # Store columns from first response (should be the same for all sessions)
-        if columns is None:
-            columns = _get_db_columns(response.columns)
-        # Accumulate events for each session
-        if response.session_events:
-            for session_item in response.session_events:
-                session_id = session_item.session_id
-                if session_id not in all_session_events:
-                    all_session_events[session_id] = []
-                all_session_events[session_id].extend([tuple(event) for event in session_item.events])
-        # Check if we have more pages
-        if response.hasMore is not True:
-            break
-        offset += page_size
-    # Store all per-session DB data in Redis
-    for session_id in session_ids_to_fetch:
-        session_events = all_session_events.get(session_id)
-        if not session_events:
-            temporalio.activity.logger.exception(
-                f"No events found for session {session_id} in team {inputs.team_id} "
-                f"when fetching batch events for group summary"
-            )
-            continue
+    stream_columns, session_events_stream = await database_sync_to_async(_get_db_events_stream)(
+        session_ids=session_ids_to_fetch,
+        team=team,
+        min_timestamp_str=inputs.min_timestamp_str,
+        max_timestamp_str=inputs.max_timestamp_str,
+    )
+    columns = _get_db_columns(stream_columns)
+    streamed_session_ids: set[str] = set()
+    stored_session_ids: set[str] = set()
+    # Store per-session DB data in Redis
+    while (session := await database_sync_to_async(_get_next_session_events)(session_events_stream)) is not None:
+        session_id, session_events = session
+        streamed_session_ids.add(session_id)
         session_metadata = metadata_dict.get(session_id)
         if not session_metadata:
             temporalio.activity.logger.exception(
@@ -192,13 +170,21 @@ async def fetch_session_batch_events_activity(
             state_id=session_id,
         )
         input_data_str = json.dumps(dataclasses.asdict(input_data))
-        fetched_session_ids.append(session_id)
+        stored_session_ids.add(session_id)
         await store_data_in_redis(
             redis_client=redis_client,
             redis_key=session_data_key,
             data=input_data_str,
             label=StateActivitiesEnum.SESSION_DB_DATA,
         )
+    for session_id in session_ids_to_fetch:
+        if session_id not in streamed_session_ids:
+            temporalio.activity.logger.exception(
+                f"No events found for session {session_id} in team {inputs.team_id} "
+                f"when fetching batch events for group summary"
+            )
+    # Keep the order of the input sessions, as the stream yields sessions ordered by id
+    fetched_session_ids.extend(session_id for session_id in session_ids_to_fetch if session_id in stored_session_ids)
     # Returning nothing as the data is stored in Redis
     return fetched_session_ids
 
@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager, contextmanager
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 import uuid
@@ -38,10 +38,21 @@ from openai.types.chat.chat_completion import ChatCompletion, Choice, ChatComple
 from datetime import datetime, timedelta
 from temporalio.testing import WorkflowEnvironment
 from posthog.temporal.ai import WORKFLOWS
+from posthog.schema import CachedSessionBatchEventsQueryResponse
 
 pytestmark = pytest.mark.django_db
 
 
+def mock_session_events_stream(
+    response: CachedSessionBatchEventsQueryResponse,
+) -> tuple[list[str], Iterator[tuple[str, list[tuple[Any, ...]]]]]:
+    """Stream the sessions of a batch events response, the same way `_get_db_events_stream` does"""
+    session_events = [
+        (item.session_id, [tuple(event) for event in item.events]) for item in response.session_events or []
+    ]
+    return response.columns or [], iter(session_events)
+
+
 @pytest.fixture
 def mock_call_llm(mock_valid_llm_yaml_response: str) -> Callable:
     def _mock_call_llm(custom_content: str | None = None) -> ChatCompletion:
@@ -331,8 +342,10 @@ class TestSummarizeSessionGroupWorkflow:
                 return_value=MockMetadataDict(),
             ),
             patch(
-                "posthog.temporal.ai.session_summary.summarize_session_group._get_db_events_per_page",
-                return_value=mock_cached_session_batch_events_query_response_factory(session_ids),
+                "posthog.temporal.ai.session_summary.summarize_session_group._get_db_events_stream",
+                side_effect=lambda **kwargs: mock_session_events_stream(
+                    mock_cached_session_batch_events_query_response_factory(session_ids)
+                ),
             ),
             # Mock deterministic hex generation
             patch.object(
@@ -1,6 +1,8 @@
 import concurrent.futures
+import time
 from datetime import datetime
 from typing import cast
+from unittest.mock import patch
 
 from django.core.cache import cache
 from django.db import IntegrityError, connection
@@ -12,7 +14,8 @@ import pytest
 from flaky import flaky
 
 from posthog.models import Cohort, FeatureFlag, GroupTypeMapping, Person
-from posthog.models.feature_flag import get_feature_flags_for_team_in_cache
+from posthog.models.feature_flag import flag_definitions, get_feature_flags_for_team_in_cache
+from posthog.models.feature_flag.flag_definitions import get_flag_definitions
 from posthog.models.feature_flag.flag_matching import (
     FeatureFlagHashKeyOverride,
     FeatureFlagMatch,
@@ -27,6 +30,7 @@ from posthog.models.group import Group
 from posthog.models.organization import Organization
 from posthog.models.team import Team
 from posthog.models.user import User
+from posthog.redis import get_client
 from posthog.test.base import (
     BaseTest,
     QueryMatchingTest,
@@ -758,6 +762,96 @@ class TestModelCache(BaseTest):
         self.assertEqual(0, len(cached_flags))
 
 
+class TestFlagDefinitions(BaseTest):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        # Subscribes this process to changes
+        get_flag_definitions(self.team.project_id)
+        assert flag_definitions._subscribed.wait(timeout=5)
+
+    def test_definitions_are_kept_until_they_change(self):
+        FeatureFlag.objects.create(
+            team=self.team,
+            key="cohort-flag",
+            created_by=self.user,
+            filters={"groups": [{"properties": [{"key": "id", "value": 1, "type": "cohort"}]}]},
+        )
+        GroupTypeMapping.objects.create(
+            team=self.team, project_id=self.team.project_id, group_type="organization", group_type_index=0
+        )
+        cohort = Cohort.objects.create(team=self.team, name="cohort", groups=[{"properties": []}])
+
+        definitions = get_flag_definitions(self.team.project_id)
+        assert definitions is not None
+        assert [flag.key for flag in definitions.feature_flags] == ["cohort-flag"]
+        assert definitions.group_types_to_indexes == {"organization": 0}
+        assert list(definitions.cohorts.keys()) == [cohort.pk]
+
+        with self.assertNumQueries(0):
+            assert get_flag_definitions(self.team.project_id) is definitions
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cohort.name = "renamed"
+            cohort.save()
+        changed_definitions = get_flag_definitions(self.team.project_id)
+        assert changed_definitions is not None and changed_definitions is not definitions
+        assert cast(Cohort, changed_definitions.cohorts[cohort.pk]).name == "renamed"
+
+    def test_definitions_are_kept_when_cohorts_are_calculated(self):
+        cohort = Cohort.objects.create(team=self.team, name="cohort", groups=[{"properties": []}])
+        definitions = get_flag_definitions(self.team.project_id)
+        assert definitions is not None
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            cohort.is_calculating = True
+            cohort.save(update_fields=["is_calculating"])
+            cohort.count = 10
+            cohort.is_calculating = False
+            cohort.save(update_fields=["count", "is_calculating", "last_calculation"])
+        assert callbacks == []
+        with self.assertNumQueries(0):
+            assert get_flag_definitions(self.team.project_id) is definitions
+
+    def test_definitions_changed_while_loading_are_only_kept_if_another_project_changed(self):
+        load_flag_definitions = flag_definitions._load_flag_definitions
+
+        def load_while_changing(changed_project_id: int):
+            def load(project_id: int) -> flag_definitions.FlagDefinitions:
+                definitions = load_flag_definitions(project_id)
+                flag_definitions._forget(changed_project_id)
+                return definitions
+
+            return load
+
+        with patch.object(
+            flag_definitions, "_load_flag_definitions", side_effect=load_while_changing(self.team.project_id + 1)
+        ):
+            flag_definitions._forget(self.team.project_id)
+            definitions = get_flag_definitions(self.team.project_id)
+        with self.assertNumQueries(0):
+            assert get_flag_definitions(self.team.project_id) is definitions
+
+        with patch.object(
+            flag_definitions, "_load_flag_definitions", side_effect=load_while_changing(self.team.project_id)
+        ):
+            flag_definitions._forget(self.team.project_id)
+            definitions = get_flag_definitions(self.team.project_id)
+        assert get_flag_definitions(self.team.project_id) is not definitions
+
+    def test_definitions_are_dropped_when_another_process_publishes_a_change(self):
+        definitions = get_flag_definitions(self.team.project_id)
+        assert definitions is not None
+
+        get_client().publish(flag_definitions.FLAG_DEFINITIONS_CHANNEL, str(self.team.project_id))
+        for _ in range(50):
+            if get_flag_definitions(self.team.project_id) is not definitions:
+                break
+            time.sleep(0.1)
+        else:
+            raise AssertionError("Definitions weren't dropped")
+
+
 class TestFeatureFlagMatcher(BaseTest, QueryMatchingTest):
     maxDiff = None
 
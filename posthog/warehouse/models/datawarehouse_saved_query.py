@@ -5,6 +5,8 @@ import uuid
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
 
 from posthog.hogql import ast
@@ -231,3 +233,11 @@ def asave_saved_query(saved_query: DataWarehouseSavedQuery) -> None:
 @database_sync_to_async
 def aget_table_by_saved_query_id(saved_query_id: str, team_id: int):
     return DataWarehouseSavedQuery.objects.exclude(deleted=True).get(id=saved_query_id, team_id=team_id).table
+
+
+@receiver(post_save, sender=DataWarehouseSavedQuery)
+@receiver(post_delete, sender=DataWarehouseSavedQuery)
+def data_warehouse_saved_query_changed(sender, instance: DataWarehouseSavedQuery, **kwargs):
+    from posthog.hogql.autocomplete_index import invalidate_autocomplete_schema
+
+    invalidate_autocomplete_schema(instance.team_id)
@@ -2,6 +2,8 @@ from typing import Optional, cast
 from warnings import warn
 from datetime import datetime
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from posthog.hogql import ast
 from posthog.hogql.ast import SelectQuery
@@ -214,3 +216,11 @@ class DataWarehouseJoin(CreatedMetaFields, UUIDModel, DeletedMetaFields):
             raise ResolutionError("Data Warehouse Join HogQL expression should be a Field or Call node")
 
         return expr
+
+
+@receiver(post_save, sender=DataWarehouseJoin)
+@receiver(post_delete, sender=DataWarehouseJoin)
+def data_warehouse_join_changed(sender, instance: DataWarehouseJoin, **kwargs):
+    from posthog.hogql.autocomplete_index import invalidate_autocomplete_schema
+
+    invalidate_autocomplete_schema(instance.team_id)
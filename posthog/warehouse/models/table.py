@@ -6,6 +6,8 @@ from uuid import UUID
 import chdb
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from posthog.clickhouse.client import sync_execute
 from posthog.clickhouse.query_tagging import tag_queries
@@ -413,3 +415,11 @@ def acreate_datawarehousetable(**kwargs):
 @database_sync_to_async
 def asave_datawarehousetable(table: DataWarehouseTable) -> None:
     table.save()
+
+
+@receiver(post_save, sender=DataWarehouseTable)
+@receiver(post_delete, sender=DataWarehouseTable)
+def data_warehouse_table_changed(sender, instance: DataWarehouseTable, **kwargs):
+    from posthog.hogql.autocomplete_index import invalidate_autocomplete_schema
+
+    invalidate_autocomplete_schema(instance.team_id)
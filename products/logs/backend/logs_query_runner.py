@@ -4,8 +4,7 @@ from zoneinfo import ZoneInfo
 
 from posthog.clickhouse.client.connection import Workload
 from posthog.hogql import ast
-from posthog.hogql.property import property_to_expr
-from posthog.hogql.parser import parse_select, parse_expr, parse_order_expr
+from posthog.hogql.parser import parse_select, parse_order_expr
 from posthog.hogql.constants import HogQLGlobalSettings, LimitContext
 from posthog.hogql_queries.insights.paginators import HogQLHasMorePaginator
 from posthog.hogql_queries.query_runner import QueryRunner
@@ -18,10 +17,10 @@ from posthog.schema import (
     LogsQueryResponse,
     IntervalType,
     PropertyGroupsMode,
-    PropertyOperator,
-    LogPropertyFilter,
 )
 
+from products.logs.backend.logs_search import LogsSearchPlanner
+
 
 class LogsQueryRunner(QueryRunner):
     query: LogsQuery
@@ -38,52 +37,6 @@ class LogsQueryRunner(QueryRunner):
             offset=self.query.offset,
         )
 
-        def get_property_type(value):
-            try:
-                value = float(value)
-                return "float"
-            except ValueError:
-                pass
-            # todo: datetime?
-            return "str"
-
-        if len(self.query.filterGroup.values) > 0:
-            filter_keys = []
-            # dynamically detect type of the given property values
-            # if they all convert cleanly to float, use the __float property mapping instead
-            # we keep multiple attribute maps for different types:
-            # attribute_map_str
-            # attribute_map_float
-            # attribute_map_datetime
-            #
-            # for now we'll just check str and float as we need a decent UI for datetime filtering.
-            for property_filter in self.query.filterGroup.values[0].values:
-                if isinstance(property_filter, LogPropertyFilter) and property_filter.value:
-                    property_type = "str"
-                    if isinstance(property_filter.value, list):
-                        property_types = {get_property_type(v) for v in property_filter.value}
-                        # only use the detected type if all given values have the same type
-                        # e.g. if values are '1', '2', we can use float, if values are '1', 'a', stick to str
-                        if len(property_types) == 1:
-                            property_type = property_types.pop()
-                    else:
-                        property_type = get_property_type(property_filter.value)
-                    property_filter.key += f"__{property_type}"
-                    # for all operators except SET and NOT_SET we add an IS_SET operator to force
-                    # the property key bloom filter index to be used.
-                    if property_filter.operator not in (PropertyOperator.IS_SET, PropertyOperator.IS_NOT_SET):
-                        filter_keys.append(property_filter.key)
-
-            for filter_key in filter_keys:
-                self.query.filterGroup.values[0].values.insert(
-                    0,
-                    LogPropertyFilter(
-                        key=filter_key,
-                        operator=PropertyOperator.IS_SET,
-                        type="log",
-                    ),
-                )
-
     def calculate(self) -> LogsQueryResponse:
         self.modifiers.convertToProjectTimezone = False
         self.modifiers.propertyGroupsMode = PropertyGroupsMode.OPTIMIZED
@@ -152,44 +105,11 @@ class LogsQueryRunner(QueryRunner):
         return query
 
     def where(self):
-        exprs: list[ast.Expr] = [
-            ast.Placeholder(expr=ast.Field(chain=["filters"])),
-        ]
+        return self.search_planner.where()
 
-        if self.query.severityLevels:
-            exprs.append(
-                parse_expr(
-                    "severity_text IN {severityLevels}",
-                    placeholders={
-                        "severityLevels": ast.Tuple(
-                            exprs=[ast.Constant(value=str(sl)) for sl in self.query.severityLevels]
-                        )
-                    },
-                )
-            )
-
-        if self.query.serviceNames:
-            exprs.append(
-                parse_expr(
-                    "service_name IN {serviceNames}",
-                    placeholders={
-                        "serviceNames": ast.Tuple(exprs=[ast.Constant(value=str(sn)) for sn in self.query.serviceNames])
-                    },
-                )
-            )
-
-        if self.query.searchTerm:
-            exprs.append(
-                parse_expr(
-                    "body LIKE {searchTerm}",
-                    placeholders={"searchTerm": ast.Constant(value=f"%{self.query.searchTerm}%")},
-                )
-            )
-
-        if self.query.filterGroup:
-            exprs.append(property_to_expr(self.query.filterGroup, team=self.team))
-
-        return ast.And(exprs=exprs)
+    @cached_property
+    def search_planner(self) -> LogsSearchPlanner:
+        return LogsSearchPlanner(self.query, self.team)
 
     @cached_property
     def properties(self):
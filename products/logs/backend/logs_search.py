@@ -0,0 +1,284 @@
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+import structlog
+from django.core.cache import cache
+
+from posthog.clickhouse.client import sync_execute
+from posthog.clickhouse.client.connection import Workload
+from posthog.exceptions_capture import capture_exception
+from posthog.hogql import ast
+from posthog.hogql.parser import parse_expr
+from posthog.hogql.property import property_to_expr
+from posthog.models import Team
+from posthog.schema import (
+    FilterLogicalOperator,
+    LogPropertyFilter,
+    LogsQuery,
+    PropertyGroupFilterValue,
+    PropertyOperator,
+)
+
+logger = structlog.get_logger(__name__)
+
+ATTRIBUTE_CATALOG_KEY = "logs_attribute_catalog:{team_id}:{attribute_key}"
+ATTRIBUTE_CATALOG_TTL_SECONDS = 5 * 60
+
+# Operators comparing values as text, which always read the string attribute map
+TEXT_OPERATORS = (
+    PropertyOperator.ICONTAINS,
+    PropertyOperator.NOT_ICONTAINS,
+    PropertyOperator.REGEX,
+    PropertyOperator.NOT_REGEX,
+)
+# Operators that only make sense on numbers, which read the float attribute map whenever the values are numbers
+NUMERIC_OPERATORS = (
+    PropertyOperator.GT,
+    PropertyOperator.GTE,
+    PropertyOperator.LT,
+    PropertyOperator.LTE,
+)
+
+# The body tokenbf_v1 index splits text on ASCII characters that aren't letters or digits
+TOKEN_SEPARATORS = re.compile(r"[\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+")
+
+
+@dataclass(frozen=True)
+class AttributeStats:
+    count: int
+    numeric_count: int
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.numeric_count == self.count
+
+
+def get_attribute_catalog(team: Team, attribute_keys: list[str]) -> dict[str, AttributeStats]:
+    """
+    How many logs had each attribute in the last hour, and how many of those values were numbers, from the
+    log_attributes table. Entries are cached per key. Keys that weren't seen are left out, as are all keys if the
+    catalog can't be read, in which case filters fall back to guessing types from their values.
+    """
+    cache_keys = {
+        attribute_key: ATTRIBUTE_CATALOG_KEY.format(team_id=team.pk, attribute_key=attribute_key)
+        for attribute_key in set(attribute_keys)
+    }
+    if not cache_keys:
+        return {}
+
+    cached = cache.get_many(list(cache_keys.values()))
+    counts: dict[str, tuple[int, int]] = {
+        attribute_key: cached[cache_key] for attribute_key, cache_key in cache_keys.items() if cache_key in cached
+    }
+
+    missing_keys = [attribute_key for attribute_key in cache_keys if attribute_key not in counts]
+    if missing_keys:
+        try:
+            rows = sync_execute(
+                """
+                SELECT
+                    attribute_key,
+                    sum(attribute_count),
+                    sumIf(attribute_count, isNotNull(toFloat64OrNull(attribute_value)))
+                FROM log_attributes
+                WHERE time_bucket >= toStartOfInterval(now() - interval 1 hour, interval 10 minute)
+                AND team_id = %(team_id)s
+                AND attribute_key IN %(attribute_keys)s
+                GROUP BY attribute_key
+                """,
+                {"team_id": team.pk, "attribute_keys": missing_keys},
+                workload=Workload.LOGS,
+                team_id=team.pk,
+                readonly=True,
+            )
+        except Exception as e:
+            logger.warning("logs_attribute_catalog_failed", team_id=team.pk, error=str(e))
+            capture_exception(e)
+            return {}
+
+        fetched = {attribute_key: (count, numeric_count) for attribute_key, count, numeric_count in rows}
+        # Unseen keys are cached as (0, 0), so that they aren't looked up again on every query
+        fetched_counts = {attribute_key: fetched.get(attribute_key, (0, 0)) for attribute_key in missing_keys}
+        cache.set_many(
+            {cache_keys[attribute_key]: value for attribute_key, value in fetched_counts.items()},
+            timeout=ATTRIBUTE_CATALOG_TTL_SECONDS,
+        )
+        counts.update(fetched_counts)
+
+    return {
+        attribute_key: AttributeStats(count=count, numeric_count=numeric_count)
+        for attribute_key, (count, numeric_count) in counts.items()
+        if count > 0
+    }
+
+
+def _is_float(value) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def attribute_type(property_filter: LogPropertyFilter, stats: AttributeStats | None) -> str:
+    """
+    Picks the typed attribute map a filter reads: "float" if the filter values are numbers and the catalog hasn't seen
+    the attribute holding anything else, "str" otherwise. Every attribute is in the string map, so filters without
+    values (e.g. is set) read that one.
+    """
+    if property_filter.operator in TEXT_OPERATORS or property_filter.value is None:
+        return "str"
+    values = property_filter.value if isinstance(property_filter.value, list) else [property_filter.value]
+    # only use float if all given values are numbers, e.g. if values are '1', '2', we can use float, if values are
+    # '1', 'a', stick to str
+    if not values or not all(_is_float(value) for value in values):
+        return "str"
+    if property_filter.operator in NUMERIC_OPERATORS or stats is None:
+        return "float"
+    return "float" if stats.is_numeric else "str"
+
+
+def search_term_tokens(search_term: str) -> list[str]:
+    """
+    The whole tokens of a search term, which every body matching `LIKE %search_term%` contains too. The first and
+    last parts of the term may only be the end or the start of a token in the body, so they are left out.
+    """
+    parts = TOKEN_SEPARATORS.split(search_term)
+    return [part for part in parts[1:-1] if part]
+
+
+class LogsSearchPlanner:
+    """
+    Builds the where clause of the logs list and sparkline queries. Predicates are ordered from the cheapest and most
+    selective to the most expensive, so that ClickHouse can skip granules with the sorting key and skip indexes
+    before reading message bodies:
+    - severity levels and service names, which are low cardinality and part of the sorting key
+    - attribute filters, rarest attributes first according to the attribute catalog, each preceded by an is set
+      filter on the same key to use the attribute key bloom filter index
+    - the search term, preceded by hasToken checks of its whole tokens to use the body token bloom filter index
+    """
+
+    def __init__(self, query: LogsQuery, team: Team):
+        self.query = query
+        self.team = team
+
+    def where(self) -> ast.Expr:
+        exprs: list[ast.Expr] = [
+            ast.Placeholder(expr=ast.Field(chain=["filters"])),
+            *self._column_filters(),
+            *self._attribute_filters(),
+            *self._search_term_filters(),
+        ]
+        return ast.And(exprs=exprs)
+
+    @cached_property
+    def attribute_catalog(self) -> dict[str, AttributeStats]:
+        return get_attribute_catalog(self.team, [property_filter.key for property_filter in self._log_filters])
+
+    @cached_property
+    def _log_filters(self) -> list[LogPropertyFilter]:
+        if not self.query.filterGroup or not self.query.filterGroup.values:
+            return []
+        return [
+            property_filter
+            for property_filter in self.query.filterGroup.values[0].values
+            if isinstance(property_filter, LogPropertyFilter)
+        ]
+
+    def _column_filters(self) -> list[ast.Expr]:
+        exprs: list[ast.Expr] = []
+        if self.query.severityLevels:
+            exprs.append(
+                parse_expr(
+                    "severity_text IN {severityLevels}",
+                    placeholders={
+                        "severityLevels": ast.Tuple(
+                            exprs=[ast.Constant(value=str(sl)) for sl in self.query.severityLevels]
+                        )
+                    },
+                )
+            )
+
+        if self.query.serviceNames:
+            exprs.append(
+                parse_expr(
+                    "service_name IN {serviceNames}",
+                    placeholders={
+                        "serviceNames": ast.Tuple(exprs=[ast.Constant(value=str(sn)) for sn in self.query.serviceNames])
+                    },
+                )
+            )
+        return exprs
+
+    def _typed_filter(self, property_filter: LogPropertyFilter) -> LogPropertyFilter:
+        # we keep multiple attribute maps for different types, and pick one per filter by suffixing its key:
+        # attribute_map_str
+        # attribute_map_float
+        # attribute_map_datetime
+        #
+        # for now we'll just pick str and float as we need a decent UI for datetime filtering.
+        property_type = attribute_type(property_filter, self.attribute_catalog.get(property_filter.key))
+        return property_filter.model_copy(update={"key": f"{property_filter.key}__{property_type}"})
+
+    def _attribute_filters(self) -> list[ast.Expr]:
+        filter_group = self.query.filterGroup
+        if not filter_group or not filter_group.values:
+            return []
+
+        typed_filters = {
+            id(property_filter): self._typed_filter(property_filter) for property_filter in self._log_filters
+        }
+        first_group = filter_group.values[0]
+        typed_values = [typed_filters.get(id(value), value) for value in first_group.values]
+
+        is_and_only = (
+            filter_group.type == FilterLogicalOperator.AND_
+            and len(filter_group.values) == 1
+            and first_group.type == FilterLogicalOperator.AND_
+            and not any(isinstance(value, PropertyGroupFilterValue) for value in first_group.values)
+        )
+        if not is_and_only:
+            # Predicates can only be reordered and prefiltered when all of them have to match
+            typed_group = filter_group.model_copy(
+                update={"values": [first_group.model_copy(update={"values": typed_values}), *filter_group.values[1:]]}
+            )
+            return [property_to_expr(typed_group, team=self.team)]
+
+        def selectivity(property_filter: LogPropertyFilter) -> int:
+            # Attributes missing from the catalog weren't seen lately, so they're likely the rarest
+            stats = self.attribute_catalog.get(property_filter.key)
+            return stats.count if stats else 0
+
+        exprs: list[ast.Expr] = []
+        for property_filter in sorted(self._log_filters, key=selectivity):
+            typed_filter = typed_filters[id(property_filter)]
+            # for all operators except SET and NOT_SET we add an IS_SET operator to force
+            # the property key bloom filter index to be used.
+            if typed_filter.operator not in (PropertyOperator.IS_SET, PropertyOperator.IS_NOT_SET):
+                exprs.append(
+                    property_to_expr(
+                        LogPropertyFilter(key=typed_filter.key, operator=PropertyOperator.IS_SET, type="log"),
+                        team=self.team,
+                    )
+                )
+            exprs.append(property_to_expr(typed_filter, team=self.team))
+
+        other_filters = [value for value in typed_values if not isinstance(value, LogPropertyFilter)]
+        exprs.extend(property_to_expr(value, team=self.team) for value in other_filters)
+        return exprs
+
+    def _search_term_filters(self) -> list[ast.Expr]:
+        if not self.query.searchTerm:
+            return []
+        exprs: list[ast.Expr] = [
+            parse_expr("hasToken(body, {token})", placeholders={"token": ast.Constant(value=token)})
+            for token in search_term_tokens(self.query.searchTerm)
+        ]
+        exprs.append(
+            parse_expr(
+                "body LIKE {searchTerm}",
+                placeholders={"searchTerm": ast.Constant(value=f"%{self.query.searchTerm}%")},
+            )
+        )
+        return exprs
@@ -0,0 +1,171 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+
+from posthog.hogql import ast
+from posthog.schema import (
+    DateRange,
+    FilterLogicalOperator,
+    LogPropertyFilter,
+    LogSeverityLevel,
+    LogsQuery,
+    PropertyGroupFilter,
+    PropertyGroupFilterValue,
+    PropertyOperator,
+)
+from posthog.test.base import BaseTest
+from products.logs.backend.logs_search import (
+    AttributeStats,
+    LogsSearchPlanner,
+    attribute_type,
+    get_attribute_catalog,
+    search_term_tokens,
+)
+
+
+def _logs_query(
+    filters: list[LogPropertyFilter] | None = None,
+    filter_type: FilterLogicalOperator = FilterLogicalOperator.AND_,
+    **kwargs,
+) -> LogsQuery:
+    return LogsQuery(
+        dateRange=DateRange(date_from="-1h"),
+        filterGroup=PropertyGroupFilter(
+            type=FilterLogicalOperator.AND_,
+            values=[PropertyGroupFilterValue(type=filter_type, values=filters or [])],
+        ),
+        serviceNames=kwargs.pop("serviceNames", []),
+        severityLevels=kwargs.pop("severityLevels", []),
+        **kwargs,
+    )
+
+
+@patch("products.logs.backend.logs_search.sync_execute")
+class TestLogsSearchPlanner(BaseTest):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def _where(self, query: LogsQuery) -> str:
+        where = LogsSearchPlanner(query, self.team).where()
+        assert isinstance(where, ast.And)
+        # The placeholder for the date range and other filters of the runners always comes first
+        assert where.exprs[0] == ast.Placeholder(expr=ast.Field(chain=["filters"]))
+        return "\n".join(expr.to_hogql() for expr in where.exprs[1:])
+
+    def test_orders_column_filters_before_the_search_term(self, mock_sync_execute: MagicMock):
+        where = self._where(
+            _logs_query(
+                severityLevels=[LogSeverityLevel.ERROR],
+                serviceNames=["api"],
+                searchTerm="GET /api/users?id=1",
+            )
+        )
+
+        positions = [
+            where.index("severity_text"),
+            where.index("service_name"),
+            where.index("hasToken(body, 'api')"),
+            where.index("hasToken(body, 'users')"),
+            where.index("hasToken(body, 'id')"),
+            where.index("body LIKE '%GET /api/users?id=1%'"),
+        ]
+        assert positions == sorted(positions)
+        # The first and last parts may be partial tokens of the body
+        assert "hasToken(body, 'GET')" not in where
+        assert "hasToken(body, '1')" not in where
+        # No attribute filters, so the catalog isn't read
+        mock_sync_execute.assert_not_called()
+
+    def test_search_term_without_whole_tokens_falls_back_to_like(self, mock_sync_execute: MagicMock):
+        where = self._where(_logs_query(searchTerm="timeout"))
+
+        assert "hasToken" not in where
+        assert "body LIKE '%timeout%'" in where
+
+    def test_orders_attribute_filters_by_rarity(self, mock_sync_execute: MagicMock):
+        mock_sync_execute.return_value = [("common", 1000, 0), ("rare", 5, 5)]
+
+        where = self._where(
+            _logs_query(
+                [
+                    LogPropertyFilter(key="common", operator=PropertyOperator.EXACT, value="a"),
+                    LogPropertyFilter(key="rare", operator=PropertyOperator.EXACT, value="1"),
+                    LogPropertyFilter(key="unseen", operator=PropertyOperator.EXACT, value="b"),
+                ]
+            )
+        )
+
+        # Attributes the catalog hasn't seen lately come first
+        assert where.index("unseen__str") < where.index("rare__float") < where.index("common__str")
+        # Each filter is preceded by an is set filter on its key, for the attribute key bloom filter index
+        assert where.count("unseen__str") == where.count("rare__float") == where.count("common__str") == 2
+
+    def test_is_set_filters_are_not_duplicated(self, mock_sync_execute: MagicMock):
+        mock_sync_execute.return_value = []
+
+        where = self._where(_logs_query([LogPropertyFilter(key="user", operator=PropertyOperator.IS_SET)]))
+
+        assert where.count("user__str") == 1
+
+    def test_filters_with_or_are_not_reordered(self, mock_sync_execute: MagicMock):
+        mock_sync_execute.return_value = [("common", 1000, 0), ("rare", 5, 0)]
+
+        where = self._where(
+            _logs_query(
+                [
+                    LogPropertyFilter(key="common", operator=PropertyOperator.EXACT, value="a"),
+                    LogPropertyFilter(key="rare", operator=PropertyOperator.EXACT, value="b"),
+                ],
+                filter_type=FilterLogicalOperator.OR_,
+            )
+        )
+
+        assert where.index("common__str") < where.index("rare__str")
+        assert where.count("common__str") == where.count("rare__str") == 1
+
+    def test_attribute_catalog_is_cached(self, mock_sync_execute: MagicMock):
+        mock_sync_execute.return_value = [("rare", 5, 5)]
+
+        expected = {"rare": AttributeStats(count=5, numeric_count=5)}
+        assert get_attribute_catalog(self.team, ["rare", "unseen"]) == expected
+        assert get_attribute_catalog(self.team, ["rare", "unseen"]) == expected
+
+        assert mock_sync_execute.call_count == 1
+
+    def test_falls_back_to_filter_values_when_the_catalog_fails(self, mock_sync_execute: MagicMock):
+        mock_sync_execute.side_effect = Exception("logs cluster is unavailable")
+
+        where = self._where(
+            _logs_query(
+                [
+                    LogPropertyFilter(key="status", operator=PropertyOperator.EXACT, value="500"),
+                    LogPropertyFilter(key="path", operator=PropertyOperator.EXACT, value="/api"),
+                ]
+            )
+        )
+
+        assert "status__float" in where
+        assert "path__str" in where
+
+
+class TestAttributeType(BaseTest):
+    def test_attribute_type(self):
+        numeric = AttributeStats(count=10, numeric_count=10)
+        mixed = AttributeStats(count=10, numeric_count=5)
+
+        def log_filter(operator: PropertyOperator, value=None) -> LogPropertyFilter:
+            return LogPropertyFilter(key="a", operator=operator, value=value)
+
+        assert attribute_type(log_filter(PropertyOperator.EXACT, "1"), numeric) == "float"
+        assert attribute_type(log_filter(PropertyOperator.EXACT, "1"), mixed) == "str"
+        assert attribute_type(log_filter(PropertyOperator.EXACT, "1"), None) == "float"
+        assert attribute_type(log_filter(PropertyOperator.GT, "1"), mixed) == "float"
+        assert attribute_type(log_filter(PropertyOperator.ICONTAINS, "1"), numeric) == "str"
+        assert attribute_type(log_filter(PropertyOperator.EXACT, ["1", "b"]), None) == "str"
+        assert attribute_type(log_filter(PropertyOperator.IS_SET), numeric) == "str"
+
+    def test_search_term_tokens(self):
+        assert search_term_tokens("GET /api/users?id=1") == ["api", "users", "id"]
+        assert search_term_tokens("connection  refused by peer") == ["refused", "by"]
+        assert search_term_tokens("timeout") == []